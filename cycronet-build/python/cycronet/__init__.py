@@ -40,7 +40,7 @@ load_native_libraries()
 
 # Import Rust extension module
 try:
-    from .cronet_cloak import PyCronetClient
+    from .cronet_cloak import PyCronetClient, CancelToken
 except ImportError as e:
     # If import fails, provide helpful error message
     if sys.platform == "linux" and "libcronet" in str(e):
@@ -55,13 +55,17 @@ except ImportError as e:
         raise
 
 # Import public API
-from ._types import HeadersType, CookiesType, DataType
+from ._types import HeadersType, CookiesType, DataType, TimeoutType
 from ._cookies import Cookie, CookieJar
-from ._response import Response, HTTPStatusError, RequestError
+from ._response import Response, Timings, HTTPStatusError, RequestError, TooManyRedirects
 from ._session import Session
 from ._async_session import AsyncSession
+from ._ratelimit import RateLimiter
+from ._retry import Retry, RetryBudget
+from ._hedge import Hedge
+from ._prepared import PreparedRequest
 from ._client import (
-    CronetClient, AsyncCronetClient,
+    CronetClient, AsyncCronetClient, close_default_clients, metrics_snapshot, warm_storage,
     set_tls_profiles, add_tls_profile, get_tls_profiles, clear_tls_profiles_cache,
     _TLS_PROFILES_CACHE
 )
@@ -75,12 +79,14 @@ from ._api_async import (
 )
 
 __all__ = [
-    "CronetClient", "Session", "Response", "HTTPStatusError", "RequestError",
+    "CronetClient", "Session", "Response", "Timings", "HTTPStatusError", "RequestError",
+    "TooManyRedirects", "CancelToken",
     "Cookie", "CookieJar",
     "get", "post", "put", "delete", "patch", "head", "options",
     "upload_file", "download_file",
-    "AsyncCronetClient", "AsyncSession",
+    "AsyncCronetClient", "AsyncSession", "PreparedRequest", "RateLimiter", "Retry", "RetryBudget", "Hedge",
     "async_get", "async_post", "async_put", "async_delete", "async_patch",
     "async_head", "async_options", "async_upload_file", "async_download_file",
-    "set_tls_profiles", "add_tls_profile", "get_tls_profiles", "clear_tls_profiles_cache"
+    "set_tls_profiles", "add_tls_profile", "get_tls_profiles", "clear_tls_profiles_cache",
+    "close_default_clients", "metrics_snapshot", "warm_storage"
 ]
@@ -2,12 +2,15 @@
 Type stubs for cycronet package
 """
 
-from typing import Dict, List, Tuple, Optional, Union, Any, Iterator
+import os
+from typing import Dict, List, Tuple, Optional, Union, Any, Iterator, AsyncIterator, Iterable, IO
 from dataclasses import dataclass
 
 HeadersType = Union[Dict[str, str], List[Tuple[str, str]]]
 CookiesType = Dict[str, str]
-DataType = Union[str, bytes, Dict[str, Any], None]
+DataType = Union[str, bytes, Dict[str, Any], Iterable[bytes], IO[bytes], None]
+# 秒：总超时，(连接, 读取) 或 (连接, 读取, 总超时)
+TimeoutType = Union[float, Tuple[float, float], Tuple[float, float, float], None]
 
 class Cookie:
     """单个 Cookie 对象"""
@@ -15,20 +18,84 @@ class Cookie:
     value: str
     domain: str
     path: str
+    expires: Optional[float]  # Unix 时间戳，None 为会话 Cookie
+    secure: bool
+    http_only: bool
+    host_only: bool  # 未带 Domain 属性：只发往设置它的主机
 
-    def __init__(self, name: str, value: str, domain: str = "", path: str = "/") -> None: ...
+    def __init__(
+        self,
+        name: str,
+        value: str,
+        domain: str = "",
+        path: str = "/",
+        expires: Optional[float] = None,
+        secure: bool = False,
+        http_only: bool = False,
+        host_only: bool = False
+    ) -> None: ...
+    def is_expired(self, now: Optional[float] = None) -> bool: ...
     def __repr__(self) -> str: ...
     def __str__(self) -> str: ...
 
 class CookieJar:
-    """Cookie Jar 管理器 - 类似 requests.cookies.RequestsCookieJar"""
+    """Cookie Jar 管理器 - 类似 requests.cookies.RequestsCookieJar
 
-    def __init__(self) -> None: ...
-    def set(self, name: str, value: str, domain: str = "", path: str = "/") -> None: ...
+    遵循 RFC 6265（Path / Expires / Max-Age / Secure / HttpOnly），过期 Cookie 在读取时惰性清理；
+    超过 max_cookies（默认 3000，None 不限）时淘汰最近最少使用的 Cookie
+    """
+    max_cookies: Optional[int]
+
+    def __init__(self, max_cookies: Optional[int] = 3000) -> None: ...
+    def set(
+        self,
+        name: str,
+        value: str,
+        domain: str = "",
+        path: str = "/",
+        *,
+        expires: Optional[float] = None,
+        secure: bool = False,
+        http_only: bool = False
+    ) -> None:
+        """设置 Cookie；expires 为 Unix 时间戳，已过期则删除该 Cookie"""
+        ...
+    def set_cookie(self, cookie: Cookie) -> None: ...
     def get(self, name: str, domain: str = "") -> Optional[str]: ...
     def get_dict(self, domain: str = "") -> Dict[str, str]: ...
+    def matching(self, domain: str, path: str = "/", secure: bool = True) -> Dict[str, str]:
+        """发往 domain + path 的 Cookie（更具体的域名/更长的 path 优先；secure=False 时不含 Secure Cookie），结果有缓存，勿修改"""
+        ...
+    def header(self, domain: str, path: str = "/", secure: bool = True) -> str:
+        """发往 domain + path 的 Cookie 请求头值，按 (domain, path, secure) 缓存，Cookie 变化时失效"""
+        ...
     def update(self, cookies: Union[Dict[str, str], 'CookieJar'], domain: str = "") -> None: ...
     def clear(self, domain: str = "") -> None: ...
+    def save(self, path: Union[str, os.PathLike]) -> None:
+        """将全部 Cookie 写入文件（JSON Lines，原子替换）"""
+        ...
+    def load(self, path: Union[str, os.PathLike]) -> None:
+        """加载 save() 或日志文件中的 Cookie，跳过已过期的 Cookie 与不完整的行"""
+        ...
+    def open_journal(
+        self,
+        path: Union[str, os.PathLike],
+        *,
+        interval: float = 1.0,
+        compact_after: int = 10000
+    ) -> None:
+        """
+        Cookie 持久化日志：先加载文件中已有的 Cookie，之后的变化在内存中排队，
+        由后台线程每 interval 秒追加写入，请求不等待磁盘；追加记录超过 compact_after
+        （且多于现存 Cookie）时重写为快照
+        """
+        ...
+    def flush(self) -> None:
+        """立即写入排队的日志变化（未开启日志时无操作）"""
+        ...
+    def close_journal(self) -> None:
+        """写完排队的变化并停止日志（未开启日志时无操作）"""
+        ...
     def items(self) -> Iterator[Tuple[str, str]]: ...
     def keys(self) -> Iterator[str]: ...
     def values(self) -> Iterator[str]: ...
@@ -37,15 +104,58 @@ class CookieJar:
     def __repr__(self) -> str: ...
     def __str__(self) -> str: ...
 
+@dataclass(frozen=True)
+class Timings:
+    """Cronet 上报的请求耗时（毫秒），未发生的阶段为 None；connect_ms 含 TLS 握手"""
+    dns_ms: Optional[int] = None
+    connect_ms: Optional[int] = None
+    tls_ms: Optional[int] = None
+    send_ms: Optional[int] = None
+    ttfb_ms: Optional[int] = None
+    total_ms: Optional[int] = None
+    socket_reused: bool = False
+    protocol: str = ""
+    sent_bytes: int = 0
+    received_bytes: int = 0
+    queue_ms: Optional[int] = None  # 在并发队列中等待的时间，不计入其余各项
+
 @dataclass
 class Response:
     """HTTP 响应对象"""
     status_code: int
     _headers: Dict[str, List[str]]
-    content: bytes
+    _content: Optional[bytes]
     url: str = ""
     _cookies: CookieJar = ...
     encoding: Optional[str] = None
+    _stream: Any = None
+    history: List['Response'] = ...  # 已跟随的重定向响应，按顺序排列
+    timings: Optional[Timings] = None  # 请求耗时；流式响应读完 body 后可用
+    attempts: int = 1  # 本请求实际发送次数，重试后大于 1
+    from_cache: bool = False  # 响应来自 Cronet HTTP 缓存（含 ETag/Last-Modified 重新验证）
+
+    def __init__(
+        self,
+        status_code: int,
+        _headers: Dict[str, List[str]],
+        content: Optional[bytes],  # 流式响应为 None，首次访问 .content 时读取
+        url: str = "",
+        _cookies: Optional[CookieJar] = None,
+        encoding: Optional[str] = None,
+        _stream: Any = None,
+        history: Optional[List['Response']] = None,
+        timings: Optional[Timings] = None,
+        attempts: int = 1,
+        from_cache: bool = False
+    ) -> None: ...
+    @property
+    def content(self) -> bytes: ...
+    def iter_content(self, chunk_size: Optional[int] = None) -> Iterator[bytes]: ...
+    def iter_lines(self, chunk_size: Optional[int] = None, delimiter: Optional[bytes] = None) -> Iterator[bytes]: ...
+    def aiter_bytes(self, chunk_size: Optional[int] = None) -> AsyncIterator[bytes]: ...
+    def aiter_lines(self) -> AsyncIterator[bytes]: ...
+    async def aread(self) -> bytes: ...
+    def close(self) -> None: ...
 
     @property
     def headers(self) -> Dict[str, str]: ...
@@ -68,10 +178,187 @@ class RequestError(Exception):
     """请求错误"""
     pass
 
+class CancelToken:
+    """请求取消句柄：cancel() 可在任意线程调用，立即取消使用该 token 的请求"""
+    def __init__(self) -> None: ...
+    def cancel(self) -> None: ...
+    @property
+    def cancelled(self) -> bool: ...
+
+class TooManyRedirects(RequestError):
+    """重定向次数超过 Session.max_redirects"""
+    response: Optional[Response]
+    def __init__(self, message: str, response: Optional[Response] = None) -> None: ...
+
+RateType = Union[float, Tuple[float, int]]
+
+class RateLimiter:
+    """按目标主机与上游代理的令牌桶限速（GCRA），可在多个会话间共享"""
+
+    def __init__(
+        self,
+        per_host: Optional[float] = None,
+        per_proxy: Optional[float] = None,
+        burst: int = 1,
+        hosts: Optional[Dict[str, RateType]] = None,
+        proxies: Optional[Dict[str, RateType]] = None
+    ) -> None:
+        """
+        Args:
+            per_host: 每个主机默认每秒请求数（None 表示不限制）
+            per_proxy: 每个代理默认每秒请求数（None 表示不限制）
+            burst: 允许连续发送的请求数（默认 1）
+            hosts: 按主机覆盖，{host: rate 或 (rate, burst)}
+            proxies: 按代理 URL 覆盖，格式同 hosts
+        """
+        ...
+
+    def reserve(self, url: str, proxy: Optional[str] = None) -> float:
+        """预留一个发送时机，返回需要等待的秒数"""
+        ...
+
+    def wait(self, url: str, proxy: Optional[str] = None) -> float:
+        """阻塞等待直到可以发送，返回等待的秒数"""
+        ...
+
+    async def wait_async(self, url: str, proxy: Optional[str] = None) -> float:
+        """异步等待（不阻塞事件循环），返回等待的秒数"""
+        ...
+
+class RetryBudget:
+    """重试预算：重试次数不超过请求数的 ratio 倍，另保底每秒 min_per_second 次"""
+    ratio: float
+    min_per_second: float
+    max_tokens: float
+
+    def __init__(self, ratio: float = 0.2, min_per_second: float = 10.0, max_tokens: float = 100.0) -> None: ...
+    def deposit(self) -> None:
+        """记录一次首发请求"""
+        ...
+    def withdraw(self) -> bool:
+        """取出一次重试额度，预算耗尽时返回 False"""
+        ...
+    @property
+    def available(self) -> float: ...
+
+class Retry:
+    """重试策略：按 Cronet 网络错误分类，指数退避 + 随机抖动，遵循 Retry-After"""
+    total: int
+    backoff_factor: float
+    backoff_max: float
+    jitter: bool
+    status_forcelist: frozenset
+    allowed_methods: frozenset
+    respect_retry_after: bool
+    retry_after_max: float
+    retry_on_timeout: bool
+
+    def __init__(
+        self,
+        total: int = 3,
+        backoff_factor: float = 0.1,
+        backoff_max: float = 10.0,
+        jitter: bool = True,
+        status_forcelist: Iterable[int] = (429, 502, 503, 504),
+        allowed_methods: Iterable[str] = ...,
+        respect_retry_after: bool = True,
+        retry_after_max: float = 60.0,
+        retry_on_timeout: bool = True
+    ) -> None:
+        """
+        Args:
+            total: 首次请求之后最多重试次数（默认 3）
+            backoff_factor: 退避基数（秒），每次重试翻倍（默认 0.1）
+            backoff_max: 单次退避上限（秒，默认 10）
+            jitter: 在 [0, 退避时间] 内均匀随机（默认 True）
+            status_forcelist: 需要重试的状态码（默认 429/502/503/504）
+            allowed_methods: 传输错误与状态码重试允许的方法（默认幂等方法）；
+                连接阶段错误（DNS、连接被拒、QUIC 握手、代理/隧道失败）对所有方法重试
+            respect_retry_after: 遵循 429/503 的 Retry-After（默认 True）
+            retry_after_max: 可接受的最长 Retry-After（秒），超过则直接返回响应
+            retry_on_timeout: 是否重试超时（连接超时对所有方法，读取/总超时仅幂等方法）
+        """
+        ...
+
+    def backoff(self, attempt: int) -> float: ...
+    def is_retryable_error(self, method: str, exc: BaseException) -> bool: ...
+    def delay_for_error(self, method: str, exc: BaseException, attempt: int) -> Optional[float]: ...
+    def delay_for_response(self, method: str, response: Response, attempt: int) -> Optional[float]: ...
+
+class Hedge:
+    """对冲策略：请求超过延迟仍未响应时再发一份（可走备用会话/代理），先到者胜，另一份在 Cronet 中取消"""
+    delay_ms: Optional[float]
+    percentile: float
+    min_samples: int
+    alternate: Optional[AsyncSession]
+    methods: frozenset
+    budget: RetryBudget
+
+    def __init__(
+        self,
+        delay_ms: Optional[float] = None,
+        percentile: float = 95.0,
+        min_samples: int = 20,
+        window: int = 256,
+        max_extra: float = 0.05,
+        alternate: Optional[AsyncSession] = None,
+        methods: Iterable[str] = ...
+    ) -> None:
+        """
+        Args:
+            delay_ms: 固定对冲延迟（毫秒）；None 时按近期响应时间的百分位自动学习
+            percentile: 自动学习时使用的延迟百分位（默认 95）
+            min_samples: 开始使用学习结果前需要的响应数（默认 20）
+            window: 保留的近期响应时间个数（默认 256）
+            max_extra: 对冲请求占请求总数的最大比例（默认 0.05）
+            alternate: 发送对冲请求的备用 AsyncSession（如使用其他代理），None 表示同一会话
+            methods: 允许对冲的方法（默认 GET/HEAD/OPTIONS）
+        """
+        ...
+
+    def observe(self, seconds: float) -> None:
+        """记录一次响应时间"""
+        ...
+
+    def delay(self, hedge_after_ms: Optional[float] = None) -> Optional[float]:
+        """对冲前等待的秒数，尚无可用延迟时返回 None"""
+        ...
+
+class PreparedRequest:
+    """
+    可复用的请求模板（Session.prepare() / AsyncSession.prepare() 创建）
+
+    URL、请求体和有序请求头列表只构建一次，每次 send() 只填入 Cookie（来自 CookieJar 缓存），
+    也可按次替换 URL 或请求体；会话默认请求头在 prepare 时固定，可迭代请求体只能发送一次
+    """
+    method: str
+    url: str
+    body: Any
+    headers: Optional[HeadersType]
+    header_plan: Tuple[Tuple[Tuple[str, str], ...], Tuple[Tuple[str, str], ...], Tuple[Tuple[str, str], ...]]
+
+    @property
+    def header_list(self) -> List[Tuple[str, str]]:
+        """固定的请求头（按发送顺序，不含每次填入的 Cookie）"""
+        ...
+
 class Session:
     """Session 对象 - 兼容 requests.Session"""
 
-    def __init__(self, client: Any, session_id: str, verify: bool = True) -> None: ...
+    max_redirects: int  # 每个请求最多跟随的重定向次数（默认 30）
+    rate_limiter: Optional[RateLimiter]  # 按主机/代理的令牌桶限速（可在多个会话间共享）
+    retry: Optional[Retry]  # 重试策略（None 表示不重试）
+    retry_budget: RetryBudget  # 本会话的重试预算，限制重试放大
+
+    def __init__(
+        self,
+        client: Any,
+        session_id: str,
+        verify: bool = True,
+        proxy: Optional[str] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry: Optional[Retry] = None
+    ) -> None: ...
 
     @property
     def cookies(self) -> CookieJar: ...
@@ -86,11 +373,43 @@ class Session:
         cookies: Optional[CookiesType] = None,
         data: DataType = None,
         json: Optional[Dict[str, Any]] = None,
-        timeout: Optional[float] = None,
+        timeout: TimeoutType = None,
         verify: Optional[bool] = None,
-        allow_redirects: bool = True
+        allow_redirects: bool = True,
+        stream: bool = False,
+        cancel_token: Optional[CancelToken] = None
     ) -> Response: ...
 
+    def prepare(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[HeadersType] = None,
+        data: DataType = None,
+        json: Optional[Dict[str, Any]] = None
+    ) -> PreparedRequest:
+        """预先构建请求（校验 URL、编码请求体、固定请求头顺序），供热点接口用 send() 反复发送"""
+        ...
+
+    def send(
+        self,
+        prepared: PreparedRequest,
+        *,
+        url: Optional[str] = None,
+        params: Optional[Dict[str, Any]] = None,
+        cookies: Optional[CookiesType] = None,
+        data: DataType = None,
+        json: Optional[Dict[str, Any]] = None,
+        timeout: TimeoutType = None,
+        allow_redirects: bool = True,
+        stream: bool = False,
+        cancel_token: Optional[CancelToken] = None
+    ) -> Response:
+        """发送 PreparedRequest；url/params、data/json 仅替换本次的 URL 与请求体，请求头保持不变"""
+        ...
+
     def get(
         self,
         url: str,
@@ -98,9 +417,10 @@ class Session:
         params: Optional[Dict[str, Any]] = None,
         headers: Optional[HeadersType] = None,
         cookies: Optional[CookiesType] = None,
-        timeout: Optional[float] = None,
+        timeout: TimeoutType = None,
         verify: Optional[bool] = None,
-        allow_redirects: bool = True
+        allow_redirects: bool = True,
+        stream: bool = False
     ) -> Response: ...
 
     def post(
@@ -112,9 +432,10 @@ class Session:
         cookies: Optional[CookiesType] = None,
         data: DataType = None,
         json: Optional[Dict[str, Any]] = None,
-        timeout: Optional[float] = None,
+        timeout: TimeoutType = None,
         verify: Optional[bool] = None,
-        allow_redirects: bool = True
+        allow_redirects: bool = True,
+        stream: bool = False
     ) -> Response: ...
 
     def put(
@@ -126,9 +447,10 @@ class Session:
         cookies: Optional[CookiesType] = None,
         data: DataType = None,
         json: Optional[Dict[str, Any]] = None,
-        timeout: Optional[float] = None,
+        timeout: TimeoutType = None,
         verify: Optional[bool] = None,
-        allow_redirects: bool = True
+        allow_redirects: bool = True,
+        stream: bool = False
     ) -> Response: ...
 
     def delete(
@@ -138,9 +460,10 @@ class Session:
         params: Optional[Dict[str, Any]] = None,
         headers: Optional[HeadersType] = None,
         cookies: Optional[CookiesType] = None,
-        timeout: Optional[float] = None,
+        timeout: TimeoutType = None,
         verify: Optional[bool] = None,
-        allow_redirects: bool = True
+        allow_redirects: bool = True,
+        stream: bool = False
     ) -> Response: ...
 
     def patch(
@@ -152,9 +475,10 @@ class Session:
         cookies: Optional[CookiesType] = None,
         data: DataType = None,
         json: Optional[Dict[str, Any]] = None,
-        timeout: Optional[float] = None,
+        timeout: TimeoutType = None,
         verify: Optional[bool] = None,
-        allow_redirects: bool = True
+        allow_redirects: bool = True,
+        stream: bool = False
     ) -> Response: ...
 
     def head(
@@ -164,9 +488,10 @@ class Session:
         params: Optional[Dict[str, Any]] = None,
         headers: Optional[HeadersType] = None,
         cookies: Optional[CookiesType] = None,
-        timeout: Optional[float] = None,
+        timeout: TimeoutType = None,
         verify: Optional[bool] = None,
-        allow_redirects: bool = True
+        allow_redirects: bool = True,
+        stream: bool = False
     ) -> Response: ...
 
     def options(
@@ -176,9 +501,10 @@ class Session:
         params: Optional[Dict[str, Any]] = None,
         headers: Optional[HeadersType] = None,
         cookies: Optional[CookiesType] = None,
-        timeout: Optional[float] = None,
+        timeout: TimeoutType = None,
         verify: Optional[bool] = None,
-        allow_redirects: bool = True
+        allow_redirects: bool = True,
+        stream: bool = False
     ) -> Response: ...
 
     def upload_file(
@@ -190,7 +516,7 @@ class Session:
         additional_fields: Optional[Dict[str, str]] = None,
         headers: Optional[HeadersType] = None,
         cookies: Optional[CookiesType] = None,
-        timeout: Optional[float] = None,
+        timeout: TimeoutType = None,
         verify: Optional[bool] = None
     ) -> Response: ...
 
@@ -201,11 +527,36 @@ class Session:
         *,
         headers: Optional[HeadersType] = None,
         cookies: Optional[CookiesType] = None,
-        timeout: Optional[float] = None,
+        timeout: TimeoutType = None,
         verify: Optional[bool] = None,
         chunk_size: int = 8192
     ) -> Dict[str, Any]: ...
 
+    def request_many(
+        self,
+        requests: Iterable[Union[str, Dict[str, Any]]],
+        *,
+        window: int = 64,
+        timeout: TimeoutType = None,
+        allow_redirects: bool = True
+    ) -> Iterator[Tuple[int, Union[Response, BaseException]]]:
+        """一次原生调用批量发送请求，按完成顺序返回 (index, Response 或异常)"""
+        ...
+
+    def preconnect(
+        self,
+        urls: Iterable[str],
+        *,
+        window: int = 32,
+        timeout: TimeoutType = 10
+    ) -> Dict[str, Union[int, BaseException]]:
+        """预连接：对每个源（scheme/host/port）发送一次 HEAD，提前完成 DNS 与 TCP/TLS 或 QUIC 握手，返回 {源: 状态码或异常}"""
+        ...
+
+    def stats(self) -> Dict[str, Any]:
+        """会话请求统计：请求数、按状态码计数、错误/超时/取消数、收发字节数、延迟分位数（总体与按主机）及活跃请求数"""
+        ...
+
     def close(self) -> None: ...
     def __enter__(self) -> Session: ...
     def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None: ...
@@ -214,7 +565,22 @@ class Session:
 class AsyncSession:
     """Async Session 对象 - 支持 async/await"""
 
-    def __init__(self, client: Any, session_id: str, verify: bool = True) -> None: ...
+    max_redirects: int  # 每个请求最多跟随的重定向次数（默认 30）
+    rate_limiter: Optional[RateLimiter]  # 按主机/代理的令牌桶限速（可在多个会话间共享）
+    retry: Optional[Retry]  # 重试策略（None 表示不重试）
+    retry_budget: RetryBudget  # 本会话的重试预算，限制重试放大
+    hedge: Optional[Hedge]  # 对冲策略（None 表示不对冲）
+
+    def __init__(
+        self,
+        client: Any,
+        session_id: str,
+        verify: bool = True,
+        proxy: Optional[str] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry: Optional[Retry] = None,
+        hedge: Optional[Hedge] = None
+    ) -> None: ...
 
     @property
     def cookies(self) -> CookieJar: ...
@@ -229,11 +595,45 @@ class AsyncSession:
         cookies: Optional[CookiesType] = None,
         data: DataType = None,
         json: Optional[Dict[str, Any]] = None,
-        timeout: Optional[float] = None,
+        timeout: TimeoutType = None,
         verify: Optional[bool] = None,
-        allow_redirects: bool = True
+        allow_redirects: bool = True,
+        stream: bool = False,
+        cancel_token: Optional[CancelToken] = None,
+        hedge_after_ms: Optional[float] = None  # 超过该毫秒数未响应则发送对冲请求
     ) -> Response: ...
 
+    def prepare(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[HeadersType] = None,
+        data: DataType = None,
+        json: Optional[Dict[str, Any]] = None
+    ) -> PreparedRequest:
+        """预先构建请求（校验 URL、编码请求体、固定请求头顺序），供热点接口用 send() 反复发送"""
+        ...
+
+    async def send(
+        self,
+        prepared: PreparedRequest,
+        *,
+        url: Optional[str] = None,
+        params: Optional[Dict[str, Any]] = None,
+        cookies: Optional[CookiesType] = None,
+        data: DataType = None,
+        json: Optional[Dict[str, Any]] = None,
+        timeout: TimeoutType = None,
+        allow_redirects: bool = True,
+        stream: bool = False,
+        cancel_token: Optional[CancelToken] = None,
+        hedge_after_ms: Optional[float] = None
+    ) -> Response:
+        """发送 PreparedRequest；url/params、data/json 仅替换本次的 URL 与请求体，请求头保持不变"""
+        ...
+
     async def get(
         self,
         url: str,
@@ -241,9 +641,11 @@ class AsyncSession:
         params: Optional[Dict[str, Any]] = None,
         headers: Optional[HeadersType] = None,
         cookies: Optional[CookiesType] = None,
-        timeout: Optional[float] = None,
+        timeout: TimeoutType = None,
         verify: Optional[bool] = None,
-        allow_redirects: bool = True
+        allow_redirects: bool = True,
+        stream: bool = False,
+        hedge_after_ms: Optional[float] = None
     ) -> Response: ...
 
     async def post(
@@ -255,9 +657,10 @@ class AsyncSession:
         cookies: Optional[CookiesType] = None,
         data: DataType = None,
         json: Optional[Dict[str, Any]] = None,
-        timeout: Optional[float] = None,
+        timeout: TimeoutType = None,
         verify: Optional[bool] = None,
-        allow_redirects: bool = True
+        allow_redirects: bool = True,
+        stream: bool = False
     ) -> Response: ...
 
     async def put(
@@ -269,9 +672,10 @@ class AsyncSession:
         cookies: Optional[CookiesType] = None,
         data: DataType = None,
         json: Optional[Dict[str, Any]] = None,
-        timeout: Optional[float] = None,
+        timeout: TimeoutType = None,
         verify: Optional[bool] = None,
-        allow_redirects: bool = True
+        allow_redirects: bool = True,
+        stream: bool = False
     ) -> Response: ...
 
     async def delete(
@@ -281,9 +685,10 @@ class AsyncSession:
         params: Optional[Dict[str, Any]] = None,
         headers: Optional[HeadersType] = None,
         cookies: Optional[CookiesType] = None,
-        timeout: Optional[float] = None,
+        timeout: TimeoutType = None,
         verify: Optional[bool] = None,
-        allow_redirects: bool = True
+        allow_redirects: bool = True,
+        stream: bool = False
     ) -> Response: ...
 
     async def patch(
@@ -295,9 +700,10 @@ class AsyncSession:
         cookies: Optional[CookiesType] = None,
         data: DataType = None,
         json: Optional[Dict[str, Any]] = None,
-        timeout: Optional[float] = None,
+        timeout: TimeoutType = None,
         verify: Optional[bool] = None,
-        allow_redirects: bool = True
+        allow_redirects: bool = True,
+        stream: bool = False
     ) -> Response: ...
 
     async def head(
@@ -307,9 +713,11 @@ class AsyncSession:
         params: Optional[Dict[str, Any]] = None,
         headers: Optional[HeadersType] = None,
         cookies: Optional[CookiesType] = None,
-        timeout: Optional[float] = None,
+        timeout: TimeoutType = None,
         verify: Optional[bool] = None,
-        allow_redirects: bool = True
+        allow_redirects: bool = True,
+        stream: bool = False,
+        hedge_after_ms: Optional[float] = None
     ) -> Response: ...
 
     async def options(
@@ -319,9 +727,11 @@ class AsyncSession:
         params: Optional[Dict[str, Any]] = None,
         headers: Optional[HeadersType] = None,
         cookies: Optional[CookiesType] = None,
-        timeout: Optional[float] = None,
+        timeout: TimeoutType = None,
         verify: Optional[bool] = None,
-        allow_redirects: bool = True
+        allow_redirects: bool = True,
+        stream: bool = False,
+        hedge_after_ms: Optional[float] = None
     ) -> Response: ...
 
     async def upload_file(
@@ -333,7 +743,7 @@ class AsyncSession:
         additional_fields: Optional[Dict[str, str]] = None,
         headers: Optional[HeadersType] = None,
         cookies: Optional[CookiesType] = None,
-        timeout: Optional[float] = None,
+        timeout: TimeoutType = None,
         verify: Optional[bool] = None
     ) -> Response: ...
 
@@ -344,11 +754,37 @@ class AsyncSession:
         *,
         headers: Optional[HeadersType] = None,
         cookies: Optional[CookiesType] = None,
-        timeout: Optional[float] = None,
+        timeout: TimeoutType = None,
         verify: Optional[bool] = None,
         chunk_size: int = 8192
     ) -> Dict[str, Any]: ...
 
+    async def gather(
+        self,
+        requests: Iterable[Union[str, Dict[str, Any]]],
+        *,
+        window: int = 64,
+        timeout: TimeoutType = None,
+        allow_redirects: bool = True,
+        return_exceptions: bool = False
+    ) -> List[Union[Response, BaseException]]:
+        """一次原生调用批量发送请求，按输入顺序返回结果（最多 window 个请求同时进行）"""
+        ...
+
+    async def apreconnect(
+        self,
+        urls: Iterable[str],
+        *,
+        window: int = 32,
+        timeout: TimeoutType = 10
+    ) -> Dict[str, Union[int, BaseException]]:
+        """异步预连接，同 Session.preconnect"""
+        ...
+
+    def stats(self) -> Dict[str, Any]:
+        """会话请求统计：请求数、按状态码计数、错误/超时/取消数、收发字节数、延迟分位数（总体与按主机）及活跃请求数"""
+        ...
+
     async def close(self) -> None: ...
     async def __aenter__(self) -> AsyncSession: ...
     async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None: ...
@@ -361,7 +797,19 @@ def CronetClient(
     verify: bool = True,
     proxies: Optional[Union[str, Dict[str, str]]] = None,
     timeout_ms: int = 30000,
-    chrometls: Optional[str] = "chrome_144"
+    chrometls: Optional[str] = "chrome_144",
+    share_engine: bool = False,
+    callback_threads: int = 0,
+    max_concurrency: int = 0,
+    max_per_host: int = 0,
+    cache_mode: Optional[str] = None,
+    cache_max_bytes: int = 0,
+    cache_dir: Optional[str] = None,
+    storage_path: Optional[str] = None,
+    quic_hints: Optional[List[Union[str, Tuple[str, int, int]]]] = None,
+    rate_limiter: Optional[RateLimiter] = None,
+    retry: Optional[Retry] = None,
+    cookie_file: Optional[str] = None
 ) -> Session:
     """
     创建 Cronet Session - 类似 requests.Session()
@@ -371,6 +819,24 @@ def CronetClient(
         proxies: 代理配置，支持字典格式 {"https": "http://127.0.0.1:8080"} 或字符串
         timeout_ms: 超时时间（毫秒）
         chrometls: TLS 指纹配置名称（如 "chrome_144"）
+        share_engine: 与相同 verify/proxies/chrometls 配置的其他会话共享 Cronet Engine
+            （连接池、DNS 与 TLS 会话缓存），Cookie 仍按会话隔离
+        callback_threads: 执行 Cronet 回调的线程数（0 表示在网络线程上同步执行，默认）
+        max_concurrency: 会话最大并发请求数（0 表示不限制），超出的请求按 FIFO 排队，
+            排队时间见 response.timings.queue_ms，超时从离开队列时开始计算
+        max_per_host: 每个主机的最大并发请求数（0 表示不限制）
+        cache_mode: Cronet HTTP 缓存模式：None/"disabled"、"memory" 或 "disk"，
+            命中缓存的响应 response.from_cache 为 True
+        cache_max_bytes: HTTP 缓存容量上限（字节，0 表示使用 Cronet 默认值）
+        cache_dir: 磁盘缓存目录（"disk" 模式必需），使用磁盘缓存的会话按网络配置共享 Engine
+        storage_path: 网络状态持久化目录（Alt-Svc、QUIC 服务器配置、HTTP/2 支持、DNS 缓存），
+            Engine 的最后一个会话关闭时写入；与 cache_dir 同时设置时须为同一目录
+        quic_hints: 已知支持 QUIC 的主机，(host, port, alternate_port) 或主机名（端口 443），
+            首个请求直接走 QUIC，无需先经 TCP 再通过 Alt-Svc 发现
+        rate_limiter: 按主机与代理限速的 RateLimiter，多个会话共享同一个实例即共享配额
+        retry: 重试策略 Retry（None 表示不重试），重试次数受 session.retry_budget 限制
+        cookie_file: Cookie 持久化文件，先加载其中的 Cookie，之后的变化由后台线程追加写入
+            （见 CookieJar.open_journal），session.close() 时写完
 
     Returns:
         Session 对象
@@ -382,7 +848,20 @@ def AsyncCronetClient(
     verify: bool = True,
     proxies: Optional[Union[str, Dict[str, str]]] = None,
     timeout_ms: int = 30000,
-    chrometls: Optional[str] = "chrome_144"
+    chrometls: Optional[str] = "chrome_144",
+    share_engine: bool = False,
+    callback_threads: int = 0,
+    max_concurrency: int = 0,
+    max_per_host: int = 0,
+    cache_mode: Optional[str] = None,
+    cache_max_bytes: int = 0,
+    cache_dir: Optional[str] = None,
+    storage_path: Optional[str] = None,
+    quic_hints: Optional[List[Union[str, Tuple[str, int, int]]]] = None,
+    rate_limiter: Optional[RateLimiter] = None,
+    retry: Optional[Retry] = None,
+    hedge: Optional[Hedge] = None,
+    cookie_file: Optional[str] = None
 ) -> AsyncSession:
     """
     创建异步 Cronet Session - 支持 async/await
@@ -392,20 +871,69 @@ def AsyncCronetClient(
         proxies: 代理配置，支持字典格式 {"https": "http://127.0.0.1:8080"} 或字符串
         timeout_ms: 超时时间（毫秒）
         chrometls: TLS 指纹配置名称（如 "chrome_144"）
+        share_engine: 与相同 verify/proxies/chrometls 配置的其他会话共享 Cronet Engine
+            （连接池、DNS 与 TLS 会话缓存），Cookie 仍按会话隔离
+        callback_threads: 执行 Cronet 回调的线程数（0 表示在网络线程上同步执行，默认）
+        max_concurrency: 会话最大并发请求数（0 表示不限制），超出的请求按 FIFO 排队，
+            排队时间见 response.timings.queue_ms，超时从离开队列时开始计算
+        max_per_host: 每个主机的最大并发请求数（0 表示不限制）
+        cache_mode: Cronet HTTP 缓存模式：None/"disabled"、"memory" 或 "disk"，
+            命中缓存的响应 response.from_cache 为 True
+        cache_max_bytes: HTTP 缓存容量上限（字节，0 表示使用 Cronet 默认值）
+        cache_dir: 磁盘缓存目录（"disk" 模式必需），使用磁盘缓存的会话按网络配置共享 Engine
+        storage_path: 网络状态持久化目录（Alt-Svc、QUIC 服务器配置、HTTP/2 支持、DNS 缓存），
+            Engine 的最后一个会话关闭时写入；与 cache_dir 同时设置时须为同一目录
+        quic_hints: 已知支持 QUIC 的主机，(host, port, alternate_port) 或主机名（端口 443），
+            首个请求直接走 QUIC，无需先经 TCP 再通过 Alt-Svc 发现
+        rate_limiter: 按主机与代理限速的 RateLimiter，多个会话共享同一个实例即共享配额
+        retry: 重试策略 Retry（None 表示不重试），重试次数受 session.retry_budget 限制
+        hedge: 对冲策略 Hedge，慢请求超时后再发一份，先返回者胜
+        cookie_file: Cookie 持久化文件，先加载其中的 Cookie，之后的变化由后台线程追加写入
+            （见 CookieJar.open_journal），session.close() 时写完
 
     Returns:
         AsyncSession 对象
     """
     ...
 
-# 模块级别的便捷函数
+def warm_storage(
+    urls: Iterable[str],
+    storage_path: str,
+    *,
+    rounds: int = 2,
+    window: int = 32,
+    timeout: TimeoutType = 10,
+    **client_options: Any
+) -> Dict[str, Union[int, BaseException]]:
+    """
+    在接入流量前预热 storage_path：对每个 URL 发送 HEAD 请求后关闭客户端写入磁盘，
+    第二轮起走 QUIC 并保存其服务器配置。client_options 须与线上客户端的网络配置一致
+
+    Returns:
+        {url: 状态码或异常}（最后一轮）
+    """
+    ...
+
+def metrics_snapshot() -> Dict[str, Any]:
+    """进程级请求统计（所有会话与客户端），字段同 Session.stats()，另含 engines（存活的 Engine 数量）"""
+    ...
+
+def close_default_clients() -> None:
+    """
+    关闭模块级函数（get/post/async_get 等）共享的默认客户端
+
+    解释器退出时会自动调用；之后的模块级调用会按需重新创建客户端
+    """
+    ...
+
+# 模块级别的便捷函数（同一配置复用共享的默认客户端）
 def get(
     url: str,
     *,
     params: Optional[Dict[str, Any]] = None,
     headers: Optional[HeadersType] = None,
     cookies: Optional[CookiesType] = None,
-    timeout: Optional[float] = None,
+    timeout: TimeoutType = None,
     verify: bool = True,
     allow_redirects: bool = True,
     proxies: Optional[Union[str, Dict[str, str]]] = None,
@@ -420,7 +948,7 @@ def post(
     cookies: Optional[CookiesType] = None,
     data: DataType = None,
     json: Optional[Dict[str, Any]] = None,
-    timeout: Optional[float] = None,
+    timeout: TimeoutType = None,
     verify: bool = True,
     allow_redirects: bool = True,
     proxies: Optional[Union[str, Dict[str, str]]] = None,
@@ -435,7 +963,7 @@ def put(
     cookies: Optional[CookiesType] = None,
     data: DataType = None,
     json: Optional[Dict[str, Any]] = None,
-    timeout: Optional[float] = None,
+    timeout: TimeoutType = None,
     verify: bool = True,
     allow_redirects: bool = True,
     proxies: Optional[Union[str, Dict[str, str]]] = None,
@@ -448,7 +976,7 @@ def delete(
     params: Optional[Dict[str, Any]] = None,
     headers: Optional[HeadersType] = None,
     cookies: Optional[CookiesType] = None,
-    timeout: Optional[float] = None,
+    timeout: TimeoutType = None,
     verify: bool = True,
     allow_redirects: bool = True,
     proxies: Optional[Union[str, Dict[str, str]]] = None,
@@ -463,7 +991,7 @@ def patch(
     cookies: Optional[CookiesType] = None,
     data: DataType = None,
     json: Optional[Dict[str, Any]] = None,
-    timeout: Optional[float] = None,
+    timeout: TimeoutType = None,
     verify: bool = True,
     allow_redirects: bool = True,
     proxies: Optional[Union[str, Dict[str, str]]] = None,
@@ -476,7 +1004,7 @@ def head(
     params: Optional[Dict[str, Any]] = None,
     headers: Optional[HeadersType] = None,
     cookies: Optional[CookiesType] = None,
-    timeout: Optional[float] = None,
+    timeout: TimeoutType = None,
     verify: bool = True,
     allow_redirects: bool = True,
     proxies: Optional[Union[str, Dict[str, str]]] = None,
@@ -489,7 +1017,7 @@ def options(
     params: Optional[Dict[str, Any]] = None,
     headers: Optional[HeadersType] = None,
     cookies: Optional[CookiesType] = None,
-    timeout: Optional[float] = None,
+    timeout: TimeoutType = None,
     verify: bool = True,
     allow_redirects: bool = True,
     proxies: Optional[Union[str, Dict[str, str]]] = None,
@@ -504,8 +1032,10 @@ def upload_file(
     additional_fields: Optional[Dict[str, str]] = None,
     headers: Optional[HeadersType] = None,
     cookies: Optional[CookiesType] = None,
-    timeout: Optional[float] = None,
-    verify: bool = True
+    timeout: TimeoutType = None,
+    verify: bool = True,
+    proxies: Optional[Union[str, Dict[str, str]]] = None,
+    chrometls: Optional[str] = "chrome_144"
 ) -> Response: ...
 
 def download_file(
@@ -514,9 +1044,11 @@ def download_file(
     *,
     headers: Optional[HeadersType] = None,
     cookies: Optional[CookiesType] = None,
-    timeout: Optional[float] = None,
+    timeout: TimeoutType = None,
     verify: bool = True,
-    chunk_size: int = 8192
+    chunk_size: int = 8192,
+    proxies: Optional[Union[str, Dict[str, str]]] = None,
+    chrometls: Optional[str] = "chrome_144"
 ) -> Dict[str, Any]: ...
 
 
@@ -527,9 +1059,11 @@ async def async_get(
     params: Optional[Dict[str, Any]] = None,
     headers: Optional[HeadersType] = None,
     cookies: Optional[CookiesType] = None,
-    timeout: Optional[float] = None,
+    timeout: TimeoutType = None,
     verify: bool = True,
-    allow_redirects: bool = True
+    allow_redirects: bool = True,
+    proxies: Optional[Union[str, Dict[str, str]]] = None,
+    chrometls: Optional[str] = "chrome_144"
 ) -> Response: ...
 
 async def async_post(
@@ -540,9 +1074,11 @@ async def async_post(
     cookies: Optional[CookiesType] = None,
     data: DataType = None,
     json: Optional[Dict[str, Any]] = None,
-    timeout: Optional[float] = None,
+    timeout: TimeoutType = None,
     verify: bool = True,
-    allow_redirects: bool = True
+    allow_redirects: bool = True,
+    proxies: Optional[Union[str, Dict[str, str]]] = None,
+    chrometls: Optional[str] = "chrome_144"
 ) -> Response: ...
 
 async def async_put(
@@ -553,9 +1089,11 @@ async def async_put(
     cookies: Optional[CookiesType] = None,
     data: DataType = None,
     json: Optional[Dict[str, Any]] = None,
-    timeout: Optional[float] = None,
+    timeout: TimeoutType = None,
     verify: bool = True,
-    allow_redirects: bool = True
+    allow_redirects: bool = True,
+    proxies: Optional[Union[str, Dict[str, str]]] = None,
+    chrometls: Optional[str] = "chrome_144"
 ) -> Response: ...
 
 async def async_delete(
@@ -564,9 +1102,11 @@ async def async_delete(
     params: Optional[Dict[str, Any]] = None,
     headers: Optional[HeadersType] = None,
     cookies: Optional[CookiesType] = None,
-    timeout: Optional[float] = None,
+    timeout: TimeoutType = None,
     verify: bool = True,
-    allow_redirects: bool = True
+    allow_redirects: bool = True,
+    proxies: Optional[Union[str, Dict[str, str]]] = None,
+    chrometls: Optional[str] = "chrome_144"
 ) -> Response: ...
 
 async def async_patch(
@@ -577,9 +1117,11 @@ async def async_patch(
     cookies: Optional[CookiesType] = None,
     data: DataType = None,
     json: Optional[Dict[str, Any]] = None,
-    timeout: Optional[float] = None,
+    timeout: TimeoutType = None,
     verify: bool = True,
-    allow_redirects: bool = True
+    allow_redirects: bool = True,
+    proxies: Optional[Union[str, Dict[str, str]]] = None,
+    chrometls: Optional[str] = "chrome_144"
 ) -> Response: ...
 
 async def async_head(
@@ -588,9 +1130,11 @@ async def async_head(
     params: Optional[Dict[str, Any]] = None,
     headers: Optional[HeadersType] = None,
     cookies: Optional[CookiesType] = None,
-    timeout: Optional[float] = None,
+    timeout: TimeoutType = None,
     verify: bool = True,
-    allow_redirects: bool = True
+    allow_redirects: bool = True,
+    proxies: Optional[Union[str, Dict[str, str]]] = None,
+    chrometls: Optional[str] = "chrome_144"
 ) -> Response: ...
 
 async def async_options(
@@ -599,9 +1143,11 @@ async def async_options(
     params: Optional[Dict[str, Any]] = None,
     headers: Optional[HeadersType] = None,
     cookies: Optional[CookiesType] = None,
-    timeout: Optional[float] = None,
+    timeout: TimeoutType = None,
     verify: bool = True,
-    allow_redirects: bool = True
+    allow_redirects: bool = True,
+    proxies: Optional[Union[str, Dict[str, str]]] = None,
+    chrometls: Optional[str] = "chrome_144"
 ) -> Response: ...
 
 async def async_upload_file(
@@ -612,8 +1158,10 @@ async def async_upload_file(
     additional_fields: Optional[Dict[str, str]] = None,
     headers: Optional[HeadersType] = None,
     cookies: Optional[CookiesType] = None,
-    timeout: Optional[float] = None,
-    verify: bool = True
+    timeout: TimeoutType = None,
+    verify: bool = True,
+    proxies: Optional[Union[str, Dict[str, str]]] = None,
+    chrometls: Optional[str] = "chrome_144"
 ) -> Response: ...
 
 async def async_download_file(
@@ -622,9 +1170,11 @@ async def async_download_file(
     *,
     headers: Optional[HeadersType] = None,
     cookies: Optional[CookiesType] = None,
-    timeout: Optional[float] = None,
+    timeout: TimeoutType = None,
     verify: bool = True,
-    chunk_size: int = 8192
+    chunk_size: int = 8192,
+    proxies: Optional[Union[str, Dict[str, str]]] = None,
+    chrometls: Optional[str] = "chrome_144"
 ) -> Dict[str, Any]: ...
 
 
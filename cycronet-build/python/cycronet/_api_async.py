@@ -2,60 +2,109 @@
 Asynchronous module-level API functions for cycronet.
 """
 
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Union
 
-from ._types import HeadersType, CookiesType, DataType
+from ._types import HeadersType, CookiesType, DataType, TimeoutType
 from ._response import Response
-from ._client import AsyncCronetClient
+from ._client import default_async_session
 
 
-async def async_get(url: str, *, verify: bool = True, timeout: Optional[float] = None, **kwargs) -> Response:
+async def async_get(
+    url: str,
+    *,
+    verify: bool = True,
+    timeout: TimeoutType = None,
+    proxies: Optional[Union[str, Dict[str, str]]] = None,
+    chrometls: Optional[str] = "chrome_144",
+    **kwargs
+) -> Response:
     """Async GET request"""
-    timeout_ms = int(timeout * 1000) if timeout else 30000
-    async with AsyncCronetClient(verify=verify, timeout_ms=timeout_ms) as session:
-        return await session.get(url, **kwargs)
+    session = default_async_session(verify=verify, proxies=proxies, chrometls=chrometls)
+    return await session.get(url, timeout=timeout, **kwargs)
 
 
-async def async_post(url: str, *, verify: bool = True, timeout: Optional[float] = None, **kwargs) -> Response:
+async def async_post(
+    url: str,
+    *,
+    verify: bool = True,
+    timeout: TimeoutType = None,
+    proxies: Optional[Union[str, Dict[str, str]]] = None,
+    chrometls: Optional[str] = "chrome_144",
+    **kwargs
+) -> Response:
     """Async POST request"""
-    timeout_ms = int(timeout * 1000) if timeout else 30000
-    async with AsyncCronetClient(verify=verify, timeout_ms=timeout_ms) as session:
-        return await session.post(url, **kwargs)
+    session = default_async_session(verify=verify, proxies=proxies, chrometls=chrometls)
+    return await session.post(url, timeout=timeout, **kwargs)
 
 
-async def async_put(url: str, *, verify: bool = True, timeout: Optional[float] = None, **kwargs) -> Response:
+async def async_put(
+    url: str,
+    *,
+    verify: bool = True,
+    timeout: TimeoutType = None,
+    proxies: Optional[Union[str, Dict[str, str]]] = None,
+    chrometls: Optional[str] = "chrome_144",
+    **kwargs
+) -> Response:
     """Async PUT request"""
-    timeout_ms = int(timeout * 1000) if timeout else 30000
-    async with AsyncCronetClient(verify=verify, timeout_ms=timeout_ms) as session:
-        return await session.put(url, **kwargs)
+    session = default_async_session(verify=verify, proxies=proxies, chrometls=chrometls)
+    return await session.put(url, timeout=timeout, **kwargs)
 
 
-async def async_delete(url: str, *, verify: bool = True, timeout: Optional[float] = None, **kwargs) -> Response:
+async def async_delete(
+    url: str,
+    *,
+    verify: bool = True,
+    timeout: TimeoutType = None,
+    proxies: Optional[Union[str, Dict[str, str]]] = None,
+    chrometls: Optional[str] = "chrome_144",
+    **kwargs
+) -> Response:
     """Async DELETE request"""
-    timeout_ms = int(timeout * 1000) if timeout else 30000
-    async with AsyncCronetClient(verify=verify, timeout_ms=timeout_ms) as session:
-        return await session.delete(url, **kwargs)
+    session = default_async_session(verify=verify, proxies=proxies, chrometls=chrometls)
+    return await session.delete(url, timeout=timeout, **kwargs)
 
 
-async def async_patch(url: str, *, verify: bool = True, timeout: Optional[float] = None, **kwargs) -> Response:
+async def async_patch(
+    url: str,
+    *,
+    verify: bool = True,
+    timeout: TimeoutType = None,
+    proxies: Optional[Union[str, Dict[str, str]]] = None,
+    chrometls: Optional[str] = "chrome_144",
+    **kwargs
+) -> Response:
     """Async PATCH request"""
-    timeout_ms = int(timeout * 1000) if timeout else 30000
-    async with AsyncCronetClient(verify=verify, timeout_ms=timeout_ms) as session:
-        return await session.patch(url, **kwargs)
+    session = default_async_session(verify=verify, proxies=proxies, chrometls=chrometls)
+    return await session.patch(url, timeout=timeout, **kwargs)
 
 
-async def async_head(url: str, *, verify: bool = True, timeout: Optional[float] = None, **kwargs) -> Response:
+async def async_head(
+    url: str,
+    *,
+    verify: bool = True,
+    timeout: TimeoutType = None,
+    proxies: Optional[Union[str, Dict[str, str]]] = None,
+    chrometls: Optional[str] = "chrome_144",
+    **kwargs
+) -> Response:
     """Async HEAD request"""
-    timeout_ms = int(timeout * 1000) if timeout else 30000
-    async with AsyncCronetClient(verify=verify, timeout_ms=timeout_ms) as session:
-        return await session.head(url, **kwargs)
+    session = default_async_session(verify=verify, proxies=proxies, chrometls=chrometls)
+    return await session.head(url, timeout=timeout, **kwargs)
 
 
-async def async_options(url: str, *, verify: bool = True, timeout: Optional[float] = None, **kwargs) -> Response:
+async def async_options(
+    url: str,
+    *,
+    verify: bool = True,
+    timeout: TimeoutType = None,
+    proxies: Optional[Union[str, Dict[str, str]]] = None,
+    chrometls: Optional[str] = "chrome_144",
+    **kwargs
+) -> Response:
     """Async OPTIONS request"""
-    timeout_ms = int(timeout * 1000) if timeout else 30000
-    async with AsyncCronetClient(verify=verify, timeout_ms=timeout_ms) as session:
-        return await session.options(url, **kwargs)
+    session = default_async_session(verify=verify, proxies=proxies, chrometls=chrometls)
+    return await session.options(url, timeout=timeout, **kwargs)
 
 
 async def async_upload_file(
@@ -65,19 +114,21 @@ async def async_upload_file(
     field_name: str = "file",
     additional_fields: Optional[Dict[str, str]] = None,
     verify: bool = True,
-    timeout: Optional[float] = None,
+    timeout: TimeoutType = None,
+    proxies: Optional[Union[str, Dict[str, str]]] = None,
+    chrometls: Optional[str] = "chrome_144",
     **kwargs
 ) -> Response:
     """Async upload file"""
-    timeout_ms = int(timeout * 1000) if timeout else 30000
-    async with AsyncCronetClient(verify=verify, timeout_ms=timeout_ms) as session:
-        return await session.upload_file(
-            url,
-            file_path,
-            field_name=field_name,
-            additional_fields=additional_fields,
-            **kwargs
-        )
+    session = default_async_session(verify=verify, proxies=proxies, chrometls=chrometls)
+    return await session.upload_file(
+        url,
+        file_path,
+        field_name=field_name,
+        additional_fields=additional_fields,
+        timeout=timeout,
+        **kwargs
+    )
 
 
 async def async_download_file(
@@ -85,16 +136,18 @@ async def async_download_file(
     save_path: str,
     *,
     verify: bool = True,
-    timeout: Optional[float] = None,
+    timeout: TimeoutType = None,
     chunk_size: int = 8192,
+    proxies: Optional[Union[str, Dict[str, str]]] = None,
+    chrometls: Optional[str] = "chrome_144",
     **kwargs
 ) -> Dict[str, Any]:
     """Async download file"""
-    timeout_ms = int(timeout * 1000) if timeout else 30000
-    async with AsyncCronetClient(verify=verify, timeout_ms=timeout_ms) as session:
-        return await session.download_file(
-            url,
-            save_path,
-            chunk_size=chunk_size,
-            **kwargs
-        )
+    session = default_async_session(verify=verify, proxies=proxies, chrometls=chrometls)
+    return await session.download_file(
+        url,
+        save_path,
+        timeout=timeout,
+        chunk_size=chunk_size,
+        **kwargs
+    )
@@ -4,9 +4,9 @@ Synchronous module-level API functions for cycronet.
 
 from typing import Optional, Dict, Any, Union
 
-from ._types import HeadersType, CookiesType, DataType
+from ._types import HeadersType, CookiesType, DataType, TimeoutType
 from ._response import Response
-from ._client import CronetClient
+from ._client import default_session
 
 
 def get(
@@ -15,7 +15,7 @@ def get(
     params: Optional[Dict[str, Any]] = None,
     headers: Optional[HeadersType] = None,
     cookies: Optional[CookiesType] = None,
-    timeout: Optional[float] = None,
+    timeout: TimeoutType = None,
     verify: bool = True,
     allow_redirects: bool = True,
     proxies: Optional[Union[str, Dict[str, str]]] = None,
@@ -23,17 +23,17 @@ def get(
     **kwargs
 ) -> Response:
     """Send GET request - similar to requests.get()"""
-    timeout_ms = int(timeout * 1000) if timeout else 30000
-    with CronetClient(verify=verify, timeout_ms=timeout_ms, proxies=proxies, chrometls=chrometls) as session:
-        return session.get(
-            url,
-            params=params,
-            headers=headers,
-            cookies=cookies,
-            verify=verify,
-            allow_redirects=allow_redirects,
-            **kwargs
-        )
+    session = default_session(verify=verify, proxies=proxies, chrometls=chrometls)
+    return session.get(
+        url,
+        params=params,
+        headers=headers,
+        cookies=cookies,
+        timeout=timeout,
+        verify=verify,
+        allow_redirects=allow_redirects,
+        **kwargs
+    )
 
 
 def post(
@@ -44,7 +44,7 @@ def post(
     cookies: Optional[CookiesType] = None,
     data: DataType = None,
     json: Optional[Dict[str, Any]] = None,
-    timeout: Optional[float] = None,
+    timeout: TimeoutType = None,
     verify: bool = True,
     allow_redirects: bool = True,
     proxies: Optional[Union[str, Dict[str, str]]] = None,
@@ -52,19 +52,19 @@ def post(
     **kwargs
 ) -> Response:
     """Send POST request - similar to requests.post()"""
-    timeout_ms = int(timeout * 1000) if timeout else 30000
-    with CronetClient(verify=verify, timeout_ms=timeout_ms, proxies=proxies, chrometls=chrometls) as session:
-        return session.post(
-            url,
-            params=params,
-            headers=headers,
-            cookies=cookies,
-            data=data,
-            json=json,
-            verify=verify,
-            allow_redirects=allow_redirects,
-            **kwargs
-        )
+    session = default_session(verify=verify, proxies=proxies, chrometls=chrometls)
+    return session.post(
+        url,
+        params=params,
+        headers=headers,
+        cookies=cookies,
+        data=data,
+        json=json,
+        timeout=timeout,
+        verify=verify,
+        allow_redirects=allow_redirects,
+        **kwargs
+    )
 
 
 def put(
@@ -75,7 +75,7 @@ def put(
     cookies: Optional[CookiesType] = None,
     data: DataType = None,
     json: Optional[Dict[str, Any]] = None,
-    timeout: Optional[float] = None,
+    timeout: TimeoutType = None,
     verify: bool = True,
     allow_redirects: bool = True,
     proxies: Optional[Union[str, Dict[str, str]]] = None,
@@ -83,19 +83,19 @@ def put(
     **kwargs
 ) -> Response:
     """Send PUT request - similar to requests.put()"""
-    timeout_ms = int(timeout * 1000) if timeout else 30000
-    with CronetClient(verify=verify, timeout_ms=timeout_ms, proxies=proxies, chrometls=chrometls) as session:
-        return session.put(
-            url,
-            params=params,
-            headers=headers,
-            cookies=cookies,
-            data=data,
-            json=json,
-            verify=verify,
-            allow_redirects=allow_redirects,
-            **kwargs
-        )
+    session = default_session(verify=verify, proxies=proxies, chrometls=chrometls)
+    return session.put(
+        url,
+        params=params,
+        headers=headers,
+        cookies=cookies,
+        data=data,
+        json=json,
+        timeout=timeout,
+        verify=verify,
+        allow_redirects=allow_redirects,
+        **kwargs
+    )
 
 
 def delete(
@@ -104,7 +104,7 @@ def delete(
     params: Optional[Dict[str, Any]] = None,
     headers: Optional[HeadersType] = None,
     cookies: Optional[CookiesType] = None,
-    timeout: Optional[float] = None,
+    timeout: TimeoutType = None,
     verify: bool = True,
     allow_redirects: bool = True,
     proxies: Optional[Union[str, Dict[str, str]]] = None,
@@ -112,17 +112,17 @@ def delete(
     **kwargs
 ) -> Response:
     """Send DELETE request - similar to requests.delete()"""
-    timeout_ms = int(timeout * 1000) if timeout else 30000
-    with CronetClient(verify=verify, timeout_ms=timeout_ms, proxies=proxies, chrometls=chrometls) as session:
-        return session.delete(
-            url,
-            params=params,
-            headers=headers,
-            cookies=cookies,
-            verify=verify,
-            allow_redirects=allow_redirects,
-            **kwargs
-        )
+    session = default_session(verify=verify, proxies=proxies, chrometls=chrometls)
+    return session.delete(
+        url,
+        params=params,
+        headers=headers,
+        cookies=cookies,
+        timeout=timeout,
+        verify=verify,
+        allow_redirects=allow_redirects,
+        **kwargs
+    )
 
 
 def patch(
@@ -133,7 +133,7 @@ def patch(
     cookies: Optional[CookiesType] = None,
     data: DataType = None,
     json: Optional[Dict[str, Any]] = None,
-    timeout: Optional[float] = None,
+    timeout: TimeoutType = None,
     verify: bool = True,
     allow_redirects: bool = True,
     proxies: Optional[Union[str, Dict[str, str]]] = None,
@@ -141,19 +141,19 @@ def patch(
     **kwargs
 ) -> Response:
     """Send PATCH request - similar to requests.patch()"""
-    timeout_ms = int(timeout * 1000) if timeout else 30000
-    with CronetClient(verify=verify, timeout_ms=timeout_ms, proxies=proxies, chrometls=chrometls) as session:
-        return session.patch(
-            url,
-            params=params,
-            headers=headers,
-            cookies=cookies,
-            data=data,
-            json=json,
-            verify=verify,
-            allow_redirects=allow_redirects,
-            **kwargs
-        )
+    session = default_session(verify=verify, proxies=proxies, chrometls=chrometls)
+    return session.patch(
+        url,
+        params=params,
+        headers=headers,
+        cookies=cookies,
+        data=data,
+        json=json,
+        timeout=timeout,
+        verify=verify,
+        allow_redirects=allow_redirects,
+        **kwargs
+    )
 
 
 def head(
@@ -162,7 +162,7 @@ def head(
     params: Optional[Dict[str, Any]] = None,
     headers: Optional[HeadersType] = None,
     cookies: Optional[CookiesType] = None,
-    timeout: Optional[float] = None,
+    timeout: TimeoutType = None,
     verify: bool = True,
     allow_redirects: bool = True,
     proxies: Optional[Union[str, Dict[str, str]]] = None,
@@ -170,17 +170,17 @@ def head(
     **kwargs
 ) -> Response:
     """Send HEAD request - similar to requests.head()"""
-    timeout_ms = int(timeout * 1000) if timeout else 30000
-    with CronetClient(verify=verify, timeout_ms=timeout_ms, proxies=proxies, chrometls=chrometls) as session:
-        return session.head(
-            url,
-            params=params,
-            headers=headers,
-            cookies=cookies,
-            verify=verify,
-            allow_redirects=allow_redirects,
-            **kwargs
-        )
+    session = default_session(verify=verify, proxies=proxies, chrometls=chrometls)
+    return session.head(
+        url,
+        params=params,
+        headers=headers,
+        cookies=cookies,
+        timeout=timeout,
+        verify=verify,
+        allow_redirects=allow_redirects,
+        **kwargs
+    )
 
 
 def options(
@@ -189,7 +189,7 @@ def options(
     params: Optional[Dict[str, Any]] = None,
     headers: Optional[HeadersType] = None,
     cookies: Optional[CookiesType] = None,
-    timeout: Optional[float] = None,
+    timeout: TimeoutType = None,
     verify: bool = True,
     allow_redirects: bool = True,
     proxies: Optional[Union[str, Dict[str, str]]] = None,
@@ -197,17 +197,17 @@ def options(
     **kwargs
 ) -> Response:
     """Send OPTIONS request - similar to requests.options()"""
-    timeout_ms = int(timeout * 1000) if timeout else 30000
-    with CronetClient(verify=verify, timeout_ms=timeout_ms, proxies=proxies, chrometls=chrometls) as session:
-        return session.options(
-            url,
-            params=params,
-            headers=headers,
-            cookies=cookies,
-            verify=verify,
-            allow_redirects=allow_redirects,
-            **kwargs
-        )
+    session = default_session(verify=verify, proxies=proxies, chrometls=chrometls)
+    return session.options(
+        url,
+        params=params,
+        headers=headers,
+        cookies=cookies,
+        timeout=timeout,
+        verify=verify,
+        allow_redirects=allow_redirects,
+        **kwargs
+    )
 
 
 def upload_file(
@@ -218,22 +218,24 @@ def upload_file(
     additional_fields: Optional[Dict[str, str]] = None,
     headers: Optional[HeadersType] = None,
     cookies: Optional[CookiesType] = None,
-    timeout: Optional[float] = None,
+    timeout: TimeoutType = None,
     verify: bool = True,
+    proxies: Optional[Union[str, Dict[str, str]]] = None,
+    chrometls: Optional[str] = "chrome_144",
     **kwargs: Any
 ) -> Response:
     """Upload file - similar to requests file upload"""
-    timeout_ms = int(timeout * 1000) if timeout else 30000
-    with CronetClient(verify=verify, timeout_ms=timeout_ms) as session:
-        return session.upload_file(
-            url,
-            file_path,
-            field_name=field_name,
-            additional_fields=additional_fields,
-            headers=headers,
-            cookies=cookies,
-            verify=verify
-        )
+    session = default_session(verify=verify, proxies=proxies, chrometls=chrometls)
+    return session.upload_file(
+        url,
+        file_path,
+        field_name=field_name,
+        additional_fields=additional_fields,
+        headers=headers,
+        cookies=cookies,
+        timeout=timeout,
+        verify=verify
+    )
 
 
 def download_file(
@@ -242,19 +244,21 @@ def download_file(
     *,
     headers: Optional[HeadersType] = None,
     cookies: Optional[CookiesType] = None,
-    timeout: Optional[float] = None,
+    timeout: TimeoutType = None,
     verify: bool = True,
     chunk_size: int = 8192,
+    proxies: Optional[Union[str, Dict[str, str]]] = None,
+    chrometls: Optional[str] = "chrome_144",
     **kwargs: Any
 ) -> Dict[str, Any]:
     """Download file - similar to requests file download"""
-    timeout_ms = int(timeout * 1000) if timeout else 30000
-    with CronetClient(verify=verify, timeout_ms=timeout_ms) as session:
-        return session.download_file(
-            url,
-            save_path,
-            headers=headers,
-            cookies=cookies,
-            verify=verify,
-            chunk_size=chunk_size
-        )
+    session = default_session(verify=verify, proxies=proxies, chrometls=chrometls)
+    return session.download_file(
+        url,
+        save_path,
+        headers=headers,
+        cookies=cookies,
+        timeout=timeout,
+        verify=verify,
+        chunk_size=chunk_size
+    )
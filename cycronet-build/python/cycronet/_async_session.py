@@ -3,26 +3,50 @@ Asynchronous Session class for cycronet.
 """
 
 import os
+import math
+import time
+import asyncio
 import json as json_lib
-from typing import Optional, Dict, List, Tuple, Any
-from urllib.parse import urlparse, urlencode
+from typing import Optional, Dict, List, Tuple, Any, Iterable, Union
+from urllib.parse import urlparse, urlencode, urljoin
 
-from ._types import HeadersType, CookiesType, DataType
+from ._types import HeadersType, CookiesType, DataType, TimeoutType
 from ._cookies import CookieJar
-from ._response import Response, HTTPStatusError, RequestError
-from ._utils import extract_domain, parse_set_cookie, domain_matches
+from ._prepared import HeaderList, PreparedRequest
+from ._response import Response, Timings, HTTPStatusError, RequestError, TooManyRedirects
+from ._utils import extract_domain, extract_path, is_secure_url, parse_set_cookie, timeout_to_ms, origins
+from ._upload import body_segments, encode_multipart
+from ._ratelimit import RateLimiter
+from ._retry import Retry, RetryBudget
+from ._hedge import Hedge
 
 
 class AsyncSession:
     """Async Session object - supports async/await"""
 
-    def __init__(self, client: 'AsyncCronetClient', session_id: str, verify: bool = True):
+    def __init__(
+        self,
+        client: 'AsyncCronetClient',
+        session_id: str,
+        verify: bool = True,
+        proxy: Optional[str] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry: Optional[Retry] = None,
+        hedge: Optional[Hedge] = None
+    ):
         self._client = client
         self._session_id = session_id
         self._closed = False
         self._verify = verify
+        self._proxy = proxy  # Proxy URL, used as the rate limiter's proxy key
+        self.rate_limiter = rate_limiter  # Token buckets per host / proxy, may be shared
+        self.retry = retry  # Retry policy, None sends every request once
+        self.retry_budget = RetryBudget()  # Caps retries to a share of this session's requests
+        self.hedge = hedge  # Hedging policy for slow idempotent requests, None disables it
+        self._adhoc_hedge: Optional[Hedge] = None  # Used only for requests given hedge_after_ms
         self._cookies = CookieJar()
         self._default_headers = {}  # Store default headers for session
+        self.max_redirects = 30  # Maximum redirects followed per request
 
     @property
     def cookies(self) -> CookieJar:
@@ -106,17 +130,20 @@ class AsyncSession:
 
         return adjusted
 
-    def _prepare_headers(
+    def _header_plan(
         self,
         headers: Optional[HeadersType] = None,
-        cookies: Optional[CookiesType] = None,
-        domain: str = "",
         method: str = "GET",
         has_body: bool = False,
         is_json: bool = False,
         need_content_type: Optional[str] = None
-    ) -> List[Tuple[str, str]]:
-        """Prepare request headers with session defaults"""
+    ) -> Tuple[HeaderList, HeaderList, HeaderList]:
+        """
+        Prepare request headers with session defaults, leaving out jar cookies
+
+        Returns:
+            (headers before the cookie, cookie headers given by the caller, priority headers)
+        """
 
         # Check if user provided headers
         user_provided = headers is not None
@@ -171,53 +198,135 @@ class AsyncSession:
             else:
                 normal_headers.append((k, v))
 
-        # Get matching cookies from CookieJar
-        merged_cookies = {}
-        for cookie in self._cookies:
-            if not cookie.domain or cookie.domain == domain or domain_matches(cookie.domain, domain):
-                merged_cookies[cookie.name] = cookie.value
-
-        if cookies:
-            merged_cookies.update(cookies)
+        return tuple(normal_headers), tuple(cookie_headers), tuple(priority_headers)
 
-        result = normal_headers
-
-        if not cookie_headers and merged_cookies:
-            cookie_str = "; ".join([f"{k}={v}" for k, v in merged_cookies.items()])
-            result.append(("cookie", cookie_str))
-        elif cookie_headers:
+    def _fill_cookies(
+        self,
+        header_plan: Tuple[HeaderList, HeaderList, HeaderList],
+        cookies: Optional[CookiesType],
+        domain: str,
+        path: str = "/",
+        secure: bool = True
+    ) -> List[Tuple[str, str]]:
+        """Header list of a header plan with the Cookie header for domain/path filled in"""
+        normal_headers, cookie_headers, priority_headers = header_plan
+        result = list(normal_headers)
+
+        if not cookie_headers:
+            # Matching cookies come from the CookieJar domain index; the header is
+            # cached per (domain, path, secure) until the jar changes
+            if cookies:
+                merged_cookies = dict(self._cookies.matching(domain, path, secure))
+                merged_cookies.update(cookies)
+                cookie_str = "; ".join([f"{k}={v}" for k, v in merged_cookies.items()])
+            else:
+                cookie_str = self._cookies.header(domain, path, secure)
+            if cookie_str:
+                result.append(("cookie", cookie_str))
+        else:
             result.extend(cookie_headers)
 
         result.extend(priority_headers)
         return result
 
-    def _update_cookies_from_response(self, headers: Dict[str, List[str]], request_domain: str):
+    def _prepare_headers(
+        self,
+        headers: Optional[HeadersType] = None,
+        cookies: Optional[CookiesType] = None,
+        domain: str = "",
+        path: str = "/",
+        secure: bool = True,
+        method: str = "GET",
+        has_body: bool = False,
+        is_json: bool = False,
+        need_content_type: Optional[str] = None
+    ) -> List[Tuple[str, str]]:
+        """Prepare request headers with session defaults"""
+        header_plan = self._header_plan(headers, method, has_body, is_json, need_content_type)
+        return self._fill_cookies(header_plan, cookies, domain, path, secure)
+
+    def _update_cookies_from_response(
+        self,
+        headers: Dict[str, List[str]],
+        request_domain: str,
+        request_path: str = "/"
+    ):
         """Extract Set-Cookie from response headers"""
         for name, values in headers.items():
             if name.lower() == 'set-cookie':
-                parsed_cookies = parse_set_cookie(values)
-                for cookie_name, cookie_value, cookie_domain in parsed_cookies:
-                    store_domain = cookie_domain if cookie_domain else request_domain
-                    self._cookies.set(cookie_name, cookie_value, store_domain)
+                for cookie in parse_set_cookie(values, request_domain, request_path):
+                    self._cookies.set_cookie(cookie)
 
-    async def request(
+    def _build_response(
         self,
-        method: str,
+        status_code: int,
+        headers_list: List[Tuple[str, str]],
         url: str,
-        *,
-        params: Optional[Dict[str, Any]] = None,
-        headers: Optional[HeadersType] = None,
-        cookies: Optional[CookiesType] = None,
-        data: DataType = None,
-        json: Optional[Dict[str, Any]] = None,
-        timeout: Optional[float] = None,
-        verify: Optional[bool] = None,
-        allow_redirects: bool = True
+        content: Optional[bytes],
+        stream: Any = None
     ) -> Response:
-        """Send async HTTP request"""
-        if self._closed:
-            raise RequestError("Session is closed")
+        """Build Response from native result and store its Set-Cookie in the session"""
+        resp_headers = {}
+        for name, value in headers_list:
+            if name not in resp_headers:
+                resp_headers[name] = []
+            resp_headers[name].append(value)
+
+        domain = extract_domain(url)
+        path = extract_path(url)
+
+        # Create response CookieJar
+        response_cookies = CookieJar()
+        for header_name, values in resp_headers.items():
+            if header_name.lower() == 'set-cookie':
+                for cookie in parse_set_cookie(values, domain, path):
+                    response_cookies.set_cookie(cookie)
+
+        # Update session cookies from response
+        self._update_cookies_from_response(resp_headers, domain, path)
 
+        return Response(
+            status_code=status_code,
+            _headers=resp_headers,
+            content=content,
+            url=url,
+            _cookies=response_cookies,
+            _stream=stream
+        )
+
+    def _prepare_request(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        headers: Optional[HeadersType],
+        cookies: Optional[CookiesType],
+        data: DataType,
+        json: Optional[Dict[str, Any]]
+    ) -> Tuple[str, str, Any, Any, bool, bool, Optional[str]]:
+        """
+        Validate URL and encode body for one request
+
+        Returns:
+            (url, domain, headers_to_prepare, body, has_body, is_json, need_content_type)
+        """
+        url = self._prepare_url(url, params)
+        domain = extract_domain(url)
+
+        if cookies:
+            self._cookies.update(cookies, domain)
+
+        if headers is None:
+            headers_to_prepare = None
+        elif isinstance(headers, dict):
+            headers_to_prepare = headers.copy()
+        else:
+            headers_to_prepare = list(headers)
+
+        body, has_body, is_json_request, need_content_type = self._encode_body(data, json)
+        return url, domain, headers_to_prepare, body, has_body, is_json_request, need_content_type
+
+    def _prepare_url(self, url: str, params: Optional[Dict[str, Any]]) -> str:
+        """Validate URL and append query params"""
         # Validate URL
         if not url or not isinstance(url, str):
             raise RequestError("URL must be a non-empty string")
@@ -233,19 +342,19 @@ class AsyncSession:
 
         if params:
             url = url + ('&' if '?' in url else '?') + urlencode(params)
+        return url
 
-        domain = extract_domain(url)
-
-        if cookies:
-            self._cookies.update(cookies, domain)
-
-        if headers is None:
-            headers_to_prepare = None
-        elif isinstance(headers, dict):
-            headers_to_prepare = headers.copy()
-        else:
-            headers_to_prepare = list(headers)
+    def _encode_body(
+        self,
+        data: DataType,
+        json: Optional[Dict[str, Any]]
+    ) -> Tuple[Any, bool, bool, Optional[str]]:
+        """
+        Encode data/json as request body
 
+        Returns:
+            (body, has_body, is_json, need_content_type)
+        """
         # Determine request type
         is_json_request = json is not None
         has_body = data is not None or json is not None
@@ -270,101 +379,369 @@ class AsyncSession:
         elif isinstance(data, str):
             body = data.encode('utf-8')
         else:
-            body = data
-
-        # Prepare headers (pass request type information)
-        prepared_headers = self._prepare_headers(
-            headers_to_prepare,
-            cookies,
-            domain,
-            method=method,
-            has_body=has_body,
-            is_json=is_json_request,
-            need_content_type=need_content_type
-        )
+            body = body_segments(data)
+
+        return body, has_body, is_json_request, need_content_type
 
-        # Use run_in_executor to execute sync request in thread pool
-        # Avoid pyo3-asyncio compatibility issues
-        import asyncio
-        loop = asyncio.get_event_loop()
-
-        # Always disable redirects at Rust layer, handle in Python
-        response_dict = await loop.run_in_executor(
-            None,
-            lambda: self._client._client.request(
-                self._session_id,
-                url,
-                method.upper(),
-                prepared_headers,
-                body,
-                False  # Always False - handle redirects in Python
+    def _prepare_batch(
+        self,
+        requests: Iterable[Union[str, Dict[str, Any]]]
+    ) -> Tuple[List[Tuple[str, str, List[Tuple[str, str]], Any, Optional[int]]], List[str]]:
+        """
+        Prepare native (url, method, headers, body, delay_ms) tuples for request_many
+
+        With a rate limiter every request reserves its slot here; the native
+        batch starts each request once its delay has passed.
+        """
+        items = []
+        urls = []
+        for spec in requests:
+            kwargs = {'url': spec} if isinstance(spec, str) else spec
+            method = kwargs.get('method', 'GET')
+            (url, domain, headers_to_prepare, body,
+             has_body, is_json_request, need_content_type) = self._prepare_request(
+                kwargs.get('url'),
+                kwargs.get('params'),
+                kwargs.get('headers'),
+                kwargs.get('cookies'),
+                kwargs.get('data'),
+                kwargs.get('json')
             )
+            prepared_headers = self._prepare_headers(
+                headers_to_prepare,
+                kwargs.get('cookies'),
+                domain,
+                path=extract_path(url),
+                secure=is_secure_url(url),
+                method=method,
+                has_body=has_body,
+                is_json=is_json_request,
+                need_content_type=need_content_type
+            )
+            delay_ms = None
+            if self.rate_limiter is not None:
+                delay_ms = math.ceil(self.rate_limiter.reserve(url, self._proxy) * 1000) or None
+            items.append((url, method.upper(), prepared_headers, body, delay_ms))
+            urls.append(url)
+        return items, urls
+
+    def _batch_response(self, response_dict: Dict[str, Any], url: str) -> Response:
+        """Build Response (with redirect history) from a request_many result"""
+        history = [
+            self._build_response(hop['status_code'], hop['headers'], hop['url'], b"")
+            for hop in response_dict.get('history', ())
+        ]
+        response = self._build_response(
+            response_dict['status_code'],
+            response_dict['headers'],
+            response_dict.get('url') or url,
+            response_dict['body']
         )
+        response.history = history
+        response.timings = Timings.from_native(response_dict.get('timings'))
+        response.from_cache = response_dict.get('from_cache', False)
+        return response
 
-        status_code = response_dict['status_code']
-        resp_headers_list = response_dict['headers']
-        body_bytes = response_dict['body']
+    def _retry_delay(
+        self,
+        method: str,
+        body: Any,
+        attempt: int,
+        cancel_token: Optional[Any],
+        error: Optional[BaseException] = None,
+        response: Optional[Response] = None
+    ) -> Optional[float]:
+        """Backoff before resending after `attempt` attempts, None when it must not be retried"""
+        retry = self.retry
+        if retry is None or (cancel_token is not None and cancel_token.cancelled):
+            return None
+        # Lazily read iterables cannot be replayed
+        if body and not isinstance(body, (bytes, bytearray, list)):
+            return None
+        if error is not None:
+            delay = retry.delay_for_error(method, error, attempt)
+        else:
+            delay = retry.delay_for_response(method, response, attempt)
+        if delay is None or not self.retry_budget.withdraw():
+            return None
+        return delay
 
-        resp_headers = {}
-        for name, value in resp_headers_list:
-            if name not in resp_headers:
-                resp_headers[name] = []
-            resp_headers[name].append(value)
+    async def _send_hedged(self, send_on: Any, hedge: Hedge, delay: Optional[float]) -> Tuple[Any, bool]:
+        """
+        Send a request, duplicating it if no response arrived within `delay`
+        (None waits for the single request, e.g. while the delay is still learned)
 
-        # Create response CookieJar
-        response_cookies = CookieJar()
-        for header_name, values in resp_headers.items():
-            if header_name.lower() == 'set-cookie':
-                for cookie_name, cookie_value, cookie_domain in parse_set_cookie(values):
-                    store_domain = cookie_domain if cookie_domain else domain
-                    response_cookies.set(cookie_name, cookie_value, store_domain)
+        Returns (native result, whether a hedge was sent). The first successful
+        copy wins and the other one is cancelled; an error is only raised once
+        both copies failed.
+        """
+        primary = asyncio.ensure_future(send_on(self))
+        pending = {primary}
+        try:
+            done, pending = await asyncio.wait(pending, timeout=delay)
+            if done or not hedge.budget.withdraw():
+                return await primary, False
+
+            alternate = hedge.alternate if hedge.alternate is not None else self
+            secondary = asyncio.ensure_future(send_on(alternate, True))
+            pending.add(secondary)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                # A copy cancelled underneath (e.g. by a cancel_token) counts as failed
+                results = [task.result() for task in done if not task.cancelled() and task.exception() is None]
+                if results:
+                    # Both copies may answer in the same step: release the loser's stream
+                    for extra in results[1:]:
+                        if extra.get('stream') is not None:
+                            extra['stream'].close()
+                    return results[0], True
+            # Both copies failed: report the original request's error, unless it was cancelled
+            return (secondary if primary.cancelled() else primary).result(), True
+        finally:
+            # Cancelling the native future cancels the request in Cronet
+            for task in pending:
+                task.cancel()
 
-        # Update session cookies from response
-        self._update_cookies_from_response(resp_headers, domain)
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[HeadersType] = None,
+        cookies: Optional[CookiesType] = None,
+        data: DataType = None,
+        json: Optional[Dict[str, Any]] = None,
+        timeout: TimeoutType = None,
+        verify: Optional[bool] = None,
+        allow_redirects: bool = True,
+        stream: bool = False,
+        cancel_token: Optional[Any] = None,
+        hedge_after_ms: Optional[float] = None
+    ) -> Response:
+        """
+        Send async HTTP request
 
-        # Handle redirects in Python layer
-        if allow_redirects and status_code in (301, 302, 303, 307, 308):
-            location = None
-            for header_name, values in resp_headers.items():
-                if header_name.lower() == 'location':
-                    location = values[0] if values else None
-                    break
+        With stream=True the call returns once headers arrive; read the body
+        with aiter_bytes()/aiter_lines() or await aread().
 
-            if location:
-                # Handle relative URLs
-                if not location.startswith(('http://', 'https://')):
-                    from urllib.parse import urljoin
-                    location = urljoin(url, location)
-
-                # Follow redirect with updated cookies and headers
-                # For 303, change method to GET
-                redirect_method = 'GET' if status_code == 303 else method
-
-                # Recursively call request with updated URL
-                # Note: cookies=None means "use session cookies only" (which includes Set-Cookie from redirect response)
-                # User-provided cookies were already added to self._cookies at line 125
-                # Server Set-Cookie was added to self._cookies at line 209
-                return await self.request(
-                    redirect_method,
-                    location,
-                    params=None,  # Don't carry params on redirect
-                    headers=headers_to_prepare,  # Carry original headers
-                    cookies=None,  # Use session cookies (includes both user cookies and Set-Cookie from response)
-                    data=None if status_code == 303 else data,  # Drop body for 303
-                    json=None,
-                    timeout=timeout,
-                    verify=verify,
-                    allow_redirects=True  # Continue following redirects
-                )
+        Cancelling the awaiting task (including asyncio.wait_for timeouts)
+        cancels the native request immediately; cancel_token and the session
+        retry policy work as in Session.request.
 
-        return Response(
-            status_code=status_code,
-            _headers=resp_headers,
-            content=body_bytes,
-            url=url,
-            _cookies=response_cookies
+        With a hedge policy (see cycronet.Hedge), or hedge_after_ms for this
+        request, an idempotent request that has not answered in time is sent
+        a second time; the first response wins and the other is cancelled.
+        """
+        # verify parameter is ignored here (decided at session creation)
+        # but accept it for requests API compatibility
+        if self._closed:
+            raise RequestError("Session is closed")
+        return await self.send(
+            self.prepare(method, url, params=params, headers=headers, data=data, json=json),
+            cookies=cookies,
+            timeout=timeout,
+            allow_redirects=allow_redirects,
+            stream=stream,
+            cancel_token=cancel_token,
+            hedge_after_ms=hedge_after_ms
+        )
+
+    def prepare(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[HeadersType] = None,
+        data: DataType = None,
+        json: Optional[Dict[str, Any]] = None
+    ) -> PreparedRequest:
+        """
+        Prepare a request once to send it many times with send()
+
+        The URL is validated, the body encoded and the ordered header list
+        (session headers adjusted for the method, or the given headers) built
+        here; each send() only adds the Cookie header from the jar's cache.
+
+        Example:
+            poll = session.prepare("GET", "https://api.example.com/status")
+            while True:
+                response = await session.send(poll)
+        """
+        (url, domain, headers_to_prepare, body,
+         has_body, is_json_request, need_content_type) = self._prepare_request(
+            url, params, headers, None, data, json
+        )
+        header_plan = self._header_plan(headers_to_prepare, method, has_body, is_json_request, need_content_type)
+        return PreparedRequest(
+            method.upper(), url, body, headers_to_prepare, has_body, is_json_request, need_content_type,
+            header_plan, domain, extract_path(url), is_secure_url(url)
         )
 
+    async def send(
+        self,
+        prepared: PreparedRequest,
+        *,
+        url: Optional[str] = None,
+        params: Optional[Dict[str, Any]] = None,
+        cookies: Optional[CookiesType] = None,
+        data: DataType = None,
+        json: Optional[Dict[str, Any]] = None,
+        timeout: TimeoutType = None,
+        allow_redirects: bool = True,
+        stream: bool = False,
+        cancel_token: Optional[Any] = None,
+        hedge_after_ms: Optional[float] = None
+    ) -> Response:
+        """
+        Send a PreparedRequest (see prepare())
+
+        url/params and data/json replace the prepared URL and body for this
+        call, while the prepared headers (including the content type) are
+        kept. Cookies, redirects, retries, streaming and cancel_token work as
+        in request().
+        """
+        if self._closed:
+            raise RequestError("Session is closed")
+
+        method = prepared.method
+        if url is None and not params:
+            url, domain, path, secure = prepared.url, prepared.domain, prepared.path, prepared.secure
+        else:
+            url = self._prepare_url(prepared.url if url is None else url, params)
+            domain, path, secure = extract_domain(url), extract_path(url), is_secure_url(url)
+        if cookies:
+            self._cookies.update(cookies, domain)
+        body = prepared.body
+        if data is not None or json is not None:
+            body = self._encode_body(data, json)[0]
+        header_plan = prepared.header_plan
+
+        # Per-request deadlines (None keeps the session timeout)
+        timeout_ms, connect_timeout_ms, read_timeout_ms = timeout_to_ms(timeout)
+
+        # Native future, completed from the Cronet callbacks on the event loop
+        # (no executor thread is held while the request is in flight)
+        loop = asyncio.get_running_loop()
+
+        hedge = self.hedge
+        if hedge is None and hedge_after_ms is not None:
+            # Keep the ad-hoc policy on the session so its budget spans requests,
+            # without hedging later requests that did not ask for it
+            if self._adhoc_hedge is None:
+                self._adhoc_hedge = Hedge()
+            hedge = self._adhoc_hedge
+        if hedge is not None and (method.upper() not in hedge.methods
+                                  or (body and not isinstance(body, (bytes, bytearray, list)))):
+            hedge = None
+
+        history: List[Response] = []
+        while True:
+            # Frozen headers plus the Cookie header for this hop
+            prepared_headers = self._fill_cookies(header_plan, cookies, domain, path, secure)
+
+            async def send_on(session: 'AsyncSession', hedged: bool = False) -> Dict[str, Any]:
+                # Redirects are followed inside Cronet. Hops that change host or set
+                # cookies are handed back so the next Cookie header uses the updated jar
+                if hedged and session.rate_limiter is not None:
+                    await session.rate_limiter.wait_async(url, session._proxy)
+                native = session._client._client
+                send = native.request_stream_async if stream else native.request_async
+                return await send(
+                    loop,
+                    session._session_id,
+                    url,
+                    method.upper(),
+                    prepared_headers,
+                    body,
+                    allow_redirects,
+                    timeout_ms=timeout_ms,
+                    connect_timeout_ms=connect_timeout_ms,
+                    read_timeout_ms=read_timeout_ms,
+                    max_redirects=max(0, self.max_redirects - len(history)),
+                    caller_manages_cookies=True,
+                    cancel_token=cancel_token
+                )
+
+            if self.retry is not None:
+                self.retry_budget.deposit()
+            if hedge is not None:
+                hedge.budget.deposit()
+            attempts = 0
+            while True:
+                if self.rate_limiter is not None:
+                    await self.rate_limiter.wait_async(url, self._proxy)
+                attempts += 1
+
+                try:
+                    if hedge is None:
+                        response_dict = await send_on(self)
+                    else:
+                        started = time.monotonic()
+                        response_dict, hedged = await self._send_hedged(send_on, hedge, hedge.delay(hedge_after_ms))
+                        hedge.observe(time.monotonic() - started)
+                        attempts += hedged
+                except (RuntimeError, TimeoutError) as exc:
+                    delay = self._retry_delay(method, body, attempts, cancel_token, error=exc)
+                    if delay is None:
+                        raise
+                    await asyncio.sleep(delay)
+                    continue
+
+                hops = [
+                    self._build_response(hop['status_code'], hop['headers'], hop['url'], b"")
+                    for hop in response_dict.get('history', ())
+                ]
+                body_stream = response_dict.get('stream')
+                response = self._build_response(
+                    response_dict['status_code'],
+                    response_dict['headers'],
+                    response_dict.get('url') or url,
+                    None if body_stream is not None else response_dict['body'],
+                    body_stream
+                )
+                response.timings = Timings.from_native(response_dict.get('timings'))
+                response.from_cache = response_dict.get('from_cache', False)
+                response.attempts = attempts
+
+                delay = self._retry_delay(method, body, attempts, cancel_token, response=response)
+                if delay is None:
+                    break
+                response.close()
+                await asyncio.sleep(delay)
+
+            history.extend(hops)
+            response.history = list(history)
+
+            location = None
+            if allow_redirects and response.status_code in (301, 302, 303, 307, 308):
+                for header_name, values in response._headers.items():
+                    if header_name.lower() == 'location':
+                        location = values[0] if values else None
+                        break
+            if not location:
+                return response
+
+            # Redirect body is never read
+            response.close()
+            if len(history) >= self.max_redirects:
+                raise TooManyRedirects(f"Exceeded {self.max_redirects} redirects", response=response)
+            history.append(response)
+
+            # Follow redirect with updated cookies and headers (relative URLs allowed)
+            url = urljoin(response.url, location)
+            domain, path, secure = extract_domain(url), extract_path(url), is_secure_url(url)
+            # User-provided cookies were already added to self._cookies, and Set-Cookie
+            # from every hop was stored by _build_response
+            cookies = None
+
+            # For 303, change method to GET and drop the body
+            if response.status_code == 303:
+                method = 'GET'
+                body = b""
+                header_plan = self._header_plan(prepared.headers, method, is_json=prepared.is_json)
+
     async def get(
         self,
         url: str,
@@ -372,14 +749,17 @@ class AsyncSession:
         params: Optional[Dict[str, Any]] = None,
         headers: Optional[HeadersType] = None,
         cookies: Optional[CookiesType] = None,
-        timeout: Optional[float] = None,
+        timeout: TimeoutType = None,
         verify: Optional[bool] = None,
-        allow_redirects: bool = True
+        allow_redirects: bool = True,
+        stream: bool = False,
+        hedge_after_ms: Optional[float] = None
     ) -> Response:
         """Send async GET request"""
         return await self.request(
             "GET", url, params=params, headers=headers, cookies=cookies,
-            timeout=timeout, verify=verify, allow_redirects=allow_redirects
+            timeout=timeout, verify=verify, allow_redirects=allow_redirects,
+            stream=stream, hedge_after_ms=hedge_after_ms
         )
 
     async def post(
@@ -391,14 +771,16 @@ class AsyncSession:
         cookies: Optional[CookiesType] = None,
         data: DataType = None,
         json: Optional[Dict[str, Any]] = None,
-        timeout: Optional[float] = None,
+        timeout: TimeoutType = None,
         verify: Optional[bool] = None,
-        allow_redirects: bool = True
+        allow_redirects: bool = True,
+        stream: bool = False
     ) -> Response:
         """Send async POST request"""
         return await self.request(
             "POST", url, params=params, headers=headers, cookies=cookies,
-            data=data, json=json, timeout=timeout, verify=verify, allow_redirects=allow_redirects
+            data=data, json=json, timeout=timeout, verify=verify, allow_redirects=allow_redirects,
+            stream=stream
         )
 
     async def put(
@@ -410,14 +792,16 @@ class AsyncSession:
         cookies: Optional[CookiesType] = None,
         data: DataType = None,
         json: Optional[Dict[str, Any]] = None,
-        timeout: Optional[float] = None,
+        timeout: TimeoutType = None,
         verify: Optional[bool] = None,
-        allow_redirects: bool = True
+        allow_redirects: bool = True,
+        stream: bool = False
     ) -> Response:
         """Send async PUT request"""
         return await self.request(
             "PUT", url, params=params, headers=headers, cookies=cookies,
-            data=data, json=json, timeout=timeout, verify=verify, allow_redirects=allow_redirects
+            data=data, json=json, timeout=timeout, verify=verify, allow_redirects=allow_redirects,
+            stream=stream
         )
 
     async def delete(
@@ -427,14 +811,16 @@ class AsyncSession:
         params: Optional[Dict[str, Any]] = None,
         headers: Optional[HeadersType] = None,
         cookies: Optional[CookiesType] = None,
-        timeout: Optional[float] = None,
+        timeout: TimeoutType = None,
         verify: Optional[bool] = None,
-        allow_redirects: bool = True
+        allow_redirects: bool = True,
+        stream: bool = False
     ) -> Response:
         """Send async DELETE request"""
         return await self.request(
             "DELETE", url, params=params, headers=headers, cookies=cookies,
-            timeout=timeout, verify=verify, allow_redirects=allow_redirects
+            timeout=timeout, verify=verify, allow_redirects=allow_redirects,
+            stream=stream
         )
 
     async def patch(
@@ -446,14 +832,16 @@ class AsyncSession:
         cookies: Optional[CookiesType] = None,
         data: DataType = None,
         json: Optional[Dict[str, Any]] = None,
-        timeout: Optional[float] = None,
+        timeout: TimeoutType = None,
         verify: Optional[bool] = None,
-        allow_redirects: bool = True
+        allow_redirects: bool = True,
+        stream: bool = False
     ) -> Response:
         """Send async PATCH request"""
         return await self.request(
             "PATCH", url, params=params, headers=headers, cookies=cookies,
-            data=data, json=json, timeout=timeout, verify=verify, allow_redirects=allow_redirects
+            data=data, json=json, timeout=timeout, verify=verify, allow_redirects=allow_redirects,
+            stream=stream
         )
 
     async def head(
@@ -463,14 +851,17 @@ class AsyncSession:
         params: Optional[Dict[str, Any]] = None,
         headers: Optional[HeadersType] = None,
         cookies: Optional[CookiesType] = None,
-        timeout: Optional[float] = None,
+        timeout: TimeoutType = None,
         verify: Optional[bool] = None,
-        allow_redirects: bool = True
+        allow_redirects: bool = True,
+        stream: bool = False,
+        hedge_after_ms: Optional[float] = None
     ) -> Response:
         """Send async HEAD request"""
         return await self.request(
             "HEAD", url, params=params, headers=headers, cookies=cookies,
-            timeout=timeout, verify=verify, allow_redirects=allow_redirects
+            timeout=timeout, verify=verify, allow_redirects=allow_redirects,
+            stream=stream, hedge_after_ms=hedge_after_ms
         )
 
     async def options(
@@ -480,14 +871,17 @@ class AsyncSession:
         params: Optional[Dict[str, Any]] = None,
         headers: Optional[HeadersType] = None,
         cookies: Optional[CookiesType] = None,
-        timeout: Optional[float] = None,
+        timeout: TimeoutType = None,
         verify: Optional[bool] = None,
-        allow_redirects: bool = True
+        allow_redirects: bool = True,
+        stream: bool = False,
+        hedge_after_ms: Optional[float] = None
     ) -> Response:
         """Send async OPTIONS request"""
         return await self.request(
             "OPTIONS", url, params=params, headers=headers, cookies=cookies,
-            timeout=timeout, verify=verify, allow_redirects=allow_redirects
+            timeout=timeout, verify=verify, allow_redirects=allow_redirects,
+            stream=stream, hedge_after_ms=hedge_after_ms
         )
 
     async def upload_file(
@@ -499,42 +893,14 @@ class AsyncSession:
         additional_fields: Optional[Dict[str, str]] = None,
         headers: Optional[HeadersType] = None,
         cookies: Optional[CookiesType] = None,
-        timeout: Optional[float] = None,
+        timeout: TimeoutType = None,
         verify: Optional[bool] = None
     ) -> Response:
-        """Async upload file"""
-        import mimetypes
-
+        """Async upload file (multipart body is streamed from disk)"""
         if not os.path.exists(file_path):
             raise RequestError(f"File not found: {file_path}")
 
-        with open(file_path, 'rb') as f:
-            file_content = f.read()
-
-        filename = os.path.basename(file_path)
-        mime_type, _ = mimetypes.guess_type(file_path)
-        if mime_type is None:
-            mime_type = 'application/octet-stream'
-
-        boundary = f'----CycronetFormBoundary{os.urandom(16).hex()}'
-        body_parts = []
-
-        if additional_fields:
-            for key, value in additional_fields.items():
-                body_parts.append(f'--{boundary}\r\n'.encode())
-                body_parts.append(f'Content-Disposition: form-data; name="{key}"\r\n\r\n'.encode())
-                body_parts.append(f'{value}\r\n'.encode())
-
-        body_parts.append(f'--{boundary}\r\n'.encode())
-        body_parts.append(
-            f'Content-Disposition: form-data; name="{field_name}"; filename="{filename}"\r\n'.encode()
-        )
-        body_parts.append(f'Content-Type: {mime_type}\r\n\r\n'.encode())
-        body_parts.append(file_content)
-        body_parts.append(b'\r\n')
-        body_parts.append(f'--{boundary}--\r\n'.encode())
-
-        body = b''.join(body_parts)
+        body, content_type = encode_multipart(additional_fields, [(field_name, file_path)])
 
         if headers is None:
             headers = {}
@@ -543,7 +909,7 @@ class AsyncSession:
         else:
             headers = dict(headers)
 
-        headers['Content-Type'] = f'multipart/form-data; boundary={boundary}'
+        headers['Content-Type'] = content_type
 
         return await self.request(
             "POST",
@@ -562,20 +928,22 @@ class AsyncSession:
         *,
         headers: Optional[HeadersType] = None,
         cookies: Optional[CookiesType] = None,
-        timeout: Optional[float] = None,
+        timeout: TimeoutType = None,
         verify: Optional[bool] = None,
         chunk_size: int = 8192
     ) -> Dict[str, Any]:
-        """Async download file"""
+        """Async download file (body is streamed to disk)"""
         response = await self.get(
             url,
             headers=headers,
             cookies=cookies,
             timeout=timeout,
-            verify=verify
+            verify=verify,
+            stream=True
         )
 
         if response.status_code >= 400:
+            response.close()
             raise HTTPStatusError(
                 f"Download failed with status {response.status_code}",
                 response=response
@@ -585,21 +953,126 @@ class AsyncSession:
         if save_dir and not os.path.exists(save_dir):
             os.makedirs(save_dir, exist_ok=True)
 
-        with open(save_path, 'wb') as f:
-            f.write(response.content)
+        size = 0
+        try:
+            with open(save_path, 'wb') as f:
+                async for chunk in response.aiter_bytes(chunk_size):
+                    f.write(chunk)
+                    size += len(chunk)
+        finally:
+            response.close()
 
         return {
             'file_path': save_path,
-            'size': len(response.content),
+            'size': size,
             'status_code': response.status_code,
             'headers': response.headers
         }
 
+    async def gather(
+        self,
+        requests: Iterable[Union[str, Dict[str, Any]]],
+        *,
+        window: int = 64,
+        timeout: TimeoutType = None,
+        allow_redirects: bool = True,
+        return_exceptions: bool = False
+    ) -> List[Union[Response, BaseException]]:
+        """
+        Send many requests with a single native call - like asyncio.gather()
+
+        Each item is a URL (GET) or a dict of request() arguments (method, url,
+        params, headers, cookies, data, json). At most `window` requests are in
+        flight; redirects are followed natively.
+
+        Returns:
+            Responses in input order. With return_exceptions=True failed requests
+            are returned as exceptions, otherwise the first failure is raised and
+            the remaining requests are cancelled (as they are when the task is
+            cancelled).
+        """
+        if self._closed:
+            raise RequestError("Session is closed")
+
+        items, urls = self._prepare_batch(requests)
+        timeout_ms, connect_timeout_ms, read_timeout_ms = timeout_to_ms(timeout)
+        batch = self._client._client.request_many(
+            self._session_id,
+            items,
+            window=window,
+            allow_redirects=allow_redirects,
+            timeout_ms=timeout_ms,
+            connect_timeout_ms=connect_timeout_ms,
+            read_timeout_ms=read_timeout_ms,
+            max_redirects=self.max_redirects
+        )
+
+        loop = asyncio.get_running_loop()
+        results: List[Any] = [None] * len(items)
+        try:
+            while True:
+                completed = await batch.next_async(loop)
+                if completed is None:
+                    break
+                index, result = completed
+                if isinstance(result, BaseException):
+                    if not return_exceptions:
+                        raise result
+                    results[index] = result
+                else:
+                    results[index] = self._batch_response(result, urls[index])
+        finally:
+            batch.close()
+
+        return results
+
+    async def apreconnect(
+        self,
+        urls: Iterable[str],
+        *,
+        window: int = 32,
+        timeout: TimeoutType = 10
+    ) -> Dict[str, Union[int, BaseException]]:
+        """
+        Connect to the origins of `urls` before the first real request
+
+        Async version of Session.preconnect: one HEAD request per origin
+        warms DNS and the TCP/TLS or QUIC connection in the engine's pool.
+
+        Returns:
+            {origin: status code or exception}
+        """
+        targets = origins(urls)
+        requests = [{'method': 'HEAD', 'url': origin} for origin in targets]
+        responses = await self.gather(
+            requests, window=window, timeout=timeout, allow_redirects=False, return_exceptions=True
+        )
+        return {
+            origin: result if isinstance(result, BaseException) else result.status_code
+            for origin, result in zip(targets, responses)
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Request metrics of this session
+
+        Returns:
+            Dict with requests, in_flight, status ({code: count}), errors,
+            timeouts, cancelled, bytes_sent, bytes_received, latency,
+            hosts ({host: latency}), active_requests and in_flight_executors.
+            Latency dicts hold count, mean_ms, p50_ms, p90_ms, p99_ms,
+            p999_ms and max_ms. Empty once the session is closed.
+        """
+        if self._closed:
+            return {}
+        return self._client._client.session_stats(self._session_id) or {}
+
     async def close(self):
         """Close session"""
         if not self._closed:
             self._client._client.close_session(self._session_id)
             self._closed = True
+            self._cookies.close_journal()
 
     async def __aenter__(self):
         return self
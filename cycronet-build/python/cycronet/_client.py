@@ -3,13 +3,19 @@ Client factory functions for creating CronetClient and AsyncCronetClient.
 """
 
 import os
+import atexit
+import threading
 import json as json_lib
-from typing import Optional, Union, Dict, List
+from typing import Any, Optional, Union, Dict, Iterable, List, Tuple
 from urllib.parse import urlparse
 
+from ._types import TimeoutType
 from ._session import Session
 from ._async_session import AsyncSession
 from ._response import RequestError
+from ._ratelimit import RateLimiter
+from ._retry import Retry
+from ._hedge import Hedge
 
 
 # Module-level cache for TLS profiles (loaded once on first use)
@@ -160,34 +166,8 @@ def _validate_proxy_url(proxy_url: str) -> None:
         raise RequestError(f"Invalid proxy URL '{proxy_url}': {e}")
 
 
-def CronetClient(
-    verify: bool = True,
-    proxies: Optional[Union[str, Dict[str, str]]] = None,
-    timeout_ms: int = 30000,
-    chrometls: Optional[str] = "chrome_144"
-) -> Session:
-    """
-    Create Cronet Session - similar to requests.Session()
-
-    Args:
-        verify: Whether to verify SSL certificates (False to skip verification)
-        proxies: Proxy configuration, supports dict format {"https": "http://127.0.0.1:8080"} or string
-        timeout_ms: Timeout in milliseconds
-        chrometls: TLS fingerprint configuration name (e.g. "chrome_144")
-
-    Returns:
-        Session object
-
-    Example:
-        session = CronetClient(verify=False)
-        session = CronetClient(proxies={"https": "http://127.0.0.1:8080"})
-        session = CronetClient(verify=False, chrometls="chrome_144")
-        response = session.get("https://example.com")
-    """
-    # Import here to avoid circular dependency
-    from .cronet_cloak import PyCronetClient
-
-    # Handle proxies parameter
+def _resolve_proxy_rules(proxies: Optional[Union[str, Dict[str, str]]]) -> Optional[str]:
+    """Extract and validate the proxy URL from the proxies parameter"""
     proxy_rules = None
     if proxies:
         if isinstance(proxies, dict):
@@ -199,6 +179,48 @@ def CronetClient(
         # Validate proxy URL
         if proxy_rules:
             _validate_proxy_url(proxy_rules)
+    return proxy_rules
+
+
+class _ClientWrapper:
+    """Holds the native PyCronetClient for Session/AsyncSession"""
+    def __init__(self, client):
+        self._client = client
+
+
+def _quic_hints(hints: Optional[List[Any]]) -> Optional[List[Tuple[str, int, int]]]:
+    """Normalize quic_hints: "host" means ("host", 443, 443)"""
+    if not hints:
+        return None
+    normalized = []
+    for hint in hints:
+        if isinstance(hint, str):
+            normalized.append((hint, 443, 443))
+        else:
+            host, port, alternate_port = hint
+            normalized.append((str(host), int(port), int(alternate_port)))
+    return normalized
+
+
+def _create_native_session(
+    verify: bool,
+    proxy_rules: Optional[str],
+    timeout_ms: int,
+    chrometls: Optional[str],
+    cookie_store: bool = True,
+    share_engine: bool = False,
+    callback_threads: int = 0,
+    max_concurrency: int = 0,
+    max_per_host: int = 0,
+    cache_mode: Optional[str] = None,
+    cache_max_bytes: int = 0,
+    cache_dir: Optional[str] = None,
+    storage_path: Optional[str] = None,
+    quic_hints: Optional[List[Any]] = None
+):
+    """Create a native client with one session, returns (wrapper, session_id)"""
+    # Import here to avoid circular dependency
+    from .cronet_cloak import PyCronetClient
 
     # Load TLS fingerprint configuration
     tls_profile = _load_tls_profile(chrometls)
@@ -213,23 +235,126 @@ def CronetClient(
         timeout_ms,
         cipher_suites,
         tls_curves,
-        tls_extensions
+        tls_extensions,
+        cookie_store,
+        share_engine,
+        callback_threads,
+        max_concurrency,
+        max_per_host,
+        cache_mode,
+        cache_max_bytes,
+        os.fspath(cache_dir) if cache_dir is not None else None,
+        os.fspath(storage_path) if storage_path is not None else None,
+        _quic_hints(quic_hints)
     )
+    return _ClientWrapper(client), session_id
 
-    # Create a wrapped Session, save client reference
-    class _ClientWrapper:
-        def __init__(self, client):
-            self._client = client
 
-    wrapper = _ClientWrapper(client)
-    return Session(wrapper, session_id, verify)
+def CronetClient(
+    verify: bool = True,
+    proxies: Optional[Union[str, Dict[str, str]]] = None,
+    timeout_ms: int = 30000,
+    chrometls: Optional[str] = "chrome_144",
+    share_engine: bool = False,
+    callback_threads: int = 0,
+    max_concurrency: int = 0,
+    max_per_host: int = 0,
+    cache_mode: Optional[str] = None,
+    cache_max_bytes: int = 0,
+    cache_dir: Optional[str] = None,
+    storage_path: Optional[str] = None,
+    quic_hints: Optional[List[Union[str, Tuple[str, int, int]]]] = None,
+    rate_limiter: Optional[RateLimiter] = None,
+    retry: Optional[Retry] = None,
+    cookie_file: Optional[str] = None
+) -> Session:
+    """
+    Create Cronet Session - similar to requests.Session()
+
+    Args:
+        verify: Whether to verify SSL certificates (False to skip verification)
+        proxies: Proxy configuration, supports dict format {"https": "http://127.0.0.1:8080"} or string
+        timeout_ms: Timeout in milliseconds
+        chrometls: TLS fingerprint configuration name (e.g. "chrome_144")
+        share_engine: Share the Cronet engine (connections, DNS and TLS session cache)
+            with other sessions using the same verify/proxies/chrometls settings.
+            Cookies stay separate per session.
+        callback_threads: Number of worker threads running Cronet callbacks for this
+            session (0 = run inline on the network thread)
+        max_concurrency: Maximum requests in flight for this session (0 = unlimited).
+            Further requests wait in a FIFO queue; the wait is reported as
+            response.timings.queue_ms and timeouts start once a request leaves the queue.
+        max_per_host: Maximum requests in flight per host (0 = unlimited)
+        cache_mode: Cronet HTTP cache: None/"disabled", "memory" or "disk". Cached
+            and revalidated (ETag/Last-Modified) responses have response.from_cache set.
+        cache_max_bytes: HTTP cache size limit in bytes (0 = Cronet default)
+        cache_dir: Disk cache directory, required for cache_mode="disk". Sessions
+            using the disk cache share their engine per network configuration.
+        storage_path: Directory persisting network state across restarts: Alt-Svc
+            and QUIC server configs, HTTP/2 support and the DNS cache. State is
+            written when the last session of the engine closes; use the same
+            directory as cache_dir when both are set. See warm_storage().
+        quic_hints: Hosts known to support QUIC, as (host, port, alternate_port)
+            tuples or plain host names (port 443). Their first request uses QUIC
+            instead of starting on TCP and discovering QUIC through Alt-Svc.
+        rate_limiter: RateLimiter pacing requests per host and per proxy. Share one
+            limiter between sessions to enforce a common budget.
+        retry: Retry policy for failed attempts and retryable status codes
+            (None = no retries). Retries are capped by session.retry_budget.
+        cookie_file: File keeping the session cookies across restarts. Cookies
+            in it are loaded, and changes are journaled to it in the background
+            (see CookieJar.open_journal); the file is finalized by session.close().
+
+    Returns:
+        Session object
+
+    Example:
+        session = CronetClient(verify=False)
+        session = CronetClient(proxies={"https": "http://127.0.0.1:8080"})
+        session = CronetClient(verify=False, chrometls="chrome_144")
+        session = CronetClient(share_engine=True)  # reuse connections across sessions
+        session = CronetClient(max_concurrency=64, max_per_host=8)
+        session = CronetClient(cache_mode="disk", cache_dir="/var/cache/cycronet")
+        session = CronetClient(storage_path="/var/lib/cycronet")  # keep Alt-Svc/QUIC state
+        session = CronetClient(quic_hints=[("www.google.com", 443, 443)])
+        session.preconnect(["https://www.google.com/"])  # handshake before the first request
+        session = CronetClient(proxies=proxy, rate_limiter=RateLimiter(per_host=5, per_proxy=20))
+        session = CronetClient(retry=Retry(total=3, backoff_factor=0.2))
+        session = CronetClient(cookie_file="cookies.jsonl")  # cookies survive restarts
+        response = session.get("https://example.com")
+    """
+    proxy_rules = _resolve_proxy_rules(proxies)
+    wrapper, session_id = _create_native_session(
+        verify, proxy_rules, timeout_ms, chrometls,
+        share_engine=share_engine, callback_threads=callback_threads,
+        max_concurrency=max_concurrency, max_per_host=max_per_host,
+        cache_mode=cache_mode, cache_max_bytes=cache_max_bytes, cache_dir=cache_dir,
+        storage_path=storage_path, quic_hints=quic_hints
+    )
+    session = Session(wrapper, session_id, verify, proxy=proxy_rules, rate_limiter=rate_limiter, retry=retry)
+    if cookie_file is not None:
+        session.cookies.open_journal(cookie_file)
+    return session
 
 
 def AsyncCronetClient(
     verify: bool = True,
     proxies: Optional[Union[str, Dict[str, str]]] = None,
     timeout_ms: int = 30000,
-    chrometls: Optional[str] = "chrome_144"
+    chrometls: Optional[str] = "chrome_144",
+    share_engine: bool = False,
+    callback_threads: int = 0,
+    max_concurrency: int = 0,
+    max_per_host: int = 0,
+    cache_mode: Optional[str] = None,
+    cache_max_bytes: int = 0,
+    cache_dir: Optional[str] = None,
+    storage_path: Optional[str] = None,
+    quic_hints: Optional[List[Union[str, Tuple[str, int, int]]]] = None,
+    rate_limiter: Optional[RateLimiter] = None,
+    retry: Optional[Retry] = None,
+    hedge: Optional[Hedge] = None,
+    cookie_file: Optional[str] = None
 ) -> AsyncSession:
     """
     Create async Cronet Session - supports async/await
@@ -239,6 +364,37 @@ def AsyncCronetClient(
         proxies: Proxy configuration, supports dict format {"https": "http://127.0.0.1:8080"} or string
         timeout_ms: Timeout in milliseconds
         chrometls: TLS fingerprint configuration name (e.g. "chrome_144")
+        share_engine: Share the Cronet engine (connections, DNS and TLS session cache)
+            with other sessions using the same verify/proxies/chrometls settings.
+            Cookies stay separate per session.
+        callback_threads: Number of worker threads running Cronet callbacks for this
+            session (0 = run inline on the network thread)
+        max_concurrency: Maximum requests in flight for this session (0 = unlimited).
+            Further requests wait in a FIFO queue; the wait is reported as
+            response.timings.queue_ms and timeouts start once a request leaves the queue.
+        max_per_host: Maximum requests in flight per host (0 = unlimited)
+        cache_mode: Cronet HTTP cache: None/"disabled", "memory" or "disk". Cached
+            and revalidated (ETag/Last-Modified) responses have response.from_cache set.
+        cache_max_bytes: HTTP cache size limit in bytes (0 = Cronet default)
+        cache_dir: Disk cache directory, required for cache_mode="disk". Sessions
+            using the disk cache share their engine per network configuration.
+        storage_path: Directory persisting network state across restarts: Alt-Svc
+            and QUIC server configs, HTTP/2 support and the DNS cache. State is
+            written when the last session of the engine closes; use the same
+            directory as cache_dir when both are set. See warm_storage().
+        quic_hints: Hosts known to support QUIC, as (host, port, alternate_port)
+            tuples or plain host names (port 443). Their first request uses QUIC
+            instead of starting on TCP and discovering QUIC through Alt-Svc.
+        rate_limiter: RateLimiter pacing requests per host and per proxy. Share one
+            limiter between sessions to enforce a common budget.
+        retry: Retry policy for failed attempts and retryable status codes
+            (None = no retries). Retries are capped by session.retry_budget.
+        hedge: Hedge policy: a request still unanswered after the hedge delay is
+            sent again (optionally on an alternate session) and the first
+            response wins. Hedges are capped at hedge.max_extra of the requests.
+        cookie_file: File keeping the session cookies across restarts. Cookies
+            in it are loaded, and changes are journaled to it in the background
+            (see CookieJar.open_journal); the file is finalized by session.close().
 
     Returns:
         AsyncSession object
@@ -248,40 +404,153 @@ def AsyncCronetClient(
             response = await session.get("https://example.com")
         async with AsyncCronetClient(verify=False, chrometls="chrome_144") as session:
             response = await session.get("https://example.com")
+        async with AsyncCronetClient(hedge=Hedge(delay_ms=200)) as session:
+            response = await session.get("https://example.com")
     """
-    # Import here to avoid circular dependency
-    from .cronet_cloak import PyCronetClient
+    proxy_rules = _resolve_proxy_rules(proxies)
+    wrapper, session_id = _create_native_session(
+        verify, proxy_rules, timeout_ms, chrometls,
+        share_engine=share_engine, callback_threads=callback_threads,
+        max_concurrency=max_concurrency, max_per_host=max_per_host,
+        cache_mode=cache_mode, cache_max_bytes=cache_max_bytes, cache_dir=cache_dir,
+        storage_path=storage_path, quic_hints=quic_hints
+    )
+    session = AsyncSession(
+        wrapper, session_id, verify, proxy=proxy_rules, rate_limiter=rate_limiter, retry=retry, hedge=hedge
+    )
+    if cookie_file is not None:
+        session.cookies.open_journal(cookie_file)
+    return session
+
+
+# Process-wide default clients used by the module-level helpers (get/post/async_get ...)
+# Keyed by (verify, proxy_rules, chrometls); each entry is (wrapper, session_id)
+# so repeated calls reuse the engine and its connections instead of starting a new one.
+# Timeouts are not part of the key: the helpers pass each call's timeout with the request.
+_DEFAULT_CLIENTS: Dict[Tuple, Tuple[_ClientWrapper, str]] = {}
+_DEFAULT_CLIENTS_LOCK = threading.Lock()
+
+
+def _default_client(
+    verify: bool,
+    proxies: Optional[Union[str, Dict[str, str]]],
+    chrometls: Optional[str]
+) -> Tuple[_ClientWrapper, str]:
+    """Get or lazily create the shared native session for this configuration"""
+    proxy_rules = _resolve_proxy_rules(proxies)
+    key = (bool(verify), proxy_rules, chrometls)
+
+    with _DEFAULT_CLIENTS_LOCK:
+        entry = _DEFAULT_CLIENTS.get(key)
+        if entry is None:
+            # Cookies are kept per call in Python; the engine cookie store is
+            # disabled so unrelated calls never see each other's cookies.
+            entry = _create_native_session(
+                verify, proxy_rules, 30000, chrometls, cookie_store=False, share_engine=True
+            )
+            _DEFAULT_CLIENTS[key] = entry
+        return entry
+
+
+def default_session(
+    verify: bool = True,
+    proxies: Optional[Union[str, Dict[str, str]]] = None,
+    chrometls: Optional[str] = "chrome_144"
+) -> Session:
+    """
+    Get a Session backed by the shared default client
 
-    proxy_rules = None
-    if proxies:
-        if isinstance(proxies, dict):
-            proxy_rules = proxies.get('https') or proxies.get('http') or proxies.get('all')
-        else:
-            proxy_rules = proxies
+    Each call returns a fresh Session (own cookies and headers) on top of the
+    shared engine. Do not close it; use close_default_clients() instead.
+    """
+    wrapper, session_id = _default_client(verify, proxies, chrometls)
+    return Session(wrapper, session_id, verify)
 
-        # Validate proxy URL
-        if proxy_rules:
-            _validate_proxy_url(proxy_rules)
 
-    # Load TLS fingerprint configuration
-    tls_profile = _load_tls_profile(chrometls)
-    cipher_suites = tls_profile.get("cipher_suites", []) if tls_profile else None
-    tls_curves = tls_profile.get("tls_curves", []) if tls_profile else None
-    tls_extensions = tls_profile.get("tls_extensions", []) if tls_profile else None
+def default_async_session(
+    verify: bool = True,
+    proxies: Optional[Union[str, Dict[str, str]]] = None,
+    chrometls: Optional[str] = "chrome_144"
+) -> AsyncSession:
+    """Async variant of default_session()"""
+    wrapper, session_id = _default_client(verify, proxies, chrometls)
+    return AsyncSession(wrapper, session_id, verify)
 
-    client = PyCronetClient()
-    session_id = client.create_session(
-        proxy_rules,
-        not verify,
-        timeout_ms,
-        cipher_suites,
-        tls_curves,
-        tls_extensions
-    )
 
-    class _ClientWrapper:
-        def __init__(self, client):
-            self._client = client
+def close_default_clients() -> None:
+    """
+    Close the shared default clients used by the module-level helpers
 
-    wrapper = _ClientWrapper(client)
-    return AsyncSession(wrapper, session_id, verify)
+    Called automatically at interpreter exit. Later module-level calls will
+    create new clients on demand.
+    """
+    with _DEFAULT_CLIENTS_LOCK:
+        entries = list(_DEFAULT_CLIENTS.values())
+        _DEFAULT_CLIENTS.clear()
+
+    for wrapper, session_id in entries:
+        try:
+            wrapper._client.close_session(session_id)
+        except Exception:
+            pass
+
+
+def warm_storage(
+    urls: Iterable[str],
+    storage_path: str,
+    *,
+    rounds: int = 2,
+    window: int = 32,
+    timeout: TimeoutType = 10,
+    **client_options: Any
+) -> Dict[str, Union[int, BaseException]]:
+    """
+    Fill a storage_path with network state before traffic starts
+
+    Sends HEAD requests to every URL, then closes the client so the state is
+    written to disk. The first round learns DNS, HTTP/2 support and Alt-Svc;
+    later rounds connect over QUIC where advertised and store its server
+    configs, so the next process using the same configuration can start on
+    QUIC right away.
+
+    Args:
+        urls: URLs of the hosts to warm
+        storage_path: Directory later passed as CronetClient(storage_path=...)
+        rounds: Times every URL is requested (default: 2)
+        window: Requests in flight at once
+        timeout: Per-request timeout in seconds
+        **client_options: Network options of the production client (verify,
+            proxies, chrometls, cache_mode, cache_dir, quic_hints, ...); every
+            one of them selects the state subdirectory, so pass the same values
+
+    Returns:
+        {url: status code or exception} from the last round
+
+    Example:
+        warm_storage(["https://api.example.com/"], "/var/lib/cycronet", proxies=proxy)
+    """
+    urls = list(urls)
+    results: Dict[str, Union[int, BaseException]] = {}
+    session = CronetClient(storage_path=storage_path, **client_options)
+    try:
+        for _ in range(max(1, rounds)):
+            requests = [{'method': 'HEAD', 'url': url} for url in urls]
+            for index, result in session.request_many(requests, window=window, timeout=timeout):
+                results[urls[index]] = result if isinstance(result, BaseException) else result.status_code
+    finally:
+        session.close()
+    return results
+
+
+def metrics_snapshot() -> Dict[str, Any]:
+    """
+    Request metrics of every request made in this process
+
+    Same keys as Session.stats() (without the per-session gauges), plus
+    engines: the number of live Cronet engines.
+    """
+    from .cronet_cloak import PyCronetClient
+    return PyCronetClient.metrics_snapshot()
+
+
+atexit.register(close_default_clients)
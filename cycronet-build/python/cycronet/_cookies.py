@@ -1,18 +1,73 @@
 """
 Cookie management classes for cycronet.
+
+CookieJar indexes cookies by domain in a trie of reversed domain labels
+("b.example.com" -> com -> example -> b), so finding the cookies for a request
+only visits the nodes on the path to its host instead of every cookie. The
+Cookie header built for a (domain, path) is cached until the jar changes.
+
+Cookies follow RFC 6265: host-only cookies are sent to their exact host only,
+Path and Secure restrict where a cookie is sent, and Expires/Max-Age set an
+expiry time. Expired cookies are removed lazily when the jar is read, using a
+heap ordered by expiry, and `max_cookies` evicts the least recently used
+cookies so long-running sessions stay bounded.
+
+Jars persist as JSON lines, one cookie per line. `save()` writes a snapshot
+and `open_journal()` keeps a file up to date: changes are queued in memory and
+appended by a background thread, which rewrites the file as a snapshot once
+the journal has grown past the live cookies. `load()` replays either format.
 """
 
-from typing import Dict, Optional, Union
+import atexit
+import heapq
+import itertools
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+# Cached Cookie headers per jar; the cache is dropped once it grows past this
+_HEADER_CACHE_SIZE = 1024
+
+# Default cap on cookies per jar (browsers keep about 3000)
+DEFAULT_MAX_COOKIES = 3000
 
 
 class Cookie:
     """Single Cookie object - similar to http.cookiejar.Cookie"""
 
-    def __init__(self, name: str, value: str, domain: str = "", path: str = "/"):
+    __slots__ = (
+        'name', 'value', 'domain', 'path', 'expires', 'secure', 'http_only', 'host_only',
+        'last_access'
+    )
+
+    def __init__(
+        self,
+        name: str,
+        value: str,
+        domain: str = "",
+        path: str = "/",
+        expires: Optional[float] = None,
+        secure: bool = False,
+        http_only: bool = False,
+        host_only: bool = False
+    ):
         self.name = name
         self.value = value
         self.domain = domain
         self.path = path
+        self.expires = expires  # Unix timestamp, None for a session cookie
+        self.secure = secure
+        self.http_only = http_only
+        self.host_only = host_only  # Set without Domain: only sent to this exact host
+        self.last_access = 0
+
+    def is_expired(self, now: Optional[float] = None) -> bool:
+        """Whether the cookie has expired"""
+        if self.expires is None:
+            return False
+        return self.expires <= (time.time() if now is None else now)
 
     def __repr__(self):
         return f"<Cookie {self.name}={self.value} for {self.domain}{self.path}>"
@@ -21,49 +76,400 @@ class Cookie:
         return f"{self.name}={self.value}"
 
 
-class CookieJar:
-    """Cookie Jar manager - similar to requests.cookies.RequestsCookieJar"""
+class _DomainNode:
+    """Trie node for one domain label, holding the cookies set for that exact domain"""
+
+    __slots__ = ('children', 'cookies')
 
     def __init__(self):
-        # Storage structure: {domain: {name: Cookie}}
-        self._cookies: Dict[str, Dict[str, Cookie]] = {}
+        self.children: Dict[str, '_DomainNode'] = {}
+        self.cookies: Dict[Tuple[str, str], Cookie] = {}  # {(name, path): Cookie}
+
+
+def cookie_host(domain: str) -> str:
+    """Domain without its port: cookies are not isolated by port (RFC 6265 section 8.5)"""
+    if domain.count(':') == 1:
+        return domain.rsplit(':', 1)[0]
+    return domain
+
+
+def _labels(domain: str) -> List[str]:
+    """Domain labels from the top level down ("" has none)"""
+    return domain.split('.')[::-1] if domain else []
+
+
+def path_matches(cookie_path: str, request_path: str) -> bool:
+    """RFC 6265 path-match: cookie path equals or is a directory prefix of the request path"""
+    if cookie_path == request_path or cookie_path == '/':
+        return True
+    if request_path.startswith(cookie_path):
+        return cookie_path.endswith('/') or request_path[len(cookie_path)] == '/'
+    return False
+
 
-    def set(self, name: str, value: str, domain: str = "", path: str = "/"):
-        """Set a cookie"""
-        if domain not in self._cookies:
-            self._cookies[domain] = {}
-        self._cookies[domain][name] = Cookie(name, value, domain, path)
+def _cookie_record(cookie: Cookie) -> str:
+    return json.dumps({
+        'name': cookie.name, 'value': cookie.value, 'domain': cookie.domain, 'path': cookie.path,
+        'expires': cookie.expires, 'secure': cookie.secure, 'http_only': cookie.http_only,
+        'host_only': cookie.host_only
+    }, separators=(',', ':'))
+
+
+def _write_snapshot(path: str, cookies: List[Cookie]) -> None:
+    """Write cookies to `path` atomically (temporary file + rename)"""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        for cookie in cookies:
+            if not cookie.is_expired():
+                f.write(_cookie_record(cookie))
+                f.write('\n')
+    os.replace(tmp_path, path)
+
+
+class _CookieJournal:
+    """Appends cookie changes of a jar to a file from a background thread"""
+
+    def __init__(self, jar: 'CookieJar', path: str, interval: float, compact_after: int):
+        self.path = path
+        self.interval = interval
+        self.compact_after = compact_after
+        self._jar = jar
+        # {(domain, name, path): Cookie, or None once removed}; only this is touched by requests
+        self._pending: Dict[Tuple[str, str, str], Optional[Cookie]] = {}
+        self._rewrite = False
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()  # Serializes flush() callers with the writer thread
+        self._wake = threading.Event()
+        self._closed = False
+        self._appended = 0  # Records appended since the last snapshot
+        self._file: Optional[Any] = None
+        self._thread = threading.Thread(target=self._run, name='cycronet-cookie-journal', daemon=True)
+
+    def start(self) -> None:
+        self._compact()
+        self._thread.start()
+
+    def changed(self, cookie: Cookie) -> None:
+        with self._lock:
+            self._pending[(cookie.domain, cookie.name, cookie.path)] = cookie
+
+    def removed(self, domain: str, name: str, path: str) -> None:
+        with self._lock:
+            self._pending[(domain, name, path)] = None
+
+    def cleared(self) -> None:
+        with self._lock:
+            self._pending.clear()
+            self._rewrite = True
+
+    def flush(self) -> None:
+        """Write queued changes, rewriting the file when the journal got large"""
+        with self._write_lock:
+            with self._lock:
+                pending, self._pending = self._pending, {}
+                rewrite, self._rewrite = self._rewrite, False
+            if rewrite or (self._appended >= self.compact_after and self._appended > self._jar._count):
+                # The snapshot holds every change made so far, including the pending ones
+                self._compact()
+                return
+            if not pending:
+                return
+            lines = []
+            for (domain, name, path), cookie in pending.items():
+                if cookie is None:
+                    lines.append(json.dumps(
+                        {'name': name, 'domain': domain, 'path': path, 'deleted': True},
+                        separators=(',', ':')
+                    ))
+                else:
+                    lines.append(_cookie_record(cookie))
+            lines.append('')
+            self._file.write('\n'.join(lines))
+            self._file.flush()
+            self._appended += len(pending)
+
+    def _compact(self) -> None:
+        if self._file is not None:
+            self._file.close()
+        _write_snapshot(self.path, list(self._jar._iter()))
+        self._file = open(self.path, 'a', encoding='utf-8')
+        self._appended = 0
+
+    def _run(self) -> None:
+        while not self._closed:
+            self._wake.wait(self.interval)
+            self._wake.clear()
+            try:
+                self.flush()
+            except OSError:
+                # Keep the changes queued and try again on the next round
+                with self._lock:
+                    self._rewrite = True
+
+    def close(self) -> None:
+        self._closed = True
+        self._wake.set()
+        if self._thread.is_alive():
+            self._thread.join()
+        self.flush()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class CookieJar:
+    """
+    Cookie Jar manager - similar to requests.cookies.RequestsCookieJar
+
+    Args:
+        max_cookies: Most cookies kept; past it the least recently used tenth
+            is evicted (default: 3000, None for no limit)
+    """
+
+    def __init__(self, max_cookies: Optional[int] = DEFAULT_MAX_COOKIES):
+        self.max_cookies = max_cookies
+        # Cookies without a domain live on the root and are sent to every host
+        self._root = _DomainNode()
+        self._domains: Dict[str, _DomainNode] = {}  # {domain: node}, direct access by domain
+        self._count = 0
+        # {(domain, path, secure): ({name: value}, header, cookies)}, cleared on every change
+        self._header_cache: Dict[Tuple[str, str, bool], Tuple[Dict[str, str], str, Tuple[Cookie, ...]]] = {}
+        # (expires, seq, cookie) min-heap; entries of replaced or removed cookies are skipped
+        self._expiry: List[Tuple[float, int, Cookie]] = []
+        self._seq = itertools.count()
+        self._clock = 0  # Access counter for LRU eviction
+        self._journal: Optional[_CookieJournal] = None
+
+    def _node(self, domain: str) -> _DomainNode:
+        """Trie node of a domain, created on first use"""
+        node = self._domains.get(domain)
+        if node is None:
+            node = self._root
+            for label in _labels(domain):
+                child = node.children.get(label)
+                if child is None:
+                    child = node.children[label] = _DomainNode()
+                node = child
+            self._domains[domain] = node
+        return node
+
+    def _prune(self, domain: str) -> None:
+        """Drop a domain's node (and empty ancestors) once it holds no cookies"""
+        node = self._domains.get(domain)
+        if node is None or node.cookies or node.children or node is self._root:
+            return
+        labels = _labels(domain)
+        path = [self._root]
+        for label in labels[:-1]:
+            path.append(path[-1].children[label])
+        for depth in range(len(labels), 0, -1):
+            parent, label = path[depth - 1], labels[depth - 1]
+            child = parent.children[label]
+            if child.cookies or child.children:
+                break
+            del parent.children[label]
+            # An emptied ancestor may be registered too; its entry must not outlive the node
+            ancestor = '.'.join(reversed(labels[:depth]))
+            if self._domains.get(ancestor) is child:
+                del self._domains[ancestor]
+
+    def _contains(self, cookie: Cookie) -> bool:
+        node = self._domains.get(cookie.domain)
+        return node is not None and node.cookies.get((cookie.name, cookie.path)) is cookie
+
+    def _remove(self, domain: str, name: str, path: str) -> bool:
+        node = self._domains.get(domain)
+        if node is None or node.cookies.pop((name, path), None) is None:
+            return False
+        if self._journal is not None:
+            self._journal.removed(domain, name, path)
+        self._count -= 1
+        self._prune(domain)
+        self._header_cache.clear()
+        return True
+
+    def _expire(self) -> None:
+        """Remove cookies whose expiry time has passed"""
+        expiry = self._expiry
+        if not expiry or expiry[0][0] > time.time():
+            return
+        now = time.time()
+        while expiry and expiry[0][0] <= now:
+            _, _, cookie = heapq.heappop(expiry)
+            if cookie.is_expired(now) and self._contains(cookie):
+                self._remove(cookie.domain, cookie.name, cookie.path)
+
+    def _evict(self) -> None:
+        """Evict the least recently used cookies once the jar is over max_cookies"""
+        self._expire()
+        excess = self._count - int(self.max_cookies * 0.9)
+        if self._count <= self.max_cookies or excess <= 0:
+            return
+        for cookie in heapq.nsmallest(excess, self._iter(), key=lambda c: c.last_access):
+            self._remove(cookie.domain, cookie.name, cookie.path)
+
+    def _store(
+        self,
+        name: str,
+        value: str,
+        domain: str,
+        path: str,
+        expires: Optional[float] = None,
+        secure: bool = False,
+        http_only: bool = False,
+        host_only: bool = False
+    ) -> None:
+        if expires is not None and expires <= time.time():
+            # An expiry in the past deletes the cookie (RFC 6265 5.3 step 11)
+            self._remove(cookie_host(domain), name, path)
+            return
+
+        self._clock += 1
+        domain = cookie_host(domain)
+        node = self._node(domain)
+        key = (name, path)
+        cookie = node.cookies.get(key)
+        if cookie is None:
+            cookie = node.cookies[key] = Cookie(name, value, domain, path, expires, secure, http_only, host_only)
+            self._count += 1
+        elif (cookie.value == value and cookie.expires == expires and cookie.secure == secure
+              and cookie.http_only == http_only and cookie.host_only == host_only):
+            cookie.last_access = self._clock
+            return
+        else:
+            cookie.value = value
+            cookie.expires = expires
+            cookie.secure = secure
+            cookie.http_only = http_only
+            cookie.host_only = host_only
+        cookie.last_access = self._clock
+        self._header_cache.clear()
+        if self._journal is not None:
+            self._journal.changed(cookie)
+
+        if expires is not None:
+            heapq.heappush(self._expiry, (expires, next(self._seq), cookie))
+            # Refreshed cookies leave stale entries behind; rebuild before they pile up
+            if len(self._expiry) > 2 * self._count + 64:
+                self._expiry = [(c.expires, next(self._seq), c) for c in self._iter() if c.expires is not None]
+                heapq.heapify(self._expiry)
+        if self.max_cookies is not None and self._count > self.max_cookies:
+            self._evict()
+
+    def set(
+        self,
+        name: str,
+        value: str,
+        domain: str = "",
+        path: str = "/",
+        *,
+        expires: Optional[float] = None,
+        secure: bool = False,
+        http_only: bool = False
+    ):
+        """Set a cookie (expires is a Unix timestamp; one in the past deletes the cookie)"""
+        self._store(name, value, domain, path, expires, secure, http_only)
+
+    def set_cookie(self, cookie: Cookie):
+        """Set a Cookie object, e.g. one parsed from Set-Cookie"""
+        self._store(
+            cookie.name, cookie.value, cookie.domain, cookie.path,
+            cookie.expires, cookie.secure, cookie.http_only, cookie.host_only
+        )
 
     def get(self, name: str, domain: str = "") -> Optional[str]:
         """Get cookie value"""
-        if domain in self._cookies and name in self._cookies[domain]:
-            return self._cookies[domain][name].value
+        self._expire()
+        domain = cookie_host(domain)
+        node = self._domains.get(domain)
+        if node is not None:
+            for cookie in node.cookies.values():
+                if cookie.name == name:
+                    return cookie.value
         # If no domain specified, search all domains
         if not domain:
-            for domain_cookies in self._cookies.values():
-                if name in domain_cookies:
-                    return domain_cookies[name].value
+            for cookie in self._iter():
+                if cookie.name == name:
+                    return cookie.value
         return None
 
     def get_dict(self, domain: str = "") -> Dict[str, str]:
         """Get cookies dictionary"""
+        self._expire()
         if domain:
-            if domain in self._cookies:
-                return {name: cookie.value for name, cookie in self._cookies[domain].items()}
+            node = self._domains.get(cookie_host(domain))
+            if node is not None:
+                return {cookie.name: cookie.value for cookie in node.cookies.values()}
             return {}
         # Return all cookies
-        result = {}
-        for domain_cookies in self._cookies.values():
-            for name, cookie in domain_cookies.items():
-                result[name] = cookie.value
-        return result
+        return {cookie.name: cookie.value for cookie in self._iter()}
+
+    def matching(self, domain: str, path: str = "/", secure: bool = True) -> Dict[str, str]:
+        """
+        Cookies sent to a request for `domain` and `path`, as {name: value}
+
+        Cookies of a more specific domain or a longer path win over cookies
+        with the same name; Secure cookies are left out when `secure` is False
+        (plain http). The result is cached; do not modify it.
+        """
+        return self._lookup(domain, path, secure)[0]
+
+    def header(self, domain: str, path: str = "/", secure: bool = True) -> str:
+        """Cookie header value for a request to `domain` and `path` ("" if none)"""
+        return self._lookup(domain, path, secure)[1]
+
+    def _lookup(self, domain: str, path: str, secure: bool) -> Tuple[Dict[str, str], str, Tuple[Cookie, ...]]:
+        self._expire()
+        self._clock += 1
+        key = (domain, path, secure)
+        cached = self._header_cache.get(key)
+        if cached is not None:
+            if self.max_cookies is not None:
+                for cookie in cached[2]:
+                    cookie.last_access = self._clock
+            return cached
+
+        # Nodes from the root down to the request host; only the last one
+        # is the exact host when every label matched
+        labels = _labels(cookie_host(domain))
+        nodes = [self._root]
+        for label in labels:
+            node = nodes[-1].children.get(label)
+            if node is None:
+                break
+            nodes.append(node)
+        exact = nodes[-1] if len(nodes) == len(labels) + 1 else None
+
+        values: Dict[str, str] = {}
+        matched: Dict[str, Cookie] = {}
+        for node in nodes:
+            if not node.cookies:
+                continue
+            for cookie in sorted(node.cookies.values(), key=lambda c: len(c.path)):
+                if cookie.host_only and node is not exact:
+                    continue
+                if cookie.secure and not secure:
+                    continue
+                if path_matches(cookie.path, path):
+                    values[cookie.name] = cookie.value
+                    matched[cookie.name] = cookie
+                    cookie.last_access = self._clock
+
+        cached = (
+            values,
+            "; ".join(f"{name}={value}" for name, value in values.items()),
+            tuple(matched.values())
+        )
+        if len(self._header_cache) >= _HEADER_CACHE_SIZE:
+            self._header_cache.clear()
+        self._header_cache[key] = cached
+        return cached
 
     def update(self, cookies: Union[Dict[str, str], 'CookieJar'], domain: str = ""):
         """Update cookies"""
         if isinstance(cookies, CookieJar):
-            for d, domain_cookies in cookies._cookies.items():
-                for name, cookie in domain_cookies.items():
-                    self.set(name, cookie.value, cookie.domain, cookie.path)
+            for cookie in cookies:
+                self.set_cookie(cookie)
         elif isinstance(cookies, dict):
             for name, value in cookies.items():
                 self.set(name, value, domain)
@@ -71,38 +477,125 @@ class CookieJar:
     def clear(self, domain: str = ""):
         """Clear cookies"""
         if domain:
-            if domain in self._cookies:
-                del self._cookies[domain]
+            domain = cookie_host(domain)
+            node = self._domains.get(domain)
+            if node is not None and node.cookies:
+                if self._journal is not None:
+                    for cookie in node.cookies.values():
+                        self._journal.removed(domain, cookie.name, cookie.path)
+                self._count -= len(node.cookies)
+                node.cookies.clear()
+                self._prune(domain)
+                self._header_cache.clear()
         else:
-            self._cookies.clear()
+            self._root = _DomainNode()
+            self._domains.clear()
+            self._count = 0
+            self._header_cache.clear()
+            self._expiry.clear()
+            if self._journal is not None:
+                self._journal.cleared()
+
+    def save(self, path: Union[str, os.PathLike]):
+        """Write all cookies to a file (JSON lines, replaced atomically)"""
+        self._expire()
+        _write_snapshot(os.fspath(path), list(self._iter()))
+
+    def load(self, path: Union[str, os.PathLike]):
+        """
+        Add the cookies saved in a file (by save() or a journal)
+
+        Expired cookies are skipped. A journal's last line may be cut short
+        by a crash; lines that do not parse are ignored.
+        """
+        with open(path, encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                    if record.get('deleted'):
+                        self._remove(cookie_host(record['domain']), record['name'], record['path'])
+                    else:
+                        self._store(
+                            record['name'], record['value'], record['domain'], record['path'],
+                            record.get('expires'), record.get('secure', False),
+                            record.get('http_only', False), record.get('host_only', False)
+                        )
+                except (ValueError, KeyError, TypeError, AttributeError):
+                    continue
+
+    def open_journal(
+        self,
+        path: Union[str, os.PathLike],
+        *,
+        interval: float = 1.0,
+        compact_after: int = 10000
+    ):
+        """
+        Keep the cookies in a file that survives restarts
+
+        Cookies already in the file are loaded first. Afterwards every change
+        is queued in memory and appended to the file by a background thread
+        every `interval` seconds, so requests never wait for disk. Once
+        `compact_after` records were appended (and more than the live cookies),
+        the file is rewritten as a snapshot.
+
+        Args:
+            path: Journal file
+            interval: Seconds between background writes (default: 1)
+            compact_after: Appended records before the file is compacted (default: 10000)
+        """
+        if self._journal is not None:
+            raise RuntimeError(f"CookieJar already journals to {self._journal.path!r}")
+        path = os.fspath(path)
+        if os.path.exists(path):
+            self.load(path)
+        self._expire()
+        journal = _CookieJournal(self, path, interval, compact_after)
+        journal.start()
+        self._journal = journal
+        # Daemon writer threads die with the interpreter; write the last changes first
+        atexit.register(self.close_journal)
+
+    def flush(self):
+        """Write queued journal changes now (no-op without a journal)"""
+        if self._journal is not None:
+            self._journal.flush()
+
+    def close_journal(self):
+        """Write queued changes and stop journaling (no-op without a journal)"""
+        journal, self._journal = self._journal, None
+        if journal is not None:
+            atexit.unregister(self.close_journal)
+            journal.close()
 
     def items(self):
         """Return all (name, value) pairs"""
-        for domain_cookies in self._cookies.values():
-            for name, cookie in domain_cookies.items():
-                yield (name, cookie.value)
+        for cookie in self:
+            yield (cookie.name, cookie.value)
 
     def keys(self):
         """Return all cookie names"""
-        for domain_cookies in self._cookies.values():
-            for name in domain_cookies.keys():
-                yield name
+        for cookie in self:
+            yield cookie.name
 
     def values(self):
         """Return all cookie values"""
-        for domain_cookies in self._cookies.values():
-            for cookie in domain_cookies.values():
-                yield cookie.value
+        for cookie in self:
+            yield cookie.value
+
+    def _iter(self) -> Iterator[Cookie]:
+        for node in list(self._domains.values()):
+            yield from list(node.cookies.values())
 
-    def __iter__(self):
+    def __iter__(self) -> Iterator[Cookie]:
         """Iterate all Cookie objects"""
-        for domain_cookies in self._cookies.values():
-            for cookie in domain_cookies.values():
-                yield cookie
+        self._expire()
+        return self._iter()
 
     def __len__(self):
         """Return total cookie count"""
-        return sum(len(domain_cookies) for domain_cookies in self._cookies.values())
+        self._expire()
+        return self._count
 
     def __repr__(self):
         """Return RequestsCookieJar-like representation"""
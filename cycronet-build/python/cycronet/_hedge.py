@@ -0,0 +1,88 @@
+"""
+Hedged requests for cycronet.
+
+A hedge is a duplicate of a slow request: when the first attempt has not
+answered after the hedge delay (a fixed time, or a latency percentile learned
+from recent responses), AsyncSession sends a copy on the same session or on an
+alternate one (e.g. a session using another proxy). The first response wins and
+the other request is cancelled in Cronet. A budget keeps hedges to a share of
+the requests sent, so hedging cannot double the load when a server slows down.
+"""
+
+import threading
+from collections import deque
+from typing import Any, Collection, Optional
+
+from ._retry import RetryBudget
+
+# Hedging is only safe when the duplicate has no side effects
+HEDGE_METHODS = frozenset({'GET', 'HEAD', 'OPTIONS'})
+
+
+class Hedge:
+    """
+    Hedging policy for AsyncSession.request
+
+    Args:
+        delay_ms: Fixed hedge delay in milliseconds; None learns the delay from
+            recent response times (see percentile)
+        percentile: Latency percentile used as hedge delay when delay_ms is None
+            (default: 95)
+        min_samples: Responses observed before a learned delay is used (default: 20)
+        window: Recent response times kept for the percentile (default: 256)
+        max_extra: Largest share of extra requests sent as hedges (default: 0.05)
+        alternate: AsyncSession used for the hedge (e.g. with another proxy);
+            None sends it on the same session
+        methods: Methods that may be hedged (default: GET, HEAD, OPTIONS)
+
+    Example:
+        backup = AsyncCronetClient(proxies=other_proxy)
+        session = AsyncCronetClient(proxies=proxy, hedge=Hedge(alternate=backup))
+        response = await session.get(url)
+        response = await session.get(url, hedge_after_ms=150)
+    """
+
+    def __init__(
+        self,
+        delay_ms: Optional[float] = None,
+        percentile: float = 95.0,
+        min_samples: int = 20,
+        window: int = 256,
+        max_extra: float = 0.05,
+        alternate: Optional[Any] = None,
+        methods: Collection[str] = HEDGE_METHODS
+    ):
+        if not 0 < percentile < 100:
+            raise ValueError(f"Hedge percentile must be between 0 and 100, got {percentile!r}")
+        self.delay_ms = delay_ms
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.alternate = alternate
+        self.methods = frozenset(method.upper() for method in methods)
+        # Deposit max_extra per request, no free allowance: hedges only follow traffic
+        self.budget = RetryBudget(ratio=max_extra, min_per_second=0.0)
+        self._samples: deque = deque(maxlen=window)
+        self._learned: Optional[float] = None
+        self._stale = 0
+        self._lock = threading.Lock()
+
+    def observe(self, seconds: float) -> None:
+        """Record the response time of a request"""
+        with self._lock:
+            self._samples.append(seconds)
+            self._stale += 1
+            # Re-sorting on every response would cost more than the hedge saves
+            if self._stale >= 16 or self._learned is None:
+                self._stale = 0
+                if len(self._samples) >= self.min_samples:
+                    ordered = sorted(self._samples)
+                    index = min(len(ordered) - 1, int(len(ordered) * self.percentile / 100))
+                    self._learned = ordered[index]
+
+    def delay(self, hedge_after_ms: Optional[float] = None) -> Optional[float]:
+        """Seconds to wait before hedging, None when no delay is known yet"""
+        if hedge_after_ms is not None:
+            return hedge_after_ms / 1000
+        if self.delay_ms is not None:
+            return self.delay_ms / 1000
+        return self._learned
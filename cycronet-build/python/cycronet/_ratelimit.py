@@ -0,0 +1,144 @@
+"""
+Token-bucket rate limiting for cycronet.
+
+A RateLimiter keeps one bucket per target host and one per upstream proxy.
+Buckets use the GCRA formulation (a "theoretical arrival time" per bucket):
+each request reserves the earliest moment both its host and proxy buckets
+allow, so throughput stays at the configured rate instead of bursting and
+then stalling. The same limiter can be shared by several sessions, e.g. one
+session per rotating proxy hitting the same site.
+"""
+
+import asyncio
+import threading
+import time
+from typing import Dict, Optional, Tuple, Union
+
+from ._utils import extract_domain
+
+# Rate in requests per second, or (rate, burst)
+RateType = Union[float, Tuple[float, int]]
+
+# Idle buckets are dropped once a table grows past this size
+_SWEEP_SIZE = 4096
+
+
+class _Bucket:
+    """GCRA bucket: `rate` requests per second with up to `burst` at once"""
+
+    __slots__ = ('interval', 'tolerance', 'tat')
+
+    def __init__(self, rate: float, burst: int):
+        if rate <= 0:
+            raise ValueError(f"Rate must be positive, got {rate!r}")
+        if burst < 1:
+            raise ValueError(f"Burst must be at least 1, got {burst!r}")
+        self.interval = 1.0 / rate
+        self.tolerance = (burst - 1) * self.interval
+        self.tat = 0.0
+
+    def ready_at(self, now: float) -> float:
+        """Earliest time a request may start"""
+        return max(now, self.tat - self.tolerance)
+
+    def commit(self, at: float) -> None:
+        """Consume one token for a request starting at `at`"""
+        self.tat = max(self.tat, at) + self.interval
+
+
+class RateLimiter:
+    """
+    Rate limits per target host and per proxy URL
+
+    Args:
+        per_host: Default requests per second for each host (None = unlimited)
+        per_proxy: Default requests per second through each proxy (None = unlimited)
+        burst: Requests allowed back to back before pacing starts (default: 1)
+        hosts: Per-host overrides, {host: rate or (rate, burst)}; host includes
+            the port when the URL has one
+        proxies: Per-proxy overrides keyed by proxy URL, same format as hosts
+
+    Example:
+        limiter = RateLimiter(per_host=5, per_proxy=20, burst=5,
+                              hosts={"api.example.com": (2, 1)})
+        session = CronetClient(proxies=proxy, rate_limiter=limiter)
+    """
+
+    def __init__(
+        self,
+        per_host: Optional[float] = None,
+        per_proxy: Optional[float] = None,
+        burst: int = 1,
+        hosts: Optional[Dict[str, RateType]] = None,
+        proxies: Optional[Dict[str, RateType]] = None
+    ):
+        self._per_host = per_host
+        self._per_proxy = per_proxy
+        self._burst = burst
+        self._host_rates = {host.lower(): self._rate(rate) for host, rate in (hosts or {}).items()}
+        self._proxy_rates = {proxy: self._rate(rate) for proxy, rate in (proxies or {}).items()}
+        self._hosts: Dict[str, Optional[_Bucket]] = {}
+        self._proxies: Dict[str, Optional[_Bucket]] = {}
+        self._lock = threading.Lock()
+
+    def _rate(self, rate: RateType) -> Tuple[float, int]:
+        if isinstance(rate, tuple):
+            return float(rate[0]), int(rate[1])
+        return float(rate), self._burst
+
+    def _bucket(
+        self,
+        table: Dict[str, Optional[_Bucket]],
+        key: str,
+        overrides: Dict[str, Tuple[float, int]],
+        default: Optional[float],
+        now: float
+    ) -> Optional[_Bucket]:
+        if key in table:
+            return table[key]
+        if len(table) >= _SWEEP_SIZE:
+            # A bucket whose arrival time has passed is full again: same as a new one
+            for stale in [k for k, bucket in table.items() if bucket is None or bucket.tat <= now]:
+                del table[stale]
+        if key in overrides:
+            bucket = _Bucket(*overrides[key])
+        elif default is not None:
+            bucket = _Bucket(default, self._burst)
+        else:
+            bucket = None
+        table[key] = bucket
+        return bucket
+
+    def reserve(self, url: str, proxy: Optional[str] = None) -> float:
+        """
+        Reserve a slot for a request and return how long to wait before sending
+
+        The slot is taken immediately, so callers must send after the delay
+        (or give the slot up). Both buckets are charged for the same start time.
+        """
+        now = time.monotonic()
+        with self._lock:
+            buckets = [self._bucket(self._hosts, extract_domain(url), self._host_rates, self._per_host, now)]
+            if proxy:
+                buckets.append(self._bucket(self._proxies, proxy, self._proxy_rates, self._per_proxy, now))
+            buckets = [bucket for bucket in buckets if bucket is not None]
+            if not buckets:
+                return 0.0
+            start = max(bucket.ready_at(now) for bucket in buckets)
+            for bucket in buckets:
+                bucket.commit(start)
+        return start - now
+
+    def wait(self, url: str, proxy: Optional[str] = None) -> float:
+        """Block until the request may be sent, returns the time waited"""
+        delay = self.reserve(url, proxy)
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    async def wait_async(self, url: str, proxy: Optional[str] = None) -> float:
+        """Wait without blocking the event loop, returns the time waited"""
+        delay = self.reserve(url, proxy)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return delay
@@ -2,22 +2,258 @@
 Response and exception classes for cycronet.
 """
 
+import asyncio
 import json as json_lib
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Iterator, AsyncIterator
 from dataclasses import dataclass, field
 
 from ._cookies import CookieJar
 
 
-@dataclass
+@dataclass(frozen=True)
+class Timings:
+    """
+    Request timings reported by Cronet (milliseconds)
+
+    Phases that did not happen (e.g. DNS and connect on a reused socket) are None.
+    connect_ms includes the TLS handshake, ttfb_ms is measured from request start
+    to response headers. queue_ms is the time spent waiting for a concurrency slot
+    (max_concurrency / max_per_host) and is not part of the other fields.
+    """
+    dns_ms: Optional[int] = None
+    connect_ms: Optional[int] = None
+    tls_ms: Optional[int] = None
+    send_ms: Optional[int] = None
+    ttfb_ms: Optional[int] = None
+    total_ms: Optional[int] = None
+    socket_reused: bool = False
+    protocol: str = ""
+    sent_bytes: int = 0
+    received_bytes: int = 0
+    queue_ms: Optional[int] = None
+
+    @classmethod
+    def from_native(cls, data: Optional[Dict[str, Any]]) -> Optional['Timings']:
+        """Build from the native timings dict (None passes through)"""
+        if not data:
+            return None
+        return cls(**data)
+
+
+@dataclass(init=False)
 class Response:
-    """HTTP response object - compatible with requests.Response"""
+    """
+    HTTP response object - compatible with requests.Response
+
+    content is None for a streamed response (stream=True); the body is then
+    read from the native stream on first access to .content.
+    """
     status_code: int
     _headers: Dict[str, List[str]]
-    content: bytes
+    _content: Optional[bytes]
     url: str = ""
     _cookies: CookieJar = field(default_factory=CookieJar)
     encoding: Optional[str] = None
+    _stream: Any = field(default=None, repr=False)
+    history: List['Response'] = field(default_factory=list, repr=False)
+    timings: Optional[Timings] = field(default=None, repr=False)
+    attempts: int = field(default=1, repr=False)  # Sends of this request, >1 after retries
+    from_cache: bool = field(default=False, repr=False)  # Served by the Cronet HTTP cache
+
+    def __init__(
+        self,
+        status_code: int,
+        _headers: Dict[str, List[str]],
+        content: Optional[bytes],
+        url: str = "",
+        _cookies: Optional[CookieJar] = None,
+        encoding: Optional[str] = None,
+        _stream: Any = None,
+        history: Optional[List['Response']] = None,
+        timings: Optional[Timings] = None,
+        attempts: int = 1,
+        from_cache: bool = False
+    ):
+        self.status_code = status_code
+        self._headers = _headers
+        self._content = content
+        self.url = url
+        self._cookies = CookieJar() if _cookies is None else _cookies
+        self.encoding = encoding
+        self._stream = _stream
+        self.history = [] if history is None else history
+        self.timings = timings
+        self.attempts = attempts
+        self.from_cache = from_cache
+
+    @property
+    def content(self) -> bytes:
+        """
+        Return response body (reads the remaining stream if stream=True)
+
+        The native layer copies the body exactly once, into this bytes object.
+        Use memoryview(response.content) to slice it without further copies.
+        """
+        if self._content is None:
+            if self._stream is None:
+                raise RuntimeError("The content for this response was already consumed")
+            self._content = b"".join(self._iter_stream())
+        return self._content
+
+    def _iter_stream(self) -> Iterator[bytes]:
+        """Pull raw chunks from the native stream until end of body"""
+        stream = self._stream
+        if stream is None:
+            return
+        try:
+            while True:
+                chunk = stream.read()
+                if chunk is None:
+                    break
+                yield chunk
+        finally:
+            self._stream = None
+            self._close_stream(stream)
+
+    def iter_content(self, chunk_size: Optional[int] = None) -> Iterator[bytes]:
+        """
+        Iterate over response body
+
+        Args:
+            chunk_size: Size of yielded chunks, None yields chunks as they arrive
+
+        Yields:
+            Body chunks (bytes)
+        """
+        if self._content is not None:
+            chunks = iter([self._content]) if self._content else iter(())
+        elif self._stream is None:
+            raise RuntimeError("The content for this response was already consumed")
+        else:
+            chunks = self._iter_stream()
+
+        if not chunk_size:
+            yield from chunks
+            return
+
+        pending = b""
+        for chunk in chunks:
+            pending += chunk
+            while len(pending) >= chunk_size:
+                yield pending[:chunk_size]
+                pending = pending[chunk_size:]
+        if pending:
+            yield pending
+
+    def iter_lines(self, chunk_size: Optional[int] = None, delimiter: Optional[bytes] = None) -> Iterator[bytes]:
+        """
+        Iterate over response body line by line
+
+        Args:
+            chunk_size: Size of chunks read from the body
+            delimiter: Line delimiter, None splits on universal newlines
+
+        Yields:
+            Lines without the delimiter (bytes)
+        """
+        pending = b""
+        for chunk in self.iter_content(chunk_size):
+            pending += chunk
+            lines = pending.split(delimiter) if delimiter else pending.splitlines(keepends=True)
+            if delimiter:
+                pending = lines.pop()
+            elif lines and not lines[-1].endswith((b"\n", b"\r")):
+                pending = lines.pop()
+            else:
+                pending = b""
+            for line in lines:
+                yield line if delimiter else line.rstrip(b"\r\n")
+        if pending:
+            yield pending
+
+    async def aiter_bytes(self, chunk_size: Optional[int] = None) -> AsyncIterator[bytes]:
+        """
+        Iterate over response body without blocking the event loop
+
+        Args:
+            chunk_size: Size of yielded chunks, None yields chunks as they arrive
+
+        Yields:
+            Body chunks (bytes)
+        """
+        if not chunk_size:
+            async for chunk in self._aiter_stream():
+                yield chunk
+            return
+
+        pending = b""
+        async for chunk in self._aiter_stream():
+            pending += chunk
+            while len(pending) >= chunk_size:
+                yield pending[:chunk_size]
+                pending = pending[chunk_size:]
+        if pending:
+            yield pending
+
+    async def _aiter_stream(self) -> AsyncIterator[bytes]:
+        """Await raw chunks from the native stream (or the buffered body) until end of body"""
+        if self._content is not None:
+            if self._content:
+                yield self._content
+            return
+        stream = self._stream
+        if stream is None:
+            raise RuntimeError("The content for this response was already consumed")
+
+        loop = asyncio.get_running_loop()
+        try:
+            while True:
+                chunk = await stream.read_async(loop)
+                if chunk is None:
+                    break
+                yield chunk
+        finally:
+            self._stream = None
+            self._close_stream(stream)
+
+    async def aiter_lines(self) -> AsyncIterator[bytes]:
+        """
+        Iterate over response body line by line without blocking the event loop
+
+        Yields:
+            Lines without line endings (bytes)
+        """
+        pending = b""
+        async for chunk in self.aiter_bytes():
+            pending += chunk
+            lines = pending.splitlines(keepends=True)
+            if lines and not lines[-1].endswith((b"\n", b"\r")):
+                pending = lines.pop()
+            else:
+                pending = b""
+            for line in lines:
+                yield line.rstrip(b"\r\n")
+        if pending:
+            yield pending
+
+    async def aread(self) -> bytes:
+        """Read the remaining body without blocking the event loop"""
+        if self._content is None:
+            self._content = b"".join([chunk async for chunk in self.aiter_bytes()])
+        return self._content
+
+    def close(self):
+        """Release the underlying stream (cancels the transfer if body was not fully read)"""
+        stream = self._stream
+        self._stream = None
+        if stream is not None:
+            self._close_stream(stream)
+
+    def _close_stream(self, stream: Any) -> None:
+        """Close the native stream, keeping its timings if the request finished"""
+        if self.timings is None:
+            self.timings = Timings.from_native(stream.timings())
+        stream.close()
 
     @property
     def headers(self) -> Dict[str, str]:
@@ -77,3 +313,10 @@ class HTTPStatusError(Exception):
 class RequestError(Exception):
     """Request error"""
     pass
+
+
+class TooManyRedirects(RequestError):
+    """Redirect chain exceeded Session.max_redirects"""
+    def __init__(self, message: str, response: Optional[Response] = None):
+        super().__init__(message)
+        self.response = response
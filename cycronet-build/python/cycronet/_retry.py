@@ -0,0 +1,226 @@
+"""
+Retries with backoff for cycronet.
+
+A Retry policy decides whether a failed attempt is sent again and how long to
+wait first. Failures are classified from the Cronet net error in the native
+message ("net::ERR_CONNECTION_RESET", ...):
+
+- connect errors: the request never reached the server (DNS, refused, QUIC
+  handshake, proxy/tunnel setup), so any method can be retried
+- transport errors: the connection broke after the request may have been sent,
+  so only idempotent methods are retried
+
+Delays use exponential backoff with full jitter, and a Retry-After header on
+429/503 responses takes precedence. Each session also owns a RetryBudget that
+caps retries to a share of its requests, so an outage does not multiply the
+load on a struggling server.
+"""
+
+import email.utils
+import random
+import re
+import threading
+import time
+from typing import Any, Collection, Optional
+
+# Net errors raised before the request was written to the server
+CONNECT_ERRORS = frozenset({
+    'ERR_NAME_NOT_RESOLVED',
+    'ERR_NAME_RESOLUTION_FAILED',
+    'ERR_CONNECTION_REFUSED',
+    'ERR_CONNECTION_TIMED_OUT',
+    'ERR_ADDRESS_UNREACHABLE',
+    'ERR_NETWORK_CHANGED',
+    'ERR_QUIC_HANDSHAKE_FAILED',
+    'ERR_PROXY_CONNECTION_FAILED',
+    'ERR_TUNNEL_CONNECTION_FAILED',
+    'ERR_SOCKS_CONNECTION_FAILED',
+    'ERR_SOCKS_CONNECTION_HOST_UNREACHABLE',
+    'ERR_PROXY_AUTH_UNSUPPORTED',
+    'ERR_SSL_PROTOCOL_ERROR',
+})
+
+# Net errors after which the server may or may not have processed the request
+TRANSPORT_ERRORS = frozenset({
+    'ERR_CONNECTION_RESET',
+    'ERR_CONNECTION_CLOSED',
+    'ERR_CONNECTION_ABORTED',
+    'ERR_EMPTY_RESPONSE',
+    'ERR_TIMED_OUT',
+    'ERR_QUIC_PROTOCOL_ERROR',
+    'ERR_HTTP2_PROTOCOL_ERROR',
+    'ERR_HTTP2_PING_FAILED',
+    'ERR_HTTP2_SERVER_REFUSED_STREAM',
+    'ERR_HTTP2_STREAM_CLOSED',
+    'ERR_INCOMPLETE_CHUNKED_ENCODING',
+    'ERR_CONTENT_LENGTH_MISMATCH',
+})
+
+IDEMPOTENT_METHODS = frozenset({'GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE', 'TRACE'})
+
+_NET_ERROR = re.compile(r'net::(ERR_[A-Z0-9_]+)')
+
+
+def net_error(exc: BaseException) -> Optional[str]:
+    """Cronet net error name ("ERR_CONNECTION_RESET") carried by an exception, if any"""
+    match = _NET_ERROR.search(str(exc))
+    return match.group(1) if match else None
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP-date)"""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when is None:
+        return None
+    return max(0.0, when.timestamp() - time.time())
+
+
+class RetryBudget:
+    """
+    Caps retries to a share of the requests sent
+
+    Every first attempt deposits `ratio` of a retry, and `min_per_second`
+    retries are always available so low-traffic sessions can still retry.
+    A retry is only sent when a whole token is available.
+
+    Args:
+        ratio: Retries allowed per request (default: 0.2, i.e. at most 20% extra load)
+        min_per_second: Retries per second allowed regardless of traffic (default: 10)
+        max_tokens: Largest balance that can be saved up (default: 100)
+    """
+
+    __slots__ = ('ratio', 'min_per_second', 'max_tokens', '_tokens', '_updated', '_lock')
+
+    def __init__(self, ratio: float = 0.2, min_per_second: float = 10.0, max_tokens: float = 100.0):
+        if ratio < 0 or min_per_second < 0:
+            raise ValueError("Retry budget ratio and min_per_second must not be negative")
+        self.ratio = ratio
+        self.min_per_second = min_per_second
+        self.max_tokens = max_tokens
+        # One second's worth of the floor; with min_per_second=0 only traffic earns retries
+        self._tokens = min(max_tokens, min_per_second)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.max_tokens, self._tokens + (now - self._updated) * self.min_per_second)
+        self._updated = now
+
+    def deposit(self) -> None:
+        """Record a first attempt"""
+        with self._lock:
+            self._tokens = min(self.max_tokens, self._tokens + self.ratio)
+
+    def withdraw(self) -> bool:
+        """Take one retry from the budget, False when it is exhausted"""
+        with self._lock:
+            self._refill(time.monotonic())
+            if self._tokens < 1.0:
+                return False
+            self._tokens -= 1.0
+            return True
+
+    @property
+    def available(self) -> float:
+        """Retries currently available"""
+        with self._lock:
+            self._refill(time.monotonic())
+            return self._tokens
+
+
+class Retry:
+    """
+    Retry policy for Session.request / AsyncSession.request
+
+    Args:
+        total: Retries after the first attempt (default: 3)
+        backoff_factor: Base delay in seconds, doubled for each retry (default: 0.1)
+        backoff_max: Largest backoff delay in seconds (default: 10)
+        jitter: Draw each delay uniformly from [0, backoff] (default: True)
+        status_forcelist: Response status codes that are retried
+            (default: 429, 502, 503, 504)
+        allowed_methods: Methods retried after transport errors and on status
+            codes (default: idempotent methods); connect errors are retried
+            for every method
+        respect_retry_after: Wait as long as Retry-After asks (default: True)
+        retry_after_max: Longest Retry-After honored in seconds; a longer one
+            returns the response instead of waiting (default: 60)
+        retry_on_timeout: Retry read/total timeouts for allowed methods and
+            connect timeouts for all methods (default: True)
+
+    Example:
+        client = CronetClient(retry=Retry(total=5, backoff_factor=0.2))
+        response = client.get(url)
+        response.attempts  # 1 when the first attempt succeeded
+    """
+
+    def __init__(
+        self,
+        total: int = 3,
+        backoff_factor: float = 0.1,
+        backoff_max: float = 10.0,
+        jitter: bool = True,
+        status_forcelist: Collection[int] = (429, 502, 503, 504),
+        allowed_methods: Collection[str] = IDEMPOTENT_METHODS,
+        respect_retry_after: bool = True,
+        retry_after_max: float = 60.0,
+        retry_on_timeout: bool = True
+    ):
+        if total < 0:
+            raise ValueError(f"Retry total must not be negative, got {total!r}")
+        self.total = total
+        self.backoff_factor = backoff_factor
+        self.backoff_max = backoff_max
+        self.jitter = jitter
+        self.status_forcelist = frozenset(status_forcelist)
+        self.allowed_methods = frozenset(method.upper() for method in allowed_methods)
+        self.respect_retry_after = respect_retry_after
+        self.retry_after_max = retry_after_max
+        self.retry_on_timeout = retry_on_timeout
+
+    def backoff(self, attempt: int) -> float:
+        """Delay before retry number `attempt` (1 for the first retry)"""
+        delay = min(self.backoff_max, self.backoff_factor * (2 ** (attempt - 1)))
+        return random.uniform(0, delay) if self.jitter else delay
+
+    def is_retryable_error(self, method: str, exc: BaseException) -> bool:
+        """Whether a failed attempt may be sent again"""
+        idempotent = method.upper() in self.allowed_methods
+        if isinstance(exc, TimeoutError):
+            if not self.retry_on_timeout:
+                return False
+            return idempotent or str(exc).startswith('Connect timeout')
+        error = net_error(exc)
+        if error in CONNECT_ERRORS:
+            return True
+        return idempotent and error in TRANSPORT_ERRORS
+
+    def delay_for_error(self, method: str, exc: BaseException, attempt: int) -> Optional[float]:
+        """Seconds to wait before retrying after `exc`, None to give up"""
+        if attempt > self.total or not self.is_retryable_error(method, exc):
+            return None
+        return self.backoff(attempt)
+
+    def delay_for_response(self, method: str, response: Any, attempt: int) -> Optional[float]:
+        """Seconds to wait before retrying after `response`, None to keep it"""
+        if attempt > self.total or response.status_code not in self.status_forcelist:
+            return None
+        if method.upper() not in self.allowed_methods:
+            return None
+        delay = self.backoff(attempt)
+        if self.respect_retry_after and response.status_code in (429, 503):
+            values = next((v for k, v in response._headers.items() if k.lower() == 'retry-after'), None)
+            retry_after = parse_retry_after(values[0] if values else None)
+            if retry_after is not None:
+                if retry_after > self.retry_after_max:
+                    return None
+                delay = max(delay, retry_after)
+        return delay
@@ -3,26 +3,45 @@ Synchronous Session class for cycronet.
 """
 
 import os
+import math
+import time
 import json as json_lib
-from typing import Optional, Dict, List, Tuple, Any
-from urllib.parse import urlparse, urlencode
+from typing import Optional, Dict, List, Tuple, Any, Iterable, Iterator, Union
+from urllib.parse import urlparse, urlencode, urljoin
 
-from ._types import HeadersType, CookiesType, DataType
+from ._types import HeadersType, CookiesType, DataType, TimeoutType
 from ._cookies import CookieJar
-from ._response import Response, HTTPStatusError, RequestError
-from ._utils import extract_domain, parse_set_cookie, domain_matches
+from ._prepared import HeaderList, PreparedRequest
+from ._response import Response, Timings, HTTPStatusError, RequestError, TooManyRedirects
+from ._utils import extract_domain, extract_path, is_secure_url, parse_set_cookie, timeout_to_ms, origins
+from ._upload import body_segments, encode_multipart
+from ._ratelimit import RateLimiter
+from ._retry import Retry, RetryBudget
 
 
 class Session:
     """Session object - compatible with requests.Session"""
 
-    def __init__(self, client: 'CronetClient', session_id: str, verify: bool = True):
+    def __init__(
+        self,
+        client: 'CronetClient',
+        session_id: str,
+        verify: bool = True,
+        proxy: Optional[str] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry: Optional[Retry] = None
+    ):
         self._client = client
         self._session_id = session_id
         self._closed = False
         self._verify = verify
+        self._proxy = proxy  # Proxy URL, used as the rate limiter's proxy key
+        self.rate_limiter = rate_limiter  # Token buckets per host / proxy, may be shared
+        self.retry = retry  # Retry policy, None sends every request once
+        self.retry_budget = RetryBudget()  # Caps retries to a share of this session's requests
         self._cookies = CookieJar()
         self._default_headers = {}  # Store default headers for session
+        self.max_redirects = 30  # Maximum redirects followed per request
 
     @property
     def cookies(self) -> CookieJar:
@@ -106,17 +125,20 @@ class Session:
 
         return adjusted
 
-    def _prepare_headers(
+    def _header_plan(
         self,
         headers: Optional[HeadersType] = None,
-        cookies: Optional[CookiesType] = None,
-        domain: str = "",
         method: str = "GET",
         has_body: bool = False,
         is_json: bool = False,
         need_content_type: Optional[str] = None
-    ) -> List[Tuple[str, str]]:
-        """Prepare request headers with session defaults"""
+    ) -> Tuple[HeaderList, HeaderList, HeaderList]:
+        """
+        Prepare request headers with session defaults, leaving out jar cookies
+
+        Returns:
+            (headers before the cookie, cookie headers given by the caller, priority headers)
+        """
 
         # Check if user provided headers
         user_provided = headers is not None
@@ -171,53 +193,135 @@ class Session:
             else:
                 normal_headers.append((k, v))
 
-        # Get matching cookies from CookieJar
-        merged_cookies = {}
-        for cookie in self._cookies:
-            if not cookie.domain or cookie.domain == domain or domain_matches(cookie.domain, domain):
-                merged_cookies[cookie.name] = cookie.value
-
-        if cookies:
-            merged_cookies.update(cookies)
+        return tuple(normal_headers), tuple(cookie_headers), tuple(priority_headers)
 
-        result = normal_headers
-
-        if not cookie_headers and merged_cookies:
-            cookie_str = "; ".join([f"{k}={v}" for k, v in merged_cookies.items()])
-            result.append(("cookie", cookie_str))
-        elif cookie_headers:
+    def _fill_cookies(
+        self,
+        header_plan: Tuple[HeaderList, HeaderList, HeaderList],
+        cookies: Optional[CookiesType],
+        domain: str,
+        path: str = "/",
+        secure: bool = True
+    ) -> List[Tuple[str, str]]:
+        """Header list of a header plan with the Cookie header for domain/path filled in"""
+        normal_headers, cookie_headers, priority_headers = header_plan
+        result = list(normal_headers)
+
+        if not cookie_headers:
+            # Matching cookies come from the CookieJar domain index; the header is
+            # cached per (domain, path, secure) until the jar changes
+            if cookies:
+                merged_cookies = dict(self._cookies.matching(domain, path, secure))
+                merged_cookies.update(cookies)
+                cookie_str = "; ".join([f"{k}={v}" for k, v in merged_cookies.items()])
+            else:
+                cookie_str = self._cookies.header(domain, path, secure)
+            if cookie_str:
+                result.append(("cookie", cookie_str))
+        else:
             result.extend(cookie_headers)
 
         result.extend(priority_headers)
         return result
 
-    def _update_cookies_from_response(self, headers: Dict[str, List[str]], request_domain: str):
+    def _prepare_headers(
+        self,
+        headers: Optional[HeadersType] = None,
+        cookies: Optional[CookiesType] = None,
+        domain: str = "",
+        path: str = "/",
+        secure: bool = True,
+        method: str = "GET",
+        has_body: bool = False,
+        is_json: bool = False,
+        need_content_type: Optional[str] = None
+    ) -> List[Tuple[str, str]]:
+        """Prepare request headers with session defaults"""
+        header_plan = self._header_plan(headers, method, has_body, is_json, need_content_type)
+        return self._fill_cookies(header_plan, cookies, domain, path, secure)
+
+    def _update_cookies_from_response(
+        self,
+        headers: Dict[str, List[str]],
+        request_domain: str,
+        request_path: str = "/"
+    ):
         """Extract Set-Cookie from response headers"""
         for name, values in headers.items():
             if name.lower() == 'set-cookie':
-                parsed_cookies = parse_set_cookie(values)
-                for cookie_name, cookie_value, cookie_domain in parsed_cookies:
-                    store_domain = cookie_domain if cookie_domain else request_domain
-                    self._cookies.set(cookie_name, cookie_value, store_domain)
+                for cookie in parse_set_cookie(values, request_domain, request_path):
+                    self._cookies.set_cookie(cookie)
 
-    def request(
+    def _build_response(
         self,
-        method: str,
+        status_code: int,
+        headers_list: List[Tuple[str, str]],
         url: str,
-        *,
-        params: Optional[Dict[str, Any]] = None,
-        headers: Optional[HeadersType] = None,
-        cookies: Optional[CookiesType] = None,
-        data: DataType = None,
-        json: Optional[Dict[str, Any]] = None,
-        timeout: Optional[float] = None,
-        verify: Optional[bool] = None,
-        allow_redirects: bool = True
+        content: Optional[bytes],
+        stream: Any = None
     ) -> Response:
-        """Send HTTP request - compatible with requests.request()"""
-        if self._closed:
-            raise RequestError("Session is closed")
+        """Build Response from native result and store its Set-Cookie in the session"""
+        resp_headers = {}
+        for name, value in headers_list:
+            if name not in resp_headers:
+                resp_headers[name] = []
+            resp_headers[name].append(value)
+
+        domain = extract_domain(url)
+        path = extract_path(url)
+
+        # Create response CookieJar
+        response_cookies = CookieJar()
+        for header_name, values in resp_headers.items():
+            if header_name.lower() == 'set-cookie':
+                for cookie in parse_set_cookie(values, domain, path):
+                    response_cookies.set_cookie(cookie)
+
+        # Update session cookies from response
+        self._update_cookies_from_response(resp_headers, domain, path)
 
+        return Response(
+            status_code=status_code,
+            _headers=resp_headers,
+            content=content,
+            url=url,
+            _cookies=response_cookies,
+            _stream=stream
+        )
+
+    def _prepare_request(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        headers: Optional[HeadersType],
+        cookies: Optional[CookiesType],
+        data: DataType,
+        json: Optional[Dict[str, Any]]
+    ) -> Tuple[str, str, Any, Any, bool, bool, Optional[str]]:
+        """
+        Validate URL and encode body for one request
+
+        Returns:
+            (url, domain, headers_to_prepare, body, has_body, is_json, need_content_type)
+        """
+        url = self._prepare_url(url, params)
+        domain = extract_domain(url)
+
+        if cookies:
+            self._cookies.update(cookies, domain)
+
+        if headers is None:
+            headers_to_prepare = None
+        elif isinstance(headers, dict):
+            headers_to_prepare = headers.copy()
+        else:
+            headers_to_prepare = list(headers)
+
+        body, has_body, is_json_request, need_content_type = self._encode_body(data, json)
+        return url, domain, headers_to_prepare, body, has_body, is_json_request, need_content_type
+
+    def _prepare_url(self, url: str, params: Optional[Dict[str, Any]]) -> str:
+        """Validate URL and append query params"""
         # Validate URL
         if not url or not isinstance(url, str):
             raise RequestError("URL must be a non-empty string")
@@ -231,24 +335,21 @@ class Session:
         if not parsed.netloc:
             raise RequestError(f"Invalid URL '{url}': No host supplied")
 
-        # verify parameter is ignored here (decided at session creation)
-        # but accept it for requests API compatibility
-
         if params:
             url = url + ('&' if '?' in url else '?') + urlencode(params)
+        return url
 
-        domain = extract_domain(url)
-
-        if cookies:
-            self._cookies.update(cookies, domain)
-
-        if headers is None:
-            headers_to_prepare = None
-        elif isinstance(headers, dict):
-            headers_to_prepare = headers.copy()
-        else:
-            headers_to_prepare = list(headers)
+    def _encode_body(
+        self,
+        data: DataType,
+        json: Optional[Dict[str, Any]]
+    ) -> Tuple[Any, bool, bool, Optional[str]]:
+        """
+        Encode data/json as request body
 
+        Returns:
+            (body, has_body, is_json, need_content_type)
+        """
         # Determine request type
         is_json_request = json is not None
         has_body = data is not None or json is not None
@@ -273,92 +374,298 @@ class Session:
         elif isinstance(data, str):
             body = data.encode('utf-8')
         else:
-            body = data
-
-        # Prepare headers (pass request type information)
-        prepared_headers = self._prepare_headers(
-            headers_to_prepare,
-            cookies,
-            domain,
-            method=method,
-            has_body=has_body,
-            is_json=is_json_request,
-            need_content_type=need_content_type
+            body = body_segments(data)
+
+        return body, has_body, is_json_request, need_content_type
+
+    def _prepare_batch(
+        self,
+        requests: Iterable[Union[str, Dict[str, Any]]]
+    ) -> Tuple[List[Tuple[str, str, List[Tuple[str, str]], Any, Optional[int]]], List[str]]:
+        """
+        Prepare native (url, method, headers, body, delay_ms) tuples for request_many
+
+        With a rate limiter every request reserves its slot here; the native
+        batch starts each request once its delay has passed.
+        """
+        items = []
+        urls = []
+        for spec in requests:
+            kwargs = {'url': spec} if isinstance(spec, str) else spec
+            method = kwargs.get('method', 'GET')
+            (url, domain, headers_to_prepare, body,
+             has_body, is_json_request, need_content_type) = self._prepare_request(
+                kwargs.get('url'),
+                kwargs.get('params'),
+                kwargs.get('headers'),
+                kwargs.get('cookies'),
+                kwargs.get('data'),
+                kwargs.get('json')
+            )
+            prepared_headers = self._prepare_headers(
+                headers_to_prepare,
+                kwargs.get('cookies'),
+                domain,
+                path=extract_path(url),
+                secure=is_secure_url(url),
+                method=method,
+                has_body=has_body,
+                is_json=is_json_request,
+                need_content_type=need_content_type
+            )
+            delay_ms = None
+            if self.rate_limiter is not None:
+                delay_ms = math.ceil(self.rate_limiter.reserve(url, self._proxy) * 1000) or None
+            items.append((url, method.upper(), prepared_headers, body, delay_ms))
+            urls.append(url)
+        return items, urls
+
+    def _batch_response(self, response_dict: Dict[str, Any], url: str) -> Response:
+        """Build Response (with redirect history) from a request_many result"""
+        history = [
+            self._build_response(hop['status_code'], hop['headers'], hop['url'], b"")
+            for hop in response_dict.get('history', ())
+        ]
+        response = self._build_response(
+            response_dict['status_code'],
+            response_dict['headers'],
+            response_dict.get('url') or url,
+            response_dict['body']
         )
+        response.history = history
+        response.timings = Timings.from_native(response_dict.get('timings'))
+        response.from_cache = response_dict.get('from_cache', False)
+        return response
 
-        # Always disable redirects at Rust layer, handle in Python
-        response_dict = self._client._client.request(
-            self._session_id,
-            url,
-            method.upper(),
-            prepared_headers,
-            body,
-            False  # Always False - handle redirects in Python
+    def _retry_delay(
+        self,
+        method: str,
+        body: Any,
+        attempt: int,
+        cancel_token: Optional[Any],
+        error: Optional[BaseException] = None,
+        response: Optional[Response] = None
+    ) -> Optional[float]:
+        """Backoff before resending after `attempt` attempts, None when it must not be retried"""
+        retry = self.retry
+        if retry is None or (cancel_token is not None and cancel_token.cancelled):
+            return None
+        # Lazily read iterables cannot be replayed
+        if body and not isinstance(body, (bytes, bytearray, list)):
+            return None
+        if error is not None:
+            delay = retry.delay_for_error(method, error, attempt)
+        else:
+            delay = retry.delay_for_response(method, response, attempt)
+        if delay is None or not self.retry_budget.withdraw():
+            return None
+        return delay
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[HeadersType] = None,
+        cookies: Optional[CookiesType] = None,
+        data: DataType = None,
+        json: Optional[Dict[str, Any]] = None,
+        timeout: TimeoutType = None,
+        verify: Optional[bool] = None,
+        allow_redirects: bool = True,
+        stream: bool = False,
+        cancel_token: Optional[Any] = None
+    ) -> Response:
+        """
+        Send HTTP request - compatible with requests.request()
+
+        With stream=True the call returns once headers arrive; read the body
+        with iter_content()/iter_lines() or access .content to read it all.
+
+        Pass a cycronet.CancelToken as cancel_token to abort the request from
+        another thread with token.cancel().
+
+        With a session retry policy (see cycronet.Retry) failed attempts and
+        retryable status codes are sent again; response.attempts counts them.
+        """
+        # verify parameter is ignored here (decided at session creation)
+        # but accept it for requests API compatibility
+        if self._closed:
+            raise RequestError("Session is closed")
+        return self.send(
+            self.prepare(method, url, params=params, headers=headers, data=data, json=json),
+            cookies=cookies,
+            timeout=timeout,
+            allow_redirects=allow_redirects,
+            stream=stream,
+            cancel_token=cancel_token
         )
 
-        status_code = response_dict['status_code']
-        resp_headers_list = response_dict['headers']
-        body_bytes = response_dict['body']
+    def prepare(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[HeadersType] = None,
+        data: DataType = None,
+        json: Optional[Dict[str, Any]] = None
+    ) -> PreparedRequest:
+        """
+        Prepare a request once to send it many times with send()
 
-        resp_headers = {}
-        for name, value in resp_headers_list:
-            if name not in resp_headers:
-                resp_headers[name] = []
-            resp_headers[name].append(value)
+        The URL is validated, the body encoded and the ordered header list
+        (session headers adjusted for the method, or the given headers) built
+        here; each send() only adds the Cookie header from the jar's cache.
 
-        # Create response CookieJar
-        response_cookies = CookieJar()
-        for header_name, values in resp_headers.items():
-            if header_name.lower() == 'set-cookie':
-                for cookie_name, cookie_value, cookie_domain in parse_set_cookie(values):
-                    store_domain = cookie_domain if cookie_domain else domain
-                    response_cookies.set(cookie_name, cookie_value, store_domain)
+        Example:
+            poll = session.prepare("GET", "https://api.example.com/status")
+            while True:
+                response = session.send(poll)
+        """
+        (url, domain, headers_to_prepare, body,
+         has_body, is_json_request, need_content_type) = self._prepare_request(
+            url, params, headers, None, data, json
+        )
+        header_plan = self._header_plan(headers_to_prepare, method, has_body, is_json_request, need_content_type)
+        return PreparedRequest(
+            method.upper(), url, body, headers_to_prepare, has_body, is_json_request, need_content_type,
+            header_plan, domain, extract_path(url), is_secure_url(url)
+        )
 
-        # Update session cookies from response
-        self._update_cookies_from_response(resp_headers, domain)
+    def send(
+        self,
+        prepared: PreparedRequest,
+        *,
+        url: Optional[str] = None,
+        params: Optional[Dict[str, Any]] = None,
+        cookies: Optional[CookiesType] = None,
+        data: DataType = None,
+        json: Optional[Dict[str, Any]] = None,
+        timeout: TimeoutType = None,
+        allow_redirects: bool = True,
+        stream: bool = False,
+        cancel_token: Optional[Any] = None
+    ) -> Response:
+        """
+        Send a PreparedRequest (see prepare())
 
-        # Handle redirects in Python layer
-        if allow_redirects and status_code in (301, 302, 303, 307, 308):
-            location = None
-            for header_name, values in resp_headers.items():
-                if header_name.lower() == 'location':
-                    location = values[0] if values else None
-                    break
+        url/params and data/json replace the prepared URL and body for this
+        call, while the prepared headers (including the content type) are
+        kept. Cookies, redirects, retries, streaming and cancel_token work as
+        in request().
+        """
+        if self._closed:
+            raise RequestError("Session is closed")
 
-            if location:
-                # Handle relative URLs
-                if not location.startswith(('http://', 'https://')):
-                    from urllib.parse import urljoin
-                    location = urljoin(url, location)
-
-                # Follow redirect with updated cookies and headers
-                # For 303, change method to GET
-                redirect_method = 'GET' if status_code == 303 else method
-
-                # Recursively call request with updated URL
-                # Note: cookies=None means "use session cookies only" (which includes Set-Cookie from redirect response)
-                # User-provided cookies were already added to self._cookies at line 128-129
-                # Server Set-Cookie was added to self._cookies at line 205
-                return self.request(
-                    redirect_method,
-                    location,
-                    params=None,  # Don't carry params on redirect
-                    headers=headers_to_prepare,  # Carry original headers
-                    cookies=None,  # Use session cookies (includes both user cookies and Set-Cookie from response)
-                    data=None if status_code == 303 else data,  # Drop body for 303
-                    json=None,
-                    timeout=timeout,
-                    verify=verify,
-                    allow_redirects=True  # Continue following redirects
+        method = prepared.method
+        if url is None and not params:
+            url, domain, path, secure = prepared.url, prepared.domain, prepared.path, prepared.secure
+        else:
+            url = self._prepare_url(prepared.url if url is None else url, params)
+            domain, path, secure = extract_domain(url), extract_path(url), is_secure_url(url)
+        if cookies:
+            self._cookies.update(cookies, domain)
+        body = prepared.body
+        if data is not None or json is not None:
+            body = self._encode_body(data, json)[0]
+        header_plan = prepared.header_plan
+
+        # Per-request deadlines (None keeps the session timeout)
+        timeout_ms, connect_timeout_ms, read_timeout_ms = timeout_to_ms(timeout)
+
+        send = self._client._client.request_stream if stream else self._client._client.request
+
+        history: List[Response] = []
+        while True:
+            # Frozen headers plus the Cookie header for this hop
+            prepared_headers = self._fill_cookies(header_plan, cookies, domain, path, secure)
+
+            if self.retry is not None:
+                self.retry_budget.deposit()
+            attempts = 0
+            while True:
+                if self.rate_limiter is not None:
+                    self.rate_limiter.wait(url, self._proxy)
+                attempts += 1
+
+                # Redirects are followed inside Cronet. Hops that change host or set
+                # cookies are handed back so the next Cookie header uses the updated jar
+                try:
+                    response_dict = send(
+                        self._session_id,
+                        url,
+                        method.upper(),
+                        prepared_headers,
+                        body,
+                        allow_redirects,
+                        timeout_ms=timeout_ms,
+                        connect_timeout_ms=connect_timeout_ms,
+                        read_timeout_ms=read_timeout_ms,
+                        max_redirects=max(0, self.max_redirects - len(history)),
+                        caller_manages_cookies=True,
+                        cancel_token=cancel_token
+                    )
+                except (RuntimeError, TimeoutError) as exc:
+                    delay = self._retry_delay(method, body, attempts, cancel_token, error=exc)
+                    if delay is None:
+                        raise
+                    time.sleep(delay)
+                    continue
+
+                hops = [
+                    self._build_response(hop['status_code'], hop['headers'], hop['url'], b"")
+                    for hop in response_dict.get('history', ())
+                ]
+                body_stream = response_dict.get('stream')
+                response = self._build_response(
+                    response_dict['status_code'],
+                    response_dict['headers'],
+                    response_dict.get('url') or url,
+                    None if body_stream is not None else response_dict['body'],
+                    body_stream
                 )
+                response.timings = Timings.from_native(response_dict.get('timings'))
+                response.from_cache = response_dict.get('from_cache', False)
+                response.attempts = attempts
 
-        return Response(
-            status_code=status_code,
-            _headers=resp_headers,
-            content=body_bytes,
-            url=url,
-            _cookies=response_cookies
-        )
+                delay = self._retry_delay(method, body, attempts, cancel_token, response=response)
+                if delay is None:
+                    break
+                response.close()
+                time.sleep(delay)
+
+            history.extend(hops)
+            response.history = list(history)
+
+            location = None
+            if allow_redirects and response.status_code in (301, 302, 303, 307, 308):
+                for header_name, values in response._headers.items():
+                    if header_name.lower() == 'location':
+                        location = values[0] if values else None
+                        break
+            if not location:
+                return response
+
+            # Redirect body is never read
+            response.close()
+            if len(history) >= self.max_redirects:
+                raise TooManyRedirects(f"Exceeded {self.max_redirects} redirects", response=response)
+            history.append(response)
+
+            # Follow redirect with updated cookies and headers (relative URLs allowed)
+            url = urljoin(response.url, location)
+            domain, path, secure = extract_domain(url), extract_path(url), is_secure_url(url)
+            # User-provided cookies were already added to self._cookies, and Set-Cookie
+            # from every hop was stored by _build_response
+            cookies = None
+
+            # For 303, change method to GET and drop the body
+            if response.status_code == 303:
+                method = 'GET'
+                body = b""
+                header_plan = self._header_plan(prepared.headers, method, is_json=prepared.is_json)
 
     def get(
         self,
@@ -367,9 +674,10 @@ class Session:
         params: Optional[Dict[str, Any]] = None,
         headers: Optional[HeadersType] = None,
         cookies: Optional[CookiesType] = None,
-        timeout: Optional[float] = None,
+        timeout: TimeoutType = None,
         verify: Optional[bool] = None,
-        allow_redirects: bool = True
+        allow_redirects: bool = True,
+        stream: bool = False
     ) -> Response:
         """Send GET request"""
         return self.request(
@@ -380,7 +688,8 @@ class Session:
             cookies=cookies,
             timeout=timeout,
             verify=verify,
-            allow_redirects=allow_redirects
+            allow_redirects=allow_redirects,
+            stream=stream
         )
 
     def post(
@@ -392,9 +701,10 @@ class Session:
         cookies: Optional[CookiesType] = None,
         data: DataType = None,
         json: Optional[Dict[str, Any]] = None,
-        timeout: Optional[float] = None,
+        timeout: TimeoutType = None,
         verify: Optional[bool] = None,
-        allow_redirects: bool = True
+        allow_redirects: bool = True,
+        stream: bool = False
     ) -> Response:
         """Send POST request"""
         return self.request(
@@ -407,7 +717,8 @@ class Session:
             json=json,
             timeout=timeout,
             verify=verify,
-            allow_redirects=allow_redirects
+            allow_redirects=allow_redirects,
+            stream=stream
         )
 
     def put(
@@ -419,9 +730,10 @@ class Session:
         cookies: Optional[CookiesType] = None,
         data: DataType = None,
         json: Optional[Dict[str, Any]] = None,
-        timeout: Optional[float] = None,
+        timeout: TimeoutType = None,
         verify: Optional[bool] = None,
-        allow_redirects: bool = True
+        allow_redirects: bool = True,
+        stream: bool = False
     ) -> Response:
         """Send PUT request"""
         return self.request(
@@ -434,7 +746,8 @@ class Session:
             json=json,
             timeout=timeout,
             verify=verify,
-            allow_redirects=allow_redirects
+            allow_redirects=allow_redirects,
+            stream=stream
         )
 
     def delete(
@@ -444,9 +757,10 @@ class Session:
         params: Optional[Dict[str, Any]] = None,
         headers: Optional[HeadersType] = None,
         cookies: Optional[CookiesType] = None,
-        timeout: Optional[float] = None,
+        timeout: TimeoutType = None,
         verify: Optional[bool] = None,
-        allow_redirects: bool = True
+        allow_redirects: bool = True,
+        stream: bool = False
     ) -> Response:
         """Send DELETE request"""
         return self.request(
@@ -457,7 +771,8 @@ class Session:
             cookies=cookies,
             timeout=timeout,
             verify=verify,
-            allow_redirects=allow_redirects
+            allow_redirects=allow_redirects,
+            stream=stream
         )
 
     def patch(
@@ -469,9 +784,10 @@ class Session:
         cookies: Optional[CookiesType] = None,
         data: DataType = None,
         json: Optional[Dict[str, Any]] = None,
-        timeout: Optional[float] = None,
+        timeout: TimeoutType = None,
         verify: Optional[bool] = None,
-        allow_redirects: bool = True
+        allow_redirects: bool = True,
+        stream: bool = False
     ) -> Response:
         """Send PATCH request"""
         return self.request(
@@ -484,7 +800,8 @@ class Session:
             json=json,
             timeout=timeout,
             verify=verify,
-            allow_redirects=allow_redirects
+            allow_redirects=allow_redirects,
+            stream=stream
         )
 
     def head(
@@ -494,9 +811,10 @@ class Session:
         params: Optional[Dict[str, Any]] = None,
         headers: Optional[HeadersType] = None,
         cookies: Optional[CookiesType] = None,
-        timeout: Optional[float] = None,
+        timeout: TimeoutType = None,
         verify: Optional[bool] = None,
-        allow_redirects: bool = True
+        allow_redirects: bool = True,
+        stream: bool = False
     ) -> Response:
         """Send HEAD request"""
         return self.request(
@@ -507,7 +825,8 @@ class Session:
             cookies=cookies,
             timeout=timeout,
             verify=verify,
-            allow_redirects=allow_redirects
+            allow_redirects=allow_redirects,
+            stream=stream
         )
 
     def options(
@@ -517,9 +836,10 @@ class Session:
         params: Optional[Dict[str, Any]] = None,
         headers: Optional[HeadersType] = None,
         cookies: Optional[CookiesType] = None,
-        timeout: Optional[float] = None,
+        timeout: TimeoutType = None,
         verify: Optional[bool] = None,
-        allow_redirects: bool = True
+        allow_redirects: bool = True,
+        stream: bool = False
     ) -> Response:
         """Send OPTIONS request"""
         return self.request(
@@ -530,7 +850,8 @@ class Session:
             cookies=cookies,
             timeout=timeout,
             verify=verify,
-            allow_redirects=allow_redirects
+            allow_redirects=allow_redirects,
+            stream=stream
         )
 
     def upload_file(
@@ -542,48 +863,16 @@ class Session:
         additional_fields: Optional[Dict[str, str]] = None,
         headers: Optional[HeadersType] = None,
         cookies: Optional[CookiesType] = None,
-        timeout: Optional[float] = None,
+        timeout: TimeoutType = None,
         verify: Optional[bool] = None
     ) -> Response:
-        """Upload file"""
-        import mimetypes
-
-        # Read file
+        """Upload file (multipart body is streamed from disk)"""
+        # Check file
         if not os.path.exists(file_path):
             raise RequestError(f"File not found: {file_path}")
 
-        with open(file_path, 'rb') as f:
-            file_content = f.read()
-
-        # Get filename and MIME type
-        filename = os.path.basename(file_path)
-        mime_type, _ = mimetypes.guess_type(file_path)
-        if mime_type is None:
-            mime_type = 'application/octet-stream'
-
-        # Build multipart/form-data
-        boundary = f'----CycronetFormBoundary{os.urandom(16).hex()}'
-        body_parts = []
-
-        # Add additional fields
-        if additional_fields:
-            for key, value in additional_fields.items():
-                body_parts.append(f'--{boundary}\r\n'.encode())
-                body_parts.append(f'Content-Disposition: form-data; name="{key}"\r\n\r\n'.encode())
-                body_parts.append(f'{value}\r\n'.encode())
-
-        # Add file
-        body_parts.append(f'--{boundary}\r\n'.encode())
-        body_parts.append(
-            f'Content-Disposition: form-data; name="{field_name}"; filename="{filename}"\r\n'.encode()
-        )
-        body_parts.append(f'Content-Type: {mime_type}\r\n\r\n'.encode())
-        body_parts.append(file_content)
-        body_parts.append(b'\r\n')
-        body_parts.append(f'--{boundary}--\r\n'.encode())
-
-        # Merge body
-        body = b''.join(body_parts)
+        # Build multipart/form-data (file content is read while uploading)
+        body, content_type = encode_multipart(additional_fields, [(field_name, file_path)])
 
         # Set Content-Type
         if headers is None:
@@ -593,7 +882,7 @@ class Session:
         else:
             headers = dict(headers)
 
-        headers['Content-Type'] = f'multipart/form-data; boundary={boundary}'
+        headers['Content-Type'] = content_type
 
         # Send request
         return self.request(
@@ -613,22 +902,24 @@ class Session:
         *,
         headers: Optional[HeadersType] = None,
         cookies: Optional[CookiesType] = None,
-        timeout: Optional[float] = None,
+        timeout: TimeoutType = None,
         verify: Optional[bool] = None,
         chunk_size: int = 8192
     ) -> Dict[str, Any]:
-        """Download file"""
+        """Download file (body is streamed to disk in chunk_size pieces)"""
         # Send request
         response = self.get(
             url,
             headers=headers,
             cookies=cookies,
             timeout=timeout,
-            verify=verify
+            verify=verify,
+            stream=True
         )
 
         # Check status code
         if response.status_code >= 400:
+            response.close()
             raise HTTPStatusError(
                 f"Download failed with status {response.status_code}",
                 response=response
@@ -640,21 +931,123 @@ class Session:
             os.makedirs(save_dir, exist_ok=True)
 
         # Save file
-        with open(save_path, 'wb') as f:
-            f.write(response.content)
+        size = 0
+        try:
+            with open(save_path, 'wb') as f:
+                for chunk in response.iter_content(chunk_size):
+                    f.write(chunk)
+                    size += len(chunk)
+        finally:
+            response.close()
 
         return {
             'file_path': save_path,
-            'size': len(response.content),
+            'size': size,
             'status_code': response.status_code,
             'headers': response.headers
         }
 
+    def request_many(
+        self,
+        requests: Iterable[Union[str, Dict[str, Any]]],
+        *,
+        window: int = 64,
+        timeout: TimeoutType = None,
+        allow_redirects: bool = True
+    ) -> Iterator[Tuple[int, Union[Response, BaseException]]]:
+        """
+        Send many requests with a single native call
+
+        Each item is a URL (GET) or a dict of request() arguments (method, url,
+        params, headers, cookies, data, json). All requests are submitted at
+        once and at most `window` of them are in flight; redirects are followed
+        natively.
+
+        Yields:
+            (index, Response) in completion order, or (index, exception) for
+            requests that failed. Stopping early cancels the remaining requests.
+
+        Example:
+            for index, response in session.request_many(urls, window=128):
+                ...
+        """
+        if self._closed:
+            raise RequestError("Session is closed")
+
+        items, urls = self._prepare_batch(requests)
+        timeout_ms, connect_timeout_ms, read_timeout_ms = timeout_to_ms(timeout)
+        batch = self._client._client.request_many(
+            self._session_id,
+            items,
+            window=window,
+            allow_redirects=allow_redirects,
+            timeout_ms=timeout_ms,
+            connect_timeout_ms=connect_timeout_ms,
+            read_timeout_ms=read_timeout_ms,
+            max_redirects=self.max_redirects
+        )
+        return self._iter_batch(batch, urls)
+
+    def preconnect(
+        self,
+        urls: Iterable[str],
+        *,
+        window: int = 32,
+        timeout: TimeoutType = 10
+    ) -> Dict[str, Union[int, BaseException]]:
+        """
+        Connect to the origins of `urls` before the first real request
+
+        The Cronet C API has no preconnect call, so one HEAD request is sent
+        per origin (scheme, host and port). It resolves DNS and completes the
+        TCP/TLS or QUIC handshake, and the connection stays in the engine's
+        pool for the requests that follow.
+
+        Returns:
+            {origin: status code or exception}
+
+        Example:
+            session.preconnect(["https://api.example.com/v1/items", "https://cdn.example.com/"])
+        """
+        targets = origins(urls)
+        requests = [{'method': 'HEAD', 'url': origin} for origin in targets]
+        results: Dict[str, Union[int, BaseException]] = {}
+        for index, result in self.request_many(requests, window=window, timeout=timeout, allow_redirects=False):
+            results[targets[index]] = result if isinstance(result, BaseException) else result.status_code
+        return results
+
+    def _iter_batch(self, batch: Any, urls: List[str]) -> Iterator[Tuple[int, Union[Response, BaseException]]]:
+        """Convert native batch results as they complete"""
+        try:
+            for index, result in batch:
+                if isinstance(result, BaseException):
+                    yield index, result
+                else:
+                    yield index, self._batch_response(result, urls[index])
+        finally:
+            batch.close()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Request metrics of this session
+
+        Returns:
+            Dict with requests, in_flight, status ({code: count}), errors,
+            timeouts, cancelled, bytes_sent, bytes_received, latency,
+            hosts ({host: latency}), active_requests and in_flight_executors.
+            Latency dicts hold count, mean_ms, p50_ms, p90_ms, p99_ms,
+            p999_ms and max_ms. Empty once the session is closed.
+        """
+        if self._closed:
+            return {}
+        return self._client._client.session_stats(self._session_id) or {}
+
     def close(self):
         """Close session"""
         if not self._closed:
             self._client._client.close_session(self._session_id)
             self._closed = True
+            self._cookies.close_journal()
 
     def __enter__(self):
         return self
@@ -2,10 +2,12 @@
 Type definitions and constants for cycronet.
 """
 
-from typing import Union, Dict, List, Tuple, Any
+from typing import Union, Dict, List, Tuple, Any, Iterable, IO
 
 
 # Type aliases
 HeadersType = Union[Dict[str, str], List[Tuple[str, str]]]
 CookiesType = Dict[str, str]
-DataType = Union[str, bytes, Dict[str, Any], None]
+DataType = Union[str, bytes, Dict[str, Any], Iterable[bytes], IO[bytes], None]
+# Seconds: total, (connect, read) or (connect, read, total)
+TimeoutType = Union[float, Tuple[float, float], Tuple[float, float, float], None]
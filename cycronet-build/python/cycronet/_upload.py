@@ -0,0 +1,114 @@
+"""
+Streaming request bodies for cycronet.
+
+Request bodies are handed to the native layer as a list of segments that are
+read on demand while uploading, so large files never have to fit in memory:
+
+- bytes: sent as-is (referenced, not copied)
+- (path, offset, length): a file range, read from disk in chunks
+- any other iterable of bytes: pulled lazily (chunked transfer encoding)
+"""
+
+import io
+import mimetypes
+import os
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+# Chunk size used when reading file objects without a usable file name
+CHUNK_SIZE = 64 * 1024
+
+
+def file_segment(path: str, offset: int = 0, length: Optional[int] = None) -> Tuple[str, int, int]:
+    """
+    Build a file range segment
+
+    Args:
+        path: File path
+        offset: Start offset in bytes
+        length: Number of bytes, None means until end of file
+
+    Returns:
+        (path, offset, length) tuple understood by the native layer
+    """
+    if length is None:
+        length = os.path.getsize(path) - offset
+    return (os.fspath(path), offset, length)
+
+
+def _iter_file(fileobj: Any) -> Iterator[bytes]:
+    """Read a file object chunk by chunk"""
+    while True:
+        chunk = fileobj.read(CHUNK_SIZE)
+        if not chunk:
+            break
+        yield chunk.encode('utf-8') if isinstance(chunk, str) else chunk
+
+
+def body_segments(data: Any) -> Any:
+    """
+    Normalize a request body for the native layer
+
+    bytes pass through unchanged. Binary files opened from disk become a file
+    range segment (known length), other file objects and iterables are read
+    lazily.
+    """
+    if isinstance(data, (bytes, bytearray, list)):
+        return data
+    if isinstance(data, memoryview):
+        return data.tobytes()
+    if hasattr(data, 'read'):
+        name = getattr(data, 'name', None)
+        if isinstance(data, io.BufferedReader) and isinstance(name, str) and os.path.isfile(name):
+            return [file_segment(name, data.tell())]
+        return _iter_file(data)
+    return data
+
+
+def encode_multipart(
+    fields: Optional[Dict[str, str]],
+    files: List[Tuple[str, str]],
+    boundary: Optional[str] = None
+) -> Tuple[List[Any], str]:
+    """
+    Build a multipart/form-data body lazily
+
+    Only the part headers are generated in memory; file contents are
+    referenced as file range segments and read while uploading.
+
+    Args:
+        fields: Plain form fields
+        files: List of (field_name, file_path)
+        boundary: Multipart boundary, generated when omitted
+
+    Returns:
+        (segments, content_type)
+    """
+    if boundary is None:
+        boundary = f'----CycronetFormBoundary{os.urandom(16).hex()}'
+
+    segments: List[Any] = []
+    head = []
+
+    if fields:
+        for key, value in fields.items():
+            head.append(f'--{boundary}\r\n')
+            head.append(f'Content-Disposition: form-data; name="{key}"\r\n\r\n')
+            head.append(f'{value}\r\n')
+
+    for field_name, file_path in files:
+        filename = os.path.basename(file_path)
+        mime_type, _ = mimetypes.guess_type(file_path)
+        if mime_type is None:
+            mime_type = 'application/octet-stream'
+
+        head.append(f'--{boundary}\r\n')
+        head.append(f'Content-Disposition: form-data; name="{field_name}"; filename="{filename}"\r\n')
+        head.append(f'Content-Type: {mime_type}\r\n\r\n')
+        segments.append(''.join(head).encode())
+        segments.append(file_segment(file_path))
+        head = ['\r\n']
+
+    head.append(f'--{boundary}--\r\n')
+    segments.append(''.join(head).encode())
+
+    return segments, f'multipart/form-data; boundary={boundary}'
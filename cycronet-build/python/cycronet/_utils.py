@@ -2,9 +2,13 @@
 Utility functions for cycronet.
 """
 
-from typing import Dict, List, Tuple
+import time
+from http.cookiejar import http2time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 from urllib.parse import urlparse
 
+from ._cookies import Cookie, cookie_host
+
 
 # Browser default header order
 BROWSER_HEADER_ORDER = [
@@ -31,36 +35,135 @@ def sort_headers_dict(headers_dict: Dict[str, str]) -> List[Tuple[str, str]]:
     return sorted_headers
 
 
+def _seconds_to_ms(value: Optional[float]) -> Optional[int]:
+    # 0 meant "use the default" before per-phase deadlines existed, keep it that way
+    if not value:
+        return None
+    if value < 0:
+        raise ValueError(f"Timeout must be positive, got {value!r}")
+    return max(1, int(value * 1000))
+
+
+def timeout_to_ms(timeout: Any) -> Tuple[Optional[int], Optional[int], Optional[int]]:
+    """
+    Split a requests-style timeout into (total, connect, read) milliseconds.
+
+    A number bounds the whole request, a (connect, read) tuple bounds connection
+    setup and the gap between received data, and a (connect, read, total) tuple
+    sets all three. None or 0 leaves the session default in place (an item of
+    0 in a tuple leaves that deadline unset); negative values raise ValueError.
+    """
+    if timeout is None:
+        return None, None, None
+    if isinstance(timeout, tuple):
+        if len(timeout) == 2:
+            connect, read = timeout
+            return None, _seconds_to_ms(connect), _seconds_to_ms(read)
+        if len(timeout) == 3:
+            connect, read, total = timeout
+            return _seconds_to_ms(total), _seconds_to_ms(connect), _seconds_to_ms(read)
+        raise ValueError(f"Timeout tuple must have 2 or 3 items, got {len(timeout)}")
+    return _seconds_to_ms(timeout), None, None
+
+
 def extract_domain(url: str) -> str:
     """Extract domain from URL."""
     parsed = urlparse(url)
     return parsed.netloc.lower()
 
 
-def parse_set_cookie(set_cookie_values: List[str]) -> List[Tuple[str, str, str]]:
-    """Parse Set-Cookie header values.
+def is_secure_url(url: str) -> bool:
+    """Whether the URL uses a secure scheme (https/wss), for Secure cookies."""
+    return url[:6].lower() in ('https:', 'wss://')
+
+
+def extract_path(url: str) -> str:
+    """Extract path from URL ("/" when empty), as used for cookie path matching."""
+    return urlparse(url).path or "/"
+
+
+def origins(urls: Iterable[str]) -> List[str]:
+    """Distinct origins ("https://host:port/") of the URLs, in first-seen order."""
+    seen = {}
+    for url in urls:
+        parsed = urlparse(url)
+        if parsed.scheme and parsed.netloc:
+            seen.setdefault(f"{parsed.scheme.lower()}://{parsed.netloc.lower()}/", None)
+    return list(seen)
+
+
+def default_cookie_path(request_path: str) -> str:
+    """RFC 6265 default-path: the request path up to its last "/"."""
+    if not request_path.startswith('/') or request_path.count('/') == 1:
+        return '/'
+    return request_path[:request_path.rindex('/')]
+
+
+def parse_set_cookie(
+    set_cookie_values: List[str],
+    request_domain: str = "",
+    request_path: str = "/"
+) -> List[Cookie]:
+    """Parse Set-Cookie header values (RFC 6265 section 5.2).
+
+    Args:
+        set_cookie_values: Set-Cookie header values
+        request_domain: Domain the response came from; cookies without a
+            Domain attribute are host-only cookies for it, and cookies whose
+            Domain does not match it are rejected
+        request_path: Request path, used for the default Path
 
     Returns:
-        List of (name, value, domain) tuples
+        List of Cookie objects; an expires in the past means the cookie is deleted
     """
     cookies = []
+    host = cookie_host(request_domain)
     for value in set_cookie_values:
-        if '=' in value:
-            parts = value.split(';')
-            cookie_part = parts[0].strip()
-            if '=' in cookie_part:
-                name, val = cookie_part.split('=', 1)
-                name = name.strip()
-                val = val.strip()
-                domain = ""
-                for part in parts[1:]:
-                    part = part.strip()
-                    if part.lower().startswith('domain='):
-                        domain = part.split('=', 1)[1].strip().lower()
-                        if domain.startswith('.'):
-                            domain = domain[1:]
-                        break
-                cookies.append((name, val, domain))
+        parts = value.split(';')
+        cookie_part = parts[0].strip()
+        if '=' not in cookie_part:
+            continue
+        name, val = cookie_part.split('=', 1)
+        name = name.strip()
+        if not name:
+            continue
+        domain = ""
+        path = ""
+        expires = None
+        max_age = None
+        secure = False
+        http_only = False
+        for part in parts[1:]:
+            attr, _, attr_value = part.partition('=')
+            attr = attr.strip().lower()
+            attr_value = attr_value.strip()
+            if attr == 'domain':
+                domain = attr_value.lower().lstrip('.')
+            elif attr == 'path':
+                path = attr_value
+            elif attr == 'expires':
+                expires = http2time(attr_value)
+            elif attr == 'max-age':
+                try:
+                    max_age = int(attr_value)
+                except ValueError:
+                    pass
+            elif attr == 'secure':
+                secure = True
+            elif attr == 'httponly':
+                http_only = True
+
+        # Max-Age wins over Expires; zero or negative deletes the cookie
+        if max_age is not None:
+            expires = time.time() + max_age if max_age > 0 else 0.0
+        if domain and host and host != domain and not host.endswith('.' + domain):
+            continue
+        if not path.startswith('/'):
+            path = default_cookie_path(request_path)
+        cookies.append(Cookie(
+            name, val.strip(), domain or host, path,
+            expires=expires, secure=secure, http_only=http_only, host_only=not domain
+        ))
     return cookies
 
 
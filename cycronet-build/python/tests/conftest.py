@@ -0,0 +1,25 @@
+"""
+Test setup.
+
+cycronet/__init__.py loads libcronet and the compiled cronet_cloak module
+before anything else. The tests here cover the pure-Python modules, so when
+the extension is not built the package is registered without running its
+__init__ and the submodules are imported directly.
+"""
+
+import os
+import sys
+import types
+
+PYTHON_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PYTHON_ROOT not in sys.path:
+    sys.path.insert(0, PYTHON_ROOT)
+
+try:
+    import cycronet  # noqa: F401
+except ImportError:
+    for name in [name for name in sys.modules if name == 'cycronet' or name.startswith('cycronet.')]:
+        del sys.modules[name]
+    package = types.ModuleType('cycronet')
+    package.__path__ = [os.path.join(PYTHON_ROOT, 'cycronet')]
+    sys.modules['cycronet'] = package
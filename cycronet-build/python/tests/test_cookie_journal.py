@@ -0,0 +1,92 @@
+"""
+CookieJar persistence tests (snapshots and the background journal).
+"""
+
+import time
+
+from cycronet._cookies import CookieJar
+
+
+def _lines(path):
+    with open(path, encoding='utf-8') as f:
+        return f.read().splitlines()
+
+
+def test_save_and_load_round_trip(tmp_path):
+    path = tmp_path / 'cookies.jsonl'
+    jar = CookieJar()
+    jar.set('a', '1', 'example.com', '/p', expires=time.time() + 3600, secure=True, http_only=True)
+    jar.set('gone', '2', 'example.com', expires=time.time() + 3600)
+    jar.save(path)
+
+    loaded = CookieJar()
+    loaded.load(path)
+    cookie = next(c for c in loaded if c.name == 'a')
+    assert (cookie.domain, cookie.path, cookie.secure, cookie.http_only) == ('example.com', '/p', True, True)
+    assert len(loaded) == 2
+
+
+def test_journal_replays_changes_and_deletions(tmp_path):
+    path = tmp_path / 'journal.jsonl'
+    jar = CookieJar()
+    jar.open_journal(path, interval=3600)
+    jar.set('a', '1', 'example.com')
+    jar.set('b', '2', 'example.com')
+    jar.flush()
+    jar.set('a', '3', 'example.com')
+    jar.set('b', '', 'example.com', expires=0)
+    jar.close_journal()
+
+    replayed = CookieJar()
+    replayed.load(path)
+    assert replayed.get_dict() == {'a': '3'}
+
+
+def test_truncated_last_line_is_ignored(tmp_path):
+    path = tmp_path / 'journal.jsonl'
+    jar = CookieJar()
+    jar.open_journal(path, interval=3600)
+    jar.set('a', '1', 'example.com')
+    jar.close_journal()
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write('{"name":"b","value":"2","dom')
+
+    replayed = CookieJar()
+    replayed.open_journal(path, interval=3600)
+    assert replayed.get_dict() == {'a': '1'}
+    replayed.close_journal()
+
+
+def test_journal_compacts_once_larger_than_the_jar(tmp_path):
+    path = tmp_path / 'journal.jsonl'
+    jar = CookieJar()
+    jar.open_journal(path, interval=3600, compact_after=5)
+    for i in range(5):
+        jar.set('a', str(i), 'example.com')
+        jar.flush()
+    assert len(_lines(path)) == 5
+
+    # The next flush finds 5 appended records for 1 live cookie and rewrites the file
+    jar.set('a', 'last', 'example.com')
+    jar.flush()
+    assert len(_lines(path)) == 1
+    jar.close_journal()
+
+    replayed = CookieJar()
+    replayed.load(path)
+    assert replayed.get_dict() == {'a': 'last'}
+
+
+def test_clear_rewrites_the_journal(tmp_path):
+    path = tmp_path / 'journal.jsonl'
+    jar = CookieJar()
+    jar.open_journal(path, interval=3600)
+    jar.set('a', '1', 'example.com')
+    jar.flush()
+    jar.clear()
+    jar.set('b', '2', 'example.com')
+    jar.close_journal()
+
+    replayed = CookieJar()
+    replayed.load(path)
+    assert replayed.get_dict() == {'b': '2'}
@@ -0,0 +1,95 @@
+"""
+CookieJar and Set-Cookie parsing tests.
+"""
+
+import time
+
+from cycronet._cookies import CookieJar
+from cycronet._utils import parse_set_cookie
+
+
+def test_cookie_sent_after_ancestor_domain_pruned():
+    jar = CookieJar()
+    jar.set('p', '1', 'example.com')
+    jar.set('c', '2', 'a.example.com')
+    jar.clear('example.com')
+    jar.clear('a.example.com')
+    assert len(jar) == 0
+
+    jar.set('p', '3', 'example.com')
+    assert len(jar) == 1
+    assert jar.header('example.com', '/') == 'p=3'
+    assert jar.header('a.example.com', '/') == 'p=3'
+
+
+def test_expired_cookie_prunes_registered_ancestor():
+    jar = CookieJar()
+    jar.set('p', '1', 'example.com')
+    jar.set('c', '2', 'a.example.com')
+    jar.set('p', '', 'example.com', expires=0)
+    jar.set('c', '', 'a.example.com', expires=0)
+
+    jar.set('p', '4', 'example.com')
+    assert jar.get_dict() == {'p': '4'}
+    assert jar.header('b.example.com', '/') == 'p=4'
+
+
+def test_set_cookie_attributes():
+    cookie, = parse_set_cookie(
+        ['sid=abc; Domain=.Example.com; Path=/app; Secure; HttpOnly; Max-Age=60'],
+        'www.example.com:8443', '/app/login'
+    )
+    assert (cookie.name, cookie.value, cookie.domain, cookie.path) == ('sid', 'abc', 'example.com', '/app')
+    assert cookie.secure and cookie.http_only and not cookie.host_only
+    assert 55 < cookie.expires - time.time() <= 60
+
+
+def test_set_cookie_defaults_and_rejections():
+    host_only, = parse_set_cookie(['a=1'], 'www.example.com', '/dir/page')
+    assert (host_only.domain, host_only.path, host_only.host_only) == ('www.example.com', '/dir', True)
+    assert host_only.expires is None
+    # Domain must match the response host; nameless cookies are ignored
+    assert parse_set_cookie(['b=2; Domain=other.com', '=3', 'novalue'], 'www.example.com') == []
+
+
+def test_max_age_wins_over_expires():
+    cookie, = parse_set_cookie(['a=1; Expires=Wed, 21 Oct 2015 07:28:00 GMT; Max-Age=60'], 'example.com')
+    assert not cookie.is_expired()
+    deleted, = parse_set_cookie(['a=; Max-Age=0'], 'example.com')
+    assert deleted.is_expired()
+
+
+def test_host_only_path_and_secure_matching():
+    jar = CookieJar()
+    for cookie in parse_set_cookie(['host=1', 'wide=2; Domain=example.com'], 'example.com'):
+        jar.set_cookie(cookie)
+    jar.set('api', '3', 'example.com', '/api')
+    jar.set('tls', '4', 'example.com', secure=True)
+
+    assert jar.matching('example.com', '/api/v1') == {'host': '1', 'wide': '2', 'api': '3', 'tls': '4'}
+    assert jar.matching('a.example.com', '/') == {'wide': '2', 'tls': '4'}
+    assert jar.matching('example.com', '/apix', secure=False) == {'host': '1', 'wide': '2'}
+
+
+def test_expired_cookies_removed_lazily(monkeypatch):
+    jar = CookieJar()
+    now = time.time()
+    jar.set('short', '1', 'example.com', expires=now + 10)
+    jar.set('long', '2', 'example.com', expires=now + 1000)
+    assert jar.header('example.com') == 'short=1; long=2'
+
+    monkeypatch.setattr(time, 'time', lambda: now + 100)
+    assert jar.header('example.com') == 'long=2'
+    assert len(jar) == 1
+
+
+def test_max_cookies_evicts_least_recently_used():
+    jar = CookieJar(max_cookies=10)
+    for i in range(10):
+        jar.set(f'c{i}', str(i), 'example.com', f'/{i}')
+    jar.header('example.com', '/0')
+    jar.set('new', 'x', 'example.com')
+
+    assert len(jar) == 9
+    names = set(jar.keys())
+    assert {'c0', 'new'} <= names and 'c1' not in names and 'c2' not in names
@@ -0,0 +1,61 @@
+"""
+Module-level helper tests: calls share one default client per configuration.
+"""
+
+import types
+
+import pytest
+
+from cycronet import _api_sync, _client
+
+
+class _Native:
+    """Native client double recording the per-request deadlines"""
+
+    def __init__(self):
+        self.timeouts = []
+
+    def request(self, session_id, url, method, headers, body, allow_redirects, **kwargs):
+        self.timeouts.append(kwargs.get('timeout_ms'))
+        return {'status_code': 200, 'headers': {}, 'body': b'', 'url': url}
+
+
+@pytest.fixture
+def created(monkeypatch):
+    """Replace the native session factory, returns the list of created configurations"""
+    created = []
+
+    def create(verify, proxy_rules, timeout_ms, chrometls, **kwargs):
+        native = _Native()
+        created.append(((verify, proxy_rules, chrometls), native))
+        return types.SimpleNamespace(_client=native), 'session'
+
+    monkeypatch.setattr(_client, '_DEFAULT_CLIENTS', {})
+    monkeypatch.setattr(_client, '_create_native_session', create)
+    return created
+
+
+def test_calls_with_different_timeouts_share_one_client(created):
+    _api_sync.get('https://example.com/', timeout=5)
+    _api_sync.get('https://example.com/', timeout=60)
+    _api_sync.get('https://example.com/')
+
+    assert len(created) == 1
+    # Each call's timeout travels with its request instead of the shared session
+    assert created[0][1].timeouts == [5000, 60000, None]
+
+
+def test_file_helpers_keep_proxy_and_fingerprint(created, tmp_path):
+    path = tmp_path / 'upload.txt'
+    path.write_bytes(b'payload')
+
+    _api_sync.upload_file(
+        'https://example.com/upload', str(path),
+        proxies={'https': 'http://127.0.0.1:8080'}, chrometls=None
+    )
+    _api_sync.get('https://example.com/')
+
+    assert [config for config, _ in created] == [
+        (True, 'http://127.0.0.1:8080', None),
+        (True, None, 'chrome_144'),
+    ]
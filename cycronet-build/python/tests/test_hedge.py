@@ -0,0 +1,111 @@
+"""
+Hedged request tests.
+"""
+
+import asyncio
+import types
+
+from cycronet._async_session import AsyncSession
+from cycronet._hedge import Hedge
+
+
+class _Native:
+    """Native client double answering every request at once"""
+
+    def __init__(self):
+        self.urls = []
+
+    async def request_async(self, loop, session_id, url, method, headers, body, allow_redirects, **kwargs):
+        self.urls.append(url)
+        return {'status_code': 200, 'headers': {}, 'body': b'ok', 'url': url}
+
+
+def _session():
+    return AsyncSession(types.SimpleNamespace(_client=_Native()), 'session')
+
+
+def test_fixed_and_per_request_delay():
+    assert Hedge().delay() is None
+    assert Hedge(delay_ms=250).delay() == 0.25
+    assert Hedge(delay_ms=250).delay(hedge_after_ms=100) == 0.1
+
+
+def test_learned_delay_needs_min_samples():
+    hedge = Hedge(percentile=90, min_samples=10)
+    for ms in range(1, 10):
+        hedge.observe(ms / 1000)
+    assert hedge.delay() is None
+    hedge.observe(0.010)
+    assert hedge.delay() == 0.010
+
+
+def test_budget_only_follows_traffic():
+    hedge = Hedge(max_extra=0.5)
+    assert not hedge.budget.withdraw()
+    hedge.budget.deposit()
+    hedge.budget.deposit()
+    assert hedge.budget.withdraw()
+    assert not hedge.budget.withdraw()
+
+
+def _hedge_with_budget():
+    hedge = Hedge(max_extra=1.0)
+    hedge.budget.deposit()
+    return hedge
+
+
+def test_slow_primary_loses_to_hedge():
+    async def send_on(session, hedged=False):
+        await asyncio.sleep(0.01 if hedged else 1)
+        return {'copy': 'hedge' if hedged else 'primary'}
+
+    result = asyncio.run(AsyncSession._send_hedged(object(), send_on, _hedge_with_budget(), 0.01))
+    assert result == ({'copy': 'hedge'}, True)
+
+
+def test_cancelled_copy_counts_as_failed():
+    async def send_on(session, hedged=False):
+        if hedged:
+            await asyncio.sleep(0.05)
+            return {'copy': 'hedge'}
+        await asyncio.sleep(0.02)
+        # e.g. the native future cancelled through a cancel_token
+        raise asyncio.CancelledError()
+
+    result = asyncio.run(AsyncSession._send_hedged(object(), send_on, _hedge_with_budget(), 0.01))
+    assert result == ({'copy': 'hedge'}, True)
+
+
+def test_both_copies_failed_reports_primary_error():
+    async def send_on(session, hedged=False):
+        await asyncio.sleep(0.02)
+        raise RuntimeError('hedge failed' if hedged else 'primary failed')
+
+    async def run():
+        try:
+            await AsyncSession._send_hedged(object(), send_on, _hedge_with_budget(), 0.01)
+        except RuntimeError as exc:
+            return str(exc)
+
+    assert asyncio.run(run()) == 'primary failed'
+
+
+def test_hedge_after_ms_does_not_enable_session_hedging():
+    session = _session()
+    hedged_calls = []
+    send_hedged = session._send_hedged
+
+    async def record(send_on, hedge, delay):
+        hedged_calls.append(delay)
+        return await send_hedged(send_on, hedge, delay)
+
+    session._send_hedged = record
+
+    async def run():
+        await session.get('https://a.example/', hedge_after_ms=500)
+        await session.get('https://a.example/')
+
+    asyncio.run(run())
+    assert hedged_calls == [0.5]
+    assert session.hedge is None
+    assert session._client._client.urls == ['https://a.example/', 'https://a.example/']
@@ -0,0 +1,80 @@
+"""
+PreparedRequest tests: prepare() + send() must send what request() sends.
+"""
+
+import types
+
+from cycronet._session import Session
+
+CHROME_HEADERS = {
+    'sec-ch-ua': '"Chromium";v="144"',
+    'user-agent': 'Mozilla/5.0',
+    'accept': 'text/html',
+    'sec-fetch-site': 'none',
+    'sec-fetch-mode': 'navigate',
+    'sec-fetch-user': '?1',
+    'sec-fetch-dest': 'document',
+    'accept-language': 'en-US',
+    'priority': 'u=0, i',
+}
+
+
+class _Native:
+    """Native client double recording what each request would send"""
+
+    def __init__(self):
+        self.sent = []
+
+    def request(self, session_id, url, method, headers, body, allow_redirects, **kwargs):
+        self.sent.append((url, method, list(headers), body))
+        return {'status_code': 200, 'headers': {}, 'body': b'', 'url': url}
+
+
+def _session():
+    native = _Native()
+    session = Session(types.SimpleNamespace(_client=native), 'session')
+    # The first request with explicit headers makes them the session defaults
+    session.get('https://example.com/', headers=CHROME_HEADERS)
+    session.cookies.set('sid', '1', 'example.com')
+    native.sent.clear()
+    return session, native.sent
+
+
+def test_send_matches_request():
+    session, sent = _session()
+    for method, kwargs in [
+        ('GET', {'params': {'q': 'x'}}),
+        ('POST', {'json': {'a': 1}}),
+        ('POST', {'data': {'a': '1'}}),
+        ('DELETE', {}),
+    ]:
+        session.request(method, 'https://example.com/api', **kwargs)
+        session.send(session.prepare(method, 'https://example.com/api', **kwargs))
+        assert sent[0] == sent[1], method
+        sent.clear()
+
+
+def test_send_overrides_url_and_body():
+    session, sent = _session()
+    prepared = session.prepare('POST', 'https://example.com/a', json={'a': 1})
+    session.send(prepared, url='https://example.com/b', json={'b': 2})
+    session.request('POST', 'https://example.com/b', json={'b': 2})
+    assert sent[0] == sent[1]
+
+
+def test_prepared_request_reads_the_current_jar():
+    session, sent = _session()
+    prepared = session.prepare('GET', 'https://example.com/status')
+    session.send(prepared)
+    session.cookies.set('csrf', '2', 'example.com')
+    session.send(prepared)
+    cookies = [dict(headers).get('cookie') for _, _, headers, _ in sent]
+    assert cookies == ['sid=1', 'sid=1; csrf=2']
+
+
+def test_batch_headers_match_request():
+    session, sent = _session()
+    items, _ = session._prepare_batch([{'url': 'https://example.com/api', 'method': 'POST', 'json': {'a': 1}}])
+    session.request('POST', 'https://example.com/api', json={'a': 1})
+    url, method, headers, body, _ = items[0]
+    assert (url, method, headers, body) == sent[0]
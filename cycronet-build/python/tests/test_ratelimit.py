@@ -0,0 +1,63 @@
+"""
+RateLimiter tests (GCRA buckets per host and per proxy).
+"""
+
+import pytest
+
+from cycronet import _ratelimit
+from cycronet._ratelimit import RateLimiter
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(_ratelimit.time, 'monotonic', lambda: now[0])
+    return now
+
+
+def test_burst_then_paced_at_rate(clock):
+    limiter = RateLimiter(per_host=10, burst=3)
+    delays = [limiter.reserve('https://a.example/') for _ in range(5)]
+    assert delays[:3] == [0.0, 0.0, 0.0]
+    assert delays[3] == pytest.approx(0.1)
+    assert delays[4] == pytest.approx(0.2)
+
+
+def test_idle_bucket_refills_to_burst(clock):
+    limiter = RateLimiter(per_host=10, burst=3)
+    for _ in range(3):
+        limiter.reserve('https://a.example/')
+    clock[0] += 1.0
+    assert [limiter.reserve('https://a.example/') for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert limiter.reserve('https://a.example/') == pytest.approx(0.1)
+
+
+def test_hosts_are_limited_independently(clock):
+    limiter = RateLimiter(per_host=1)
+    assert limiter.reserve('https://a.example/') == 0.0
+    assert limiter.reserve('https://b.example/') == 0.0
+    assert limiter.reserve('https://a.example/x') == pytest.approx(1.0)
+
+
+def test_host_override_and_unlimited_default(clock):
+    limiter = RateLimiter(hosts={'api.example': (2, 1)})
+    assert limiter.reserve('https://other.example/') == 0.0
+    assert limiter.reserve('https://other.example/') == 0.0
+    assert limiter.reserve('https://API.example/') == 0.0
+    assert limiter.reserve('https://api.example/') == pytest.approx(0.5)
+
+
+def test_host_and_proxy_buckets_share_the_start_time(clock):
+    limiter = RateLimiter(per_host=10, per_proxy=1)
+    proxy = 'http://proxy.example:8080'
+    assert limiter.reserve('https://a.example/', proxy) == 0.0
+    # The proxy bucket is the slower one for both requests
+    assert limiter.reserve('https://b.example/', proxy) == pytest.approx(1.0)
+    assert limiter.reserve('https://a.example/') == pytest.approx(0.1)
+
+
+def test_invalid_rates_raise():
+    with pytest.raises(ValueError):
+        RateLimiter(per_host=0).reserve('https://a.example/')
+    with pytest.raises(ValueError):
+        RateLimiter(hosts={'a.example': (1, 0)}).reserve('https://a.example/')
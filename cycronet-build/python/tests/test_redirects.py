@@ -0,0 +1,92 @@
+"""
+Redirect tests: hops followed inside Cronet and hops handed back to
+Session.send must produce the same url and history.
+"""
+
+import types
+from urllib.parse import urljoin, urlsplit
+
+import pytest
+
+from cycronet._session import Session
+
+# same-host hop -> hop setting a cookie -> cross-host hop -> final page
+CHAIN = {
+    'https://a.test/start': (302, [('Location', '/login')]),
+    'https://a.test/login': (302, [('Location', '/home'), ('Set-Cookie', 'sid=1; Path=/')]),
+    'https://a.test/home': (302, [('Location', 'https://b.test/final')]),
+    'https://b.test/final': (200, []),
+}
+
+
+class _Native:
+    """
+    Native client double serving CHAIN
+
+    mode decides which hops are followed before returning:
+    'native' follows every hop, 'python' none, and 'mixed' follows the same
+    hops as should_follow_redirect() in cronet.rs when the caller manages cookies.
+    """
+
+    def __init__(self, mode):
+        self.mode = mode
+        self.sent = []
+
+    def _follow(self, url, status, headers, location, followed, max_redirects):
+        if self.mode == 'python' or followed >= max_redirects:
+            return False
+        if self.mode == 'native':
+            return True
+        sets_cookie = any(name.lower() == 'set-cookie' for name, _ in headers)
+        return not sets_cookie and urlsplit(url).netloc == urlsplit(location).netloc
+
+    def request(self, session_id, url, method, headers, body, allow_redirects, **kwargs):
+        history = []
+        while True:
+            cookie = next((value for name, value in headers if name.lower() == 'cookie'), None)
+            self.sent.append((url, cookie))
+            status, response_headers = CHAIN[url]
+            location = dict(response_headers).get('Location')
+            if location is None or not allow_redirects:
+                break
+            location = urljoin(url, location)
+            if not self._follow(url, status, response_headers, location, len(history), kwargs['max_redirects']):
+                break
+            history.append({'status_code': status, 'headers': response_headers, 'url': url})
+            url = location
+        return {'status_code': status, 'headers': response_headers, 'body': b'', 'url': url, 'history': history}
+
+
+def _fetch(mode):
+    native = _Native(mode)
+    session = Session(types.SimpleNamespace(_client=native), 'session')
+    response = session.get('https://a.test/start')
+    return response, native.sent
+
+
+@pytest.mark.parametrize('mode', ['native', 'mixed'])
+def test_history_matches_python_redirect_loop(mode):
+    expected, _ = _fetch('python')
+    response, _ = _fetch(mode)
+
+    assert response.url == expected.url == 'https://b.test/final'
+    assert [(hop.status_code, hop.url) for hop in response.history] == \
+        [(hop.status_code, hop.url) for hop in expected.history] == [
+            (302, 'https://a.test/start'),
+            (302, 'https://a.test/login'),
+            (302, 'https://a.test/home'),
+        ]
+
+
+def test_mixed_chain_hands_back_cookie_and_host_changes():
+    response, sent = _fetch('mixed')
+
+    # /login is followed inside Cronet; the Set-Cookie hop and the host change are
+    # handed back, so the next request carries the cookie from the updated jar
+    assert sent == [
+        ('https://a.test/start', None),
+        ('https://a.test/login', None),
+        ('https://a.test/home', 'sid=1'),
+        ('https://b.test/final', None),
+    ]
+    assert response.status_code == 200
@@ -0,0 +1,52 @@
+"""
+Response regression tests.
+"""
+
+import asyncio
+
+import pytest
+
+from cycronet._response import Response
+
+
+class _FakeStream:
+    def __init__(self, chunks):
+        self._chunks = list(chunks) + [None]
+
+    def read(self):
+        return self._chunks.pop(0)
+
+    async def read_async(self, loop):
+        return self._chunks.pop(0)
+
+    def close(self):
+        pass
+
+    def timings(self):
+        return None
+
+    def from_cache(self):
+        return False
+
+
+def test_content_constructor_argument():
+    response = Response(200, {}, content=b'{"a": 1}', url='https://example.com/')
+    assert response.content == b'{"a": 1}'
+    assert response.json() == {'a': 1}
+
+
+def test_content_after_stream_consumed_raises():
+    response = Response(200, {}, None, _stream=_FakeStream([b'a', b'b']))
+    assert list(response.iter_content()) == [b'a', b'b']
+    with pytest.raises(RuntimeError, match='already consumed'):
+        response.content
+
+
+def test_aiter_bytes_rechunks_like_iter_content():
+    async def collect(chunk_size):
+        response = Response(200, {}, None, _stream=_FakeStream([b'abc', b'de', b'fghij']))
+        return [chunk async for chunk in response.aiter_bytes(chunk_size)]
+
+    expected = list(Response(200, {}, None, _stream=_FakeStream([b'abc', b'de', b'fghij'])).iter_content(4))
+    assert asyncio.run(collect(4)) == expected == [b'abcd', b'efgh', b'ij']
+    assert asyncio.run(collect(None)) == [b'abc', b'de', b'fghij']
@@ -0,0 +1,105 @@
+"""
+Retry policy and RetryBudget tests.
+"""
+
+import pytest
+
+from cycronet import _retry
+from cycronet._response import Response
+from cycronet._retry import Retry, RetryBudget, net_error, parse_retry_after
+
+
+def _response(status_code, headers=None):
+    return Response(status_code, {k: [v] for k, v in (headers or {}).items()}, b'')
+
+
+def test_backoff_doubles_up_to_max():
+    retry = Retry(backoff_factor=0.5, backoff_max=3, jitter=False)
+    assert [retry.backoff(attempt) for attempt in range(1, 5)] == [0.5, 1.0, 2.0, 3.0]
+
+
+def test_jitter_stays_within_backoff():
+    retry = Retry(backoff_factor=0.5)
+    assert all(0 <= retry.backoff(3) <= 2.0 for _ in range(100))
+
+
+def test_net_error_extracted_from_native_message():
+    assert net_error(RuntimeError("Request failed: net::ERR_CONNECTION_RESET")) == 'ERR_CONNECTION_RESET'
+    assert net_error(RuntimeError("Request failed")) is None
+
+
+@pytest.mark.parametrize('method, message, retryable', [
+    # Connect errors never reached the server: every method is retried
+    ('POST', 'Request failed: net::ERR_CONNECTION_REFUSED', True),
+    ('GET', 'Request failed: net::ERR_NAME_NOT_RESOLVED', True),
+    # Transport errors may have been processed: idempotent methods only
+    ('GET', 'Request failed: net::ERR_CONNECTION_RESET', True),
+    ('POST', 'Request failed: net::ERR_CONNECTION_RESET', False),
+    ('GET', 'Request failed: net::ERR_CERT_DATE_INVALID', False),
+    ('GET', 'Request failed', False),
+])
+def test_error_classification(method, message, retryable):
+    assert Retry().is_retryable_error(method, RuntimeError(message)) is retryable
+
+
+def test_timeouts_retry_connect_for_any_method():
+    retry = Retry()
+    assert retry.is_retryable_error('POST', TimeoutError("Connect timeout after 1000ms"))
+    assert not retry.is_retryable_error('POST', TimeoutError("Read timeout after 1000ms without data"))
+    assert retry.is_retryable_error('GET', TimeoutError("Request timeout after 5000ms"))
+    assert not Retry(retry_on_timeout=False).is_retryable_error('GET', TimeoutError("Connect timeout after 1ms"))
+
+
+def test_delay_for_error_stops_after_total():
+    retry = Retry(total=2, jitter=False)
+    error = RuntimeError("net::ERR_CONNECTION_REFUSED")
+    assert retry.delay_for_error('GET', error, 2) == pytest.approx(0.2)
+    assert retry.delay_for_error('GET', error, 3) is None
+
+
+def test_delay_for_response():
+    retry = Retry(jitter=False)
+    assert retry.delay_for_response('GET', _response(200), 1) is None
+    assert retry.delay_for_response('POST', _response(503), 1) is None
+    assert retry.delay_for_response('GET', _response(502), 1) == pytest.approx(0.1)
+    assert retry.delay_for_response('GET', _response(429, {'Retry-After': '7'}), 1) == 7.0
+    # A Retry-After longer than retry_after_max keeps the response
+    assert retry.delay_for_response('GET', _response(503, {'retry-after': '120'}), 1) is None
+    assert Retry(jitter=False, respect_retry_after=False).delay_for_response(
+        'GET', _response(503, {'Retry-After': '120'}), 1) == pytest.approx(0.1)
+
+
+def test_parse_retry_after():
+    assert parse_retry_after('5') == 5.0
+    assert parse_retry_after('Wed, 21 Oct 2015 07:28:00 GMT') == 0.0
+    assert parse_retry_after('soon') is None
+    assert parse_retry_after(None) is None
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(_retry.time, 'monotonic', lambda: now[0])
+    return now
+
+
+def test_budget_allows_ratio_of_requests(clock):
+    budget = RetryBudget(ratio=0.2, min_per_second=0.0)
+    while budget.withdraw():
+        pass
+    for _ in range(4):
+        budget.deposit()
+    assert not budget.withdraw()
+    budget.deposit()
+    assert budget.withdraw()
+    assert not budget.withdraw()
+
+
+def test_budget_refills_min_per_second(clock):
+    budget = RetryBudget(ratio=0.0, min_per_second=2.0, max_tokens=3.0)
+    assert budget.withdraw() and budget.withdraw()
+    assert not budget.withdraw()
+    clock[0] += 0.5
+    assert budget.withdraw()
+    clock[0] += 60
+    assert budget.available == 3.0
@@ -0,0 +1,30 @@
+"""
+Timeout conversion tests.
+"""
+
+import pytest
+
+from cycronet._utils import timeout_to_ms
+
+
+def test_number_bounds_the_whole_request():
+    assert timeout_to_ms(2.5) == (2500, None, None)
+    assert timeout_to_ms(0.0001) == (1, None, None)
+
+
+def test_none_and_zero_keep_the_session_default():
+    assert timeout_to_ms(None) == (None, None, None)
+    assert timeout_to_ms(0) == (None, None, None)
+    assert timeout_to_ms(0.0) == (None, None, None)
+
+
+def test_tuple_sets_connect_read_and_total():
+    assert timeout_to_ms((3, 10)) == (None, 3000, 10000)
+    assert timeout_to_ms((3, 10, 30)) == (30000, 3000, 10000)
+    assert timeout_to_ms((0, 10)) == (None, None, 10000)
+
+
+@pytest.mark.parametrize('timeout', [-1, (1, -2), (1, 2, 3, 4)])
+def test_invalid_timeouts_raise(timeout):
+    with pytest.raises(ValueError):
+        timeout_to_ms(timeout)
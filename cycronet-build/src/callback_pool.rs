@@ -0,0 +1,190 @@
+// -----------------------------------------------------------------------------
+// Callback Thread Pool
+// -----------------------------------------------------------------------------
+//
+// 执行 Cronet 回调的线程池，以及请求销毁前等待回调返回的计数器。
+// 本模块只依赖标准库，顺序与销毁安全的测试不需要 libcronet，可以单独运行：
+//
+//     rustc --edition 2021 --test src/callback_pool.rs -o target/callback_pool_tests
+//     target/callback_pool_tests
+
+use std::sync::atomic::{AtomicUsize, Ordering};
+use std::sync::mpsc::{channel, SendError, Sender};
+use std::sync::{Arc, Mutex};
+use std::time::{Duration, Instant};
+
+pub type CallbackJob = Box<dyn FnOnce() + Send>;
+
+/// 执行 Cronet 回调的固定大小线程池
+/// 每个请求固定分配到一个 worker，保证同一请求的回调按投递顺序串行执行，
+/// 不同请求的 body 复制、header 解析等工作则可以并行
+pub struct CallbackPool {
+    workers: Vec<Mutex<Sender<CallbackJob>>>,
+    next: AtomicUsize,
+}
+
+impl CallbackPool {
+    pub fn new(size: usize) -> Self {
+        let size = size.max(1);
+        let workers = (0..size)
+            .map(|i| {
+                let (sender, receiver) = channel::<CallbackJob>();
+                std::thread::Builder::new()
+                    .name(format!("cycronet-callback-{}", i))
+                    .spawn(move || {
+                        // 所有 Sender 释放后退出
+                        while let Ok(job) = receiver.recv() {
+                            job();
+                        }
+                    })
+                    .expect("Failed to spawn callback worker");
+                Mutex::new(sender)
+            })
+            .collect();
+        CallbackPool {
+            workers,
+            next: AtomicUsize::new(0),
+        }
+    }
+
+    pub fn size(&self) -> usize {
+        self.workers.len()
+    }
+
+    /// 轮询分配 worker
+    pub fn next_worker(&self) -> usize {
+        self.next.fetch_add(1, Ordering::Relaxed) % self.workers.len()
+    }
+
+    /// 投递到指定 worker，同一 worker 上的 job 按投递顺序执行
+    pub fn submit(&self, worker: usize, job: CallbackJob) {
+        let sender = match self.workers[worker].lock() {
+            Ok(guard) => guard,
+            Err(poisoned) => poisoned.into_inner(),
+        };
+        if let Err(SendError(job)) = sender.send(job) {
+            // worker 已退出（不应发生），退回到调用线程执行
+            drop(sender);
+            job();
+        }
+    }
+}
+
+/// 已投递但尚未执行完的回调数量
+///
+/// job 只持有这个计数器，不访问请求的其他对象；请求销毁前调用 wait_idle，
+/// 等 worker 上的回调完全返回后才能释放回调仍在使用的 Cronet 对象
+#[derive(Clone, Default)]
+pub struct PendingCallbacks(Arc<AtomicUsize>);
+
+impl PendingCallbacks {
+    /// 投递一个回调前调用
+    pub fn enter(&self) {
+        self.0.fetch_add(1, Ordering::AcqRel);
+    }
+
+    /// 回调（包括其后的清理）全部完成后调用
+    pub fn exit(&self) {
+        self.0.fetch_sub(1, Ordering::AcqRel);
+    }
+
+    pub fn is_idle(&self) -> bool {
+        self.0.load(Ordering::Acquire) == 0
+    }
+
+    /// 等待所有已投递的回调返回，超时返回 false
+    pub fn wait_idle(&self, timeout: Duration) -> bool {
+        let start = Instant::now();
+        while !self.is_idle() {
+            if start.elapsed() > timeout {
+                return false;
+            }
+            std::thread::sleep(Duration::from_millis(1));
+        }
+        true
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use std::sync::atomic::AtomicBool;
+    use std::sync::mpsc as std_mpsc;
+
+    /// 同一请求的回调必须按投递顺序执行，即使多个请求同时向线程池投递
+    #[test]
+    fn callback_pool_preserves_per_request_order() {
+        const REQUESTS: usize = 64;
+        const CALLBACKS: usize = 500;
+
+        let pool = Arc::new(CallbackPool::new(4));
+        let (done_tx, done_rx) = std_mpsc::channel();
+
+        let producers: Vec<_> = (0..REQUESTS)
+            .map(|_| {
+                let pool = pool.clone();
+                let done_tx = done_tx.clone();
+                std::thread::spawn(move || {
+                    let worker = pool.next_worker();
+                    let seen = Arc::new(Mutex::new(Vec::with_capacity(CALLBACKS)));
+                    for seq in 0..CALLBACKS {
+                        let seen = seen.clone();
+                        let done_tx = done_tx.clone();
+                        pool.submit(worker, Box::new(move || {
+                            let mut seen = seen.lock().unwrap();
+                            seen.push(seq);
+                            if seen.len() == CALLBACKS {
+                                let _ = done_tx.send(seen.clone());
+                            }
+                        }));
+                    }
+                })
+            })
+            .collect();
+        for producer in producers {
+            producer.join().unwrap();
+        }
+
+        for _ in 0..REQUESTS {
+            let seen = done_rx.recv_timeout(Duration::from_secs(30)).expect("callbacks not finished");
+            assert_eq!(seen, (0..CALLBACKS).collect::<Vec<_>>());
+        }
+    }
+
+    /// 终止回调在 worker 上执行的同时，调用方收到结果后会立即销毁请求：
+    /// 销毁方必须等回调完全返回（wait_idle）后才能释放回调仍在使用的对象
+    #[test]
+    fn wait_idle_waits_for_terminal_callback() {
+        const ROUNDS: usize = 2000;
+
+        let pool = CallbackPool::new(8);
+
+        for round in 0..ROUNDS {
+            let worker = pool.next_worker();
+            let pending = PendingCallbacks::default();
+            let (result_tx, result_rx) = std_mpsc::channel();
+
+            // 回调返回后仍会访问的对象（相当于 Cronet 的 runnable / UrlRequest）
+            let in_use = Arc::new(AtomicBool::new(false));
+            let callback_in_use = in_use.clone();
+
+            // 相当于 executor_execute 投递 on_succeeded
+            let callback_pending = pending.clone();
+            pending.enter();
+            pool.submit(worker, Box::new(move || {
+                callback_in_use.store(true, Ordering::Release);
+                let _ = result_tx.send(round);
+                if round % 7 == 0 {
+                    std::thread::yield_now();
+                }
+                callback_in_use.store(false, Ordering::Release);
+                callback_pending.exit();
+            }));
+
+            // 相当于调用方：收到结果后立即按 CronetRequest::drop 的方式等待并销毁
+            assert_eq!(result_rx.recv().expect("result not sent"), round);
+            assert!(pending.wait_idle(Duration::from_secs(30)), "callback did not finish");
+            assert!(!in_use.load(Ordering::Acquire), "request destroyed while callback running");
+        }
+    }
+}
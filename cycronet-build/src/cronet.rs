@@ -1,12 +1,15 @@
+use crate::callback_pool::{CallbackPool, PendingCallbacks};
 use crate::cronet_c::*;
 use crate::cronet_pb::proxy_config::ProxyType;
+use crate::metrics::{MetricsSnapshot, RequestMetrics, RequestOutcome, RequestRecorder};
 use crate::VERBOSE_MODE;
 use std::collections::HashMap;
 use std::ffi::{c_void, CStr, CString};
-use std::ptr;
-use std::sync::atomic::{AtomicBool, AtomicUsize, AtomicI32, Ordering};
-use std::sync::{Arc, Mutex};
-use tokio::sync::oneshot;
+use std::io::{Read, Seek, SeekFrom};
+use std::path::PathBuf;
+use std::sync::atomic::{AtomicBool, AtomicUsize, AtomicI32, AtomicU64, Ordering};
+use std::sync::{Arc, Mutex, MutexGuard, OnceLock};
+use tokio::sync::{mpsc, oneshot, OwnedSemaphorePermit, Semaphore};
 
 // Macro for verbose logging
 macro_rules! verbose_log {
@@ -205,6 +208,8 @@ impl CronetEngine {
 
             // 创建完成标志，用于追踪请求是否已完成
             let completed = Arc::new(AtomicBool::new(false));
+            let progress = Arc::new(RequestProgress::new());
+            let timings: Arc<Mutex<Option<RequestTimings>>> = Arc::new(Mutex::new(None));
 
             // Create Context to hold state across callbacks
             let context = Box::new(RequestContext {
@@ -212,19 +217,29 @@ impl CronetEngine {
                 response_buffer: Mutex::new(Vec::new()),
                 response_headers: Mutex::new(Vec::new()),
                 status_code: AtomicI32::new(0),
+                from_cache: AtomicBool::new(false),
                 completed: completed.clone(),
                 active_requests: None,  // CronetEngine 不使用活跃请求计数
                 allow_redirects: true,  // 默认允许重定向（REST API）
+                max_redirects: None,
+                caller_manages_cookies: false,
+                redirects: Mutex::new(Vec::new()),
+                response_url: Mutex::new(String::new()),
                 redirect_response: Mutex::new(None),
                 context_taken: AtomicBool::new(false),
+                stream_tx: None,
+                progress: progress.clone(),
+                timings: timings.clone(),
+                recorder: Some(RequestRecorder::start(None, &target.url, None)),
+                queue_ms: None,
+                _admission: None,
             });
 
             let context_ptr = Box::into_raw(context);
 
             // 复用引擎共享的 executor 线程（避免每个请求创建新线程）
-            let executor_context = Box::new(ExecutorContext {
-                in_flight_executors: None,  // CronetEngine 不使用 in-flight 计数
-            });
+            // CronetEngine 不使用 in-flight 计数，回调在网络线程上同步执行
+            let executor_context = Box::new(ExecutorContext::new(None, None));
             let executor_context_ptr = Box::into_raw(executor_context);
 
             // Executor
@@ -281,43 +296,13 @@ impl CronetEngine {
             }
 
             // Upload Data Provider (Body)
-            let mut upload_data_provider_ptr: Option<Cronet_UploadDataProviderPtr> = None;
-
-            // Keep body alive
-            let upload_body_data = if !target.body.is_empty() {
-                Some(target.body.clone())
-            } else {
-                None
-            };
-
-            if let Some(body) = &upload_body_data {
-                eprintln!(
-                    "[DEBUG] Creating Rust UploadDataProvider. Body len: {}",
-                    body.len()
-                );
-
-                let upload_context = Box::new(UploadContext {
-                    data: body.clone(),
-                    position: 0,
-                });
-                let upload_context_ptr = Box::into_raw(upload_context);
-
-                let provider = Cronet_UploadDataProvider_CreateWith(
-                    Some(upload_get_length),
-                    Some(upload_read),
-                    Some(upload_rewind),
-                    Some(upload_close),
-                );
-                Cronet_UploadDataProvider_SetClientContext(
-                    provider,
-                    upload_context_ptr as *mut c_void,
-                );
-
-                Cronet_UrlRequestParams_upload_data_provider_set(params_ptr, provider);
-                Cronet_UrlRequestParams_upload_data_provider_executor_set(params_ptr, executor_ptr);
-
-                upload_data_provider_ptr = Some(provider);
-            }
+            let upload_data_provider_ptr = attach_upload_body(
+                params_ptr,
+                executor_ptr,
+                UploadBody::from(target.body.clone()),
+                progress.clone(),
+            );
+            let finished_listener_ptr = attach_finished_listener(params_ptr, executor_ptr, &timings);
 
             Cronet_UrlRequest_InitWithParams(
                 request_ptr,
@@ -342,8 +327,12 @@ impl CronetEngine {
                 executor_context_ptr,
                 owned_engine_ptr,
                 upload_data_provider_ptr,
-                upload_body_data,
                 completed,
+                body_stream: None,
+                progress,
+                finished_listener_ptr,
+                timings,
+                queue_ms: None,
             };
 
             (request_handle, rx)
@@ -381,6 +370,39 @@ pub struct RequestResult {
     pub status_code: i32,
     pub headers: Vec<(String, String)>,
     pub body: Vec<u8>,
+    /// 最终响应的 URL（跟随重定向后）
+    pub url: String,
+    /// 已自动跟随的重定向，按顺序排列
+    pub history: Vec<RedirectHop>,
+    /// 来自 RequestFinishedInfo 的耗时统计（流式响应头阶段尚不可用）
+    pub timings: Option<RequestTimings>,
+    /// 响应来自 Cronet HTTP 缓存（包括经 ETag/Last-Modified 重新验证后的缓存）
+    pub from_cache: bool,
+}
+
+/// 自动跟随的一跳重定向（保留各跳的响应头，调用方据此提取 Set-Cookie）
+#[derive(Clone, Debug)]
+pub struct RedirectHop {
+    pub status_code: i32,
+    pub url: String,
+    pub headers: Vec<(String, String)>,
+}
+
+/// 流式响应的 body 块：Ok(Some(块)) / Ok(None) 表示结束 / Err 表示失败
+pub type BodyChunk = Result<Option<Vec<u8>>, String>;
+
+/// 单个请求的选项
+#[derive(Clone, Debug, Default)]
+pub struct RequestOptions {
+    /// 是否由 Cronet 自动跟随重定向
+    pub allow_redirects: bool,
+    /// 自动跟随的重定向上限，达到上限后把重定向响应交回调用方（None 表示不限制）
+    pub max_redirects: Option<u32>,
+    /// 调用方自行管理 Cookie：跨主机或带 Set-Cookie 的重定向交回调用方处理，
+    /// 以免沿用已过期的 Cookie 请求头
+    pub caller_manages_cookies: bool,
+    /// 流式模式：收到响应头即返回，body 按需逐块读取
+    pub stream: bool,
 }
 
 #[allow(dead_code)]
@@ -391,11 +413,206 @@ pub struct CronetRequest {
     executor_context_ptr: *mut ExecutorContext,  // Executor 的独立 context
     owned_engine_ptr: Option<Cronet_EnginePtr>,
     upload_data_provider_ptr: Option<Cronet_UploadDataProviderPtr>,
-    upload_body_data: Option<Vec<u8>>, // Owns the body data so pointers are valid
     completed: Arc<AtomicBool>,  // 标记请求是否完成，由回调设置
+    body_stream: Option<mpsc::UnboundedReceiver<BodyChunk>>,  // 流式模式下的 body 块接收端
+    progress: Arc<RequestProgress>,  // 回调更新的进度，用于连接/读取空闲超时
+    finished_listener_ptr: Cronet_RequestFinishedInfoListenerPtr,
+    timings: Arc<Mutex<Option<RequestTimings>>>,  // RequestFinishedInfo 监听器写入
+    queue_ms: Option<i64>,
+}
+
+/// 请求进度：由回调更新，等待方据此判断连接超时与读取空闲超时
+pub struct RequestProgress {
+    started: Instant,
+    last_activity_ms: AtomicU64,  // 最近一次网络活动（相对 started 的毫秒数）
+    connected: AtomicBool,        // 已开始上传 body 或收到响应
+    timed_out: AtomicBool,        // 因截止时间到期而取消（统计中计为超时而非取消）
+}
+
+impl RequestProgress {
+    fn new() -> Self {
+        RequestProgress {
+            started: Instant::now(),
+            last_activity_ms: AtomicU64::new(0),
+            connected: AtomicBool::new(false),
+            timed_out: AtomicBool::new(false),
+        }
+    }
+
+    /// 记录一次网络活动
+    fn touch(&self) {
+        let elapsed = self.started.elapsed().as_millis() as u64;
+        self.last_activity_ms.fetch_max(elapsed, Ordering::AcqRel);
+    }
+
+    /// 连接已建立（开始上传或收到响应）
+    fn mark_connected(&self) {
+        self.touch();
+        self.connected.store(true, Ordering::Release);
+    }
+
+    pub fn started(&self) -> Instant {
+        self.started
+    }
+
+    pub fn is_connected(&self) -> bool {
+        self.connected.load(Ordering::Acquire)
+    }
+
+    fn is_timed_out(&self) -> bool {
+        self.timed_out.load(Ordering::Acquire)
+    }
+
+    /// 最近一次网络活动的时间点
+    pub fn last_activity(&self) -> Instant {
+        self.started + std::time::Duration::from_millis(self.last_activity_ms.load(Ordering::Acquire))
+    }
+}
+
+/// 单个请求的耗时统计（毫秒，来自 Cronet_Metrics；未发生的阶段为 None）
+#[derive(Clone, Debug, Default)]
+pub struct RequestTimings {
+    pub dns_ms: Option<i64>,
+    /// 建立连接耗时（含 TLS 握手）
+    pub connect_ms: Option<i64>,
+    pub tls_ms: Option<i64>,
+    pub send_ms: Option<i64>,
+    /// 请求开始到收到响应头
+    pub ttfb_ms: Option<i64>,
+    pub total_ms: Option<i64>,
+    pub socket_reused: bool,
+    pub sent_bytes: i64,
+    pub received_bytes: i64,
+    /// 协商的协议，例如 "h2"、"h3"、"http/1.1"
+    pub protocol: String,
+    /// 在会话并发队列中等待的时间（不计入以上各项）
+    pub queue_ms: Option<i64>,
+}
+
+/// 读取耗时统计并附上排队时间
+fn load_timings(slot: &Mutex<Option<RequestTimings>>, queue_ms: Option<i64>) -> Option<RequestTimings> {
+    lock_or_recover(slot, "load_timings")
+        .clone()
+        .map(|timings| RequestTimings { queue_ms, ..timings })
+}
+
+unsafe fn metrics_span(start: Cronet_DateTimePtr, end: Cronet_DateTimePtr) -> Option<i64> {
+    if start.is_null() || end.is_null() {
+        return None;
+    }
+    Some((Cronet_DateTime_value_get(end) - Cronet_DateTime_value_get(start)).max(0))
+}
+
+/// 为请求挂上 RequestFinishedInfo 监听器，结果写入 timings
+/// 监听器与回调共用同一个 executor：Cronet 先投递监听器再投递终止回调，
+/// 因此 on_succeeded / on_failed / on_canceled 执行时耗时统计已经写好
+unsafe fn attach_finished_listener(
+    params_ptr: Cronet_UrlRequestParamsPtr,
+    executor_ptr: Cronet_ExecutorPtr,
+    timings: &Arc<Mutex<Option<RequestTimings>>>,
+) -> Cronet_RequestFinishedInfoListenerPtr {
+    let listener_ptr = Cronet_RequestFinishedInfoListener_CreateWith(Some(on_request_finished));
+    Cronet_RequestFinishedInfoListener_SetClientContext(
+        listener_ptr,
+        Arc::into_raw(timings.clone()) as *mut c_void,
+    );
+    Cronet_UrlRequestParams_request_finished_listener_set(params_ptr, listener_ptr);
+    Cronet_UrlRequestParams_request_finished_executor_set(params_ptr, executor_ptr);
+    listener_ptr
+}
+
+unsafe extern "C" fn on_request_finished(
+    self_: Cronet_RequestFinishedInfoListenerPtr,
+    request_info: Cronet_RequestFinishedInfoPtr,
+    response_info: Cronet_UrlResponseInfoPtr,
+    _error: Cronet_ErrorPtr,
+) {
+    let slot = Cronet_RequestFinishedInfoListener_GetClientContext(self_) as *const Mutex<Option<RequestTimings>>;
+    if slot.is_null() || request_info.is_null() {
+        return;
+    }
+    let metrics = Cronet_RequestFinishedInfo_metrics_get(request_info);
+    if metrics.is_null() {
+        return;
+    }
+
+    let request_start = Cronet_Metrics_request_start_get(metrics);
+    let timings = RequestTimings {
+        dns_ms: metrics_span(Cronet_Metrics_dns_start_get(metrics), Cronet_Metrics_dns_end_get(metrics)),
+        connect_ms: metrics_span(Cronet_Metrics_connect_start_get(metrics), Cronet_Metrics_connect_end_get(metrics)),
+        tls_ms: metrics_span(Cronet_Metrics_ssl_start_get(metrics), Cronet_Metrics_ssl_end_get(metrics)),
+        send_ms: metrics_span(Cronet_Metrics_sending_start_get(metrics), Cronet_Metrics_sending_end_get(metrics)),
+        ttfb_ms: metrics_span(request_start, Cronet_Metrics_response_start_get(metrics)),
+        total_ms: metrics_span(request_start, Cronet_Metrics_request_end_get(metrics)),
+        socket_reused: Cronet_Metrics_socket_reused_get(metrics),
+        sent_bytes: Cronet_Metrics_sent_byte_count_get(metrics),
+        received_bytes: Cronet_Metrics_received_byte_count_get(metrics),
+        protocol: if response_info.is_null() {
+            String::new()
+        } else {
+            cronet_string(Cronet_UrlResponseInfo_negotiated_protocol_get(response_info))
+        },
+        queue_ms: None,
+    };
+    verbose_log!("[DEBUG] on_request_finished: {:?}", timings);
+    *lock_or_recover(&*slot, "on_request_finished") = Some(timings);
 }
 
 unsafe impl Send for CronetRequest {}
+// &self 方法只调用 Cronet 的线程安全接口（Cancel / Read）
+unsafe impl Sync for CronetRequest {}
+
+impl CronetRequest {
+    /// 请求是否已完成（成功、失败或取消回调已执行）
+    pub fn is_completed(&self) -> bool {
+        self.completed.load(Ordering::Acquire)
+    }
+
+    /// 请求进度（连接状态与最近一次网络活动）
+    pub fn progress(&self) -> &RequestProgress {
+        &self.progress
+    }
+
+    /// 请求结束后的耗时统计（请求未结束时为 None）
+    pub fn timings(&self) -> Option<RequestTimings> {
+        load_timings(&self.timings, self.queue_ms)
+    }
+
+    /// 取出流式模式下的 body 块接收端（只能取一次）
+    pub fn take_body_stream(&mut self) -> Option<mpsc::UnboundedReceiver<BodyChunk>> {
+        self.body_stream.take()
+    }
+
+    /// 流式模式：请求读取下一个 body 块
+    /// 只有消费者调用时才发起 Cronet_UrlRequest_Read，从而实现背压
+    pub fn read_next(&self) -> bool {
+        if self.is_completed() || self.ptr.is_null() {
+            return false;
+        }
+        unsafe {
+            let buffer_ptr = Cronet_Buffer_Create();
+            Cronet_Buffer_InitWithAlloc(buffer_ptr, READ_CHUNK_SIZE as u64);
+            Cronet_UrlRequest_Read(self.ptr, buffer_ptr);
+        }
+        true
+    }
+
+    /// 因截止时间到期取消请求，统计中计为超时
+    pub fn cancel_timed_out(&self) {
+        self.progress.timed_out.store(true, Ordering::Release);
+        self.cancel();
+    }
+
+    /// 取消尚未完成的请求（不等待 on_canceled 回调）
+    pub fn cancel(&self) {
+        if !self.completed.load(Ordering::Acquire) && !self.ptr.is_null() {
+            verbose_log!("[DEBUG] CronetRequest::cancel - Canceling in-flight request");
+            unsafe {
+                Cronet_UrlRequest_Cancel(self.ptr);
+            }
+        }
+    }
+}
 
 impl Drop for CronetRequest {
     fn drop(&mut self) {
@@ -418,6 +635,14 @@ impl Drop for CronetRequest {
                 }
             }
 
+            // 线程池模式：等待已投递的回调执行完，避免 worker 访问已销毁的对象
+            if !self.executor_context_ptr.is_null() {
+                let pending = &(*self.executor_context_ptr).pending;
+                if !pending.wait_idle(std::time::Duration::from_secs(5)) {
+                    eprintln!("[WARN] CronetRequest::drop - Timeout waiting for pooled callbacks");
+                }
+            }
+
             // 现在可以安全销毁了（同步执行模式下不需要等待 executor）
             if !self.ptr.is_null() {
                 Cronet_UrlRequest_Destroy(self.ptr);
@@ -435,6 +660,13 @@ impl Drop for CronetRequest {
             if let Some(dp) = self.upload_data_provider_ptr {
                 Cronet_UploadDataProvider_Destroy(dp);
             }
+            if !self.finished_listener_ptr.is_null() {
+                let slot = Cronet_RequestFinishedInfoListener_GetClientContext(self.finished_listener_ptr);
+                if !slot.is_null() {
+                    drop(Arc::from_raw(slot as *const Mutex<Option<RequestTimings>>));
+                }
+                Cronet_RequestFinishedInfoListener_Destroy(self.finished_listener_ptr);
+            }
             // Finally destroy engine if we own it
             if let Some(engine_ptr) = self.owned_engine_ptr {
                 Cronet_Engine_Shutdown(engine_ptr);
@@ -450,27 +682,158 @@ struct RequestContext {
     response_buffer: Mutex<Vec<u8>>,
     response_headers: Mutex<Vec<(String, String)>>,
     status_code: AtomicI32,
+    from_cache: AtomicBool,  // 响应是否来自 HTTP 缓存
     completed: Arc<AtomicBool>,  // 标记请求是否完成
     active_requests: Option<Arc<AtomicUsize>>,  // Session 的活跃请求计数器
     allow_redirects: bool,  // 是否允许重定向（只读，不需要锁）
-    redirect_response: Mutex<Option<RequestResult>>,  // 存储重定向响应（当 allow_redirects=false 时）
+    max_redirects: Option<u32>,
+    caller_manages_cookies: bool,
+    redirects: Mutex<Vec<RedirectHop>>,  // 已自动跟随的重定向
+    response_url: Mutex<String>,  // 最终响应的 URL
+    redirect_response: Mutex<Option<RequestResult>>,  // 存储交回调用方的重定向响应
     context_taken: AtomicBool,  // 防止双重释放：标记 context 是否已被取走
+    stream_tx: Option<mpsc::UnboundedSender<BodyChunk>>,  // 流式模式：响应头通过 tx 发送，body 块通过这里发送
+    progress: Arc<RequestProgress>,
+    timings: Arc<Mutex<Option<RequestTimings>>>,
+    recorder: Option<RequestRecorder>,  // 会话与进程级统计，请求结束时记录一次
+    queue_ms: Option<i64>,  // 在会话并发队列中等待的时间
+    _admission: Option<Admission>,  // 并发许可，context 释放时归还
 }
 
 // Executor 专用 context - 独立于 RequestContext，避免 use-after-free
 struct ExecutorContext {
     in_flight_executors: Option<Arc<AtomicUsize>>,
+    // 线程池模式：回调投递到固定的 worker，同一请求的回调保持顺序
+    pool: Option<(Arc<CallbackPool>, usize)>,
+    // 已投递但尚未执行完的回调，请求销毁前需等待它们返回
+    pending: PendingCallbacks,
+}
+
+impl ExecutorContext {
+    fn new(in_flight_executors: Option<Arc<AtomicUsize>>, pool: Option<Arc<CallbackPool>>) -> Self {
+        ExecutorContext {
+            in_flight_executors,
+            pool: pool.map(|pool| {
+                let worker = pool.next_worker();
+                (pool, worker)
+            }),
+            pending: PendingCallbacks::default(),
+        }
+    }
+}
+
+struct RunnablePtr(Cronet_RunnablePtr);
+
+unsafe impl Send for RunnablePtr {}
+
+// -----------------------------------------------------------------------------
+// Response Body Buffers
+// -----------------------------------------------------------------------------
+
+// 每次 Read 至少提供的空间
+const READ_CHUNK_SIZE: usize = 32 * 1024;
+
+// 根据 Content-Length 预分配的上限，防止异常的 Content-Length 一次性分配过多内存
+const MAX_BODY_PREALLOCATE: usize = 64 * 1024 * 1024;
+
+// 获取锁，mutex poisoned 时恢复继续使用
+fn lock_or_recover<'a, T>(mutex: &'a Mutex<T>, context: &str) -> MutexGuard<'a, T> {
+    match mutex.lock() {
+        Ok(guard) => guard,
+        Err(poisoned) => {
+            eprintln!("[WARN] {}: Mutex poisoned, recovering", context);
+            poisoned.into_inner()
+        }
+    }
+}
+
+struct BufferCallbackPtr(Cronet_BufferCallbackPtr);
+
+unsafe impl Send for BufferCallbackPtr {}
+unsafe impl Sync for BufferCallbackPtr {}
+
+unsafe extern "C" fn buffer_on_destroy(_self: Cronet_BufferCallbackPtr, _buffer: Cronet_BufferPtr) {
+    // 内存归 RequestContext 的 Vec 所有，这里无需释放
+}
+
+// 进程级共享的 BufferCallback（Buffer 可能在请求销毁时才被释放，所以 callback 不能随请求销毁）
+fn borrowed_buffer_callback() -> Cronet_BufferCallbackPtr {
+    static CALLBACK: OnceLock<BufferCallbackPtr> = OnceLock::new();
+    CALLBACK
+        .get_or_init(|| unsafe {
+            BufferCallbackPtr(Cronet_BufferCallback_CreateWith(Some(buffer_on_destroy)))
+        })
+        .0
+}
+
+// 让 Cronet 直接写入 response_buffer 的剩余容量，避免 Cronet buffer → Vec 的复制
+// 同一时刻只有一个 Read 在进行，数据写入期间 Vec 不会被重新分配
+unsafe fn read_into_response_buffer(request: Cronet_UrlRequestPtr, context: &RequestContext) {
+    let mut response_buffer = lock_or_recover(&context.response_buffer, "read_into_response_buffer");
+    response_buffer.reserve(READ_CHUNK_SIZE);
+    let len = response_buffer.len();
+    let spare = response_buffer.capacity() - len;
+    let data_ptr = response_buffer.as_mut_ptr().add(len);
+    drop(response_buffer);
+
+    let buffer_ptr = Cronet_Buffer_Create();
+    Cronet_Buffer_InitWithDataAndCallback(
+        buffer_ptr,
+        data_ptr as *mut c_void,
+        spare as u64,
+        borrowed_buffer_callback(),
+    );
+    Cronet_UrlRequest_Read(request, buffer_ptr);
+}
+
+// 从响应头中取 Content-Length 作为 body 大小提示（取最后一个，跳过重定向响应的头）
+fn content_length_hint(headers: &[(String, String)]) -> Option<usize> {
+    headers
+        .iter()
+        .rev()
+        .find(|(name, _)| name.eq_ignore_ascii_case("content-length"))
+        .and_then(|(_, value)| value.trim().parse::<usize>().ok())
+        .map(|len| len.min(MAX_BODY_PREALLOCATE))
 }
 
 // -----------------------------------------------------------------------------
 // C Callbacks (Extern "C")
 // -----------------------------------------------------------------------------
 
-unsafe extern "C" fn executor_execute(_self: Cronet_ExecutorPtr, command: Cronet_RunnablePtr) {
-    // 同步执行，避免线程调度导致的竞态条件
-    // 这会牺牲一些性能，但能保证线程安全
-    Cronet_Runnable_Run(command);
-    Cronet_Runnable_Destroy(command);
+unsafe extern "C" fn executor_execute(self_: Cronet_ExecutorPtr, command: Cronet_RunnablePtr) {
+    let context_ptr = Cronet_Executor_GetClientContext(self_) as *const ExecutorContext;
+    let pool = if context_ptr.is_null() { None } else { (*context_ptr).pool.as_ref() };
+
+    let (pool, worker) = match pool {
+        Some(pool) => pool,
+        None => {
+            // 默认：同步执行，避免线程调度导致的竞态条件
+            // 这会牺牲一些性能，但能保证线程安全
+            Cronet_Runnable_Run(command);
+            Cronet_Runnable_Destroy(command);
+            return;
+        }
+    };
+
+    // 线程池模式：job 只持有计数器的 Arc，不访问 ExecutorContext（请求销毁时它会被释放）
+    let context = &*context_ptr;
+    let pending = context.pending.clone();
+    let in_flight = context.in_flight_executors.clone();
+    pending.enter();
+    if let Some(ref in_flight) = in_flight {
+        in_flight.fetch_add(1, Ordering::AcqRel);
+    }
+
+    let runnable = RunnablePtr(command);
+    pool.submit(*worker, Box::new(move || {
+        let runnable = runnable;
+        Cronet_Runnable_Run(runnable.0);
+        Cronet_Runnable_Destroy(runnable.0);
+        if let Some(ref in_flight) = in_flight {
+            in_flight.fetch_sub(1, Ordering::AcqRel);
+        }
+        pending.exit();
+    }));
 }
 
 // UrlRequest Callbacks
@@ -478,11 +841,12 @@ unsafe extern "C" fn on_redirect_received(
     self_: Cronet_UrlRequestCallbackPtr,
     request: Cronet_UrlRequestPtr,
     info: Cronet_UrlResponseInfoPtr,
-    _new_location_url: Cronet_String,
+    new_location_url: Cronet_String,
 ) {
     // 获取 RequestContext 检查是否允许重定向
     let context_ptr = Cronet_UrlRequestCallback_GetClientContext(self_) as *mut RequestContext;
     let context = &*context_ptr;
+    context.progress.mark_connected();
 
     // 获取响应头（无论是否允许重定向，都需要提取 Set-Cookie）
     let mut headers = Vec::new();
@@ -501,48 +865,79 @@ unsafe extern "C" fn on_redirect_received(
         }
     }
 
-    if context.allow_redirects {
-        // 允许重定向：将重定向响应头追加到 response_headers（用于提取 Set-Cookie）
-        match context.response_headers.lock() {
-            Ok(mut response_headers) => {
-                response_headers.extend(headers);
-            }
-            Err(poisoned) => {
-                eprintln!("[WARN] on_redirect_received: response_headers mutex poisoned, recovering");
-                let mut response_headers = poisoned.into_inner();
-                response_headers.extend(headers);
-            }
-        }
+    let hop = RedirectHop {
+        status_code: Cronet_UrlResponseInfo_http_status_code_get(info),
+        url: cronet_string(Cronet_UrlResponseInfo_url_get(info)),
+        headers,
+    };
+    let new_location = cronet_string(new_location_url);
+
+    let mut redirects = lock_or_recover(&context.redirects, "on_redirect_received");
+    if context.allow_redirects && should_follow_redirect(context, redirects.len(), &hop, &new_location) {
+        verbose_log!("[DEBUG] on_redirect_received: following {} -> {}", hop.url, new_location);
+        redirects.push(hop);
+        drop(redirects);
         Cronet_UrlRequest_FollowRedirect(request);
     } else {
-        // 不允许重定向，保存重定向响应信息然后取消请求
-        let status_code = Cronet_UrlResponseInfo_http_status_code_get(info);
-
-        // 保存重定向响应（使用锁保护，处理 poisoned）
-        match context.redirect_response.lock() {
-            Ok(mut redirect_response) => {
-                *redirect_response = Some(RequestResult {
-                    status_code,
-                    headers,
-                    body: Vec::new(), // 重定向响应通常没有 body
-                });
-            }
-            Err(poisoned) => {
-                eprintln!("[WARN] on_redirect_received: Mutex poisoned, recovering");
-                let mut redirect_response = poisoned.into_inner();
-                *redirect_response = Some(RequestResult {
-                    status_code,
-                    headers,
-                    body: Vec::new(),
-                });
-            }
-        }
+        // 不跟随：保存重定向响应（连同已跟随的各跳）然后取消请求
+        let history = std::mem::take(&mut *redirects);
+        drop(redirects);
+        *lock_or_recover(&context.redirect_response, "on_redirect_received") = Some(RequestResult {
+            status_code: hop.status_code,
+            headers: hop.headers,
+            body: Vec::new(), // 重定向响应通常没有 body
+            url: hop.url,
+            history,
+            timings: None,
+            from_cache: Cronet_UrlResponseInfo_was_cached_get(info),
+        });
 
         // 取消请求，on_canceled 会检查 redirect_response 并发送它
         Cronet_UrlRequest_Cancel(request);
     }
 }
 
+/// 判断是否在 Cronet 内部直接跟随这一跳重定向
+fn should_follow_redirect(context: &RequestContext, followed: usize, hop: &RedirectHop, new_location: &str) -> bool {
+    if let Some(max_redirects) = context.max_redirects {
+        if followed >= max_redirects as usize {
+            return false;
+        }
+    }
+    if context.caller_manages_cookies {
+        // Cookie 请求头由调用方按主机生成：换主机或服务端改写 Cookie 时交回调用方
+        let sets_cookie = hop.headers.iter().any(|(name, _)| name.eq_ignore_ascii_case("set-cookie"));
+        if sets_cookie || !same_authority(&hop.url, new_location) {
+            return false;
+        }
+    }
+    true
+}
+
+/// URL 的主机部分（含端口，去掉 userinfo）
+pub(crate) fn url_authority(url: &str) -> Option<&str> {
+    let rest = &url[url.find("://")? + 3..];
+    let end = rest.find(|c| matches!(c, '/' | '?' | '#')).unwrap_or(rest.len());
+    let authority = &rest[..end];
+    Some(authority.rsplit('@').next().unwrap_or(authority))
+}
+
+/// 比较两个 URL 的主机部分（含端口，忽略大小写）
+fn same_authority(a: &str, b: &str) -> bool {
+    match (url_authority(a), url_authority(b)) {
+        (Some(a), Some(b)) => a.eq_ignore_ascii_case(b),
+        _ => false,
+    }
+}
+
+unsafe fn cronet_string(value: Cronet_String) -> String {
+    if value.is_null() {
+        String::new()
+    } else {
+        CStr::from_ptr(value).to_string_lossy().into_owned()
+    }
+}
+
 unsafe extern "C" fn on_response_started(
     self_: Cronet_UrlRequestCallbackPtr,
     request: Cronet_UrlRequestPtr,
@@ -551,9 +946,13 @@ unsafe extern "C" fn on_response_started(
     verbose_log!("[DEBUG] on_response_started");
     let context_ptr = Cronet_UrlRequestCallback_GetClientContext(self_) as *mut RequestContext;
     let context = &*context_ptr;
+    context.progress.mark_connected();
 
     let status_code = Cronet_UrlResponseInfo_http_status_code_get(info);
     context.status_code.store(status_code, Ordering::Release);
+    context.from_cache.store(Cronet_UrlResponseInfo_was_cached_get(info), Ordering::Release);
+    *lock_or_recover(&context.response_url, "on_response_started") =
+        cronet_string(Cronet_UrlResponseInfo_url_get(info));
 
     // 提取响应 headers（使用锁保护，处理 poisoned）
     match context.response_headers.lock() {
@@ -591,10 +990,33 @@ unsafe extern "C" fn on_response_started(
         }
     }
 
-    let buffer_ptr = Cronet_Buffer_Create();
-    Cronet_Buffer_InitWithAlloc(buffer_ptr, 32 * 1024);
+    // 流式模式：先把响应头交给调用方，body 由调用方按需读取
+    if context.stream_tx.is_some() {
+        let tx = lock_or_recover(&context.tx, "on_response_started").take();
+        if let Some(tx) = tx {
+            let headers = std::mem::take(
+                &mut *lock_or_recover(&context.response_headers, "on_response_started"),
+            );
+            let _ = tx.send(Ok(RequestResult {
+                status_code,
+                headers,
+                body: Vec::new(),
+                url: lock_or_recover(&context.response_url, "on_response_started").clone(),
+                history: std::mem::take(&mut *lock_or_recover(&context.redirects, "on_response_started")),
+                timings: None,
+                from_cache: context.from_cache.load(Ordering::Acquire),
+            }));
+        }
+        return;
+    }
 
-    Cronet_UrlRequest_Read(request, buffer_ptr);
+    // 按 Content-Length 预分配，避免读取过程中反复扩容
+    let size_hint = content_length_hint(&lock_or_recover(&context.response_headers, "on_response_started"));
+    if let Some(size_hint) = size_hint {
+        lock_or_recover(&context.response_buffer, "on_response_started").reserve(size_hint);
+    }
+
+    read_into_response_buffer(request, context);
 }
 
 unsafe extern "C" fn on_read_completed(
@@ -607,28 +1029,28 @@ unsafe extern "C" fn on_read_completed(
     verbose_log!("[DEBUG] on_read_completed: {} bytes", bytes_read);
     let context_ptr = Cronet_UrlRequestCallback_GetClientContext(self_) as *mut RequestContext;
     let context = &*context_ptr;
+    context.progress.touch();
+
+    // 流式模式：把这一块交给消费者，等消费者再次调用 read_next 才继续读取
+    if let Some(ref stream_tx) = context.stream_tx {
+        let data_ptr = Cronet_Buffer_GetData(buffer);
+        let chunk = std::slice::from_raw_parts(data_ptr as *const u8, bytes_read as usize).to_vec();
+        Cronet_Buffer_Destroy(buffer);
+        let _ = stream_tx.send(Ok(Some(chunk)));
+        return;
+    }
 
-    let data_ptr = Cronet_Buffer_GetData(buffer);
-    let slice = std::slice::from_raw_parts(data_ptr as *const u8, bytes_read as usize);
-
-    // 使用锁保护 response_buffer，处理 poisoned
-    match context.response_buffer.lock() {
-        Ok(mut response_buffer) => {
-            response_buffer.extend_from_slice(slice);
-        }
-        Err(poisoned) => {
-            eprintln!("[WARN] on_read_completed: Mutex poisoned, recovering");
-            let mut response_buffer = poisoned.into_inner();
-            response_buffer.extend_from_slice(slice);
-        }
+    // 数据已由 Cronet 直接写入 response_buffer 的剩余容量，这里只需更新长度
+    {
+        let mut response_buffer = lock_or_recover(&context.response_buffer, "on_read_completed");
+        let new_len = response_buffer.len() + bytes_read as usize;
+        debug_assert!(new_len <= response_buffer.capacity());
+        response_buffer.set_len(new_len);
     }
 
     Cronet_Buffer_Destroy(buffer);
 
-    let new_buffer = Cronet_Buffer_Create();
-    Cronet_Buffer_InitWithAlloc(new_buffer, 32 * 1024);
-
-    Cronet_UrlRequest_Read(request, new_buffer);
+    read_into_response_buffer(request, context);
 }
 
 unsafe extern "C" fn on_succeeded(
@@ -663,13 +1085,13 @@ unsafe extern "C" fn on_canceled(
     let context_ptr = Cronet_UrlRequestCallback_GetClientContext(self_) as *mut RequestContext;
 
     // 检查 context 是否已被取走，防止双重释放
-    let context_ref = &*context_ptr;
-    if context_ref.context_taken.swap(true, Ordering::AcqRel) {
-        verbose_log!("[WARN] on_canceled: Context already taken, skipping");
-        return;
-    }
-
-    let context = Box::from_raw(context_ptr);
+    let mut context = match take_context(context_ptr) {
+        Some(context) => context,
+        None => {
+            verbose_log!("[WARN] on_canceled: Context already taken, skipping");
+            return;
+        }
+    };
 
     // 标记请求已完成
     context.completed.store(true, Ordering::Release);
@@ -688,7 +1110,16 @@ unsafe extern "C" fn on_canceled(
         }
     };
 
-    if let Some(redirect_response) = redirect_response {
+    if let Some(recorder) = context.recorder.take() {
+        recorder.finish(match redirect_response {
+            Some(ref redirect) => response_outcome(&context, redirect.status_code, redirect.body.len()),
+            None if context.progress.is_timed_out() => RequestOutcome::TimedOut,
+            None => RequestOutcome::Cancelled,
+        });
+    }
+
+    if let Some(mut redirect_response) = redirect_response {
+        redirect_response.timings = load_timings(&context.timings, context.queue_ms);
         verbose_log!("[DEBUG] on_canceled: Sending redirect response (status {})", redirect_response.status_code);
         let tx = match context.tx.lock() {
             Ok(mut guard) => guard.take(),
@@ -711,23 +1142,44 @@ unsafe extern "C" fn on_canceled(
         };
         if let Some(tx) = tx {
             let _ = tx.send(Err("Canceled".to_string()));
+        } else if let Some(ref stream_tx) = context.stream_tx {
+            // 流式模式下响应头已发出，通过 body 流通知取消
+            let _ = stream_tx.send(Err("Canceled".to_string()));
         }
     }
 }
 
+/// 收到响应时的统计结果：优先使用 Cronet 上报的收发字节数（流式模式下 body 不经过缓冲区）
+fn response_outcome(context: &RequestContext, status_code: i32, body_len: usize) -> RequestOutcome {
+    let timings = lock_or_recover(&context.timings, "response_outcome");
+    let (sent_bytes, received_bytes) = match timings.as_ref() {
+        Some(timings) => (timings.sent_bytes.max(0) as u64, timings.received_bytes.max(0) as u64),
+        None => (0, body_len as u64),
+    };
+    RequestOutcome::Response { status_code, sent_bytes, received_bytes }
+}
+
+// 取回 RequestContext 的所有权，只有第一个调用者能取到（完成与取消回调可能在不同线程竞争）
+unsafe fn take_context(context_ptr: *mut RequestContext) -> Option<Box<RequestContext>> {
+    if (*context_ptr).context_taken.swap(true, Ordering::AcqRel) {
+        return None;
+    }
+    Some(Box::from_raw(context_ptr))
+}
+
 unsafe fn complete_request(callback_ptr: Cronet_UrlRequestCallbackPtr, result: Result<(), String>) {
     let context_ptr =
         Cronet_UrlRequestCallback_GetClientContext(callback_ptr) as *mut RequestContext;
 
     // 检查 context 是否已被取走，防止双重释放
-    let context_ref = &*context_ptr;
-    if context_ref.context_taken.swap(true, Ordering::AcqRel) {
-        verbose_log!("[WARN] complete_request: Context already taken, skipping");
-        return;
-    }
-
     // Take ownership back to drop it.
-    let context = Box::from_raw(context_ptr);
+    let mut context = match take_context(context_ptr) {
+        Some(context) => context,
+        None => {
+            verbose_log!("[WARN] complete_request: Context already taken, skipping");
+            return;
+        }
+    };
 
     // 标记请求已完成
     context.completed.store(true, Ordering::Release);
@@ -739,6 +1191,16 @@ unsafe fn complete_request(callback_ptr: Cronet_UrlRequestCallbackPtr, result: R
 
     verbose_log!("[DEBUG] complete_request: {:?}", result);
 
+    if let Some(recorder) = context.recorder.take() {
+        recorder.finish(match result {
+            Ok(_) => {
+                let body_len = lock_or_recover(&context.response_buffer, "complete_request").len();
+                response_outcome(&context, context.status_code.load(Ordering::Acquire), body_len)
+            }
+            Err(_) => RequestOutcome::Failed,
+        });
+    }
+
     let tx = match context.tx.lock() {
         Ok(mut guard) => guard.take(),
         Err(poisoned) => {
@@ -752,26 +1214,22 @@ unsafe fn complete_request(callback_ptr: Cronet_UrlRequestCallbackPtr, result: R
             Ok(_) => {
                 let status_code = context.status_code.load(Ordering::Acquire);
 
-                let headers = match context.response_headers.lock() {
-                    Ok(guard) => guard.clone(),
-                    Err(poisoned) => {
-                        eprintln!("[WARN] complete_request: response_headers mutex poisoned, recovering");
-                        poisoned.into_inner().clone()
-                    }
-                };
-
-                let body = match context.response_buffer.lock() {
-                    Ok(guard) => guard.clone(),
-                    Err(poisoned) => {
-                        eprintln!("[WARN] complete_request: response_buffer mutex poisoned, recovering");
-                        poisoned.into_inner().clone()
-                    }
-                };
+                // context 即将释放，直接移出 headers 和 body，避免整体复制
+                let headers = std::mem::take(
+                    &mut *lock_or_recover(&context.response_headers, "complete_request"),
+                );
+                let body = std::mem::take(
+                    &mut *lock_or_recover(&context.response_buffer, "complete_request"),
+                );
 
                 let res = RequestResult {
                     status_code,
                     headers,
                     body,
+                    url: std::mem::take(&mut *lock_or_recover(&context.response_url, "complete_request")),
+                    history: std::mem::take(&mut *lock_or_recover(&context.redirects, "complete_request")),
+                    timings: load_timings(&context.timings, context.queue_ms),
+                    from_cache: context.from_cache.load(Ordering::Acquire),
                 };
                 let _ = tx.send(Ok(res));
             }
@@ -779,6 +1237,9 @@ unsafe fn complete_request(callback_ptr: Cronet_UrlRequestCallbackPtr, result: R
                 let _ = tx.send(Err(e));
             }
         }
+    } else if let Some(ref stream_tx) = context.stream_tx {
+        // 流式模式：响应头已发出，这里只通知 body 结束或失败
+        let _ = stream_tx.send(result.map(|_| None));
     }
 }
 
@@ -786,87 +1247,761 @@ unsafe fn complete_request(callback_ptr: Cronet_UrlRequestCallbackPtr, result: R
 // Upload Data Provider Callbacks
 // -----------------------------------------------------------------------------
 
-struct UploadContext {
-    data: Vec<u8>,
-    position: u64,
+/// 一块流式上传数据：Ok(None) 表示结束
+pub type ChunkResult = Result<Option<Vec<u8>>, String>;
+
+/// 流式分段取到数据后的回调，可以在任意线程上调用，且只调用一次
+pub type ChunkCallback = Box<dyn FnOnce(ChunkResult) + Send>;
+
+/// 按需产生上传数据的分段（例如 Python 迭代器）
+///
+/// request_chunk 在 Cronet 的读取回调中调用，未设置 callback_threads 时就是网络线程，
+/// 实现必须立即返回，不能在其中等待数据（包括等待其他线程或 GIL），否则会卡住该
+/// Engine 上的所有请求；数据就绪后再调用 done，由 done 完成这次读取
+pub trait UploadStream: Send {
+    /// 异步获取下一块数据，同一时间最多只有一个未完成的请求
+    fn request_chunk(&mut self, done: ChunkCallback);
 }
 
-unsafe extern "C" fn upload_get_length(self_: Cronet_UploadDataProviderPtr) -> i64 {
-    let context_ptr = Cronet_UploadDataProvider_GetClientContext(self_) as *mut UploadContext;
-    let context = &*context_ptr;
-    context.data.len() as i64
+/// 请求体的一个分段
+pub enum UploadSegment {
+    /// 内存中的数据
+    Bytes(Vec<u8>),
+    /// 调用方持有的不可变数据（例如 Python bytes），上传时直接读取，不复制
+    Shared(Box<dyn AsRef<[u8]> + Send>),
+    /// 文件的一段，上传时按需打开并读取
+    File { path: PathBuf, offset: u64, length: u64 },
+    /// 长度未知的数据流，使用 chunked 上传，不支持 rewind
+    Stream(Box<dyn UploadStream>),
 }
 
-unsafe extern "C" fn upload_read(
-    self_: Cronet_UploadDataProviderPtr,
-    sink: Cronet_UploadDataSinkPtr,
-    buffer: Cronet_BufferPtr,
-) {
-    let context_ptr = Cronet_UploadDataProvider_GetClientContext(self_) as *mut UploadContext;
-    let context = &mut *context_ptr;
+impl UploadSegment {
+    fn len(&self) -> Option<u64> {
+        match self {
+            UploadSegment::Bytes(data) => Some(data.len() as u64),
+            UploadSegment::Shared(data) => Some((**data).as_ref().len() as u64),
+            UploadSegment::File { length, .. } => Some(*length),
+            UploadSegment::Stream(_) => None,
+        }
+    }
+}
 
-    let buffer_size = Cronet_Buffer_GetSize(buffer);
-    let buffer_data = Cronet_Buffer_GetData(buffer) as *mut u8;
+/// 由多个分段组成的请求体，上传时依次读取（multipart 可以直接由分段拼接）
+#[derive(Default)]
+pub struct UploadBody {
+    segments: Vec<UploadSegment>,
+}
 
-    let remaining = (context.data.len() as u64) - context.position;
-    let to_read = std::cmp::min(buffer_size, remaining);
+impl UploadBody {
+    pub fn new(segments: Vec<UploadSegment>) -> Self {
+        UploadBody { segments }
+    }
 
-    if to_read > 0 {
-        ptr::copy_nonoverlapping(
-            context.data.as_ptr().add(context.position as usize),
-            buffer_data,
-            to_read as usize,
-        );
-        context.position += to_read;
+    /// 总长度，包含流式分段时返回 None（chunked 上传）
+    pub fn len(&self) -> Option<u64> {
+        self.segments.iter().try_fold(0u64, |total, segment| Some(total + segment.len()?))
     }
 
-    Cronet_UploadDataSink_OnReadSucceeded(sink, to_read, false);
+    pub fn is_empty(&self) -> bool {
+        self.len() == Some(0)
+    }
 }
 
-unsafe extern "C" fn upload_rewind(
-    self_: Cronet_UploadDataProviderPtr,
-    sink: Cronet_UploadDataSinkPtr,
-) {
-    let context_ptr = Cronet_UploadDataProvider_GetClientContext(self_) as *mut UploadContext;
-    let context = &mut *context_ptr;
-    context.position = 0;
-    Cronet_UploadDataSink_OnRewindSucceeded(sink);
+impl From<Vec<u8>> for UploadBody {
+    fn from(data: Vec<u8>) -> Self {
+        UploadBody::new(vec![UploadSegment::Bytes(data)])
+    }
 }
 
-unsafe extern "C" fn upload_close(self_: Cronet_UploadDataProviderPtr) {
-    let context_ptr = Cronet_UploadDataProvider_GetClientContext(self_) as *mut UploadContext;
-    // Take ownership to drop
-    let _ = Box::from_raw(context_ptr);
-}
+/// 为请求参数挂载 UploadDataProvider，空 body 不挂载
+/// UploadContext 由 provider 持有，在 upload_close 回调中释放
+unsafe fn attach_upload_body(
+    params_ptr: Cronet_UrlRequestParamsPtr,
+    executor_ptr: Cronet_ExecutorPtr,
+    body: UploadBody,
+    progress: Arc<RequestProgress>,
+) -> Option<Cronet_UploadDataProviderPtr> {
+    if body.is_empty() {
+        return None;
+    }
 
-// -----------------------------------------------------------------------------
-// Session Management
-// -----------------------------------------------------------------------------
+    verbose_log!(
+        "[DEBUG] Creating Rust UploadDataProvider. Body len: {:?}, segments: {}",
+        body.len(),
+        body.segments.len()
+    );
+
+    let upload_context = Box::new(UploadContext {
+        progress,
+        length: body.len(),
+        body,
+        segment: 0,
+        position: 0,
+        file: None,
+        pending: Vec::new(),
+        pending_pos: 0,
+    });
+    let upload_context_ptr = Box::into_raw(upload_context);
+
+    let provider = Cronet_UploadDataProvider_CreateWith(
+        Some(upload_get_length),
+        Some(upload_read),
+        Some(upload_rewind),
+        Some(upload_close),
+    );
+    Cronet_UploadDataProvider_SetClientContext(
+        provider,
+        upload_context_ptr as *mut c_void,
+    );
+
+    Cronet_UrlRequestParams_upload_data_provider_set(params_ptr, provider);
+    Cronet_UrlRequestParams_upload_data_provider_executor_set(params_ptr, executor_ptr);
+
+    Some(provider)
+}
 
-use std::sync::RwLock;
-use std::time::Instant;
-use uuid::Uuid;
+/// fill 的结果
+enum Fill {
+    /// 写入的字节数，0 表示所有分段已读完
+    Written(usize),
+    /// 当前流式分段的数据已用完，需要先异步获取下一块
+    NeedChunk,
+}
 
-/// 会话配置
-#[derive(Clone, Debug)]
-pub struct SessionConfig {
-    pub proxy_rules: Option<String>,
-    pub skip_cert_verify: bool,
-    pub timeout_ms: u64,
-    pub cipher_suites: Option<Vec<String>>,
-    pub tls_curves: Option<Vec<String>>,
-    pub tls_extensions: Option<Vec<String>>,
-    pub allow_redirects: bool,
+struct UploadContext {
+    progress: Arc<RequestProgress>,
+    body: UploadBody,
+    length: Option<u64>,
+    segment: usize,                 // 当前分段下标
+    position: u64,                  // 当前分段内的读取位置
+    file: Option<std::fs::File>,    // 当前文件分段的句柄（按需打开）
+    pending: Vec<u8>,               // 流式分段中尚未写出的数据
+    pending_pos: usize,
 }
 
-/// 单个会话 - 持有独立的 Cronet Engine
-pub struct Session {
-    pub id: String,
-    engine_ptr: Cronet_EnginePtr,
+impl UploadContext {
+    /// 切换到下一个分段
+    fn next_segment(&mut self) {
+        self.segment += 1;
+        self.position = 0;
+        self.file = None;
+        self.pending = Vec::new();
+        self.pending_pos = 0;
+    }
+
+    /// 流式分段取到的数据：None 表示该分段结束
+    fn accept_chunk(&mut self, chunk: Option<Vec<u8>>) {
+        match chunk {
+            Some(chunk) => {
+                self.pending = chunk;
+                self.pending_pos = 0;
+            }
+            None => self.next_segment(),
+        }
+    }
+
+    /// 尽量填满 Cronet 提供的缓冲区；遇到没有缓存数据的流式分段时，
+    /// 已写入的数据先交给 Cronet，尚未写入任何数据时返回 NeedChunk
+    fn fill(&mut self, buf: &mut [u8]) -> Result<Fill, String> {
+        let mut written = 0;
+        while written < buf.len() && self.segment < self.body.segments.len() {
+            let out = &mut buf[written..];
+            let n = match &mut self.body.segments[self.segment] {
+                UploadSegment::Bytes(data) => copy_from(data, &mut self.position, out),
+                UploadSegment::Shared(data) => copy_from((**data).as_ref(), &mut self.position, out),
+                UploadSegment::File { path, offset, length } => {
+                    let remaining = *length - self.position;
+                    if remaining == 0 {
+                        0
+                    } else {
+                        if self.file.is_none() {
+                            let mut file = std::fs::File::open(&*path)
+                                .map_err(|e| format!("Failed to open {}: {}", path.display(), e))?;
+                            file.seek(SeekFrom::Start(*offset + self.position))
+                                .map_err(|e| format!("Failed to seek {}: {}", path.display(), e))?;
+                            self.file = Some(file);
+                        }
+                        let want = std::cmp::min(remaining, out.len() as u64) as usize;
+                        let read = self.file.as_mut().unwrap().read(&mut out[..want])
+                            .map_err(|e| format!("Failed to read {}: {}", path.display(), e))?;
+                        if read == 0 {
+                            return Err(format!("File {} is shorter than expected", path.display()));
+                        }
+                        self.position += read as u64;
+                        read
+                    }
+                }
+                UploadSegment::Stream(_) => {
+                    if self.pending_pos >= self.pending.len() {
+                        return Ok(if written > 0 { Fill::Written(written) } else { Fill::NeedChunk });
+                    } else {
+                        let n = std::cmp::min(self.pending.len() - self.pending_pos, out.len());
+                        out[..n].copy_from_slice(&self.pending[self.pending_pos..self.pending_pos + n]);
+                        self.pending_pos += n;
+                        n
+                    }
+                }
+            };
+            if n == 0 {
+                self.next_segment();
+            } else {
+                written += n;
+            }
+        }
+        Ok(Fill::Written(written))
+    }
+}
+
+/// 从内存分段复制数据到缓冲区
+fn copy_from(data: &[u8], position: &mut u64, out: &mut [u8]) -> usize {
+    let start = *position as usize;
+    let n = std::cmp::min(data.len() - start, out.len());
+    out[..n].copy_from_slice(&data[start..start + n]);
+    *position += n as u64;
+    n
+}
+
+unsafe extern "C" fn upload_get_length(self_: Cronet_UploadDataProviderPtr) -> i64 {
+    let context_ptr = Cronet_UploadDataProvider_GetClientContext(self_) as *mut UploadContext;
+    let context = &*context_ptr;
+    // -1 表示长度未知，Cronet 使用 chunked 上传
+    context.length.map(|len| len as i64).unwrap_or(-1)
+}
+
+unsafe extern "C" fn upload_read(
+    self_: Cronet_UploadDataProviderPtr,
+    sink: Cronet_UploadDataSinkPtr,
+    buffer: Cronet_BufferPtr,
+) {
+    let context_ptr = Cronet_UploadDataProvider_GetClientContext(self_) as *mut UploadContext;
+
+    // 开始上传说明连接已建立
+    (*context_ptr).progress.mark_connected();
+
+    PendingRead { context: context_ptr, sink, buffer }.complete();
+}
+
+/// 一次尚未完成的 upload_read
+///
+/// 在调用 OnReadSucceeded/OnReadError 之前，Cronet 保证 buffer 有效，且不会再调用
+/// read/rewind；close 也会推迟到这次读取完成之后，所以可以在其他线程上继续使用 context
+struct PendingRead {
+    context: *mut UploadContext,
+    sink: Cronet_UploadDataSinkPtr,
+    buffer: Cronet_BufferPtr,
+}
+
+unsafe impl Send for PendingRead {}
+
+impl PendingRead {
+    /// 填充缓冲区并完成读取；流式分段需要数据时交给分段异步获取，数据到达后在其线程上继续
+    unsafe fn complete(self) {
+        let context = &mut *self.context;
+        let buffer_size = Cronet_Buffer_GetSize(self.buffer) as usize;
+        let buffer_data = Cronet_Buffer_GetData(self.buffer) as *mut u8;
+        let out = std::slice::from_raw_parts_mut(buffer_data, buffer_size);
+
+        match context.fill(out) {
+            Ok(Fill::Written(written)) => {
+                // chunked 上传时，读完所有分段后标记最后一块
+                let final_chunk = context.length.is_none() && written == 0;
+                Cronet_UploadDataSink_OnReadSucceeded(self.sink, written as u64, final_chunk);
+            }
+            Ok(Fill::NeedChunk) => {
+                if let UploadSegment::Stream(stream) = &mut context.body.segments[context.segment] {
+                    stream.request_chunk(Box::new(move |chunk| self.resume(chunk)));
+                }
+            }
+            Err(e) => self.fail(e),
+        }
+    }
+
+    /// 流式分段的数据到达
+    fn resume(self, chunk: ChunkResult) {
+        unsafe {
+            match chunk {
+                Ok(chunk) => {
+                    (*self.context).accept_chunk(chunk);
+                    self.complete();
+                }
+                Err(e) => self.fail(e),
+            }
+        }
+    }
+
+    unsafe fn fail(self, e: String) {
+        eprintln!("[ERROR] upload_read: {}", e);
+        let message = CString::new(e.replace('\0', " ")).unwrap_or_default();
+        Cronet_UploadDataSink_OnReadError(self.sink, message.as_ptr());
+    }
+}
+
+unsafe extern "C" fn upload_rewind(
+    self_: Cronet_UploadDataProviderPtr,
+    sink: Cronet_UploadDataSinkPtr,
+) {
+    let context_ptr = Cronet_UploadDataProvider_GetClientContext(self_) as *mut UploadContext;
+    let context = &mut *context_ptr;
+
+    // 迭代器数据已被消费，无法重新读取（例如 307/308 重定向后重发 body）
+    if context.length.is_none() {
+        let message = CString::new("Upload stream cannot be rewound").unwrap();
+        Cronet_UploadDataSink_OnRewindError(sink, message.as_ptr());
+        return;
+    }
+
+    context.segment = 0;
+    context.position = 0;
+    context.file = None;
+    Cronet_UploadDataSink_OnRewindSucceeded(sink);
+}
+
+unsafe extern "C" fn upload_close(self_: Cronet_UploadDataProviderPtr) {
+    let context_ptr = Cronet_UploadDataProvider_GetClientContext(self_) as *mut UploadContext;
+    // Take ownership to drop
+    let _ = Box::from_raw(context_ptr);
+}
+
+// -----------------------------------------------------------------------------
+// Admission Control
+// -----------------------------------------------------------------------------
+
+/// 按主机的信号量表超过该大小时清理空闲主机
+const LIMITER_HOST_SWEEP: usize = 1024;
+
+/// 会话级准入控制：总并发上限与每主机并发上限（0 表示不限制）
+/// 等待者先按主机排队，再进入总队列；tokio 的 Semaphore 按 FIFO 顺序发放许可，
+/// 某个主机排满时不会阻塞其他主机的请求
+pub struct ConcurrencyLimiter {
+    total: Option<Arc<Semaphore>>,
+    max_per_host: usize,
+    hosts: Mutex<HashMap<String, Arc<Semaphore>>>,
+    waiting: AtomicUsize,  // 正在排队的请求数
+}
+
+/// 准入许可：随 RequestContext 一起释放，即请求的终止回调执行后归还
+pub struct Admission {
+    _host: Option<OwnedSemaphorePermit>,
+    _total: Option<OwnedSemaphorePermit>,
+    /// 在队列中等待的时间
+    pub queued: std::time::Duration,
+}
+
+/// 排队计数：取消排队（future 被丢弃）时也能正确递减
+struct WaitingGuard<'a>(&'a AtomicUsize);
+
+impl Drop for WaitingGuard<'_> {
+    fn drop(&mut self) {
+        self.0.fetch_sub(1, Ordering::Relaxed);
+    }
+}
+
+impl ConcurrencyLimiter {
+    pub fn new(max_concurrency: usize, max_per_host: usize) -> Self {
+        ConcurrencyLimiter {
+            total: (max_concurrency > 0).then(|| Arc::new(Semaphore::new(max_concurrency))),
+            max_per_host,
+            hosts: Mutex::new(HashMap::new()),
+            waiting: AtomicUsize::new(0),
+        }
+    }
+
+    /// 是否设置了任何上限
+    pub fn is_limited(&self) -> bool {
+        self.total.is_some() || self.max_per_host > 0
+    }
+
+    /// 正在排队的请求数
+    pub fn waiting(&self) -> usize {
+        self.waiting.load(Ordering::Relaxed)
+    }
+
+    fn host_semaphore(&self, url: &str) -> Option<Arc<Semaphore>> {
+        if self.max_per_host == 0 {
+            return None;
+        }
+        let host = url_authority(url).unwrap_or("").to_ascii_lowercase();
+        let mut hosts = lock_or_recover(&self.hosts, "ConcurrencyLimiter::host_semaphore");
+        if hosts.len() >= LIMITER_HOST_SWEEP && !hosts.contains_key(&host) {
+            // 只有表本身持有引用的信号量没有在途或排队的请求
+            hosts.retain(|_, semaphore| Arc::strong_count(semaphore) > 1);
+        }
+        let max_per_host = self.max_per_host;
+        Some(hosts.entry(host).or_insert_with(|| Arc::new(Semaphore::new(max_per_host))).clone())
+    }
+
+    /// 排队等待许可（先主机后总量，顺序固定，不会互相等待）
+    pub async fn acquire(&self, url: &str) -> Admission {
+        let started = Instant::now();
+        self.waiting.fetch_add(1, Ordering::Relaxed);
+        let _waiting = WaitingGuard(&self.waiting);
+
+        let host = match self.host_semaphore(url) {
+            Some(semaphore) => semaphore.acquire_owned().await.ok(),
+            None => None,
+        };
+        let total = match self.total {
+            Some(ref semaphore) => semaphore.clone().acquire_owned().await.ok(),
+            None => None,
+        };
+        Admission {
+            _host: host,
+            _total: total,
+            queued: started.elapsed(),
+        }
+    }
+}
+
+// -----------------------------------------------------------------------------
+// Session Management
+// -----------------------------------------------------------------------------
+
+use std::sync::RwLock;
+use std::time::Instant;
+use uuid::Uuid;
+
+/// 会话配置
+#[derive(Clone, Debug)]
+pub struct SessionConfig {
+    pub proxy_rules: Option<String>,
+    pub skip_cert_verify: bool,
+    pub timeout_ms: u64,
+    pub cipher_suites: Option<Vec<String>>,
+    pub tls_curves: Option<Vec<String>>,
+    pub tls_extensions: Option<Vec<String>>,
+    pub allow_redirects: bool,
+    /// 是否启用 Cronet 内置 Cookie Store（共享的默认会话关闭它，避免不同调用之间泄漏 Cookie）
+    pub cookie_store: bool,
+    /// 与网络配置相同的其他会话共享 Engine（连接池、DNS 缓存、TLS 会话缓存）
+    pub share_engine: bool,
+    /// 执行 Cronet 回调的线程数，0 表示在网络线程上同步执行（默认）
+    pub callback_threads: usize,
+    /// 会话的最大并发请求数，超出的请求按 FIFO 排队（0 表示不限制）
+    pub max_concurrency: usize,
+    /// 每个主机的最大并发请求数（0 表示不限制）
+    pub max_per_host: usize,
+    /// Cronet HTTP 缓存模式
+    pub cache_mode: CacheMode,
+    /// HTTP 缓存容量上限（字节，0 表示使用 Cronet 默认值）
+    pub cache_max_bytes: i64,
+    /// 磁盘缓存目录（CacheMode::Disk 必需），每种网络配置使用其中的一个子目录
+    pub cache_dir: Option<String>,
+    /// 网络状态持久化目录：HTTP server properties（Alt-Svc、QUIC 服务器配置、HTTP/2 支持）
+    /// 与 DNS 缓存在 Engine 关闭时写入，下次以相同配置启动时加载
+    pub storage_path: Option<String>,
+    /// 已知支持 QUIC 的主机 (host, port, alternate_port)，首个请求直接走 QUIC
+    pub quic_hints: Vec<(String, i32, i32)>,
+}
+
+impl SessionConfig {
+    /// 是否使用进程级共享 Engine
+    /// 持久化目录同一时间只能被一个 Engine 打开，因此使用目录的会话总是按配置共享 Engine
+    pub fn shares_engine(&self) -> bool {
+        self.share_engine || self.cache_dir.is_some() || self.storage_path.is_some()
+    }
+}
+
+/// Cronet HTTP 缓存模式
+#[derive(Hash, Eq, PartialEq, Clone, Copy, Debug, Default)]
+pub enum CacheMode {
+    #[default]
+    Disabled,
+    /// 内存缓存，Engine 关闭后丢失
+    Memory,
+    /// 磁盘缓存，进程重启后仍可命中
+    Disk,
+}
+
+impl CacheMode {
+    /// 解析 "disabled" / "memory" / "disk"（大小写不敏感）
+    pub fn parse(name: &str) -> Option<Self> {
+        match name.to_ascii_lowercase().as_str() {
+            "disabled" | "none" | "off" => Some(CacheMode::Disabled),
+            "memory" | "in-memory" | "in_memory" => Some(CacheMode::Memory),
+            "disk" => Some(CacheMode::Disk),
+            _ => None,
+        }
+    }
+
+    fn to_cronet(self) -> Cronet_EngineParams_HTTP_CACHE_MODE {
+        match self {
+            CacheMode::Disabled => Cronet_EngineParams_HTTP_CACHE_MODE_Cronet_EngineParams_HTTP_CACHE_MODE_DISABLED,
+            CacheMode::Memory => Cronet_EngineParams_HTTP_CACHE_MODE_Cronet_EngineParams_HTTP_CACHE_MODE_IN_MEMORY,
+            CacheMode::Disk => Cronet_EngineParams_HTTP_CACHE_MODE_Cronet_EngineParams_HTTP_CACHE_MODE_DISK,
+        }
+    }
+}
+
+/// Engine 指纹：只包含影响网络层的配置（不含超时、重定向等请求级选项）
+#[derive(Hash, Eq, PartialEq, Clone, Debug)]
+pub struct EngineKey {
+    proxy_rules: Option<String>,
+    skip_cert_verify: bool,
+    cipher_suites: Option<Vec<String>>,
+    tls_curves: Option<Vec<String>>,
+    tls_extensions: Option<Vec<String>>,
+    cookie_store: bool,
+    cache_mode: CacheMode,
+    cache_max_bytes: i64,
+    cache_dir: Option<String>,
+    storage_path: Option<String>,
+    quic_hints: Vec<(String, i32, i32)>,
+}
+
+impl EngineKey {
+    fn from_config(config: &SessionConfig) -> Self {
+        EngineKey {
+            proxy_rules: config.proxy_rules.clone(),
+            skip_cert_verify: config.skip_cert_verify,
+            cipher_suites: config.cipher_suites.clone(),
+            tls_curves: config.tls_curves.clone(),
+            tls_extensions: config.tls_extensions.clone(),
+            // 共享 Engine 的会话各自在 Python 层维护 Cookie，不能共用 Cronet Cookie Store
+            cookie_store: config.cookie_store && !config.shares_engine(),
+            cache_mode: config.cache_mode,
+            cache_max_bytes: config.cache_max_bytes,
+            cache_dir: config.cache_dir.clone(),
+            storage_path: config.storage_path.clone(),
+            quic_hints: config.quic_hints.clone(),
+        }
+    }
+
+    /// 持久化子目录名：由网络配置计算（FNV-1a），同一配置在进程重启后落到同一目录
+    ///
+    /// 必须包含 EngineKey 的全部字段：不同的 key 会启动各自的共享 Engine，
+    /// 而 Cronet 不允许两个 Engine 使用同一 storage_path
+    fn storage_name(&self) -> String {
+        let fingerprint = format!(
+            "{:?}|{}|{:?}|{:?}|{:?}|{}|{:?}|{}|{:?}|{:?}|{:?}",
+            self.proxy_rules,
+            self.skip_cert_verify,
+            self.cipher_suites,
+            self.tls_curves,
+            self.tls_extensions,
+            self.cookie_store,
+            self.cache_mode,
+            self.cache_max_bytes,
+            self.cache_dir,
+            self.storage_path,
+            self.quic_hints,
+        );
+        let mut hash: u64 = 0xcbf2_9ce4_8422_2325;
+        for byte in fingerprint.bytes() {
+            hash ^= byte as u64;
+            hash = hash.wrapping_mul(0x0000_0100_0000_01b3);
+        }
+        format!("engine-{:016x}", hash)
+    }
+
+    /// 该配置的 Cronet storage_path（storage_path 优先，其次 cache_dir；都未设置时为 None）
+    fn storage_dir(&self) -> Option<PathBuf> {
+        self.storage_path
+            .as_ref()
+            .or(self.cache_dir.as_ref())
+            .map(|dir| PathBuf::from(dir).join(self.storage_name()))
+    }
+}
+
+/// Cronet Engine 句柄，最后一个引用释放时关闭 Engine
+pub struct EngineHandle {
+    pub id: u64,
+    ptr: Cronet_EnginePtr,
+    shared: bool,
+    sessions: AtomicUsize,  // 使用该 Engine 的会话数量
+}
+
+unsafe impl Send for EngineHandle {}
+unsafe impl Sync for EngineHandle {}
+
+impl Drop for EngineHandle {
+    fn drop(&mut self) {
+        unsafe {
+            if !self.ptr.is_null() {
+                // 同步执行模式下不需要等待 executor 线程
+                verbose_log!("[DEBUG] EngineHandle::drop - Calling Cronet_Engine_Shutdown (engine {})", self.id);
+                Cronet_Engine_Shutdown(self.ptr);
+
+                verbose_log!("[DEBUG] EngineHandle::drop - Calling Cronet_Engine_Destroy");
+                Cronet_Engine_Destroy(self.ptr);
+                verbose_log!("[DEBUG] EngineHandle::drop - Engine destroyed");
+            }
+        }
+        ENGINE_COUNT.fetch_sub(1, Ordering::Relaxed);
+    }
+}
+
+static NEXT_ENGINE_ID: AtomicU64 = AtomicU64::new(1);
+static ENGINE_COUNT: AtomicUsize = AtomicUsize::new(0);
+
+/// 进程级共享 Engine 池（弱引用，所有会话关闭后 Engine 随之释放）
+/// 跨 SessionManager 共享，因为每个 Python 客户端都有自己的 SessionManager
+fn shared_engines() -> &'static Mutex<HashMap<EngineKey, std::sync::Weak<EngineHandle>>> {
+    static SHARED_ENGINES: OnceLock<Mutex<HashMap<EngineKey, std::sync::Weak<EngineHandle>>>> = OnceLock::new();
+    SHARED_ENGINES.get_or_init(|| Mutex::new(HashMap::new()))
+}
+
+/// 获取或创建指定指纹的共享 Engine
+fn acquire_shared_engine(key: EngineKey) -> Option<Arc<EngineHandle>> {
+    let mut engines = lock_or_recover(shared_engines(), "acquire_shared_engine");
+    if let Some(engine) = engines.get(&key).and_then(|weak| weak.upgrade()) {
+        verbose_log!("[DEBUG] Reusing shared engine {}", engine.id);
+        return Some(engine);
+    }
+
+    // 顺便清理已释放的条目
+    engines.retain(|_, weak| weak.strong_count() > 0);
+
+    let mut engine = start_engine(&key)?;
+    if let Some(handle) = Arc::get_mut(&mut engine) {
+        handle.shared = true;
+    }
+    engines.insert(key, Arc::downgrade(&engine));
+    Some(engine)
+}
+
+/// 按配置创建并启动一个新的 Cronet Engine
+fn start_engine(key: &EngineKey) -> Option<Arc<EngineHandle>> {
+    unsafe {
+        let engine = Cronet_Engine_Create();
+        let params = Cronet_EngineParams_Create();
+
+        if let Some(ref proxy_rules) = key.proxy_rules {
+            let c_rules = CString::new(proxy_rules.as_str()).expect("Invalid proxy string");
+            Cronet_EngineParams_proxy_rules_set(params, c_rules.as_ptr());
+        }
+
+        Cronet_EngineParams_enable_quic_set(params, true);
+        Cronet_EngineParams_enable_http2_set(params, true);
+        Cronet_EngineParams_enable_brotli_set(params, true);
+
+        // QUIC hints：跳过 TCP 首连与 Alt-Svc 发现（quic_hints_add 会复制 hint）
+        for (host, port, alternate_port) in &key.quic_hints {
+            let c_host = match CString::new(host.as_str()) {
+                Ok(c_host) => c_host,
+                Err(_) => continue,
+            };
+            let hint = Cronet_QuicHint_Create();
+            Cronet_QuicHint_host_set(hint, c_host.as_ptr());
+            Cronet_QuicHint_port_set(hint, *port);
+            Cronet_QuicHint_alternate_port_set(hint, *alternate_port);
+            Cronet_EngineParams_quic_hints_add(params, hint);
+            Cronet_QuicHint_Destroy(hint);
+        }
+
+        if key.skip_cert_verify {
+            Cronet_EngineParams_skip_cert_verify_set(params, true);
+        }
+
+        // 磁盘缓存与网络状态持久化都需要 storage_path，目录必须事先存在
+        if let Some(storage_path) = key.storage_dir() {
+            if let Err(e) = std::fs::create_dir_all(&storage_path) {
+                eprintln!("[ERROR] Failed to create storage directory {}: {}", storage_path.display(), e);
+                Cronet_EngineParams_Destroy(params);
+                Cronet_Engine_Destroy(engine);
+                return None;
+            }
+            let c_path = CString::new(storage_path.to_string_lossy().into_owned()).expect("Invalid storage path");
+            Cronet_EngineParams_storage_path_set(params, c_path.as_ptr());
+        }
+        if key.cache_mode != CacheMode::Disabled {
+            Cronet_EngineParams_http_cache_mode_set(params, key.cache_mode.to_cronet());
+            if key.cache_max_bytes > 0 {
+                Cronet_EngineParams_http_cache_max_size_set(params, key.cache_max_bytes);
+            }
+        }
+
+        // Set custom TLS configuration and enable cookie store
+        let mut options_parts = Vec::new();
+
+        // Enable Cookie Store to handle Set-Cookie in 302 redirects
+        if key.cookie_store {
+            options_parts.push("\"enable_cookie_store\":true".to_string());
+        }
+
+        if let Some(ref cipher_suites) = key.cipher_suites {
+            if !cipher_suites.is_empty() {
+                let cipher_suites_json: Vec<String> = cipher_suites
+                    .iter()
+                    .map(|s| format!("\"{}\"", s))
+                    .collect();
+                options_parts.push(format!(
+                    "\"tls_cipher_suites\":[{}]",
+                    cipher_suites_json.join(",")
+                ));
+            }
+        }
+
+        if let Some(ref tls_curves) = key.tls_curves {
+            if !tls_curves.is_empty() {
+                let tls_curves_json: Vec<String> = tls_curves
+                    .iter()
+                    .map(|s| format!("\"{}\"", s))
+                    .collect();
+                options_parts.push(format!(
+                    "\"tls_curves\":[{}]",
+                    tls_curves_json.join(",")
+                ));
+            }
+        }
+
+        // 持久化网络状态：QUIC 服务器配置写入 server properties，DNS 结果写入磁盘
+        // （StaleDNS 的 persist_to_disk；Cronet 版本不支持时忽略该选项）
+        if key.storage_path.is_some() {
+            options_parts.push("\"QUIC\":{\"max_server_configs_stored_in_properties\":32}".to_string());
+            options_parts.push("\"StaleDNS\":{\"enable\":true,\"persist_to_disk\":true}".to_string());
+        }
+
+        if let Some(ref tls_extensions) = key.tls_extensions {
+            if !tls_extensions.is_empty() {
+                let tls_extensions_json: Vec<String> = tls_extensions
+                    .iter()
+                    .map(|s| format!("\"{}\"", s))
+                    .collect();
+                options_parts.push(format!(
+                    "\"tls_extensions\":[{}]",
+                    tls_extensions_json.join(",")
+                ));
+            }
+        }
+
+        // Set experimental_options (enable_cookie_store and TLS options)
+        if !options_parts.is_empty() {
+            let experimental_options = format!("{{{}}}", options_parts.join(","));
+            verbose_log!("[DEBUG] Setting experimental options: {}", experimental_options);
+            let c_options = CString::new(experimental_options).expect("Invalid experimental options");
+            Cronet_EngineParams_experimental_options_set(params, c_options.as_ptr());
+        }
+
+        let res = Cronet_Engine_StartWithParams(engine, params);
+        Cronet_EngineParams_Destroy(params);
+
+        if res != Cronet_RESULT_Cronet_RESULT_SUCCESS {
+            eprintln!("[ERROR] Failed to create session engine: {:?}", res);
+            Cronet_Engine_Destroy(engine);
+            return None;
+        }
+
+        ENGINE_COUNT.fetch_add(1, Ordering::Relaxed);
+        Some(Arc::new(EngineHandle {
+            id: NEXT_ENGINE_ID.fetch_add(1, Ordering::Relaxed),
+            ptr: engine,
+            shared: false,
+            sessions: AtomicUsize::new(0),
+        }))
+    }
+}
+
+/// 单个会话 - 持有（可能与其他会话共享的）Cronet Engine
+pub struct Session {
+    pub id: String,
+    engine: Arc<EngineHandle>,
     pub config: SessionConfig,
     pub created_at: Instant,
     active_requests: Arc<AtomicUsize>,  // 追踪活跃请求数量（仅用于监控）
     in_flight_executors: Arc<AtomicUsize>,  // 追踪正在执行的 executor 回调数量
+    metrics: Arc<RequestMetrics>,  // 会话级请求统计
+    limiter: Arc<ConcurrencyLimiter>,  // 并发限制与排队
+    callback_pool: Option<Arc<CallbackPool>>,  // 线程池模式下执行回调的 worker（None 为同步执行）
     is_closed: Arc<AtomicBool>,  // 标记 session 是否已关闭
 }
 
@@ -880,38 +2015,50 @@ impl Drop for Session {
         // 标记 session 已关闭
         self.is_closed.store(true, Ordering::Release);
 
-        unsafe {
-            if !self.engine_ptr.is_null() {
-                // 等待所有活跃请求完成
-                let active = self.active_requests.load(Ordering::Acquire);
-                verbose_log!("[DEBUG] Session::drop - active_requests={}", active);
-
-                if active > 0 {
-                    verbose_log!("[DEBUG] Session::drop - Waiting for {} active requests to complete", active);
-                    let start = std::time::Instant::now();
-                    while self.active_requests.load(Ordering::Acquire) > 0 {
-                        if start.elapsed() > std::time::Duration::from_secs(30) {
-                            eprintln!("[WARN] Session::drop - Timeout waiting for {} active requests",
-                                self.active_requests.load(Ordering::Acquire));
-                            break;
-                        }
-                        std::thread::sleep(std::time::Duration::from_millis(50));
-                    }
+        // 等待所有活跃请求完成
+        let active = self.active_requests.load(Ordering::Acquire);
+        verbose_log!("[DEBUG] Session::drop - active_requests={}", active);
+
+        if active > 0 {
+            verbose_log!("[DEBUG] Session::drop - Waiting for {} active requests to complete", active);
+            let start = std::time::Instant::now();
+            while self.active_requests.load(Ordering::Acquire) > 0 {
+                if start.elapsed() > std::time::Duration::from_secs(30) {
+                    eprintln!("[WARN] Session::drop - Timeout waiting for {} active requests",
+                        self.active_requests.load(Ordering::Acquire));
+                    break;
                 }
-
-                // 同步执行模式下不需要等待 executor 线程
-                verbose_log!("[DEBUG] Session::drop - Calling Cronet_Engine_Shutdown");
-                Cronet_Engine_Shutdown(self.engine_ptr);
-
-                verbose_log!("[DEBUG] Session::drop - Calling Cronet_Engine_Destroy");
-                Cronet_Engine_Destroy(self.engine_ptr);
-                verbose_log!("[DEBUG] Session::drop - Engine destroyed");
+                std::thread::sleep(std::time::Duration::from_millis(50));
             }
         }
+
+        // 所有请求结束后释放 Engine 引用，Engine 由最后一个引用它的会话关闭
+        self.engine.sessions.fetch_sub(1, Ordering::AcqRel);
         verbose_log!("[DEBUG] Session::drop - Finished for session {}", self.id);
     }
 }
 
+/// 会话信息（用于 list_sessions）
+#[derive(Clone, Debug)]
+pub struct SessionInfo {
+    pub session_id: String,
+    pub engine_id: u64,
+    pub engine_shared: bool,
+    pub engine_sessions: usize,  // 使用同一 Engine 的会话数量（跨所有 SessionManager）
+    pub active_requests: usize,
+}
+
+/// 会话统计（用于 session_stats）
+#[derive(Clone, Debug)]
+pub struct SessionStats {
+    pub session_id: String,
+    pub active_requests: usize,
+    pub in_flight_executors: usize,
+    /// 在并发队列中等待的请求数
+    pub queued: usize,
+    pub metrics: MetricsSnapshot,
+}
+
 /// 会话管理器 - 管理多个会话，支持并发访问
 pub struct SessionManager {
     sessions: RwLock<HashMap<String, Session>>,
@@ -925,111 +2072,56 @@ impl SessionManager {
     }
 
     /// 创建新会话，返回会话ID
+    /// config.share_engine 为 true（或使用磁盘缓存）时，与相同网络配置的会话共享同一个 Engine
     pub fn create_session(&self, config: SessionConfig) -> String {
         let session_id = Uuid::new_v4().to_string();
 
-        unsafe {
-            let engine = Cronet_Engine_Create();
-            let params = Cronet_EngineParams_Create();
-
-            if let Some(ref proxy_rules) = config.proxy_rules {
-                let c_rules = CString::new(proxy_rules.as_str()).expect("Invalid proxy string");
-                Cronet_EngineParams_proxy_rules_set(params, c_rules.as_ptr());
-            }
-
-            Cronet_EngineParams_enable_quic_set(params, true);
-            Cronet_EngineParams_enable_http2_set(params, true);
-            Cronet_EngineParams_enable_brotli_set(params, true);
-
-            if config.skip_cert_verify {
-                Cronet_EngineParams_skip_cert_verify_set(params, true);
-            }
-
-            // Set custom TLS configuration and enable cookie store
-            let mut options_parts = Vec::new();
-
-            // Always enable Cookie Store to handle Set-Cookie in 302 redirects
-            options_parts.push("\"enable_cookie_store\":true".to_string());
-
-            if let Some(ref cipher_suites) = config.cipher_suites {
-                if !cipher_suites.is_empty() {
-                    let cipher_suites_json: Vec<String> = cipher_suites
-                        .iter()
-                        .map(|s| format!("\"{}\"", s))
-                        .collect();
-                    options_parts.push(format!(
-                        "\"tls_cipher_suites\":[{}]",
-                        cipher_suites_json.join(",")
-                    ));
-                }
-            }
-
-            if let Some(ref tls_curves) = config.tls_curves {
-                if !tls_curves.is_empty() {
-                    let tls_curves_json: Vec<String> = tls_curves
-                        .iter()
-                        .map(|s| format!("\"{}\"", s))
-                        .collect();
-                    options_parts.push(format!(
-                        "\"tls_curves\":[{}]",
-                        tls_curves_json.join(",")
-                    ));
-                }
-            }
+        let engine = if config.shares_engine() {
+            acquire_shared_engine(EngineKey::from_config(&config))
+        } else {
+            start_engine(&EngineKey::from_config(&config))
+        };
+        let engine = match engine {
+            Some(engine) => engine,
+            None => return String::new(),
+        };
+        engine.sessions.fetch_add(1, Ordering::AcqRel);
 
-            if let Some(ref tls_extensions) = config.tls_extensions {
-                if !tls_extensions.is_empty() {
-                    let tls_extensions_json: Vec<String> = tls_extensions
-                        .iter()
-                        .map(|s| format!("\"{}\"", s))
-                        .collect();
-                    options_parts.push(format!(
-                        "\"tls_extensions\":[{}]",
-                        tls_extensions_json.join(",")
-                    ));
-                }
-            }
+        // 创建 in-flight 计数器用于监控
+        let in_flight = Arc::new(AtomicUsize::new(0));
 
-            // Always set experimental_options (at least for enable_cookie_store)
-            if !options_parts.is_empty() {
-                let experimental_options = format!("{{{}}}", options_parts.join(","));
-                verbose_log!("[DEBUG] Setting experimental options: {}", experimental_options);
-                let c_options = CString::new(experimental_options).expect("Invalid experimental options");
-                Cronet_EngineParams_experimental_options_set(params, c_options.as_ptr());
-            }
+        // callback_threads > 0 时使用独立线程池执行回调，否则在网络线程上同步执行
+        let callback_pool = if config.callback_threads > 0 {
+            Some(Arc::new(CallbackPool::new(config.callback_threads)))
+        } else {
+            None
+        };
 
-            let res = Cronet_Engine_StartWithParams(engine, params);
-            Cronet_EngineParams_Destroy(params);
+        // 并发限制：超出上限的请求在会话内按 FIFO 排队
+        let limiter = Arc::new(ConcurrencyLimiter::new(config.max_concurrency, config.max_per_host));
+
+        let session = Session {
+            id: session_id.clone(),
+            engine,
+            config,
+            created_at: Instant::now(),
+            active_requests: Arc::new(AtomicUsize::new(0)),
+            in_flight_executors: in_flight,
+            metrics: Arc::new(RequestMetrics::new()),
+            limiter,
+            callback_pool,
+            is_closed: Arc::new(AtomicBool::new(false)),
+        };
 
-            if res != Cronet_RESULT_Cronet_RESULT_SUCCESS {
-                eprintln!("[ERROR] Failed to create session engine: {:?}", res);
-                Cronet_Engine_Destroy(engine);
-                return String::new();
+        verbose_log!("[DEBUG] Created session: {}", session_id);
+        match self.sessions.write() {
+            Ok(mut sessions) => {
+                sessions.insert(session_id.clone(), session);
             }
-
-            // 创建 in-flight 计数器用于监控
-            let in_flight = Arc::new(AtomicUsize::new(0));
-
-            let session = Session {
-                id: session_id.clone(),
-                engine_ptr: engine,
-                config,
-                created_at: Instant::now(),
-                active_requests: Arc::new(AtomicUsize::new(0)),
-                in_flight_executors: in_flight,
-                is_closed: Arc::new(AtomicBool::new(false)),
-            };
-
-            verbose_log!("[DEBUG] Created session: {}", session_id);
-            match self.sessions.write() {
-                Ok(mut sessions) => {
-                    sessions.insert(session_id.clone(), session);
-                }
-                Err(poisoned) => {
-                    eprintln!("[WARN] create_session: RwLock poisoned, recovering");
-                    let mut sessions = poisoned.into_inner();
-                    sessions.insert(session_id.clone(), session);
-                }
+            Err(poisoned) => {
+                eprintln!("[WARN] create_session: RwLock poisoned, recovering");
+                let mut sessions = poisoned.into_inner();
+                sessions.insert(session_id.clone(), session);
             }
         }
 
@@ -1039,11 +2131,44 @@ impl SessionManager {
     /// 使用会话发送请求
     /// 限制并发请求数量,避免资源泄漏
     /// 返回 (CronetRequest, Receiver, timeout_ms)
+    /// 流式模式下 Receiver 在收到响应头时完成，body 通过 CronetRequest::take_body_stream 读取
     pub fn send_request(
         &self,
         session_id: &str,
         target: &crate::cronet_pb::TargetRequest,
-        allow_redirects: bool,
+        options: &RequestOptions,
+    ) -> Option<(CronetRequest, oneshot::Receiver<Result<RequestResult, String>>, u64)> {
+        self.send_request_with_body(session_id, target, UploadBody::from(target.body.clone()), options)
+    }
+
+    /// 使用会话发送请求，请求体由调用方以 UploadBody 形式提供（忽略 target.body）
+    /// 文件与迭代器分段在上传时按需读取，不会整体载入内存
+    pub fn send_request_with_body(
+        &self,
+        session_id: &str,
+        target: &crate::cronet_pb::TargetRequest,
+        body: UploadBody,
+        options: &RequestOptions,
+    ) -> Option<(CronetRequest, oneshot::Receiver<Result<RequestResult, String>>, u64)> {
+        self.send_request_admitted(session_id, target, body, options, None)
+    }
+
+    /// 会话的并发限制器与默认超时（会话不存在时为 None）
+    /// 调用方先通过 ConcurrencyLimiter::acquire 排队，再用 send_request_admitted 发起请求
+    pub fn session_limiter(&self, session_id: &str) -> Option<(Arc<ConcurrencyLimiter>, u64)> {
+        let sessions = self.sessions.read().unwrap_or_else(|p| p.into_inner());
+        let session = sessions.get(session_id)?;
+        Some((session.limiter.clone(), session.config.timeout_ms))
+    }
+
+    /// 持准入许可发送请求，许可在请求结束（终止回调执行）后归还
+    pub fn send_request_admitted(
+        &self,
+        session_id: &str,
+        target: &crate::cronet_pb::TargetRequest,
+        body: UploadBody,
+        options: &RequestOptions,
+        admission: Option<Admission>,
     ) -> Option<(CronetRequest, oneshot::Receiver<Result<RequestResult, String>>, u64)> {
         let sessions = match self.sessions.read() {
             Ok(guard) => guard,
@@ -1068,11 +2193,15 @@ impl SessionManager {
             session_id, target.url, current_active);
 
         let (request, rx) = Self::start_request_with_engine(
-            session.engine_ptr,
+            session.engine.ptr,
             target,
             Some(session.active_requests.clone()),
             Some(session.in_flight_executors.clone()),
-            allow_redirects,
+            Some(session.metrics.clone()),
+            session.callback_pool.clone(),
+            body,
+            options,
+            admission,
         );
 
         Some((request, rx, session.config.timeout_ms))
@@ -1084,31 +2213,56 @@ impl SessionManager {
         target: &crate::cronet_pb::TargetRequest,
         active_requests: Option<Arc<AtomicUsize>>,
         in_flight_executors: Option<Arc<AtomicUsize>>,
-        allow_redirects: bool,
+        metrics: Option<Arc<RequestMetrics>>,
+        callback_pool: Option<Arc<CallbackPool>>,
+        body: UploadBody,
+        options: &RequestOptions,
+        admission: Option<Admission>,
     ) -> (CronetRequest, oneshot::Receiver<Result<RequestResult, String>>) {
         unsafe {
+            let queued = admission.as_ref().map(|admission| admission.queued);
+            let queue_ms = queued.map(|queued| queued.as_millis() as i64);
             let (tx, rx) = oneshot::channel();
 
+            // 流式模式的 body 通道（消费者每次只请求一块，通道中最多积压一块）
+            let (stream_tx, body_stream) = if options.stream {
+                let (stream_tx, body_stream) = mpsc::unbounded_channel();
+                (Some(stream_tx), Some(body_stream))
+            } else {
+                (None, None)
+            };
+
             // 创建完成标志
             let completed = Arc::new(AtomicBool::new(false));
+            let progress = Arc::new(RequestProgress::new());
+            let timings: Arc<Mutex<Option<RequestTimings>>> = Arc::new(Mutex::new(None));
 
             let context = Box::new(RequestContext {
                 tx: Mutex::new(Some(tx)),
                 response_buffer: Mutex::new(Vec::new()),
                 response_headers: Mutex::new(Vec::new()),
                 status_code: AtomicI32::new(0),
+                from_cache: AtomicBool::new(false),
                 completed: completed.clone(),
                 active_requests,
-                allow_redirects,
+                allow_redirects: options.allow_redirects,
+                max_redirects: options.max_redirects,
+                caller_manages_cookies: options.caller_manages_cookies,
+                redirects: Mutex::new(Vec::new()),
+                response_url: Mutex::new(String::new()),
                 redirect_response: Mutex::new(None),
                 context_taken: AtomicBool::new(false),
+                stream_tx,
+                progress: progress.clone(),
+                timings: timings.clone(),
+                recorder: Some(RequestRecorder::start(metrics, &target.url, queued)),
+                queue_ms,
+                _admission: admission,
             });
             let context_ptr = Box::into_raw(context);
 
             // 创建独立的 ExecutorContext
-            let executor_context = Box::new(ExecutorContext {
-                in_flight_executors,
-            });
+            let executor_context = Box::new(ExecutorContext::new(in_flight_executors, callback_pool));
             let executor_context_ptr = Box::into_raw(executor_context);
 
             // Executor - 使用独立的 ExecutorContext
@@ -1162,37 +2316,9 @@ impl SessionManager {
                 Cronet_HttpHeader_Destroy(header_ptr);
             }
 
-            // Upload Data Provider (Body)
-            let mut upload_data_provider_ptr: Option<Cronet_UploadDataProviderPtr> = None;
-            let upload_body_data = if !target.body.is_empty() {
-                Some(target.body.clone())
-            } else {
-                None
-            };
-
-            if let Some(body) = &upload_body_data {
-                let upload_context = Box::new(UploadContext {
-                    data: body.clone(),
-                    position: 0,
-                });
-                let upload_context_ptr = Box::into_raw(upload_context);
-
-                let provider = Cronet_UploadDataProvider_CreateWith(
-                    Some(upload_get_length),
-                    Some(upload_read),
-                    Some(upload_rewind),
-                    Some(upload_close),
-                );
-                Cronet_UploadDataProvider_SetClientContext(
-                    provider,
-                    upload_context_ptr as *mut c_void,
-                );
-
-                Cronet_UrlRequestParams_upload_data_provider_set(params_ptr, provider);
-                Cronet_UrlRequestParams_upload_data_provider_executor_set(params_ptr, executor_ptr);
-
-                upload_data_provider_ptr = Some(provider);
-            }
+            // Upload Data Provider (Body)，body 直接移交给 provider，不再复制
+            let upload_data_provider_ptr = attach_upload_body(params_ptr, executor_ptr, body, progress.clone());
+            let finished_listener_ptr = attach_finished_listener(params_ptr, executor_ptr, &timings);
 
             Cronet_UrlRequest_InitWithParams(
                 request_ptr,
@@ -1215,8 +2341,12 @@ impl SessionManager {
                 executor_context_ptr,
                 owned_engine_ptr: None, // Session owns the engine
                 upload_data_provider_ptr,
-                upload_body_data,
                 completed,
+                body_stream,
+                progress,
+                finished_listener_ptr,
+                timings,
+                queue_ms,
             };
 
             (request_handle, rx)
@@ -1240,6 +2370,40 @@ impl SessionManager {
         self.sessions.read().unwrap().keys().cloned().collect()
     }
 
+    /// 列出所有会话及其所用 Engine 的信息
+    pub fn session_infos(&self) -> Vec<SessionInfo> {
+        self.sessions
+            .read()
+            .unwrap()
+            .values()
+            .map(|session| SessionInfo {
+                session_id: session.id.clone(),
+                engine_id: session.engine.id,
+                engine_shared: session.engine.shared,
+                engine_sessions: session.engine.sessions.load(Ordering::Acquire),
+                active_requests: session.active_requests.load(Ordering::Acquire),
+            })
+            .collect()
+    }
+
+    /// 单个会话的请求统计
+    pub fn session_stats(&self, session_id: &str) -> Option<SessionStats> {
+        let sessions = self.sessions.read().unwrap_or_else(|p| p.into_inner());
+        let session = sessions.get(session_id)?;
+        Some(SessionStats {
+            session_id: session.id.clone(),
+            active_requests: session.active_requests.load(Ordering::Acquire),
+            in_flight_executors: session.in_flight_executors.load(Ordering::Acquire),
+            queued: session.limiter.waiting(),
+            metrics: session.metrics.snapshot(),
+        })
+    }
+
+    /// 当前进程中存活的 Engine 数量
+    pub fn engine_count() -> usize {
+        ENGINE_COUNT.load(Ordering::Relaxed)
+    }
+
     /// 获取会话数量
     pub fn session_count(&self) -> usize {
         self.sessions.read().unwrap().len()
@@ -1250,3 +2414,220 @@ impl SessionManager {
         self.sessions.read().unwrap().contains_key(session_id)
     }
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use std::sync::mpsc as std_mpsc;
+    use std::time::Duration;
+
+    fn test_context() -> (Box<RequestContext>, oneshot::Receiver<Result<RequestResult, String>>) {
+        let (tx, rx) = oneshot::channel();
+        let context = Box::new(RequestContext {
+            tx: Mutex::new(Some(tx)),
+            response_buffer: Mutex::new(Vec::new()),
+            response_headers: Mutex::new(Vec::new()),
+            status_code: AtomicI32::new(200),
+            from_cache: AtomicBool::new(false),
+            completed: Arc::new(AtomicBool::new(false)),
+            active_requests: None,
+            allow_redirects: true,
+            max_redirects: None,
+            caller_manages_cookies: false,
+            redirects: Mutex::new(Vec::new()),
+            response_url: Mutex::new(String::new()),
+            redirect_response: Mutex::new(None),
+            context_taken: AtomicBool::new(false),
+            stream_tx: None,
+            progress: Arc::new(RequestProgress::new()),
+            timings: Arc::new(Mutex::new(None)),
+            recorder: None,
+            queue_ms: None,
+            _admission: None,
+        });
+        (context, rx)
+    }
+
+    struct ContextPtr(*mut RequestContext);
+    unsafe impl Send for ContextPtr {}
+
+    /// 线程池模式下，终止回调在 worker 上执行的同时，调用方收到结果后会立即销毁请求：
+    /// 销毁方必须等回调完全返回（pending 归零）后才能释放回调仍在使用的对象
+    ///
+    /// 等待逻辑本身由 callback_pool 模块的测试覆盖（不需要 Cronet）；这里还经过
+    /// RequestContext 与 take_context，测试二进制需要链接 libcronet：
+    /// 在 cronet-bin 中有对应平台的库时运行 `cargo test -- --ignored`
+    #[test]
+    #[ignore = "links libcronet; run with `cargo test -- --ignored` where it is available"]
+    fn request_drop_waits_for_terminal_callback() {
+        const ROUNDS: usize = 2000;
+
+        let pool = Arc::new(CallbackPool::new(8));
+
+        for round in 0..ROUNDS {
+            let executor_context = ExecutorContext::new(None, Some(pool.clone()));
+            let (pool, worker) = executor_context.pool.clone().unwrap();
+
+            let (context, rx) = test_context();
+            let completed = context.completed.clone();
+            let context_ptr = ContextPtr(Box::into_raw(context));
+
+            // 回调返回后仍会访问的对象（相当于 Cronet 的 runnable / UrlRequest）
+            let in_use = Arc::new(AtomicBool::new(false));
+            let callback_in_use = in_use.clone();
+
+            // 模拟 executor_execute 投递 on_succeeded
+            let pending = executor_context.pending.clone();
+            pending.enter();
+            pool.submit(worker, Box::new(move || {
+                let context_ptr = context_ptr;
+                callback_in_use.store(true, Ordering::Release);
+                let context = unsafe { take_context(context_ptr.0) }.expect("context taken twice");
+                context.completed.store(true, Ordering::Release);
+                if let Some(tx) = lock_or_recover(&context.tx, "test").take() {
+                    let _ = tx.send(Ok(RequestResult {
+                        status_code: 200,
+                        headers: Vec::new(),
+                        body: vec![round as u8],
+                        url: String::new(),
+                        history: Vec::new(),
+                        timings: None,
+                        from_cache: false,
+                    }));
+                }
+                drop(context);
+                if round % 7 == 0 {
+                    std::thread::yield_now();
+                }
+                callback_in_use.store(false, Ordering::Release);
+                pending.exit();
+            }));
+
+            // 模拟调用方：收到结果后立即按 CronetRequest::drop 的方式等待并销毁
+            let result = rx.blocking_recv().expect("result not sent").expect("request failed");
+            assert_eq!(result.body, vec![round as u8]);
+            assert!(completed.load(Ordering::Acquire));
+
+            assert!(executor_context.pending.wait_idle(Duration::from_secs(30)), "callback did not finish");
+            assert!(!in_use.load(Ordering::Acquire), "request destroyed while callback running");
+        }
+    }
+
+    /// 只有主机（含端口）相同的重定向才会在 Cronet 内部直接跟随
+    #[test]
+    fn same_authority_compares_host_and_port() {
+        assert!(same_authority("https://Example.com/a?x=1", "https://example.com/b"));
+        assert!(same_authority("http://user@example.com/", "https://example.com#top"));
+        assert!(!same_authority("https://example.com/", "https://example.com:8443/"));
+        assert!(!same_authority("https://example.com/", "https://other.com/"));
+        assert!(!same_authority("https://example.com/", "/relative"));
+    }
+
+    #[test]
+    fn limiter_queues_per_host_without_blocking_other_hosts() {
+        let runtime = tokio::runtime::Builder::new_current_thread().enable_time().build().unwrap();
+        runtime.block_on(async {
+            let limiter = ConcurrencyLimiter::new(2, 1);
+            let first = limiter.acquire("https://a.example/1").await;
+
+            // 同一主机需要等待，其他主机不受影响
+            let blocked = tokio::time::timeout(Duration::from_millis(20), limiter.acquire("https://a.example/2")).await;
+            assert!(blocked.is_err());
+            assert_eq!(limiter.waiting(), 0);
+            let other = limiter.acquire("https://b.example/").await;
+
+            // 总并发已满：释放 a 的许可后，排队的请求才能继续
+            let queued = tokio::time::timeout(Duration::from_millis(20), limiter.acquire("https://c.example/")).await;
+            assert!(queued.is_err());
+            drop(first);
+            let next = limiter.acquire("https://c.example/").await;
+            assert!(next.queued < Duration::from_millis(20));
+            drop((other, next));
+        });
+    }
+
+    /// 测试用的流式分段：记录取数请求，由测试决定何时交付数据
+    struct ManualStream(Arc<Mutex<Vec<ChunkCallback>>>);
+
+    impl UploadStream for ManualStream {
+        fn request_chunk(&mut self, done: ChunkCallback) {
+            self.0.lock().unwrap().push(done);
+        }
+    }
+
+    /// 流式分段没有数据时 fill 不会等待：先交出已写入的数据，缓冲区为空时才请求下一块
+    #[test]
+    fn upload_fill_never_waits_for_stream_chunks() {
+        let requests = Arc::new(Mutex::new(Vec::new()));
+        let body = UploadBody::new(vec![
+            UploadSegment::Bytes(b"head".to_vec()),
+            UploadSegment::Stream(Box::new(ManualStream(requests.clone()))),
+            UploadSegment::Bytes(b"tail".to_vec()),
+        ]);
+        let mut context = UploadContext {
+            progress: Arc::new(RequestProgress::new()),
+            length: body.len(),
+            body,
+            segment: 0,
+            position: 0,
+            file: None,
+            pending: Vec::new(),
+            pending_pos: 0,
+        };
+        let mut buf = [0u8; 16];
+
+        assert!(matches!(context.fill(&mut buf), Ok(Fill::Written(4))));
+        assert_eq!(&buf[..4], b"head");
+        assert!(matches!(context.fill(&mut buf), Ok(Fill::NeedChunk)));
+
+        let (tx, rx) = std_mpsc::channel();
+        for chunk in [Some(b"abc".to_vec()), Some(Vec::new()), None] {
+            if let UploadSegment::Stream(stream) = &mut context.body.segments[context.segment] {
+                let tx = tx.clone();
+                stream.request_chunk(Box::new(move |chunk| tx.send(chunk).unwrap()));
+            }
+            let done = requests.lock().unwrap().pop().expect("chunk not requested");
+            done(Ok(chunk));
+            context.accept_chunk(rx.recv().unwrap().unwrap());
+            if context.pending_pos < context.pending.len() {
+                assert!(matches!(context.fill(&mut buf), Ok(Fill::Written(3))));
+                assert_eq!(&buf[..3], b"abc");
+                assert!(matches!(context.fill(&mut buf), Ok(Fill::NeedChunk)));
+            }
+        }
+
+        // 流结束后继续读取后面的分段
+        assert!(matches!(context.fill(&mut buf), Ok(Fill::Written(4))));
+        assert_eq!(&buf[..4], b"tail");
+        assert!(matches!(context.fill(&mut buf), Ok(Fill::Written(0))));
+    }
+
+    #[test]
+    fn storage_name_covers_every_engine_key_field() {
+        let base = EngineKey {
+            proxy_rules: None,
+            skip_cert_verify: false,
+            cipher_suites: None,
+            tls_curves: None,
+            tls_extensions: None,
+            cookie_store: false,
+            cache_mode: CacheMode::Disk,
+            cache_max_bytes: 0,
+            cache_dir: Some("/tmp/cycronet".to_string()),
+            storage_path: None,
+            quic_hints: Vec::new(),
+        };
+        let same = EngineKey { quic_hints: Vec::new(), ..base.clone() };
+        assert_eq!(base.storage_name(), same.storage_name());
+
+        // 同一目录下的不同 Engine 必须落到不同子目录，否则第二个 Engine 启动失败
+        let variants = [
+            EngineKey { cache_mode: CacheMode::Memory, ..base.clone() },
+            EngineKey { cache_max_bytes: 1 << 20, ..base.clone() },
+            EngineKey { quic_hints: vec![("a.example".to_string(), 443, 443)], ..base.clone() },
+        ];
+        for variant in &variants {
+            assert_ne!(base.storage_name(), variant.storage_name());
+        }
+    }
+}
@@ -3,7 +3,9 @@
 #![allow(non_camel_case_types)]
 #![allow(non_snake_case)]
 
+pub mod callback_pool;
 pub mod cronet;
+pub mod metrics;
 
 #[cfg(feature = "server")]
 pub mod service;
@@ -185,6 +185,8 @@ async fn run_server(args: Args) {
         // Version endpoint
         .route("/version", get(service::get_version))
         .route("/api/version", get(service::get_version))
+        // Prometheus metrics
+        .route("/metrics", get(service::metrics))
         // Session Management API
         .route("/api/v1/session", post(service::create_session))
         .route("/api/v1/session", get(service::list_sessions))
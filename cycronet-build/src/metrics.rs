@@ -0,0 +1,430 @@
+// -----------------------------------------------------------------------------
+// Request Metrics
+// -----------------------------------------------------------------------------
+//
+// 会话级与进程级的请求统计。记录路径只使用原子操作：计数器、状态码表和
+// 延迟直方图的桶都是 AtomicU64，回调线程之间不会互相阻塞。
+// 按主机的直方图放在读多写少的表里，只有首次见到某个主机时才需要写锁。
+
+use std::collections::HashMap;
+use std::fmt::Write as _;
+use std::sync::atomic::{AtomicI64, AtomicU64, Ordering};
+use std::sync::{Arc, OnceLock, RwLock};
+use std::time::{Duration, Instant};
+
+use crate::cronet::url_authority;
+
+/// 每个 2 的幂区间内的子桶位数（16 个子桶，相对误差不超过 1/16）
+const SUB_BUCKET_BITS: u32 = 4;
+const SUB_BUCKETS: usize = 1 << SUB_BUCKET_BITS;
+/// 可记录的最大延迟为 2^36 微秒（约 19 小时），更大的值计入最后一个桶
+const MAX_VALUE_BITS: u32 = 36;
+const BUCKET_COUNT: usize = (MAX_VALUE_BITS - SUB_BUCKET_BITS + 1) as usize * SUB_BUCKETS;
+/// 可记录的 HTTP 状态码范围（之外的状态码计入 0）
+const STATUS_CODES: usize = 600;
+/// 按主机统计的主机数上限，超出后计入 OTHER_HOST
+const MAX_HOSTS: usize = 256;
+pub const OTHER_HOST: &str = "_other";
+
+/// 进程内所有请求（会话与 CronetEngine）的统计
+pub fn global() -> &'static RequestMetrics {
+    static GLOBAL: OnceLock<RequestMetrics> = OnceLock::new();
+    GLOBAL.get_or_init(RequestMetrics::new)
+}
+
+// -----------------------------------------------------------------------------
+// Latency Histogram
+// -----------------------------------------------------------------------------
+
+/// HDR 风格的对数-线性直方图（单位：微秒）
+/// 每个 2 的幂区间再均分为 SUB_BUCKETS 个子桶，记录只是一次原子加
+pub struct LatencyHistogram {
+    buckets: Box<[AtomicU64]>,
+    sum_us: AtomicU64,
+    max_us: AtomicU64,
+}
+
+fn bucket_index(value: u64) -> usize {
+    let value = value.min((1u64 << MAX_VALUE_BITS) - 1);
+    if value < SUB_BUCKETS as u64 {
+        return value as usize;
+    }
+    let msb = 63 - value.leading_zeros();
+    let shift = msb - SUB_BUCKET_BITS;
+    let sub = ((value >> shift) as usize) & (SUB_BUCKETS - 1);
+    (shift as usize + 1) * SUB_BUCKETS + sub
+}
+
+/// 桶的上界（含）
+fn bucket_upper(index: usize) -> u64 {
+    let group = index / SUB_BUCKETS;
+    if group == 0 {
+        return index as u64;
+    }
+    let shift = group as u32 - 1;
+    let sub = (index % SUB_BUCKETS) as u64;
+    ((SUB_BUCKETS as u64 + sub) << shift) + (1u64 << shift) - 1
+}
+
+impl LatencyHistogram {
+    pub fn new() -> Self {
+        LatencyHistogram {
+            buckets: (0..BUCKET_COUNT).map(|_| AtomicU64::new(0)).collect(),
+            sum_us: AtomicU64::new(0),
+            max_us: AtomicU64::new(0),
+        }
+    }
+
+    pub fn record(&self, value_us: u64) {
+        self.buckets[bucket_index(value_us)].fetch_add(1, Ordering::Relaxed);
+        self.sum_us.fetch_add(value_us, Ordering::Relaxed);
+        self.max_us.fetch_max(value_us, Ordering::Relaxed);
+    }
+
+    pub fn snapshot(&self) -> HistogramSnapshot {
+        let buckets = self
+            .buckets
+            .iter()
+            .enumerate()
+            .filter_map(|(index, bucket)| {
+                let count = bucket.load(Ordering::Relaxed);
+                (count > 0).then(|| (bucket_upper(index), count))
+            })
+            .collect::<Vec<_>>();
+        HistogramSnapshot {
+            count: buckets.iter().map(|(_, count)| count).sum(),
+            sum_us: self.sum_us.load(Ordering::Relaxed),
+            max_us: self.max_us.load(Ordering::Relaxed),
+            buckets,
+        }
+    }
+}
+
+impl Default for LatencyHistogram {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+
+/// 直方图快照：只保留非空桶，按上界升序排列
+#[derive(Clone, Debug, Default)]
+pub struct HistogramSnapshot {
+    pub count: u64,
+    pub sum_us: u64,
+    pub max_us: u64,
+    /// (桶上界微秒, 计数)
+    pub buckets: Vec<(u64, u64)>,
+}
+
+impl HistogramSnapshot {
+    /// 分位数（q 取 0.0..=1.0），返回所在桶的上界，不超过记录到的最大值
+    pub fn percentile(&self, q: f64) -> u64 {
+        if self.count == 0 {
+            return 0;
+        }
+        let rank = ((q.clamp(0.0, 1.0) * self.count as f64).ceil() as u64).max(1);
+        let mut seen = 0;
+        for &(upper, count) in &self.buckets {
+            seen += count;
+            if seen >= rank {
+                return upper.min(self.max_us);
+            }
+        }
+        self.max_us
+    }
+
+    /// 不超过 bound_us 的记录数（按桶上界计算，近似值）
+    pub fn count_le(&self, bound_us: u64) -> u64 {
+        self.buckets
+            .iter()
+            .take_while(|(upper, _)| *upper <= bound_us)
+            .map(|(_, count)| count)
+            .sum()
+    }
+}
+
+// -----------------------------------------------------------------------------
+// Request Metrics
+// -----------------------------------------------------------------------------
+
+/// 请求的最终结果
+#[derive(Clone, Copy, Debug)]
+pub enum RequestOutcome {
+    Response { status_code: i32, sent_bytes: u64, received_bytes: u64 },
+    Failed,
+    TimedOut,
+    Cancelled,
+}
+
+/// 一组请求的统计（会话级或进程级）
+pub struct RequestMetrics {
+    requests: AtomicU64,
+    in_flight: AtomicI64,
+    status: Box<[AtomicU64]>,
+    errors: AtomicU64,
+    timeouts: AtomicU64,
+    cancelled: AtomicU64,
+    bytes_sent: AtomicU64,
+    bytes_received: AtomicU64,
+    latency: LatencyHistogram,
+    queue: LatencyHistogram,  // 在会话并发队列中等待的时间
+    hosts: RwLock<HashMap<String, Arc<LatencyHistogram>>>,
+}
+
+impl RequestMetrics {
+    pub fn new() -> Self {
+        RequestMetrics {
+            requests: AtomicU64::new(0),
+            in_flight: AtomicI64::new(0),
+            status: (0..STATUS_CODES).map(|_| AtomicU64::new(0)).collect(),
+            errors: AtomicU64::new(0),
+            timeouts: AtomicU64::new(0),
+            cancelled: AtomicU64::new(0),
+            bytes_sent: AtomicU64::new(0),
+            bytes_received: AtomicU64::new(0),
+            latency: LatencyHistogram::new(),
+            queue: LatencyHistogram::new(),
+            hosts: RwLock::new(HashMap::new()),
+        }
+    }
+
+    fn start(&self, queued_us: Option<u64>) {
+        self.requests.fetch_add(1, Ordering::Relaxed);
+        self.in_flight.fetch_add(1, Ordering::Relaxed);
+        if let Some(queued_us) = queued_us {
+            self.queue.record(queued_us);
+        }
+    }
+
+    fn finish(&self, host: &str, outcome: RequestOutcome, latency_us: u64) {
+        self.in_flight.fetch_sub(1, Ordering::Relaxed);
+        match outcome {
+            RequestOutcome::Response { status_code, sent_bytes, received_bytes } => {
+                let index = usize::try_from(status_code).ok().filter(|&code| code < STATUS_CODES).unwrap_or(0);
+                self.status[index].fetch_add(1, Ordering::Relaxed);
+                self.bytes_sent.fetch_add(sent_bytes, Ordering::Relaxed);
+                self.bytes_received.fetch_add(received_bytes, Ordering::Relaxed);
+                self.latency.record(latency_us);
+                self.host_histogram(host).record(latency_us);
+            }
+            RequestOutcome::Failed => {
+                self.errors.fetch_add(1, Ordering::Relaxed);
+            }
+            RequestOutcome::TimedOut => {
+                self.timeouts.fetch_add(1, Ordering::Relaxed);
+            }
+            RequestOutcome::Cancelled => {
+                self.cancelled.fetch_add(1, Ordering::Relaxed);
+            }
+        }
+    }
+
+    /// 取主机的直方图：已存在时只需读锁，首次出现时才加写锁插入
+    fn host_histogram(&self, host: &str) -> Arc<LatencyHistogram> {
+        if let Some(histogram) = self.hosts.read().unwrap_or_else(|p| p.into_inner()).get(host) {
+            return histogram.clone();
+        }
+        let mut hosts = self.hosts.write().unwrap_or_else(|p| p.into_inner());
+        let key = if hosts.len() < MAX_HOSTS || hosts.contains_key(host) { host } else { OTHER_HOST };
+        hosts.entry(key.to_string()).or_default().clone()
+    }
+
+    pub fn snapshot(&self) -> MetricsSnapshot {
+        let mut hosts = self
+            .hosts
+            .read()
+            .unwrap_or_else(|p| p.into_inner())
+            .iter()
+            .map(|(host, histogram)| (host.clone(), histogram.snapshot()))
+            .collect::<Vec<_>>();
+        hosts.sort_by(|a, b| a.0.cmp(&b.0));
+
+        MetricsSnapshot {
+            requests: self.requests.load(Ordering::Relaxed),
+            in_flight: self.in_flight.load(Ordering::Relaxed).max(0) as u64,
+            status: self
+                .status
+                .iter()
+                .enumerate()
+                .filter_map(|(code, count)| {
+                    let count = count.load(Ordering::Relaxed);
+                    (count > 0).then(|| (code as u16, count))
+                })
+                .collect(),
+            errors: self.errors.load(Ordering::Relaxed),
+            timeouts: self.timeouts.load(Ordering::Relaxed),
+            cancelled: self.cancelled.load(Ordering::Relaxed),
+            bytes_sent: self.bytes_sent.load(Ordering::Relaxed),
+            bytes_received: self.bytes_received.load(Ordering::Relaxed),
+            latency: self.latency.snapshot(),
+            queue: self.queue.snapshot(),
+            hosts,
+        }
+    }
+}
+
+impl Default for RequestMetrics {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+
+/// 统计快照（状态码 0 表示超出 0..600 的状态码）
+#[derive(Clone, Debug, Default)]
+pub struct MetricsSnapshot {
+    pub requests: u64,
+    pub in_flight: u64,
+    pub status: Vec<(u16, u64)>,
+    pub errors: u64,
+    pub timeouts: u64,
+    pub cancelled: u64,
+    pub bytes_sent: u64,
+    pub bytes_received: u64,
+    pub latency: HistogramSnapshot,
+    /// 排队时间（只包含经过并发限制的请求）
+    pub queue: HistogramSnapshot,
+    pub hosts: Vec<(String, HistogramSnapshot)>,
+}
+
+/// 单个请求的记录器：创建时计入请求数与排队时间，结束时记录结果与延迟
+/// 同时记录到会话统计（如有）和进程级统计
+pub struct RequestRecorder {
+    session: Option<Arc<RequestMetrics>>,
+    host: String,
+    started: Instant,
+}
+
+impl RequestRecorder {
+    pub fn start(session: Option<Arc<RequestMetrics>>, url: &str, queued: Option<Duration>) -> Self {
+        let queued_us = queued.map(|queued| queued.as_micros() as u64);
+        global().start(queued_us);
+        if let Some(ref session) = session {
+            session.start(queued_us);
+        }
+        RequestRecorder {
+            session,
+            host: url_authority(url).unwrap_or("").to_ascii_lowercase(),
+            started: Instant::now(),
+        }
+    }
+
+    pub fn finish(self, outcome: RequestOutcome) {
+        let latency_us = self.started.elapsed().as_micros() as u64;
+        global().finish(&self.host, outcome, latency_us);
+        if let Some(ref session) = self.session {
+            session.finish(&self.host, outcome, latency_us);
+        }
+    }
+}
+
+// -----------------------------------------------------------------------------
+// Prometheus Export
+// -----------------------------------------------------------------------------
+
+/// Prometheus 直方图的桶边界（秒）
+const PROMETHEUS_BUCKETS: [f64; 14] = [
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0,
+];
+
+fn escape_label(value: &str) -> String {
+    value.replace('\\', "\\\\").replace('"', "\\\"").replace('\n', "\\n")
+}
+
+fn write_histogram(out: &mut String, name: &str, labels: &str, histogram: &HistogramSnapshot) {
+    let separator = if labels.is_empty() { "" } else { "," };
+    for bound in PROMETHEUS_BUCKETS {
+        let count = histogram.count_le((bound * 1_000_000.0) as u64);
+        let _ = writeln!(out, "{}_bucket{{{}{}le=\"{}\"}} {}", name, labels, separator, bound, count);
+    }
+    let _ = writeln!(out, "{}_bucket{{{}{}le=\"+Inf\"}} {}", name, labels, separator, histogram.count);
+    let braces = if labels.is_empty() { String::new() } else { format!("{{{}}}", labels) };
+    let _ = writeln!(out, "{}_sum{} {}", name, braces, histogram.sum_us as f64 / 1_000_000.0);
+    let _ = writeln!(out, "{}_count{} {}", name, braces, histogram.count);
+}
+
+/// 以 Prometheus 文本格式导出进程级统计
+/// sessions 为 (会话ID, 活跃请求数)，导出为按会话的 gauge
+pub fn render_prometheus(snapshot: &MetricsSnapshot, sessions: &[(String, usize)], engines: usize) -> String {
+    let mut out = String::new();
+
+    let counters: [(&str, &str, u64); 6] = [
+        ("cycronet_requests_total", "Requests started", snapshot.requests),
+        ("cycronet_request_errors_total", "Requests that failed without a response", snapshot.errors),
+        ("cycronet_request_timeouts_total", "Requests that hit a deadline", snapshot.timeouts),
+        ("cycronet_request_cancelled_total", "Requests cancelled by the caller", snapshot.cancelled),
+        ("cycronet_sent_bytes_total", "Bytes sent on the wire", snapshot.bytes_sent),
+        ("cycronet_received_bytes_total", "Bytes received on the wire", snapshot.bytes_received),
+    ];
+    for (name, help, value) in counters {
+        let _ = writeln!(out, "# HELP {} {}\n# TYPE {} counter\n{} {}", name, help, name, name, value);
+    }
+
+    let _ = writeln!(out, "# HELP cycronet_responses_total Responses by HTTP status code");
+    let _ = writeln!(out, "# TYPE cycronet_responses_total counter");
+    for (code, count) in &snapshot.status {
+        let _ = writeln!(out, "cycronet_responses_total{{code=\"{}\"}} {}", code, count);
+    }
+
+    let gauges: [(&str, &str, u64); 3] = [
+        ("cycronet_requests_in_flight", "Requests currently in flight", snapshot.in_flight),
+        ("cycronet_sessions", "Open sessions", sessions.len() as u64),
+        ("cycronet_engines", "Live Cronet engines", engines as u64),
+    ];
+    for (name, help, value) in gauges {
+        let _ = writeln!(out, "# HELP {} {}\n# TYPE {} gauge\n{} {}", name, help, name, name, value);
+    }
+
+    let _ = writeln!(out, "# HELP cycronet_session_active_requests Requests in flight per session");
+    let _ = writeln!(out, "# TYPE cycronet_session_active_requests gauge");
+    for (session_id, active) in sessions {
+        let _ = writeln!(out, "cycronet_session_active_requests{{session=\"{}\"}} {}", escape_label(session_id), active);
+    }
+
+    let name = "cycronet_request_duration_seconds";
+    let _ = writeln!(out, "# HELP {} Time from request start to completion", name);
+    let _ = writeln!(out, "# TYPE {} histogram", name);
+    write_histogram(&mut out, name, "", &snapshot.latency);
+
+    let name = "cycronet_queue_wait_seconds";
+    let _ = writeln!(out, "# HELP {} Time spent waiting for a session concurrency slot", name);
+    let _ = writeln!(out, "# TYPE {} histogram", name);
+    write_histogram(&mut out, name, "", &snapshot.queue);
+
+    let name = "cycronet_host_request_duration_seconds";
+    let _ = writeln!(out, "# HELP {} Time from request start to completion, by host", name);
+    let _ = writeln!(out, "# TYPE {} histogram", name);
+    for (host, histogram) in &snapshot.hosts {
+        write_histogram(&mut out, name, &format!("host=\"{}\"", escape_label(host)), histogram);
+    }
+
+    out
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn bucket_bounds_cover_recorded_values() {
+        for value in [0u64, 1, 15, 16, 17, 31, 32, 1000, 123_456, 9_999_999] {
+            let index = bucket_index(value);
+            assert!(bucket_upper(index) >= value);
+            if index > 0 {
+                assert!(bucket_upper(index - 1) < value);
+            }
+        }
+    }
+
+    #[test]
+    fn percentile_stays_within_precision() {
+        let histogram = LatencyHistogram::new();
+        for value in 1..=1000u64 {
+            histogram.record(value * 1000);
+        }
+        let snapshot = histogram.snapshot();
+        assert_eq!(snapshot.count, 1000);
+        let p50 = snapshot.percentile(0.5) as f64;
+        assert!((p50 - 500_000.0).abs() / 500_000.0 < 1.0 / SUB_BUCKETS as f64);
+        assert_eq!(snapshot.percentile(1.0), 1_000_000);
+    }
+}
@@ -1,10 +1,960 @@
 use pyo3::prelude::*;
-use pyo3::types::{PyBytes, PyDict, PyList};
-use std::sync::Arc;
-use std::time::Duration;
+use pyo3::types::{PyByteArray, PyBytes, PyDict, PyIterator, PyList, PyString, PyTuple};
+use std::sync::atomic::{AtomicBool, AtomicUsize, Ordering};
+use std::sync::{Arc, Mutex, OnceLock};
+use std::time::{Duration, Instant};
+use tokio::sync::{mpsc, oneshot};
 
-use crate::cronet::{SessionConfig, SessionManager};
+use crate::cronet::{
+    BodyChunk, CacheMode, ChunkCallback, ConcurrencyLimiter, CronetRequest, RequestOptions, RequestProgress, RequestResult, RequestTimings,
+    SessionConfig, SessionManager, UploadBody, UploadSegment, UploadStream,
+};
 use crate::cronet_pb::{Header, TargetRequest};
+use crate::metrics::{self, HistogramSnapshot, MetricsSnapshot};
+
+/// 共享的 tokio runtime，用于异步等待 Cronet 回调结果
+/// 所有 in-flight 请求共用少量 worker 线程，而不是每个请求占用一个线程
+fn runtime() -> &'static tokio::runtime::Runtime {
+    static RUNTIME: OnceLock<tokio::runtime::Runtime> = OnceLock::new();
+    RUNTIME.get_or_init(|| {
+        tokio::runtime::Builder::new_multi_thread()
+            .worker_threads(2)
+            .thread_name("cycronet-waiter")
+            .enable_time()
+            .build()
+            .expect("Failed to build cycronet runtime")
+    })
+}
+
+/// 当前正在等待截止时间的请求数量（用于确认 watchdog 没有泄漏）
+static LIVE_WATCHDOGS: AtomicUsize = AtomicUsize::new(0);
+
+struct WatchdogGuard;
+
+impl WatchdogGuard {
+    fn new() -> Self {
+        LIVE_WATCHDOGS.fetch_add(1, Ordering::Relaxed);
+        WatchdogGuard
+    }
+}
+
+impl Drop for WatchdogGuard {
+    fn drop(&mut self) {
+        LIVE_WATCHDOGS.fetch_sub(1, Ordering::Relaxed);
+    }
+}
+
+/// Which deadline expired
+#[derive(Clone, Copy, Debug)]
+enum TimeoutKind {
+    Connect,
+    Read,
+    Total,
+}
+
+/// Per-request deadlines in milliseconds
+///
+/// `total_ms` bounds the whole request, `connect_ms` the time until the
+/// connection is up (upload started or response received) and `read_ms` the
+/// longest gap between two network events once connected.
+#[derive(Clone, Copy, Debug)]
+struct Deadlines {
+    total_ms: u64,
+    connect_ms: Option<u64>,
+    read_ms: Option<u64>,
+}
+
+impl Deadlines {
+    fn new(
+        session_timeout_ms: u64,
+        timeout_ms: Option<u64>,
+        connect_timeout_ms: Option<u64>,
+        read_timeout_ms: Option<u64>,
+    ) -> Self {
+        Deadlines {
+            total_ms: timeout_ms.unwrap_or(session_timeout_ms),
+            connect_ms: connect_timeout_ms,
+            read_ms: read_timeout_ms,
+        }
+    }
+
+    /// 最早到期的截止时间（读取空闲截止时间随网络活动后移）
+    fn next_expiry(&self, progress: &RequestProgress) -> (Instant, TimeoutKind) {
+        let started = progress.started();
+        let mut expiry = (started + Duration::from_millis(self.total_ms), TimeoutKind::Total);
+        let phase = if progress.is_connected() {
+            self.read_ms
+                .map(|ms| (progress.last_activity() + Duration::from_millis(ms), TimeoutKind::Read))
+        } else {
+            self.connect_ms
+                .map(|ms| (started + Duration::from_millis(ms), TimeoutKind::Connect))
+        };
+        if let Some(phase) = phase {
+            if phase.0 < expiry.0 {
+                expiry = phase;
+            }
+        }
+        expiry
+    }
+
+    /// 流式读取时下一块的等待上限：读取空闲超时与请求剩余的总时间取较小者
+    fn chunk_wait(&self, started: Instant) -> (Duration, TimeoutKind) {
+        let remaining = (started + Duration::from_millis(self.total_ms)).saturating_duration_since(Instant::now());
+        match self.read_ms.map(Duration::from_millis) {
+            Some(read) if read < remaining => (read, TimeoutKind::Read),
+            _ => (remaining, TimeoutKind::Total),
+        }
+    }
+
+    fn timeout_error(&self, kind: TimeoutKind) -> PyErr {
+        let message = match kind {
+            TimeoutKind::Connect => format!("Connect timeout after {}ms", self.connect_ms.unwrap_or(0)),
+            TimeoutKind::Read => format!("Read timeout after {}ms without data", self.read_ms.unwrap_or(0)),
+            TimeoutKind::Total => format!("Request timeout after {}ms", self.total_ms),
+        };
+        PyErr::new::<pyo3::exceptions::PyTimeoutError, _>(message)
+    }
+}
+
+/// Result of waiting for a request with a deadline
+enum WaitOutcome {
+    Done(Result<RequestResult, String>),
+    Closed,
+    TimedOut(TimeoutKind),
+    Cancelled,
+    /// 会话不存在或已关闭，请求未发出
+    NotSent,
+}
+
+/// 请求取消信号：可从任意线程触发，所有等待方立即返回
+#[derive(Default)]
+struct CancelSignal {
+    cancelled: AtomicBool,
+    notify: tokio::sync::Notify,
+    /// 用户传入的 CancelToken：取消它会取消本请求，本请求自身取消不影响它
+    parent: Option<Arc<CancelSignal>>,
+}
+
+impl CancelSignal {
+    /// 单个请求专用的信号，同时响应父信号（只支持一层）
+    fn child_of(parent: Arc<CancelSignal>) -> Self {
+        CancelSignal {
+            parent: Some(parent),
+            ..Default::default()
+        }
+    }
+
+    fn cancel(&self) {
+        self.cancelled.store(true, Ordering::Release);
+        self.notify.notify_waiters();
+    }
+
+    fn is_cancelled(&self) -> bool {
+        self.cancelled.load(Ordering::Acquire)
+            || self.parent.as_ref().map_or(false, |parent| parent.cancelled.load(Ordering::Acquire))
+    }
+
+    /// 等待本信号的取消（先登记再检查标志，避免错过 notify_waiters）
+    async fn own_cancelled(&self) {
+        let notified = self.notify.notified();
+        tokio::pin!(notified);
+        notified.as_mut().enable();
+        if self.cancelled.load(Ordering::Acquire) {
+            return;
+        }
+        notified.await;
+    }
+
+    /// 等待取消（本信号或父信号）
+    async fn cancelled(&self) {
+        match self.parent {
+            Some(ref parent) => tokio::select! {
+                _ = self.own_cancelled() => {}
+                _ = parent.own_cancelled() => {}
+            },
+            None => self.own_cancelled().await,
+        }
+    }
+}
+
+/// 释放请求句柄：未完成的请求先取消，再到阻塞线程池中等待 on_canceled 后销毁
+fn release_request(request: CronetRequest) {
+    if request.is_completed() {
+        drop(request);
+    } else {
+        request.cancel();
+        runtime().spawn_blocking(move || drop(request));
+    }
+}
+
+/// 在共享 runtime 的定时器上等待回调结果，不为每个请求创建线程
+/// 连接、读取空闲或总截止时间到期时取消 Cronet 请求
+/// 收到取消信号时立即取消 Cronet 请求并返回（on_canceled 由 release_request 等待）
+async fn wait_result(
+    request: &CronetRequest,
+    rx: oneshot::Receiver<Result<RequestResult, String>>,
+    deadlines: Deadlines,
+    cancel: &CancelSignal,
+) -> WaitOutcome {
+    let _watchdog = WatchdogGuard::new();
+    let mut rx = rx;
+    loop {
+        let (expiry, kind) = deadlines.next_expiry(request.progress());
+        if Instant::now() >= expiry {
+            request.cancel_timed_out();
+            return WaitOutcome::TimedOut(kind);
+        }
+        // 定时器到期后重新计算：期间有网络活动时读取截止时间会后移
+        tokio::select! {
+            waited = tokio::time::timeout_at(expiry.into(), &mut rx) => match waited {
+                Ok(Ok(result)) => return WaitOutcome::Done(result),
+                Ok(Err(_)) => return WaitOutcome::Closed,
+                Err(_) => continue,
+            },
+            _ = cancel.cancelled() => {
+                request.cancel();
+                return WaitOutcome::Cancelled;
+            }
+        }
+    }
+}
+
+/// 等待请求完成并释放请求句柄
+async fn wait_with_deadline(
+    request: CronetRequest,
+    rx: oneshot::Receiver<Result<RequestResult, String>>,
+    deadlines: Deadlines,
+    cancel: &CancelSignal,
+) -> WaitOutcome {
+    let outcome = wait_result(&request, rx, deadlines, cancel).await;
+    release_request(request);
+    outcome
+}
+
+/// Convert a wait outcome into the response dict or the matching Python exception
+fn outcome_to_py(py: Python, outcome: WaitOutcome, deadlines: &Deadlines) -> PyResult<PyObject> {
+    match outcome {
+        WaitOutcome::Done(Ok(response)) => result_to_dict(py, response),
+        WaitOutcome::Done(Err(e)) => Err(PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(
+            format!("Request failed: {}", e)
+        )),
+        WaitOutcome::Closed => Err(PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(
+            "Channel closed unexpectedly"
+        )),
+        WaitOutcome::TimedOut(kind) => Err(deadlines.timeout_error(kind)),
+        WaitOutcome::Cancelled => Err(PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(
+            "Request canceled"
+        )),
+        WaitOutcome::NotSent => Err(send_failed_error()),
+    }
+}
+
+type ResultReceiver = oneshot::Receiver<Result<RequestResult, String>>;
+
+/// 待发起的请求：在会话的并发限制下排队，轮到后才交给 Cronet
+struct PendingRequest {
+    manager: Arc<SessionManager>,
+    limiter: Arc<ConcurrencyLimiter>,
+    session_id: String,
+    target: TargetRequest,
+    upload: UploadBody,
+    options: RequestOptions,
+}
+
+impl PendingRequest {
+    /// 返回待发起的请求与会话的默认超时（会话不存在时为 None）
+    fn new(
+        manager: &Arc<SessionManager>,
+        session_id: String,
+        target: TargetRequest,
+        upload: UploadBody,
+        options: RequestOptions,
+    ) -> Option<(Self, u64)> {
+        let (limiter, session_timeout_ms) = manager.session_limiter(&session_id)?;
+        let pending = PendingRequest {
+            manager: manager.clone(),
+            limiter,
+            session_id,
+            target,
+            upload,
+            options,
+        };
+        Some((pending, session_timeout_ms))
+    }
+
+    /// 排队并发起请求（截止时间从发起时开始计算，不包含排队时间）
+    /// 排队期间收到取消信号返回 Cancelled，会话已关闭返回 NotSent
+    async fn send(self, cancel: &CancelSignal) -> Result<(CronetRequest, ResultReceiver), WaitOutcome> {
+        let admission = if self.limiter.is_limited() {
+            tokio::select! {
+                admission = self.limiter.acquire(&self.target.url) => Some(admission),
+                _ = cancel.cancelled() => return Err(WaitOutcome::Cancelled),
+            }
+        } else {
+            None
+        };
+        self.manager
+            .send_request_admitted(&self.session_id, &self.target, self.upload, &self.options, admission)
+            .map(|(request, rx, _)| (request, rx))
+            .ok_or(WaitOutcome::NotSent)
+    }
+
+    /// 排队、发起请求并等待结果，结束后释放请求句柄
+    async fn send_and_wait(self, deadlines: Deadlines, cancel: &CancelSignal) -> WaitOutcome {
+        match self.send(cancel).await {
+            Ok((request, rx)) => wait_with_deadline(request, rx, deadlines, cancel).await,
+            Err(outcome) => outcome,
+        }
+    }
+}
+
+/// Build target request from Python arguments
+fn build_target(
+    url: String,
+    method: String,
+    headers: Option<Vec<(String, String)>>,
+) -> TargetRequest {
+    TargetRequest {
+        url,
+        method,
+        headers: headers
+            .unwrap_or_default()
+            .into_iter()
+            .map(|(name, value)| Header { name, value })
+            .collect(),
+        // body 通过 UploadBody 单独传递
+        body: Vec::new(),
+    }
+}
+
+/// 持有 Python bytes 对象，上传时直接读取其内部缓冲区（bytes 不可变，无需复制）
+struct PyBytesSegment {
+    _owner: Py<PyBytes>,
+    data: *const u8,
+    len: usize,
+}
+
+// bytes 内容不可变，且 _owner 保证缓冲区在上传期间有效
+unsafe impl Send for PyBytesSegment {}
+
+impl AsRef<[u8]> for PyBytesSegment {
+    fn as_ref(&self) -> &[u8] {
+        unsafe { std::slice::from_raw_parts(self.data, self.len) }
+    }
+}
+
+/// 按需从 Python 迭代器读取上传数据
+///
+/// 每块数据在 blocking 线程池上获取 GIL 拉取，再由该线程完成 Cronet 的读取；
+/// 读取回调所在的线程（默认是网络线程）不会等待 Python 代码
+struct PyIterStream {
+    iter: Arc<Py<PyIterator>>,
+}
+
+impl UploadStream for PyIterStream {
+    fn request_chunk(&mut self, done: ChunkCallback) {
+        let iter = self.iter.clone();
+        runtime().spawn_blocking(move || {
+            let chunk = Python::with_gil(|py| {
+                let mut iter = iter.bind(py).clone();
+                match iter.next() {
+                    None => Ok(None),
+                    Some(Err(e)) => Err(format!("Upload iterator raised: {}", e)),
+                    Some(Ok(chunk)) => bytes_like_to_vec(&chunk)
+                        .map(Some)
+                        .ok_or_else(|| "Upload iterator must yield bytes".to_string()),
+                }
+            });
+            done(chunk);
+        });
+    }
+}
+
+fn bytes_like_to_vec(obj: &Bound<'_, PyAny>) -> Option<Vec<u8>> {
+    if let Ok(bytes) = obj.downcast::<PyBytes>() {
+        Some(bytes.as_bytes().to_vec())
+    } else if let Ok(bytearray) = obj.downcast::<PyByteArray>() {
+        Some(bytearray.to_vec())
+    } else if let Ok(text) = obj.downcast::<PyString>() {
+        text.to_cow().ok().map(|text| text.as_bytes().to_vec())
+    } else {
+        None
+    }
+}
+
+/// Convert one body part into an upload segment
+///
+/// bytes are referenced without copying, `(path, offset, length)` tuples are
+/// read from disk on demand and any other iterable is pulled chunk by chunk.
+fn build_segment(obj: &Bound<'_, PyAny>) -> PyResult<UploadSegment> {
+    if let Ok(bytes) = obj.downcast::<PyBytes>() {
+        let data = bytes.as_bytes();
+        return Ok(UploadSegment::Shared(Box::new(PyBytesSegment {
+            data: data.as_ptr(),
+            len: data.len(),
+            _owner: bytes.clone().unbind(),
+        })));
+    }
+    if obj.is_instance_of::<PyByteArray>() || obj.is_instance_of::<PyString>() {
+        return Ok(UploadSegment::Bytes(bytes_like_to_vec(obj).unwrap_or_default()));
+    }
+    if let Ok(tuple) = obj.downcast::<PyTuple>() {
+        let (path, offset, length): (String, u64, u64) = tuple.extract()?;
+        return Ok(UploadSegment::File {
+            path: path.into(),
+            offset,
+            length,
+        });
+    }
+    let iter = PyIterator::from_object(obj).map_err(|_| {
+        PyErr::new::<pyo3::exceptions::PyTypeError, _>(
+            "body must be bytes, a list of segments or an iterable of bytes"
+        )
+    })?;
+    Ok(UploadSegment::Stream(Box::new(PyIterStream { iter: Arc::new(iter.unbind()) })))
+}
+
+/// Convert the Python body argument into an UploadBody
+///
+/// Accepts bytes, a list of segments (see `build_segment`) or an iterable of bytes.
+fn build_upload(py: Python, body: Option<PyObject>) -> PyResult<UploadBody> {
+    let body = match body {
+        Some(body) => body.into_bound(py),
+        None => return Ok(UploadBody::default()),
+    };
+    if let Ok(parts) = body.downcast::<PyList>() {
+        let segments = parts
+            .iter()
+            .map(|part| build_segment(&part))
+            .collect::<PyResult<Vec<_>>>()?;
+        return Ok(UploadBody::new(segments));
+    }
+    Ok(UploadBody::new(vec![build_segment(&body)?]))
+}
+
+/// Convert a completed RequestResult into the response dict returned to Python
+///
+/// Cronet reads straight into the body Vec, which is moved (not cloned) out of the
+/// request; exactly one copy of the body remains, into the Python bytes object.
+/// The abi3 build cannot expose the Vec through the buffer protocol.
+fn result_to_dict(py: Python, response: RequestResult) -> PyResult<PyObject> {
+    let dict = PyDict::new_bound(py);
+    dict.set_item("status_code", response.status_code)?;
+    dict.set_item("body", PyBytes::new_bound(py, &response.body))?;
+
+    // Convert headers
+    dict.set_item("headers", headers_to_py(py, response.headers)?)?;
+    dict.set_item("url", response.url)?;
+
+    // 已跟随的重定向（每一跳的响应头用于提取 Set-Cookie）
+    let history = PyList::empty_bound(py);
+    for hop in response.history {
+        let hop_dict = PyDict::new_bound(py);
+        hop_dict.set_item("status_code", hop.status_code)?;
+        hop_dict.set_item("url", hop.url)?;
+        hop_dict.set_item("headers", headers_to_py(py, hop.headers)?)?;
+        history.append(hop_dict)?;
+    }
+    dict.set_item("history", history)?;
+    dict.set_item("timings", timings_to_py(py, response.timings)?)?;
+    dict.set_item("from_cache", response.from_cache)?;
+
+    Ok(dict.into_py(py))
+}
+
+/// 耗时统计转换为 dict（毫秒），没有统计时为 None
+fn timings_to_py(py: Python, timings: Option<RequestTimings>) -> PyResult<PyObject> {
+    let timings = match timings {
+        Some(timings) => timings,
+        None => return Ok(py.None()),
+    };
+    let dict = PyDict::new_bound(py);
+    dict.set_item("dns_ms", timings.dns_ms)?;
+    dict.set_item("connect_ms", timings.connect_ms)?;
+    dict.set_item("tls_ms", timings.tls_ms)?;
+    dict.set_item("send_ms", timings.send_ms)?;
+    dict.set_item("ttfb_ms", timings.ttfb_ms)?;
+    dict.set_item("total_ms", timings.total_ms)?;
+    dict.set_item("socket_reused", timings.socket_reused)?;
+    dict.set_item("sent_bytes", timings.sent_bytes)?;
+    dict.set_item("received_bytes", timings.received_bytes)?;
+    dict.set_item("protocol", timings.protocol)?;
+    dict.set_item("queue_ms", timings.queue_ms)?;
+    Ok(dict.into_py(py))
+}
+
+fn histogram_to_py(py: Python, histogram: &HistogramSnapshot) -> PyResult<PyObject> {
+    let ms = |us: u64| us as f64 / 1000.0;
+    let dict = PyDict::new_bound(py);
+    dict.set_item("count", histogram.count)?;
+    dict.set_item("mean_ms", if histogram.count > 0 { ms(histogram.sum_us) / histogram.count as f64 } else { 0.0 })?;
+    dict.set_item("p50_ms", ms(histogram.percentile(0.5)))?;
+    dict.set_item("p90_ms", ms(histogram.percentile(0.9)))?;
+    dict.set_item("p99_ms", ms(histogram.percentile(0.99)))?;
+    dict.set_item("p999_ms", ms(histogram.percentile(0.999)))?;
+    dict.set_item("max_ms", ms(histogram.max_us))?;
+    Ok(dict.into_py(py))
+}
+
+fn metrics_to_py<'py>(py: Python<'py>, snapshot: &MetricsSnapshot) -> PyResult<Bound<'py, PyDict>> {
+    let dict = PyDict::new_bound(py);
+    dict.set_item("requests", snapshot.requests)?;
+    dict.set_item("in_flight", snapshot.in_flight)?;
+    let status = PyDict::new_bound(py);
+    for (code, count) in &snapshot.status {
+        status.set_item(*code, *count)?;
+    }
+    dict.set_item("status", status)?;
+    dict.set_item("errors", snapshot.errors)?;
+    dict.set_item("timeouts", snapshot.timeouts)?;
+    dict.set_item("cancelled", snapshot.cancelled)?;
+    dict.set_item("bytes_sent", snapshot.bytes_sent)?;
+    dict.set_item("bytes_received", snapshot.bytes_received)?;
+    dict.set_item("latency", histogram_to_py(py, &snapshot.latency)?)?;
+    dict.set_item("queue", histogram_to_py(py, &snapshot.queue)?)?;
+    let hosts = PyDict::new_bound(py);
+    for (host, histogram) in &snapshot.hosts {
+        hosts.set_item(host, histogram_to_py(py, histogram)?)?;
+    }
+    dict.set_item("hosts", hosts)?;
+    Ok(dict)
+}
+
+fn headers_to_py(py: Python, headers: Vec<(String, String)>) -> PyResult<Bound<'_, PyList>> {
+    let headers_list = PyList::empty_bound(py);
+    for (name, value) in headers {
+        let tuple = (name, value);
+        headers_list.append(tuple)?;
+    }
+    Ok(headers_list)
+}
+
+/// 在 blocking 线程池上获取 GIL 执行 f（转换结果并投递给事件循环）
+///
+/// runtime 只有两个 worker，还驱动所有截止时间、限速等待与取消信号；
+/// 若在 worker 上等待 GIL（asyncio 线程持有 GIL 时），这些计时器会全部停摆
+fn resolve_with_gil<F>(f: F)
+where
+    F: FnOnce(Python) + Send + 'static,
+{
+    runtime().spawn_blocking(move || Python::with_gil(f));
+}
+
+/// Schedule completion of an asyncio.Future on its event loop
+fn schedule_resolve(py: Python, event_loop: &PyObject, future: PyObject, result: PyResult<PyObject>) {
+    let (result, exception) = match result {
+        Ok(value) => (Some(value), None),
+        Err(e) => (None, Some(e.into_value(py).into_py(py))),
+    };
+    let resolver = FutureResolver {
+        future,
+        result,
+        exception,
+    };
+    let scheduled = Py::new(py, resolver).and_then(|resolver| {
+        event_loop.call_method1(py, "call_soon_threadsafe", (resolver,))
+    });
+    if let Err(e) = scheduled {
+        // 事件循环已关闭，无法再投递结果
+        e.print(py);
+    }
+}
+
+/// Result of reading one chunk from a streaming response
+enum ChunkOutcome {
+    Chunk(Vec<u8>),
+    End,
+    Failed(String),
+    TimedOut,
+}
+
+/// 读取流式响应的下一个 body 块
+/// 每次只发起一次 Cronet_UrlRequest_Read，消费者不读取时 Cronet 不会继续接收数据（背压）
+async fn next_chunk(
+    request: Arc<Mutex<Option<CronetRequest>>>,
+    chunks: Arc<tokio::sync::Mutex<mpsc::UnboundedReceiver<BodyChunk>>>,
+    wait: Duration,
+) -> ChunkOutcome {
+    let mut chunks = chunks.lock().await;
+
+    // 已关闭或已完成的请求不再发起读取，直接取通道中剩余的结束事件
+    let reading = match request.lock() {
+        Ok(guard) => guard.as_ref().map(|r| r.read_next()),
+        Err(poisoned) => poisoned.into_inner().as_ref().map(|r| r.read_next()),
+    };
+    if reading.is_none() {
+        return ChunkOutcome::End;
+    }
+
+    let _watchdog = WatchdogGuard::new();
+    let outcome = match tokio::time::timeout(wait, chunks.recv()).await {
+        Ok(Some(Ok(Some(chunk)))) => return ChunkOutcome::Chunk(chunk),
+        Ok(Some(Ok(None))) | Ok(None) => ChunkOutcome::End,
+        Ok(Some(Err(e))) => ChunkOutcome::Failed(e),
+        Err(_) => ChunkOutcome::TimedOut,
+    };
+
+    // body 已结束、失败或超时，释放请求句柄
+    let finished = match request.lock() {
+        Ok(mut guard) => guard.take(),
+        Err(poisoned) => poisoned.into_inner().take(),
+    };
+    if let Some(finished) = finished {
+        if matches!(outcome, ChunkOutcome::TimedOut) {
+            finished.cancel_timed_out();
+        }
+        release_request(finished);
+    }
+    outcome
+}
+
+/// Convert a chunk outcome into bytes (None at end of body) or the matching Python exception
+///
+/// Each chunk is copied once into a new bytes object, as in result_to_dict.
+fn chunk_to_py(py: Python, outcome: ChunkOutcome, deadlines: &Deadlines, kind: TimeoutKind) -> PyResult<PyObject> {
+    match outcome {
+        ChunkOutcome::Chunk(chunk) => Ok(PyBytes::new_bound(py, &chunk).into_py(py)),
+        ChunkOutcome::End => Ok(py.None()),
+        ChunkOutcome::Failed(e) => Err(PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(
+            format!("Request failed: {}", e)
+        )),
+        ChunkOutcome::TimedOut => Err(deadlines.timeout_error(kind)),
+    }
+}
+
+/// Streaming response body
+///
+/// Chunks are pulled on demand: each read issues a single Cronet read, so a
+/// slow consumer stops the transfer instead of buffering the body in memory.
+/// Each read waits at most the read timeout, and never past the total deadline
+/// counted from the start of the request.
+#[pyclass]
+struct PyResponseStream {
+    request: Arc<Mutex<Option<CronetRequest>>>,
+    chunks: Arc<tokio::sync::Mutex<mpsc::UnboundedReceiver<BodyChunk>>>,
+    deadlines: Deadlines,
+    started: Instant,
+}
+
+#[pymethods]
+impl PyResponseStream {
+    /// Read the next body chunk, returns None at end of body
+    fn read(&self, py: Python) -> PyResult<PyObject> {
+        let request = self.request.clone();
+        let chunks = self.chunks.clone();
+        let (wait, kind) = self.deadlines.chunk_wait(self.started);
+        let outcome = py.allow_threads(move || {
+            runtime().block_on(next_chunk(request, chunks, wait))
+        });
+        chunk_to_py(py, outcome, &self.deadlines, kind)
+    }
+
+    /// Read the next body chunk without blocking, returns an asyncio.Future
+    fn read_async(&self, py: Python, event_loop: PyObject) -> PyResult<PyObject> {
+        let future = event_loop.call_method0(py, "create_future")?;
+        let pending_future = future.clone_ref(py);
+        let request = self.request.clone();
+        let chunks = self.chunks.clone();
+        let deadlines = self.deadlines;
+        let (wait, kind) = deadlines.chunk_wait(self.started);
+
+        runtime().spawn(async move {
+            let outcome = next_chunk(request, chunks, wait).await;
+            resolve_with_gil(move |py| {
+                let result = chunk_to_py(py, outcome, &deadlines, kind);
+                schedule_resolve(py, &event_loop, pending_future, result);
+            });
+        });
+
+        Ok(future)
+    }
+
+    /// Timings of the finished request as a dict, None until the body was fully read
+    fn timings(&self, py: Python) -> PyResult<PyObject> {
+        let timings = match self.request.lock() {
+            Ok(guard) => guard.as_ref().and_then(|request| request.timings()),
+            Err(poisoned) => poisoned.into_inner().as_ref().and_then(|request| request.timings()),
+        };
+        timings_to_py(py, timings)
+    }
+
+    /// Cancel the transfer and release the native request
+    fn close(&self) {
+        let request = match self.request.lock() {
+            Ok(mut guard) => guard.take(),
+            Err(poisoned) => poisoned.into_inner().take(),
+        };
+        if let Some(request) = request {
+            release_request(request);
+        }
+    }
+}
+
+impl Drop for PyResponseStream {
+    fn drop(&mut self) {
+        self.close();
+    }
+}
+
+/// 将流式请求的响应头转换为 dict，并附上 stream 对象
+fn stream_head_to_py(
+    py: Python,
+    outcome: WaitOutcome,
+    mut request: CronetRequest,
+    deadlines: &Deadlines,
+) -> PyResult<PyObject> {
+    match outcome {
+        WaitOutcome::Done(Ok(head)) => {
+            let body_stream = request.take_body_stream();
+            let dict = result_to_dict(py, head)?;
+            if let Some(body_stream) = body_stream {
+                let started = request.progress().started();
+                let stream = PyResponseStream {
+                    request: Arc::new(Mutex::new(Some(request))),
+                    chunks: Arc::new(tokio::sync::Mutex::new(body_stream)),
+                    deadlines: *deadlines,
+                    started,
+                };
+                dict.bind(py).set_item("stream", Py::new(py, stream)?)?;
+            } else {
+                release_request(request);
+            }
+            Ok(dict)
+        }
+        outcome => {
+            release_request(request);
+            outcome_to_py(py, outcome, deadlines)
+        }
+    }
+}
+
+fn send_failed_error() -> PyErr {
+    PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(
+        "Failed to send request (session not found or closed)"
+    )
+}
+
+/// 批量请求中的一项：在输入列表中的位置、请求、body 以及发起前的延迟（限速）
+type BatchItem = (usize, TargetRequest, UploadBody, Option<Duration>);
+
+/// 批量请求的一个结果（按完成顺序产生）
+type BatchResult = (usize, WaitOutcome, Option<Deadlines>);
+
+/// 在共享 runtime 上驱动一批请求，最多同时保持 window 个请求在途
+async fn drive_batch(
+    manager: Arc<SessionManager>,
+    session_id: String,
+    items: Vec<BatchItem>,
+    options: RequestOptions,
+    window: usize,
+    overrides: (Option<u64>, Option<u64>, Option<u64>),
+    results: mpsc::UnboundedSender<BatchResult>,
+    cancel: Arc<CancelSignal>,
+) {
+    let permits = Arc::new(tokio::sync::Semaphore::new(window.max(1)));
+    let (timeout_ms, connect_timeout_ms, read_timeout_ms) = overrides;
+    let submitted = tokio::time::Instant::now();
+
+    for (index, target, upload, delay) in items {
+        let permit = match permits.clone().acquire_owned().await {
+            Ok(permit) => permit,
+            Err(_) => return,
+        };
+        // 批次已关闭：不再发起剩余请求
+        if cancel.is_cancelled() || results.is_closed() {
+            return;
+        }
+
+        match PendingRequest::new(&manager, session_id.clone(), target, upload, options.clone()) {
+            Some((pending, session_timeout_ms)) => {
+                let deadlines = Deadlines::new(session_timeout_ms, timeout_ms, connect_timeout_ms, read_timeout_ms);
+                let results = results.clone();
+                let cancel = cancel.clone();
+                runtime().spawn(async move {
+                    // 限速：到达调用方预留的发送时间后才发起
+                    let delayed = match delay {
+                        Some(delay) => tokio::select! {
+                            _ = tokio::time::sleep_until(submitted + delay) => true,
+                            _ = cancel.cancelled() => false,
+                        },
+                        None => true,
+                    };
+                    let outcome = if delayed {
+                        pending.send_and_wait(deadlines, &cancel).await
+                    } else {
+                        WaitOutcome::Cancelled
+                    };
+                    let _ = results.send((index, outcome, Some(deadlines)));
+                    drop(permit);
+                });
+            }
+            None => {
+                let _ = results.send((index, WaitOutcome::NotSent, None));
+            }
+        }
+    }
+}
+
+/// 将批量结果转换为 (index, dict) 或 (index, exception)
+fn batch_result_to_py(py: Python, result: Option<BatchResult>) -> PyResult<PyObject> {
+    let (index, outcome, deadlines) = match result {
+        Some(result) => result,
+        None => return Ok(py.None()),
+    };
+    let value = match deadlines {
+        Some(deadlines) => match outcome_to_py(py, outcome, &deadlines) {
+            Ok(dict) => dict,
+            Err(e) => e.into_value(py).into_py(py),
+        },
+        None => send_failed_error().into_value(py).into_py(py),
+    };
+    Ok((index, value).into_py(py))
+}
+
+/// Results of `PyCronetClient.request_many`, yielded in completion order
+///
+/// Each item is `(index, result)` where `index` is the position in the
+/// submitted list and `result` is the response dict or the exception the
+/// request failed with. Closing the batch stops submitting queued requests
+/// and cancels the ones in flight.
+#[pyclass]
+struct PyRequestBatch {
+    results: Arc<tokio::sync::Mutex<mpsc::UnboundedReceiver<BatchResult>>>,
+    cancel: Arc<CancelSignal>,
+}
+
+#[pymethods]
+impl PyRequestBatch {
+    fn __iter__(slf: PyRef<'_, Self>) -> PyRef<'_, Self> {
+        slf
+    }
+
+    fn __next__(&self, py: Python) -> PyResult<Option<PyObject>> {
+        let results = self.results.clone();
+        let result = py.allow_threads(move || {
+            runtime().block_on(async move { results.lock().await.recv().await })
+        });
+        if result.is_none() {
+            return Ok(None);
+        }
+        batch_result_to_py(py, result).map(Some)
+    }
+
+    /// Wait for the next result without blocking, returns an asyncio.Future
+    /// resolving to `(index, result)` or None once every request finished
+    fn next_async(&self, py: Python, event_loop: PyObject) -> PyResult<PyObject> {
+        let future = event_loop.call_method0(py, "create_future")?;
+        let pending_future = future.clone_ref(py);
+        let results = self.results.clone();
+
+        runtime().spawn(async move {
+            let result = results.lock().await.recv().await;
+            resolve_with_gil(move |py| {
+                let result = batch_result_to_py(py, result);
+                schedule_resolve(py, &event_loop, pending_future, result);
+            });
+        });
+
+        Ok(future)
+    }
+
+    /// Stop submitting the remaining requests and cancel those in flight
+    fn close(&self) {
+        self.cancel.cancel();
+    }
+}
+
+impl Drop for PyRequestBatch {
+    fn drop(&mut self) {
+        self.close();
+    }
+}
+
+/// Cancellation handle for an in-flight request
+///
+/// Pass it as `cancel_token` and call `cancel()` from any thread: the Cronet
+/// request is cancelled right away and the waiting call raises
+/// "Request canceled". Async requests also cancel themselves when their
+/// asyncio future is cancelled (task.cancel(), asyncio.wait_for timeout).
+#[pyclass(name = "CancelToken")]
+struct PyCancelToken {
+    signal: Arc<CancelSignal>,
+}
+
+#[pymethods]
+impl PyCancelToken {
+    #[new]
+    fn new() -> Self {
+        PyCancelToken {
+            signal: Arc::new(CancelSignal::default()),
+        }
+    }
+
+    /// Cancel every request using this token
+    fn cancel(&self) {
+        self.signal.cancel();
+    }
+
+    #[getter]
+    fn cancelled(&self) -> bool {
+        self.signal.is_cancelled()
+    }
+
+    /// asyncio.Future done callback: cancel the request when the future was cancelled
+    fn __call__(&self, future: &Bound<'_, PyAny>) -> PyResult<()> {
+        if future.call_method0("cancelled")?.is_truthy()? {
+            self.signal.cancel();
+        }
+        Ok(())
+    }
+}
+
+fn cancel_signal(token: Option<PyRef<'_, PyCancelToken>>) -> Arc<CancelSignal> {
+    token.map(|token| token.signal.clone()).unwrap_or_default()
+}
+
+/// 异步请求的取消信号：future 被取消时只取消这一个请求，
+/// 共享同一个 CancelToken 的其他请求（如对冲请求的另一份）不受影响
+fn future_cancel_signal(token: Option<PyRef<'_, PyCancelToken>>) -> Arc<CancelSignal> {
+    token
+        .map(|token| Arc::new(CancelSignal::child_of(token.signal.clone())))
+        .unwrap_or_default()
+}
+
+/// asyncio.Future 被取消（task.cancel / wait_for 超时）时立即取消 Cronet 请求
+fn cancel_with_future(py: Python, future: &PyObject, cancel: &Arc<CancelSignal>) -> PyResult<()> {
+    let callback = Py::new(py, PyCancelToken { signal: cancel.clone() })?;
+    future.call_method1(py, "add_done_callback", (callback,))?;
+    Ok(())
+}
+
+/// Completes an asyncio.Future on its event loop thread
+///
+/// Scheduled through `loop.call_soon_threadsafe`, so the future is only ever
+/// touched from the thread running the loop.
+#[pyclass]
+struct FutureResolver {
+    future: PyObject,
+    result: Option<PyObject>,
+    exception: Option<PyObject>,
+}
+
+#[pymethods]
+impl FutureResolver {
+    fn __call__(&self, py: Python) -> PyResult<()> {
+        let future = self.future.bind(py);
+        // Future 可能已被取消（例如 asyncio.wait_for 超时），此时直接忽略结果
+        if future.call_method0("done")?.is_truthy()? {
+            return Ok(());
+        }
+        if let Some(ref exception) = self.exception {
+            future.call_method1("set_exception", (exception.clone_ref(py),))?;
+        } else if let Some(ref result) = self.result {
+            future.call_method1("set_result", (result.clone_ref(py),))?;
+        }
+        Ok(())
+    }
+}
 
 /// Python wrapper for SessionManager
 #[pyclass]
@@ -30,10 +980,30 @@ impl PyCronetClient {
     ///     cipher_suites: Optional list of TLS cipher suite names (e.g., ["TLS_AES_128_GCM_SHA256", "TLS_RSA_WITH_AES_128_CBC_SHA"])
     ///     tls_curves: Optional list of TLS curve/group names (e.g., ["X25519MLKEM768", "X25519", "P-256"])
     ///     tls_extensions: Optional list of TLS extension control names (e.g., ["application_settings_old"])
+    ///     cookie_store: Enable Cronet's built-in cookie store (default: True)
+    ///     share_engine: Share one Cronet engine (connection pool, DNS and TLS session cache)
+    ///                   with other sessions that have the same network configuration.
+    ///                   Shared engines never use the Cronet cookie store.
+    ///     callback_threads: Run Cronet callbacks on a pool of this many worker threads
+    ///                       (default: 0, callbacks run inline on the network thread)
+    ///     max_concurrency: Maximum requests in flight for the session; further requests
+    ///                      wait in a FIFO queue (default: 0, unlimited)
+    ///     max_per_host: Maximum requests in flight per host (default: 0, unlimited)
+    ///     cache_mode: Cronet HTTP cache, "disabled" (default), "memory" or "disk"
+    ///     cache_max_bytes: HTTP cache size limit in bytes (default: 0, Cronet's default)
+    ///     cache_dir: Directory for the disk cache (required for "disk"); each network
+    ///                configuration uses its own subdirectory. Disk-cached sessions
+    ///                always share their engine.
+    ///     storage_path: Directory persisting network state across restarts (Alt-Svc,
+    ///                   QUIC server configs, HTTP/2 support, DNS cache); each network
+    ///                   configuration uses its own subdirectory. Written when the
+    ///                   engine shuts down. Mutually exclusive with a different cache_dir.
+    ///     quic_hints: Hosts known to speak QUIC as (host, port, alternate_port) tuples;
+    ///                 their first request uses QUIC instead of discovering it via Alt-Svc
     ///
     /// Returns:
     ///     Session ID string
-    #[pyo3(signature = (proxy_rules=None, skip_cert_verify=None, timeout_ms=None, cipher_suites=None, tls_curves=None, tls_extensions=None))]
+    #[pyo3(signature = (proxy_rules=None, skip_cert_verify=None, timeout_ms=None, cipher_suites=None, tls_curves=None, tls_extensions=None, cookie_store=None, share_engine=None, callback_threads=None, max_concurrency=None, max_per_host=None, cache_mode=None, cache_max_bytes=None, cache_dir=None, storage_path=None, quic_hints=None))]
     fn create_session(
         &self,
         proxy_rules: Option<String>,
@@ -42,7 +1012,40 @@ impl PyCronetClient {
         cipher_suites: Option<Vec<String>>,
         tls_curves: Option<Vec<String>>,
         tls_extensions: Option<Vec<String>>,
+        cookie_store: Option<bool>,
+        share_engine: Option<bool>,
+        callback_threads: Option<usize>,
+        max_concurrency: Option<usize>,
+        max_per_host: Option<usize>,
+        cache_mode: Option<String>,
+        cache_max_bytes: Option<i64>,
+        cache_dir: Option<String>,
+        storage_path: Option<String>,
+        quic_hints: Option<Vec<(String, i32, i32)>>,
     ) -> PyResult<String> {
+        let cache_mode = match cache_mode {
+            Some(name) => CacheMode::parse(&name).ok_or_else(|| {
+                PyErr::new::<pyo3::exceptions::PyValueError, _>(format!(
+                    "Invalid cache_mode {:?}, expected \"disabled\", \"memory\" or \"disk\"",
+                    name
+                ))
+            })?,
+            None => CacheMode::Disabled,
+        };
+        if cache_mode == CacheMode::Disk && cache_dir.is_none() {
+            return Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(
+                "cache_mode=\"disk\" requires cache_dir",
+            ));
+        }
+        if let (Some(cache_dir), Some(storage_path)) = (&cache_dir, &storage_path) {
+            if cache_dir != storage_path {
+                // Cronet 每个 Engine 只有一个存储目录，磁盘缓存与网络状态放在一起
+                return Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(
+                    "cache_dir and storage_path must be the same directory",
+                ));
+            }
+        }
+
         let config = SessionConfig {
             proxy_rules,
             skip_cert_verify: skip_cert_verify.unwrap_or(false),
@@ -51,6 +1054,16 @@ impl PyCronetClient {
             tls_curves,
             tls_extensions,
             allow_redirects: true,  // 默认允许重定向
+            cookie_store: cookie_store.unwrap_or(true),
+            share_engine: share_engine.unwrap_or(false),
+            callback_threads: callback_threads.unwrap_or(0),
+            max_concurrency: max_concurrency.unwrap_or(0),
+            max_per_host: max_per_host.unwrap_or(0),
+            cache_mode,
+            cache_max_bytes: cache_max_bytes.unwrap_or(0),
+            cache_dir,
+            storage_path,
+            quic_hints: quic_hints.unwrap_or_default(),
         };
 
         let session_id = self.manager.create_session(config);
@@ -64,12 +1077,23 @@ impl PyCronetClient {
     ///     url: Target URL
     ///     method: HTTP method (GET, POST, etc.)
     ///     headers: List of tuples [("name", "value"), ...]
-    ///     body: Request body as bytes
+    ///     body: Request body: bytes, an iterable of bytes, or a list of segments
+    ///           (bytes, `(path, offset, length)` file ranges or iterables)
     ///     allow_redirects: Whether to follow redirects (default: True)
+    ///     timeout_ms: Total deadline, defaults to the session timeout
+    ///     connect_timeout_ms: Deadline until the response (or upload) starts
+    ///     read_timeout_ms: Longest gap between received data
+    ///     max_redirects: Redirects followed inside Cronet before the redirect
+    ///                    response is returned (default: unlimited)
+    ///     caller_manages_cookies: Return cross-host and Set-Cookie redirects to the
+    ///                             caller instead of following them with stale cookies
+    ///     cancel_token: CancelToken that aborts the request when cancelled
     ///
     /// Returns:
-    ///     Dict with keys: status_code, headers, body
-    #[pyo3(signature = (session_id, url, method, headers=None, body=None, allow_redirects=true))]
+    ///     Dict with keys: status_code, headers, body, url, history, timings
+    ///     (history lists the followed redirects as dicts with status_code, url, headers;
+    ///     timings holds the Cronet metrics in milliseconds, or None)
+    #[pyo3(signature = (session_id, url, method, headers=None, body=None, allow_redirects=true, timeout_ms=None, connect_timeout_ms=None, read_timeout_ms=None, max_redirects=None, caller_manages_cookies=false, cancel_token=None))]
     fn request(
         &self,
         py: Python,
@@ -77,96 +1101,289 @@ impl PyCronetClient {
         url: String,
         method: String,
         headers: Option<Vec<(String, String)>>,
-        body: Option<Vec<u8>>,
+        body: Option<PyObject>,
         allow_redirects: bool,
+        timeout_ms: Option<u64>,
+        connect_timeout_ms: Option<u64>,
+        read_timeout_ms: Option<u64>,
+        max_redirects: Option<u32>,
+        caller_manages_cookies: bool,
+        cancel_token: Option<PyRef<'_, PyCancelToken>>,
     ) -> PyResult<PyObject> {
-        let headers_vec = headers.unwrap_or_default();
-        let body_vec = body.unwrap_or_default();
-
-        // Build target request
-        let target = TargetRequest {
-            url,
-            method,
-            headers: headers_vec
-                .into_iter()
-                .map(|(name, value)| Header { name, value })
-                .collect(),
-            body: body_vec,
+        let cancel = cancel_signal(cancel_token);
+        let target = build_target(url, method, headers);
+        let upload = build_upload(py, body)?;
+        let options = RequestOptions {
+            allow_redirects,
+            max_redirects,
+            caller_manages_cookies,
+            ..Default::default()
         };
+        let (pending, session_timeout_ms) = PendingRequest::new(&self.manager, session_id, target, upload, options)
+            .ok_or_else(send_failed_error)?;
+        let deadlines = Deadlines::new(session_timeout_ms, timeout_ms, connect_timeout_ms, read_timeout_ms);
 
-        // Send request
-        let result = self.manager.send_request(&session_id, &target, allow_redirects);
-
-        match result {
-            Some((request, rx, timeout_ms)) => {
-                // Wait for response with timeout
-                let timeout_duration = Duration::from_millis(timeout_ms);
-
-                // Release GIL while waiting for response to allow concurrent requests
-                let response_result = py.allow_threads(move || {
-                    // Use a thread to implement timeout
-                    let (timeout_tx, timeout_rx) = std::sync::mpsc::channel();
-                    std::thread::spawn(move || {
-                        match rx.blocking_recv() {
-                            Ok(result) => {
-                                let _ = timeout_tx.send(Some(result));
-                            }
-                            Err(_) => {
-                                let _ = timeout_tx.send(None);
-                            }
-                        }
-                    });
-
-                    // Wait with timeout and keep request alive
-                    let result = timeout_rx.recv_timeout(timeout_duration);
-                    // Explicitly drop request here to ensure cleanup on timeout
-                    drop(request);
-                    result
-                });
+        // Release GIL while queued and waiting for response to allow concurrent requests
+        let outcome = py.allow_threads(move || {
+            runtime().block_on(pending.send_and_wait(deadlines, &cancel))
+        });
 
-                match response_result {
-                    Ok(Some(Ok(response))) => {
-                        let dict = PyDict::new_bound(py);
-                        dict.set_item("status_code", response.status_code)?;
-                        dict.set_item("body", PyBytes::new_bound(py, &response.body))?;
-
-                        // Convert headers
-                        let headers_list = PyList::empty_bound(py);
-                        for (name, value) in response.headers {
-                            let tuple = (name, value);
-                            headers_list.append(tuple)?;
-                        }
-                        dict.set_item("headers", headers_list)?;
-
-                        Ok(dict.into_py(py))
-                    }
-                    Ok(Some(Err(e))) => {
-                        Err(PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(
-                            format!("Request failed: {}", e)
-                        ))
-                    }
-                    Ok(None) => {
-                        Err(PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(
-                            "Channel closed unexpectedly"
-                        ))
-                    }
-                    Err(std::sync::mpsc::RecvTimeoutError::Timeout) => {
-                        // Request was already dropped in the closure above
-                        Err(PyErr::new::<pyo3::exceptions::PyTimeoutError, _>(
-                            format!("Request timeout after {}ms", timeout_ms)
-                        ))
-                    }
-                    Err(std::sync::mpsc::RecvTimeoutError::Disconnected) => {
-                        Err(PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(
-                            "Timeout channel disconnected"
-                        ))
+        outcome_to_py(py, outcome, &deadlines)
+    }
+
+    /// Execute request without blocking a thread, returning an awaitable future
+    ///
+    /// The future is created on `event_loop` and completed from the Cronet
+    /// callbacks via `event_loop.call_soon_threadsafe`, so no thread is held
+    /// while the request is in flight.
+    ///
+    /// Args:
+    ///     event_loop: Running asyncio event loop
+    ///     session_id: Session ID
+    ///     url: Target URL
+    ///     method: HTTP method (GET, POST, etc.)
+    ///     headers: List of tuples [("name", "value"), ...]
+    ///     body: Request body: bytes, an iterable of bytes, or a list of segments
+    ///           (bytes, `(path, offset, length)` file ranges or iterables)
+    ///     allow_redirects: Whether to follow redirects (default: True)
+    ///
+    /// Other arguments are the same as `request`. Cancelling the returned
+    /// future cancels the Cronet request immediately.
+    ///
+    /// Returns:
+    ///     asyncio.Future resolving to a dict with keys: status_code, headers, body
+    #[pyo3(signature = (event_loop, session_id, url, method, headers=None, body=None, allow_redirects=true, timeout_ms=None, connect_timeout_ms=None, read_timeout_ms=None, max_redirects=None, caller_manages_cookies=false, cancel_token=None))]
+    fn request_async(
+        &self,
+        py: Python,
+        event_loop: PyObject,
+        session_id: String,
+        url: String,
+        method: String,
+        headers: Option<Vec<(String, String)>>,
+        body: Option<PyObject>,
+        allow_redirects: bool,
+        timeout_ms: Option<u64>,
+        connect_timeout_ms: Option<u64>,
+        read_timeout_ms: Option<u64>,
+        max_redirects: Option<u32>,
+        caller_manages_cookies: bool,
+        cancel_token: Option<PyRef<'_, PyCancelToken>>,
+    ) -> PyResult<PyObject> {
+        let cancel = future_cancel_signal(cancel_token);
+        let target = build_target(url, method, headers);
+        let upload = build_upload(py, body)?;
+        let options = RequestOptions {
+            allow_redirects,
+            max_redirects,
+            caller_manages_cookies,
+            ..Default::default()
+        };
+        let (pending, session_timeout_ms) = PendingRequest::new(&self.manager, session_id, target, upload, options)
+            .ok_or_else(send_failed_error)?;
+        let deadlines = Deadlines::new(session_timeout_ms, timeout_ms, connect_timeout_ms, read_timeout_ms);
+
+        let future = event_loop.call_method0(py, "create_future")?;
+        let pending_future = future.clone_ref(py);
+        cancel_with_future(py, &future, &cancel)?;
+
+        runtime().spawn(async move {
+            let outcome = pending.send_and_wait(deadlines, &cancel).await;
+
+            resolve_with_gil(move |py| {
+                let result = outcome_to_py(py, outcome, &deadlines);
+                schedule_resolve(py, &event_loop, pending_future, result);
+            });
+        });
+
+        Ok(future)
+    }
+
+    /// Execute a batch of requests with a single call
+    ///
+    /// All requests are converted up front and started from the shared runtime,
+    /// keeping at most `window` of them in flight. Redirects are followed
+    /// natively.
+    ///
+    /// Args:
+    ///     session_id: Session ID
+    ///     requests: List of (url, method, headers, body) tuples, optionally with a
+    ///               fifth delay_ms item: the request starts that long after submission
+    ///               (used by rate limiting)
+    ///     window: Maximum number of requests in flight (default: 64)
+    ///     allow_redirects, timeout_ms, connect_timeout_ms, read_timeout_ms,
+    ///     max_redirects: Same as `request`, applied to every request
+    ///
+    /// Returns:
+    ///     Batch iterator yielding (index, dict or exception) in completion order
+    #[pyo3(signature = (session_id, requests, window=64, allow_redirects=true, timeout_ms=None, connect_timeout_ms=None, read_timeout_ms=None, max_redirects=None))]
+    fn request_many(
+        &self,
+        py: Python,
+        session_id: String,
+        requests: PyObject,
+        window: usize,
+        allow_redirects: bool,
+        timeout_ms: Option<u64>,
+        connect_timeout_ms: Option<u64>,
+        read_timeout_ms: Option<u64>,
+        max_redirects: Option<u32>,
+    ) -> PyResult<PyRequestBatch> {
+        if !self.manager.session_exists(&session_id) {
+            return Err(send_failed_error());
+        }
+
+        let mut items: Vec<BatchItem> = Vec::new();
+        for (index, item) in PyIterator::from_object(requests.bind(py))?.enumerate() {
+            let item = item?;
+            let (url, method, headers, body, delay_ms): (String, String, Option<Vec<(String, String)>>, Option<PyObject>, Option<u64>) =
+                match item.extract() {
+                    Ok(item) => item,
+                    Err(_) => {
+                        let (url, method, headers, body) = item.extract()?;
+                        (url, method, headers, body, None)
                     }
-                }
-            }
-            None => Err(PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(
-                "Failed to send request (session not found or concurrent limit reached)"
-            )),
+                };
+            let target = build_target(url, method, headers);
+            let upload = build_upload(py, body)?;
+            items.push((index, target, upload, delay_ms.map(Duration::from_millis)));
         }
+
+        let (results_tx, results_rx) = mpsc::unbounded_channel();
+        let cancel = Arc::new(CancelSignal::default());
+        runtime().spawn(drive_batch(
+            self.manager.clone(),
+            session_id,
+            items,
+            RequestOptions {
+                allow_redirects,
+                max_redirects,
+                ..Default::default()
+            },
+            window,
+            (timeout_ms, connect_timeout_ms, read_timeout_ms),
+            results_tx,
+            cancel.clone(),
+        ));
+
+        Ok(PyRequestBatch {
+            results: Arc::new(tokio::sync::Mutex::new(results_rx)),
+            cancel,
+        })
+    }
+
+    /// Execute request in streaming mode
+    ///
+    /// Returns as soon as the response headers arrive. The dict carries the
+    /// same keys as `request` (with an empty body) plus `stream`, whose
+    /// `read()` pulls the body one chunk at a time.
+    #[pyo3(signature = (session_id, url, method, headers=None, body=None, allow_redirects=true, timeout_ms=None, connect_timeout_ms=None, read_timeout_ms=None, max_redirects=None, caller_manages_cookies=false, cancel_token=None))]
+    fn request_stream(
+        &self,
+        py: Python,
+        session_id: String,
+        url: String,
+        method: String,
+        headers: Option<Vec<(String, String)>>,
+        body: Option<PyObject>,
+        allow_redirects: bool,
+        timeout_ms: Option<u64>,
+        connect_timeout_ms: Option<u64>,
+        read_timeout_ms: Option<u64>,
+        max_redirects: Option<u32>,
+        caller_manages_cookies: bool,
+        cancel_token: Option<PyRef<'_, PyCancelToken>>,
+    ) -> PyResult<PyObject> {
+        let cancel = cancel_signal(cancel_token);
+        let target = build_target(url, method, headers);
+        let upload = build_upload(py, body)?;
+        let options = RequestOptions {
+            allow_redirects,
+            max_redirects,
+            caller_manages_cookies,
+            stream: true,
+        };
+        let (pending, session_timeout_ms) = PendingRequest::new(&self.manager, session_id, target, upload, options)
+            .ok_or_else(send_failed_error)?;
+        let deadlines = Deadlines::new(session_timeout_ms, timeout_ms, connect_timeout_ms, read_timeout_ms);
+
+        let sent = py.allow_threads(move || {
+            runtime().block_on(async move {
+                let (request, rx) = pending.send(&cancel).await?;
+                let outcome = wait_result(&request, rx, deadlines, &cancel).await;
+                Ok::<_, WaitOutcome>((request, outcome))
+            })
+        });
+
+        match sent {
+            Ok((request, outcome)) => stream_head_to_py(py, outcome, request, &deadlines),
+            Err(outcome) => outcome_to_py(py, outcome, &deadlines),
+        }
+    }
+
+    /// Async variant of `request_stream`, returns an asyncio.Future
+    #[pyo3(signature = (event_loop, session_id, url, method, headers=None, body=None, allow_redirects=true, timeout_ms=None, connect_timeout_ms=None, read_timeout_ms=None, max_redirects=None, caller_manages_cookies=false, cancel_token=None))]
+    fn request_stream_async(
+        &self,
+        py: Python,
+        event_loop: PyObject,
+        session_id: String,
+        url: String,
+        method: String,
+        headers: Option<Vec<(String, String)>>,
+        body: Option<PyObject>,
+        allow_redirects: bool,
+        timeout_ms: Option<u64>,
+        connect_timeout_ms: Option<u64>,
+        read_timeout_ms: Option<u64>,
+        max_redirects: Option<u32>,
+        caller_manages_cookies: bool,
+        cancel_token: Option<PyRef<'_, PyCancelToken>>,
+    ) -> PyResult<PyObject> {
+        let cancel = future_cancel_signal(cancel_token);
+        let target = build_target(url, method, headers);
+        let upload = build_upload(py, body)?;
+        let options = RequestOptions {
+            allow_redirects,
+            max_redirects,
+            caller_manages_cookies,
+            stream: true,
+        };
+        let (pending, session_timeout_ms) = PendingRequest::new(&self.manager, session_id, target, upload, options)
+            .ok_or_else(send_failed_error)?;
+        let deadlines = Deadlines::new(session_timeout_ms, timeout_ms, connect_timeout_ms, read_timeout_ms);
+
+        let future = event_loop.call_method0(py, "create_future")?;
+        let pending_future = future.clone_ref(py);
+        cancel_with_future(py, &future, &cancel)?;
+
+        runtime().spawn(async move {
+            let sent = match pending.send(&cancel).await {
+                Ok((request, rx)) => {
+                    let outcome = wait_result(&request, rx, deadlines, &cancel).await;
+                    Ok((request, outcome))
+                }
+                Err(outcome) => Err(outcome),
+            };
+            resolve_with_gil(move |py| {
+                let result = match sent {
+                    Ok((request, outcome)) => stream_head_to_py(py, outcome, request, &deadlines),
+                    Err(outcome) => outcome_to_py(py, outcome, &deadlines),
+                };
+                schedule_resolve(py, &event_loop, pending_future, result);
+            });
+        });
+
+        Ok(future)
+    }
+
+    /// Number of requests currently waiting on a deadline
+    ///
+    /// Each in-flight request holds one watchdog until it completes or its
+    /// deadline cancels it; the count returns to zero once traffic drains.
+    #[staticmethod]
+    fn live_watchdogs() -> usize {
+        LIVE_WATCHDOGS.load(Ordering::Relaxed)
     }
 
     /// Close a session
@@ -175,8 +1392,62 @@ impl PyCronetClient {
     }
 
     /// List all active sessions
-    fn list_sessions(&self) -> PyResult<Vec<String>> {
-        Ok(self.manager.list_sessions())
+    ///
+    /// Args:
+    ///     detailed: Return a dict per session instead of the session ID, with keys
+    ///               session_id, engine_id, engine_shared, engine_sessions (number of
+    ///               sessions using the same engine) and active_requests
+    #[pyo3(signature = (detailed=false))]
+    fn list_sessions(&self, py: Python, detailed: bool) -> PyResult<PyObject> {
+        if !detailed {
+            return Ok(self.manager.list_sessions().into_py(py));
+        }
+
+        let list = PyList::empty_bound(py);
+        for info in self.manager.session_infos() {
+            let dict = PyDict::new_bound(py);
+            dict.set_item("session_id", info.session_id)?;
+            dict.set_item("engine_id", info.engine_id)?;
+            dict.set_item("engine_shared", info.engine_shared)?;
+            dict.set_item("engine_sessions", info.engine_sessions)?;
+            dict.set_item("active_requests", info.active_requests)?;
+            list.append(dict)?;
+        }
+        Ok(list.into_py(py))
+    }
+
+    /// Number of Cronet engines alive in this process
+    #[staticmethod]
+    fn engine_count() -> usize {
+        SessionManager::engine_count()
+    }
+
+    /// Request metrics of a session, None if the session does not exist
+    ///
+    /// Keys: requests, in_flight, status ({code: count}), errors, timeouts,
+    /// cancelled, bytes_sent, bytes_received, latency and hosts ({host: latency}),
+    /// queue (time spent waiting for a concurrency slot), plus active_requests,
+    /// in_flight_executors and queued. Latency dicts hold count,
+    /// mean_ms, p50_ms, p90_ms, p99_ms, p999_ms and max_ms.
+    fn session_stats(&self, py: Python, session_id: String) -> PyResult<PyObject> {
+        let stats = match self.manager.session_stats(&session_id) {
+            Some(stats) => stats,
+            None => return Ok(py.None()),
+        };
+        let dict = metrics_to_py(py, &stats.metrics)?;
+        dict.set_item("active_requests", stats.active_requests)?;
+        dict.set_item("in_flight_executors", stats.in_flight_executors)?;
+        dict.set_item("queued", stats.queued)?;
+        Ok(dict.into_py(py))
+    }
+
+    /// Request metrics of every request made in this process (same keys as
+    /// session_stats, plus engines)
+    #[staticmethod]
+    fn metrics_snapshot(py: Python) -> PyResult<PyObject> {
+        let dict = metrics_to_py(py, &metrics::global().snapshot())?;
+        dict.set_item("engines", SessionManager::engine_count())?;
+        Ok(dict.into_py(py))
     }
 }
 
@@ -184,6 +1455,10 @@ impl PyCronetClient {
 #[pymodule]
 fn cronet_cloak(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_class::<PyCronetClient>()?;
+    m.add_class::<FutureResolver>()?;
+    m.add_class::<PyResponseStream>()?;
+    m.add_class::<PyRequestBatch>()?;
+    m.add_class::<PyCancelToken>()?;
     Ok(())
 }
 
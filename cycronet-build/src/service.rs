@@ -428,3 +428,22 @@ pub async fn list_sessions(State(state): State<AppState>) -> Json<ListSessionsRe
         count,
     })
 }
+
+/// Prometheus 指标（进程级请求统计与各会话的活跃请求数）
+pub async fn metrics(State(state): State<AppState>) -> impl IntoResponse {
+    let sessions = state
+        .session_manager
+        .session_infos()
+        .into_iter()
+        .map(|info| (info.session_id, info.active_requests))
+        .collect::<Vec<_>>();
+    let body = crate::metrics::render_prometheus(
+        &crate::metrics::global().snapshot(),
+        &sessions,
+        SessionManager::engine_count(),
+    );
+    (
+        [(axum::http::header::CONTENT_TYPE, "text/plain; version=0.0.4")],
+        body,
+    )
+}